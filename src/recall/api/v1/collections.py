@@ -2,7 +2,7 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from recall.api.v1.dependencies import get_registry, get_vectordb
 from recall.core.embedders.factory import EmbedderFactory
@@ -47,12 +47,16 @@ async def create_collection(
     )
 
 
-@router.get("", response_model=list[str])
+@router.get("", response_model=list[str] | list[Collection])
 async def list_collections(
     registry: Annotated[SchemaRegistry, Depends(get_registry)],
-) -> list[str]:
-    """List all collection names."""
-    return await registry.list_all()
+    details: Annotated[bool, Query(description="Return full configurations")] = False,
+) -> list[str] | list[Collection]:
+    """List all collection names, or their configurations with ``details=true``."""
+    names = await registry.list_all()
+    if details:
+        return await registry.get_many(names)
+    return names
 
 
 @router.get("/{name}", response_model=Collection)
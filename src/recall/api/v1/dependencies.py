@@ -6,10 +6,20 @@ from arq import ArqRedis
 from fastapi import Depends, Request
 from redis.asyncio import Redis
 
+from recall.config import get_settings
+from recall.core.blobstore.base import BlobStore
 from recall.core.vectordb.base import VectorDBClient
+from recall.services.blob_staging import BlobStaging
+from recall.services.collection_cache import CollectionCache
+from recall.services.doc_versions import DocumentVersions
+from recall.services.filter_usage import FilterUsageTracker
 from recall.services.ingestion import IngestionService
+from recall.services.lanes import LaneScheduler
+from recall.services.payload_updates import PayloadUpdateService
 from recall.services.registry import SchemaRegistry
 from recall.services.search import SearchService
+from recall.services.task_events import TaskEventHub
+from recall.services.task_progress import TaskProgressStore
 
 
 async def get_redis(request: Request) -> Redis:
@@ -27,24 +37,97 @@ async def get_vectordb(request: Request) -> VectorDBClient:
     return request.app.state.vectordb
 
 
+async def get_blob_store(request: Request) -> BlobStore:
+    """Get the blob store for staged content from app state."""
+    return request.app.state.blob_store
+
+
+async def get_collection_cache(request: Request) -> CollectionCache:
+    """Get the process-wide collection config cache from app state."""
+    return request.app.state.collection_cache
+
+
+async def get_task_events(request: Request) -> TaskEventHub:
+    """Get the process-wide task event hub from app state."""
+    return request.app.state.task_events
+
+
+async def get_filter_usage(request: Request) -> FilterUsageTracker:
+    """Get the process-wide filter usage counters from app state."""
+    return request.app.state.filter_usage
+
+
 async def get_registry(
     redis: Annotated[Redis, Depends(get_redis)],
+    cache: Annotated[CollectionCache, Depends(get_collection_cache)],
 ) -> SchemaRegistry:
     """Get schema registry instance."""
-    return SchemaRegistry(redis)
+    return SchemaRegistry(redis, cache)
+
+
+async def get_task_progress(redis: Annotated[Redis, Depends(get_redis)]) -> TaskProgressStore:
+    """Get the store of batch ingestion progress records."""
+    return TaskProgressStore(redis, ttl=get_settings().task_progress_ttl)
+
+
+async def get_doc_versions(redis: Annotated[Redis, Depends(get_redis)]) -> DocumentVersions:
+    """Get the record of each document's latest queued job."""
+    return DocumentVersions(redis, ttl=get_settings().doc_versions_ttl)
+
+
+async def get_lane_scheduler(
+    arq_redis: Annotated[ArqRedis, Depends(get_arq_redis)],
+) -> LaneScheduler:
+    """Get the fair scheduler of ingestion lanes."""
+    settings = get_settings()
+    return LaneScheduler(
+        arq_redis,
+        settings.ingest_collection_weights,
+        job_deserializer=arq_redis.job_deserializer,
+        throughput_window=settings.lane_throughput_window,
+    )
 
 
 async def get_ingestion_service(
     registry: Annotated[SchemaRegistry, Depends(get_registry)],
     arq_redis: Annotated[ArqRedis, Depends(get_arq_redis)],
+    redis: Annotated[Redis, Depends(get_redis)],
+    blob_store: Annotated[BlobStore, Depends(get_blob_store)],
+    progress: Annotated[TaskProgressStore, Depends(get_task_progress)],
+    scheduler: Annotated[LaneScheduler, Depends(get_lane_scheduler)],
+    versions: Annotated[DocumentVersions, Depends(get_doc_versions)],
 ) -> IngestionService:
     """Get ingestion service instance."""
-    return IngestionService(registry, arq_redis)
+    settings = get_settings()
+    return IngestionService(
+        registry,
+        arq_redis,
+        staging=BlobStaging(redis, blob_store, ttl=settings.blob_staging_ttl),
+        blob_min_bytes=settings.blob_staging_min_bytes,
+        progress=progress,
+        scheduler=scheduler,
+        interactive_max_docs=settings.lane_interactive_max_docs,
+        max_queue_depth=settings.ingest_max_queue_depth,
+        max_drain_seconds=settings.ingest_max_drain_seconds,
+        versions=versions,
+        stream_chunk_size=settings.ingest_stream_chunk_size,
+        stream_max_line_bytes=settings.ingest_stream_max_line_bytes,
+        stream_max_wait=settings.ingest_stream_max_wait,
+    )
+
+
+async def get_payload_update_service(
+    registry: Annotated[SchemaRegistry, Depends(get_registry)],
+    vectordb: Annotated[VectorDBClient, Depends(get_vectordb)],
+) -> PayloadUpdateService:
+    """Get payload update service instance."""
+    return PayloadUpdateService(registry, vectordb)
 
 
 async def get_search_service(
     registry: Annotated[SchemaRegistry, Depends(get_registry)],
     vectordb: Annotated[VectorDBClient, Depends(get_vectordb)],
+    usage: Annotated[FilterUsageTracker, Depends(get_filter_usage)],
 ) -> SearchService:
     """Get search service instance."""
-    return SearchService(registry, vectordb)
+    return SearchService(registry, vectordb, usage=usage)
@@ -2,14 +2,30 @@
 
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel, Field
 
-from recall.api.v1.dependencies import get_ingestion_service, get_registry, get_vectordb
+from recall.api.v1.dependencies import (
+    get_ingestion_service,
+    get_payload_update_service,
+    get_registry,
+    get_vectordb,
+)
 from recall.core.vectordb.base import VectorDBClient
-from recall.models.document import IngestRequest, IngestResponse
-from recall.models.errors import CollectionNotFoundError, SchemaValidationError
+from recall.models.document import (
+    IngestLane,
+    IngestRequest,
+    IngestResponse,
+    PayloadUpdateRequest,
+    PayloadUpdateResponse,
+    StreamIngestResponse,
+)
+from recall.models.errors import (
+    CollectionNotFoundError,
+    IngestionBackpressureError,
+)
 from recall.services.ingestion import IngestionService
+from recall.services.payload_updates import PayloadUpdateService
 from recall.services.registry import SchemaRegistry
 
 router = APIRouter(prefix="/collections/{collection_name}/documents")
@@ -86,6 +102,9 @@ async def ingest_documents(
     1. Content fetched from URI (if provided)
     2. Embedding generated using collection's configured model
     3. Vector + payload stored in vector database
+
+    Returns 429 with a ``Retry-After`` header while the batch's lane is too
+    far behind to accept it.
     """
     try:
         return await service.ingest(collection_name, body)
@@ -94,9 +113,75 @@ async def ingest_documents(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=e.message,
         )
-    except SchemaValidationError as e:
+    except IngestionBackpressureError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=e.message,
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
+
+@router.post(
+    "/stream",
+    response_model=StreamIngestResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+)
+async def ingest_document_stream(
+    collection_name: str,
+    request: Request,
+    service: Annotated[IngestionService, Depends(get_ingestion_service)],
+    lane: IngestLane | None = Query(
+        default=None, description="Queue lane; chosen by size when omitted"
+    ),
+) -> StreamIngestResponse:
+    """Queue an NDJSON body of documents, one per line, of any size.
+
+    Documents are validated and queued in chunks while the body is read,
+    all under one task. Invalid lines are skipped and listed in ``errors``
+    with their line numbers; the rest are queued.
+
+    Returns 429 with a ``Retry-After`` header if the lane is too far behind
+    to accept the first chunk. Later chunks wait for the lane instead, which
+    slows reading of the body; a stream that waits too long stops with a
+    ``partial`` status and the ``resume_from_line`` to send again from.
+    """
+    try:
+        return await service.ingest_stream(collection_name, request.stream(), lane)
+    except CollectionNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=e.message,
+        )
+    except IngestionBackpressureError as e:
         raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail=e.message,
+            headers={"Retry-After": str(e.retry_after)},
         )
 
+
+@router.patch("", response_model=PayloadUpdateResponse)
+async def update_document_payloads(
+    collection_name: str,
+    body: PayloadUpdateRequest,
+    service: Annotated[PayloadUpdateService, Depends(get_payload_update_service)],
+) -> PayloadUpdateResponse:
+    """Update the payloads of ingested documents without re-embedding them.
+
+    The given fields are merged into each document's payload (or replace it
+    with ``overwrite``) synchronously; vectors are left untouched. Documents
+    that have not been ingested are listed in ``not_found``.
+    """
+    try:
+        return await service.update(collection_name, body)
+    except CollectionNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=e.message,
+        )
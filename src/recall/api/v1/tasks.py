@@ -1,86 +1,119 @@
 """Task status endpoints for async job tracking."""
 
+import asyncio
+from collections.abc import AsyncIterator
 from typing import Annotated
 
-from arq import ArqRedis
-from arq.jobs import Job
-from arq.jobs import JobStatus as ArqJobStatus
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 
-from recall.api.v1.dependencies import get_arq_redis
-from recall.models.task import JobStatus, TaskStatusResponse, TaskSummary
+from recall.api.v1.dependencies import get_task_events, get_task_progress
+from recall.config import get_settings
+from recall.models.task import TaskStatusListResponse, TaskStatusResponse, TaskSummary
+from recall.services.task_events import TaskEventHub
+from recall.services.task_progress import TaskProgressStore
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
-ARQ_STATUS_MAP = {
-    ArqJobStatus.queued: "queued",
-    ArqJobStatus.in_progress: "in_progress",
-    ArqJobStatus.complete: "complete",
-    ArqJobStatus.not_found: "not_found",
-}
+
+@router.get("", response_model=TaskStatusListResponse)
+async def get_task_statuses(
+    progress: Annotated[TaskProgressStore, Depends(get_task_progress)],
+    ids: list[str] = Query(..., min_length=1, max_length=100, description="Task ids to read"),
+    limit: int = Query(default=0, ge=0, le=1000, description="Jobs to return per task"),
+    offset: int = Query(default=0, ge=0, description="Position of the first job per task"),
+) -> TaskStatusListResponse:
+    """Poll several batch ingestion tasks in one call.
+
+    Returns only summaries unless ``limit`` asks for jobs as well.
+    """
+    statuses = await progress.get_many(ids, limit, offset)
+    return TaskStatusListResponse(
+        tasks=[s for s in statuses if s is not None],
+        not_found=[task_id for task_id, s in zip(ids, statuses) if s is None],
+    )
 
 
 @router.get("/{task_id}", response_model=TaskStatusResponse)
 async def get_task_status(
     task_id: str,
-    arq_redis: Annotated[ArqRedis, Depends(get_arq_redis)],
+    progress: Annotated[TaskProgressStore, Depends(get_task_progress)],
+    limit: int = Query(default=100, ge=0, le=1000, description="Maximum jobs to return"),
+    offset: int = Query(default=0, ge=0, description="Position of the first job"),
 ) -> TaskStatusResponse:
     """Poll the status of a batch ingestion task.
 
     The task_id is the batch identifier returned from POST /documents.
-    Each document in the batch has a job_id of format: {task_id}:{doc_id}
+    Jobs are listed in submission order; use offset and limit to page
+    through large batches. The summary always covers the whole batch.
     """
-    pattern = f"{task_id}:*"
-    all_keys: list[bytes] = await arq_redis.keys(f"arq:job:{pattern}")
-
-    jobs: list[JobStatus] = []
-    summary_counts = {"queued": 0, "in_progress": 0, "complete": 0, "failed": 0}
-
-    for key in all_keys:
-        key_str = key.decode() if isinstance(key, bytes) else key
-        job_id = key_str.replace("arq:job:", "")
-        doc_id = job_id.split(":", 1)[1] if ":" in job_id else job_id
-
-        job = Job(job_id, arq_redis)
-        
-        # Use job.status() method instead of info.status attribute
-        status = await job.status()
-        status_str = ARQ_STATUS_MAP.get(status, "queued")
-
-        if status == ArqJobStatus.complete:
-            # Use result_info() to get result details
-            result_info = await job.result_info()
-            if result_info and result_info.success:
-                summary_counts["complete"] += 1
-                jobs.append(JobStatus(
-                    doc_id=doc_id,
-                    status="complete",
-                    result=result_info.result if isinstance(result_info.result, dict) else None,
-                ))
-            else:
-                summary_counts["failed"] += 1
-                error_msg = "Unknown error"
-                if result_info and result_info.result:
-                    error_msg = str(result_info.result)
-                jobs.append(JobStatus(
-                    doc_id=doc_id,
-                    status="failed",
-                    error=error_msg,
-                ))
-        elif status == ArqJobStatus.not_found:
-            jobs.append(JobStatus(doc_id=doc_id, status="not_found"))
-        else:
-            summary_counts[status_str] = summary_counts.get(status_str, 0) + 1
-            jobs.append(JobStatus(doc_id=doc_id, status=status_str))
-
-    return TaskStatusResponse(
-        task_id=task_id,
-        jobs=jobs,
-        summary=TaskSummary(
-            total=len(jobs),
-            queued=summary_counts["queued"],
-            in_progress=summary_counts["in_progress"],
-            complete=summary_counts["complete"],
-            failed=summary_counts["failed"],
-        ),
+    task_status = await progress.get(task_id, limit, offset)
+    if task_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task '{task_id}' not found",
+        )
+    return task_status
+
+
+@router.get("/{task_id}/events")
+async def stream_task_events(
+    task_id: str,
+    progress: Annotated[TaskProgressStore, Depends(get_task_progress)],
+    hub: Annotated[TaskEventHub, Depends(get_task_events)],
+) -> StreamingResponse:
+    """Stream a batch ingestion task's progress as Server-Sent Events.
+
+    Events:
+    - ``summary``: current status counts, sent first (and again if events were missed)
+    - ``document``: a document completed, failed or was superseded (a ``JobStatus``)
+    - ``done``: final status counts, sent once every document has finished
+
+    The stream closes after ``done``. Idle streams carry keep-alive comments.
+    """
+    if await progress.get(task_id, limit=0) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task '{task_id}' not found",
+        )
+    return StreamingResponse(
+        _task_events(task_id, progress, hub, get_settings().task_events_keepalive),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
+
+
+async def _task_events(
+    task_id: str, progress: TaskProgressStore, hub: TaskEventHub, keepalive: float
+) -> AsyncIterator[str]:
+    async with hub.watch(task_id) as queue:
+        # Read after subscribing, so no change is missed between the two.
+        summary = await _summary(progress, task_id)
+        if summary is None:
+            return
+        yield _sse("summary", summary)
+        while summary.finished < summary.total:
+            try:
+                event = await asyncio.wait_for(queue.get(), keepalive)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if event is None:
+                summary = await _summary(progress, task_id)
+                if summary is None:
+                    return
+                yield _sse("summary", summary)
+            else:
+                summary = event.summary
+                yield _sse("document", event.job)
+        yield _sse("done", summary)
+
+
+async def _summary(progress: TaskProgressStore, task_id: str) -> TaskSummary | None:
+    task_status = await progress.get(task_id, limit=0)
+    return task_status.summary if task_status is not None else None
+
+
+def _sse(event: str, data: BaseModel) -> str:
+    return f"event: {event}\ndata: {data.model_dump_json()}\n\n"
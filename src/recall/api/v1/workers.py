@@ -0,0 +1,29 @@
+"""Worker observability endpoints."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from redis.asyncio import Redis
+
+from recall.api.v1.dependencies import get_lane_scheduler, get_redis
+from recall.models.task import LaneStats, WorkerPipelineStats
+from recall.services.lanes import LaneScheduler
+from recall.services.pipeline_stats import PipelineStatsStore
+
+router = APIRouter(prefix="/workers", tags=["workers"])
+
+
+@router.get("/pipeline", response_model=list[WorkerPipelineStats])
+async def get_pipeline_stats(
+    redis: Annotated[Redis, Depends(get_redis)],
+) -> list[WorkerPipelineStats]:
+    """Per-stage queue depth and utilization reported by each live worker."""
+    return await PipelineStatsStore(redis).read_all()
+
+
+@router.get("/lanes", response_model=list[LaneStats])
+async def get_lane_stats(
+    scheduler: Annotated[LaneScheduler, Depends(get_lane_scheduler)],
+) -> list[LaneStats]:
+    """Queue depth and queueing delay of each ingestion lane."""
+    return await scheduler.stats()
@@ -0,0 +1,115 @@
+"""Command line tools for operating a Recall deployment."""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+from redis.asyncio import Redis
+
+from recall.config import get_settings
+from recall.core.vectordb.factory import VectorDBFactory
+from recall.models.errors import RecallError
+from recall.services.bulk_loader import BulkLoader, Checkpoint, LoadStats, open_source
+from recall.services.registry import SchemaRegistry
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="recall", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    load = commands.add_parser(
+        "load",
+        help="Bulk load a file or directory straight into a collection",
+        description="Embed and upsert documents directly, without the job queue. "
+        "Progress is checkpointed, so an interrupted load resumes where it stopped.",
+    )
+    load.add_argument("collection", help="Target collection")
+    load.add_argument("path", type=Path, help="JSONL or CSV file, or a directory of images")
+    load.add_argument(
+        "--format",
+        choices=["jsonl", "csv", "images"],
+        help="Source format (default: from the file extension; directories are images)",
+    )
+    load.add_argument("--id-column", default="id", help="CSV column holding document ids")
+    load.add_argument("--content-column", default="content", help="CSV column holding text")
+    load.add_argument("--batch-size", type=int, default=256, help="Documents per embed batch")
+    load.add_argument(
+        "--embed-workers",
+        type=int,
+        default=None,
+        help="Batches embedded at once (default: EMBED_WORKERS, or one per CPU core)",
+    )
+    load.add_argument("--upsert-batch-size", type=int, default=512, help="Points per upsert")
+    load.add_argument("--upsert-concurrency", type=int, default=4, help="Upserts in flight")
+    load.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="Checkpoint file (default: PATH.recall-checkpoint.json)",
+    )
+    load.add_argument("--restart", action="store_true", help="Ignore any saved checkpoint")
+    load.add_argument("--errors", type=Path, default=None, help="Append failed records here")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return asyncio.run(_load(args))
+    except (RecallError, ValueError, OSError) as e:
+        print(f"recall: {getattr(e, 'message', e)}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        print("recall: interrupted; rerun to resume from the checkpoint", file=sys.stderr)
+        return 130
+
+
+async def _load(args: argparse.Namespace) -> int:
+    settings = get_settings()
+    source = open_source(args.path, args.format, args.id_column, args.content_column)
+    checkpoint_path = args.checkpoint or args.path.with_name(
+        f"{args.path.name}.recall-checkpoint.json"
+    )
+    embed_workers = args.embed_workers or settings.embed_workers or os.cpu_count() or 1
+
+    redis = Redis.from_url(settings.redis_url)
+    vectordb = VectorDBFactory.from_settings(settings)
+    errors = args.errors.open("a", encoding="utf-8") if args.errors else None
+    try:
+        loader = BulkLoader(
+            SchemaRegistry(redis),
+            vectordb,
+            batch_size=args.batch_size,
+            embed_workers=embed_workers,
+            upsert_batch_size=args.upsert_batch_size,
+            upsert_concurrency=args.upsert_concurrency,
+            checkpoint=Checkpoint(checkpoint_path),
+            errors=errors,
+            on_progress=_print_progress,
+        )
+        stats = await loader.load(args.collection, source, resume=not args.restart)
+    finally:
+        if errors is not None:
+            errors.close()
+        await vectordb.close()
+        await redis.aclose()
+
+    print(
+        f"Loaded {stats.loaded} documents into {args.collection!r} "
+        f"({stats.failed} failed, {stats.docs_per_second:.1f} docs/s this run)"
+    )
+    return 0
+
+
+def _print_progress(stats: LoadStats) -> None:
+    print(
+        f"{stats.loaded} loaded, {stats.failed} failed, "
+        f"{stats.docs_per_second:.1f} docs/s, {stats.elapsed:.0f}s elapsed",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,72 @@ class Settings(BaseSettings):
     redis_url: str = "redis://localhost:6379"
     qdrant_url: str = "http://localhost:6333"
 
+    vectordb_backend: str = "qdrant"
+    embedded_data_dir: str = "./data/vectordb"
+
+    job_serializer: str = "msgpack"
+    job_compress_min_bytes: int = 1024
+    task_progress_ttl: float = 86400.0
+    task_events_keepalive: float = 15.0
+    doc_versions_ttl: float = 86400.0
+
+    lane_interactive_max_docs: int = 10
+    ingest_collection_weights: dict[str, float] = {}
+    lane_throughput_window: float = 60.0
+    ingest_max_queue_depth: int | None = None
+    ingest_max_drain_seconds: float | None = None
+    ingest_stream_chunk_size: int = 500
+    ingest_stream_max_line_bytes: int = 64 * 1024 * 1024
+    ingest_stream_max_wait: float = 600.0
+
+    filter_cache_size: int = 1024
+    collection_cache_ttl: float = 60.0
+
+    search_exact_max_matches: int = 5000
+    search_hnsw_ef: int = 128
+    search_max_hnsw_ef: int = 1024
+    search_plan_ttl: float = 60.0
+
+    index_advisor_enabled: bool = True
+    index_advisor_interval_minutes: int = 5
+    index_advisor_min_uses: int = 50
+    index_advisor_min_latency_ms: float = 5.0
+    filter_usage_flush_interval: float = 5.0
+
+    blob_store_backend: str = "local"
+    blob_store_path: str = "./data/blobs"
+    blob_store_s3_bucket: str = ""
+    blob_store_s3_prefix: str = "recall/blobs/"
+    blob_store_s3_endpoint_url: str | None = None
+    blob_store_s3_region: str | None = None
+    blob_staging_min_bytes: int = 16 * 1024
+    blob_staging_ttl: float = 7 * 86400.0
+
+    fetch_max_bytes: int = 50 * 1024 * 1024
+    fetch_per_host_limit: int = 8
+    fetch_max_connections: int = 100
+    fetch_timeout: float = 30.0
+    fetch_retries: int = 3
+    fetch_max_retry_after: float = 60.0
+    fetch_http2: bool = True
+    fetch_conditional: bool = True
+    fetch_file_roots: list[str] = []
+    fetch_s3_endpoint_url: str | None = None
+    fetch_s3_region: str | None = None
+    fetch_s3_part_size: int = 8 * 1024 * 1024
+    fetch_s3_part_concurrency: int = 8
+    fetch_validators_ttl: float = 30 * 86400.0
+
+    embed_batch_size: int = 32
+    embed_batch_linger_ms: float = 20.0
+    embed_workers: int = 0
+
+    pipeline_fetch_concurrency: int = 32
+    pipeline_prepare_concurrency: int = 4
+    pipeline_upsert_concurrency: int = 4
+    pipeline_buffer_size: int = 64
+    pipeline_stats_interval: float = 10.0
+
     default_text_model: str = "all-MiniLM-L6-v2"
     default_image_model: str = "clip-ViT-B-32"
 
@@ -0,0 +1,13 @@
+"""Blob store abstractions and implementations."""
+
+from recall.core.blobstore.base import BlobStore
+from recall.core.blobstore.factory import BlobStoreFactory
+from recall.core.blobstore.local import LocalBlobStore
+from recall.core.blobstore.s3 import S3BlobStore
+
+__all__ = [
+    "BlobStore",
+    "BlobStoreFactory",
+    "LocalBlobStore",
+    "S3BlobStore",
+]
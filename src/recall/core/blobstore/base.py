@@ -0,0 +1,61 @@
+"""Base blob store abstract class."""
+
+from abc import ABC, abstractmethod
+
+
+class BlobStore(ABC):
+    """Abstract base class for stores of opaque, immutable blobs by key."""
+
+    @abstractmethod
+    async def put(self, key: str, data: bytes) -> None:
+        """Store a blob, replacing any blob with the same key.
+
+        Args:
+            key: Blob key
+            data: Blob contents
+        """
+        ...
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes:
+        """Read a blob.
+
+        Args:
+            key: Blob key
+
+        Returns:
+            Blob contents
+
+        Raises:
+            BlobNotFoundError: If no blob has this key
+        """
+        ...
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        """Check if a blob exists.
+
+        Args:
+            key: Blob key
+
+        Returns:
+            True if exists
+        """
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """Delete a blob.
+
+        Args:
+            key: Blob key
+
+        Returns:
+            True if deleted, False if not found
+        """
+        ...
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release any connections held by the store."""
+        ...
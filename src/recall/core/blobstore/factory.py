@@ -0,0 +1,43 @@
+"""Factory for creating blob stores."""
+
+from recall.config import Settings
+from recall.core.blobstore.base import BlobStore
+from recall.core.blobstore.local import LocalBlobStore
+from recall.core.blobstore.s3 import S3BlobStore
+
+
+class BlobStoreFactory:
+    """Factory for creating blob store instances."""
+
+    @classmethod
+    def create(cls, backend: str = "local", location: str | None = None, **options) -> BlobStore:
+        """Create a blob store.
+
+        Args:
+            backend: Store backend type ('local' or 's3')
+            location: Root directory for 'local', bucket name for 's3'
+            **options: Backend-specific options (prefix, endpoint_url, region for 's3')
+
+        Returns:
+            Configured BlobStore instance
+        """
+        if backend == "local":
+            return LocalBlobStore(location or "./data/blobs")
+        if backend == "s3":
+            if not location:
+                raise ValueError("The s3 blob store needs a bucket")
+            return S3BlobStore(location, **options)
+        raise ValueError(f"Unsupported blob store backend: {backend}")
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> BlobStore:
+        """Create the store configured by ``BLOB_STORE_BACKEND``."""
+        if settings.blob_store_backend == "s3":
+            return cls.create(
+                "s3",
+                settings.blob_store_s3_bucket,
+                prefix=settings.blob_store_s3_prefix,
+                endpoint_url=settings.blob_store_s3_endpoint_url,
+                region=settings.blob_store_s3_region,
+            )
+        return cls.create(settings.blob_store_backend, settings.blob_store_path)
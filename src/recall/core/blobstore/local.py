@@ -0,0 +1,59 @@
+"""Blob store on the local filesystem."""
+
+import asyncio
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+
+from recall.core.blobstore.base import BlobStore
+from recall.models.errors import BlobNotFoundError
+
+
+class LocalBlobStore(BlobStore):
+    """Stores each blob as a file under ``root``, fanned out by key prefix.
+
+    Writes go to a temporary file that is renamed into place, so readers
+    never see a partial blob. File I/O runs in a thread.
+    """
+
+    def __init__(self, root: str | Path = "./data/blobs"):
+        self._root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self._root / key[:2] / key
+
+    async def put(self, key: str, data: bytes) -> None:
+        await asyncio.to_thread(self._write, self._path(key), data)
+
+    async def get(self, key: str) -> bytes:
+        try:
+            return await asyncio.to_thread(self._path(key).read_bytes)
+        except FileNotFoundError as e:
+            raise BlobNotFoundError(key) from e
+
+    async def exists(self, key: str) -> bool:
+        return await asyncio.to_thread(self._path(key).is_file)
+
+    async def delete(self, key: str) -> bool:
+        try:
+            await asyncio.to_thread(self._path(key).unlink)
+        except FileNotFoundError:
+            return False
+        return True
+
+    async def close(self) -> None:
+        pass
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp)
+            raise
@@ -0,0 +1,74 @@
+"""Blob store on S3 or an S3-compatible object store."""
+
+import asyncio
+from typing import Any
+
+from recall.core.blobstore.base import BlobStore
+from recall.models.errors import BlobNotFoundError
+
+
+class S3BlobStore(BlobStore):
+    """Stores each blob as an object under ``prefix`` in ``bucket``.
+
+    Uses one boto3 client (thread-safe, with its own connection pool) and
+    runs its blocking calls in threads. Requires the ``s3`` extra.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "recall/blobs/",
+        endpoint_url: str | None = None,
+        region: str | None = None,
+        client: Any = None,
+    ):
+        if client is None:
+            try:
+                import boto3
+            except ImportError as e:
+                raise ImportError(
+                    "The S3 blob store requires boto3: pip install 'recall[s3]'"
+                ) from e
+            client = boto3.client("s3", endpoint_url=endpoint_url, region_name=region)
+        self._client = client
+        self._bucket = bucket
+        self._prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}{key}"
+
+    async def put(self, key: str, data: bytes) -> None:
+        await asyncio.to_thread(
+            self._client.put_object, Bucket=self._bucket, Key=self._key(key), Body=data
+        )
+
+    async def get(self, key: str) -> bytes:
+        try:
+            response = await asyncio.to_thread(
+                self._client.get_object, Bucket=self._bucket, Key=self._key(key)
+            )
+        except self._client.exceptions.NoSuchKey as e:
+            raise BlobNotFoundError(key) from e
+        return await asyncio.to_thread(response["Body"].read)
+
+    async def exists(self, key: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            await asyncio.to_thread(
+                self._client.head_object, Bucket=self._bucket, Key=self._key(key)
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+        return True
+
+    async def delete(self, key: str) -> bool:
+        if not await self.exists(key):
+            return False
+        await asyncio.to_thread(self._client.delete_object, Bucket=self._bucket, Key=self._key(key))
+        return True
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._client.close)
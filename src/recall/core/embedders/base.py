@@ -1,6 +1,7 @@
 """Base embedder abstract class (Strategy Pattern)."""
 
 from abc import ABC, abstractmethod
+from typing import Any
 
 
 class BaseEmbedder(ABC):
@@ -30,6 +31,20 @@ class BaseEmbedder(ABC):
         """
         ...
 
+    def prepare(self, content: bytes | str) -> Any:
+        """Decode raw content into the model's input form.
+
+        ``embed`` and ``embed_batch`` accept either raw content or the result
+        of this method, so decoding can run separately from inference.
+
+        Args:
+            content: Raw bytes or string
+
+        Returns:
+            Model input (the content itself by default)
+        """
+        return content
+
     @property
     @abstractmethod
     def dimensions(self) -> int:
@@ -2,6 +2,7 @@
 
 import io
 from functools import cached_property
+from typing import Any
 
 from sentence_transformers import SentenceTransformer
 
@@ -26,19 +27,33 @@ class CLIPEmbedder(BaseEmbedder):
     def _model(self):
         return SentenceTransformer(self._model_name)
 
-    def embed(self, content: bytes | str) -> list[float]:
+    def _open(self, content: Any) -> Any:
         from PIL import Image
 
+        if isinstance(content, Image.Image):
+            return content
+        if isinstance(content, str):
+            if content.startswith(("http://", "https://", "s3://")):
+                raise EmbeddingError(
+                    "CLIPEmbedder received URI, content must be downloaded first",
+                    self._model_name,
+                )
+            content = content.encode("utf-8")
+        return Image.open(io.BytesIO(content))
+
+    def prepare(self, content: bytes | str) -> Any:
+        try:
+            img = self._open(content)
+            img.load()
+            return img
+        except EmbeddingError:
+            raise
+        except Exception as e:
+            raise EmbeddingError(str(e), self._model_name) from e
+
+    def embed(self, content: bytes | str) -> list[float]:
         try:
-            if isinstance(content, str):
-                if content.startswith(("http://", "https://", "s3://")):
-                    raise EmbeddingError(
-                        "CLIPEmbedder received URI, content must be downloaded first",
-                        self._model_name,
-                    )
-                content = content.encode("utf-8")
-
-            img = Image.open(io.BytesIO(content))
+            img = self._open(content)
             embedding = self._model.encode(img, convert_to_numpy=True)
             return embedding.tolist()
         except EmbeddingError:
@@ -47,13 +62,7 @@ class CLIPEmbedder(BaseEmbedder):
             raise EmbeddingError(str(e), self._model_name) from e
 
     def embed_batch(self, contents: list[bytes | str]) -> list[list[float]]:
-        from PIL import Image
-
-        images = []
-        for content in contents:
-            if isinstance(content, str):
-                content = content.encode("utf-8")
-            images.append(Image.open(io.BytesIO(content)))
+        images = [self._open(content) for content in contents]
 
         try:
             embeddings = self._model.encode(images, convert_to_numpy=True)
@@ -26,15 +26,19 @@ class TextEmbedder(BaseEmbedder):
     def _model(self):
         return SentenceTransformer(self._model_name)
 
-    def embed(self, content: bytes | str) -> list[float]:
-        if isinstance(content, bytes):
-            content = content.decode("utf-8")
+    def prepare(self, content: bytes | str) -> str:
+        if isinstance(content, (bytes, memoryview)):
+            content = str(content, "utf-8")
 
         if not isinstance(content, str):
             raise EmbeddingError(
                 f"TextEmbedder expects string content, got {type(content).__name__}",
                 self._model_name,
             )
+        return content
+
+    def embed(self, content: bytes | str) -> list[float]:
+        content = self.prepare(content)
 
         try:
             embedding = self._model.encode(content, convert_to_numpy=True)
@@ -45,8 +49,8 @@ class TextEmbedder(BaseEmbedder):
     def embed_batch(self, contents: list[bytes | str]) -> list[list[float]]:
         texts = []
         for content in contents:
-            if isinstance(content, bytes):
-                content = content.decode("utf-8")
+            if isinstance(content, (bytes, memoryview)):
+                content = str(content, "utf-8")
             texts.append(content)
 
         try:
@@ -0,0 +1,74 @@
+"""Batched arq job enqueueing."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from arq import ArqRedis
+from arq.constants import job_key_prefix
+from arq.jobs import serialize_job
+from arq.utils import timestamp_ms
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """One arq job to enqueue: function name, job id and keyword arguments.
+
+    ``score`` orders the job in its queue and defaults to the enqueue time;
+    arq runs jobs in score order once their score is due.
+    """
+
+    function: str
+    job_id: str
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    score: float | None = None
+
+
+async def enqueue_jobs(
+    redis: ArqRedis,
+    jobs: Sequence[JobSpec],
+    queue_name: str | None = None,
+) -> list[str]:
+    """Enqueue many arq jobs in a single Redis round trip.
+
+    Writes the same job records and queue entries as ``ArqRedis.enqueue_job``,
+    but for the whole batch in one ``MULTI`` pipeline, so workers see either
+    all of the batch or none of it. Unlike ``enqueue_job`` there is no
+    per-job existence check; callers must use job ids that are not already
+    queued (e.g. prefixed with a fresh batch id). Repeated ids within the
+    batch keep their first occurrence.
+
+    Args:
+        redis: Arq Redis connection
+        jobs: Jobs to enqueue
+        queue_name: Target queue (defaults to the connection's default queue)
+
+    Returns:
+        Ids of the jobs enqueued, in order
+    """
+    queue_name = queue_name or redis.default_queue_name
+    first: dict[str, JobSpec] = {}
+    for job in jobs:
+        first.setdefault(job.job_id, job)
+    unique = list(first.values())
+    if not unique:
+        return []
+
+    enqueue_time_ms = timestamp_ms()
+    pipe = redis.pipeline(transaction=True)
+    for job in unique:
+        data = serialize_job(
+            job.function,
+            (),
+            job.kwargs,
+            None,
+            enqueue_time_ms,
+            serializer=redis.job_serializer,
+        )
+        pipe.psetex(job_key_prefix + job.job_id, redis.expires_extra_ms, data)
+    pipe.zadd(
+        queue_name,
+        {job.job_id: enqueue_time_ms if job.score is None else job.score for job in unique},
+    )
+    await pipe.execute()
+    return [job.job_id for job in unique]
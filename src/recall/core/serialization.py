@@ -0,0 +1,110 @@
+"""Compact serialization of arq jobs and results: msgpack with optional zstd."""
+
+import pickle
+from enum import Enum
+from typing import Any
+
+import msgpack
+import zstandard
+
+from recall.config import Settings
+
+# 0xc1 is never used by msgpack and is not a pickle opcode, so data written
+# by this serializer cannot be confused with pickled jobs already queued.
+MAGIC = b"\xc1R"
+PLAIN = 0
+ZSTD = 1
+
+EXT_TUPLE = 1
+EXT_EXCEPTION = 2
+
+
+class RemoteJobError(Exception):
+    """A job's exception, as read back from a serialized result.
+
+    Exceptions are stored by type name and message rather than pickled, so
+    readers need not import the job's exception classes.
+    """
+
+    def __init__(self, type_name: str, message: str):
+        super().__init__(message)
+        self.type_name = type_name
+
+
+class JobSerializer:
+    """msgpack job serializer for arq, compressing large jobs with zstd.
+
+    Use :meth:`dumps` and :meth:`loads` as arq's ``job_serializer`` and
+    ``job_deserializer``. Output starts with :data:`MAGIC` and a flag byte
+    saying whether the body is zstd-compressed; bodies of at least
+    ``compress_min_bytes`` are compressed (0 disables compression).
+    :meth:`loads` falls back to pickle for data without the magic prefix,
+    so jobs and results written by the default serializer stay readable.
+
+    Tuples round-trip as tuples (arq's job args) and exceptions as
+    :class:`RemoteJobError`. ``str``/``int`` subclasses such as string
+    enums are stored as their plain value.
+    """
+
+    def __init__(self, compress_min_bytes: int = 1024, level: int = 3):
+        self._compress_min_bytes = compress_min_bytes
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def dumps(self, obj: Any) -> bytes:
+        body = _pack(obj)
+        if self._compress_min_bytes and len(body) >= self._compress_min_bytes:
+            return MAGIC + bytes([ZSTD]) + self._compressor.compress(body)
+        return MAGIC + bytes([PLAIN]) + body
+
+    def loads(self, data: bytes) -> Any:
+        if not data.startswith(MAGIC):
+            return pickle.loads(data)
+        flag, body = data[len(MAGIC)], data[len(MAGIC) + 1 :]
+        if flag == ZSTD:
+            body = self._decompressor.decompress(body)
+        return _unpack(body)
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, tuple):
+        return msgpack.ExtType(EXT_TUPLE, _pack(list(obj)))
+    if isinstance(obj, BaseException):
+        return msgpack.ExtType(EXT_EXCEPTION, _pack([type(obj).__name__, str(obj)]))
+    # With strict_types, subclasses of built-in types (e.g. enums) land here.
+    if isinstance(obj, Enum):
+        return obj.value
+    for base in (int, float, str, bytes, list, dict):
+        if isinstance(obj, base):
+            return base(obj)
+    raise TypeError(f"Cannot serialize {type(obj).__name__} in a job")
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == EXT_TUPLE:
+        return tuple(_unpack(data))
+    if code == EXT_EXCEPTION:
+        return RemoteJobError(*_unpack(data))
+    return msgpack.ExtType(code, data)
+
+
+def _pack(obj: Any) -> bytes:
+    return msgpack.packb(obj, default=_default, strict_types=True, use_bin_type=True)
+
+
+def _unpack(data: bytes) -> Any:
+    return msgpack.unpackb(data, ext_hook=_ext_hook, raw=False, strict_map_key=False)
+
+
+def job_serializer_options(settings: Settings) -> dict[str, Any]:
+    """``job_serializer``/``job_deserializer`` arguments for arq pools and workers.
+
+    The deserializer always reads both formats, so switching
+    ``JOB_SERIALIZER`` either way leaves queued jobs readable.
+    """
+    serializer = JobSerializer(compress_min_bytes=settings.job_compress_min_bytes)
+    if settings.job_serializer == "pickle":
+        return {"job_serializer": pickle.dumps, "job_deserializer": serializer.loads}
+    if settings.job_serializer == "msgpack":
+        return {"job_serializer": serializer.dumps, "job_deserializer": serializer.loads}
+    raise ValueError(f"Unsupported job serializer: {settings.job_serializer}")
@@ -1,5 +1,13 @@
 """Filter DSL transpiler for vector databases."""
 
+from recall.core.transpiler.cache import CompiledFilter, FilterCache, get_filter_cache
+from recall.core.transpiler.optimizer import FilterOptimizer
 from recall.core.transpiler.qdrant import QdrantTranspiler
 
-__all__ = ["QdrantTranspiler"]
+__all__ = [
+    "CompiledFilter",
+    "FilterCache",
+    "FilterOptimizer",
+    "QdrantTranspiler",
+    "get_filter_cache",
+]
@@ -0,0 +1,205 @@
+"""Bounded compile cache for filter DSL transpilation."""
+
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Any
+
+from pydantic import TypeAdapter
+from qdrant_client.models import Filter
+
+from recall.config import get_settings
+from recall.core.transpiler.optimizer import FilterOptimizer, OptimizedFilter
+from recall.core.transpiler.qdrant import QdrantTranspiler
+from recall.models.collection import FieldType
+from recall.models.search import FilterCondition
+
+_FILTER_ADAPTER: TypeAdapter[FilterCondition] = TypeAdapter(FilterCondition)
+
+
+def filter_key(raw: Mapping[str, Any]) -> str:
+    """Hash the canonical JSON form of a filter.
+
+    Keys are sorted and whitespace stripped, so the same filter sent with a
+    different key order maps to the same cache entry.
+
+    Args:
+        raw: Filter DSL as decoded JSON
+
+    Returns:
+        Hex digest identifying the filter
+    """
+    canonical = json.dumps(raw, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+def _scoped_key(key: str, scalar_fields: frozenset[str]) -> str:
+    return f"{key}|{','.join(sorted(scalar_fields))}" if scalar_fields else key
+
+
+@dataclass(frozen=True)
+class CompiledFilter:
+    """A parsed filter together with its optimized and transpiled forms."""
+
+    key: str
+    dsl: FilterCondition
+    optimized: OptimizedFilter | None
+    filter: Filter | None
+    scalar_fields: frozenset[str] = frozenset()
+
+    @property
+    def matches_nothing(self) -> bool:
+        return self.optimized is not None and self.optimized.op == "NEVER"
+
+    @cached_property
+    def fields(self) -> dict[str, frozenset[FieldType]]:
+        """Payload fields the filter references, with the index types its values imply."""
+        found: dict[str, set[FieldType]] = {}
+        stack: list[Any] = [self.dsl]
+        while stack:
+            node = stack.pop()
+            if node.op in ("AND", "OR"):
+                stack.extend(node.conditions)
+                continue
+            values = node.value if node.op == "IN" else [node.value]
+            found.setdefault(node.field, set()).update(_value_type(v) for v in values)
+        return {name: frozenset(types) for name, types in found.items()}
+
+
+def _value_type(value: Any) -> FieldType:
+    if isinstance(value, bool):
+        return FieldType.BOOL
+    if isinstance(value, int):
+        return FieldType.INT
+    if isinstance(value, float):
+        return FieldType.FLOAT
+    return FieldType.KEYWORD
+
+
+class FilterCache:
+    """LRU cache of compiled filters keyed by canonical filter JSON.
+
+    A hit skips both the discriminated-union parsing of the DSL and the
+    transpilation. Parsed DSL objects handed out by :meth:`parse` are shared
+    between requests and must be treated as immutable. A filter compiled for
+    different sets of scalar fields is cached once per set, since the
+    optimizer rewrites more of it when it knows which fields hold one value.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, CompiledFilter] = OrderedDict()
+        self._keys_by_dsl: dict[tuple[int, frozenset[str]], str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def parse(
+        self,
+        raw: Mapping[str, Any],
+        validate: Callable[[Any], FilterCondition] | None = None,
+    ) -> FilterCondition:
+        """Return the parsed DSL for raw filter JSON, parsing only on a miss.
+
+        Args:
+            raw: Filter DSL as decoded JSON
+            validate: Validator to use on a miss (defaults to the DSL type adapter)
+
+        Returns:
+            Parsed filter condition
+        """
+        return self._entry_for_raw(raw, validate).dsl
+
+    def compile(
+        self,
+        dsl: FilterCondition | Mapping[str, Any] | None,
+        scalar_fields: Collection[str] = frozenset(),
+    ) -> CompiledFilter | None:
+        """Return the compiled form of a filter.
+
+        Args:
+            dsl: Parsed filter (ideally one returned by :meth:`parse`) or raw filter JSON
+            scalar_fields: Fields known to hold one value per point, such as the
+                collection's ``index_schema`` fields
+
+        Returns:
+            Compiled filter, or None when no filter was given
+        """
+        if dsl is None:
+            return None
+        scalar_fields = frozenset(scalar_fields)
+        if isinstance(dsl, Mapping):
+            return self._entry_for_raw(dsl, scalar_fields=scalar_fields)
+
+        key = self._keys_by_dsl.get((id(dsl), scalar_fields))
+        entry = self._entries.get(key) if key else None
+        if entry is not None and entry.dsl is dsl:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        key = _scoped_key(filter_key(dsl.model_dump(mode="json")), scalar_fields)
+        return self._lookup(key) or self._store(key, dsl, scalar_fields)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_dsl.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_for_raw(
+        self,
+        raw: Mapping[str, Any],
+        validate: Callable[[Any], FilterCondition] | None = None,
+        scalar_fields: frozenset[str] = frozenset(),
+    ) -> CompiledFilter:
+        key = _scoped_key(filter_key(raw), scalar_fields)
+        entry = self._lookup(key)
+        if entry is None:
+            dsl = (validate or _FILTER_ADAPTER.validate_python)(raw)
+            entry = self._store(key, dsl, scalar_fields)
+        return entry
+
+    def _lookup(self, key: str) -> CompiledFilter | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def _store(
+        self,
+        key: str,
+        dsl: FilterCondition,
+        scalar_fields: frozenset[str] = frozenset(),
+    ) -> CompiledFilter:
+        self.misses += 1
+        optimized = FilterOptimizer.optimize(dsl, scalar_fields)
+        entry = CompiledFilter(
+            key=key,
+            dsl=dsl,
+            optimized=optimized,
+            filter=QdrantTranspiler.transpile(optimized),
+            scalar_fields=scalar_fields,
+        )
+        self._entries[key] = entry
+        self._keys_by_dsl[(id(dsl), scalar_fields)] = key
+
+        while len(self._entries) > self._maxsize:
+            _, evicted = self._entries.popitem(last=False)
+            dsl_key = (id(evicted.dsl), evicted.scalar_fields)
+            if self._keys_by_dsl.get(dsl_key) == evicted.key:
+                del self._keys_by_dsl[dsl_key]
+        return entry
+
+
+@lru_cache
+def get_filter_cache() -> FilterCache:
+    """Get the process-wide filter compile cache."""
+    return FilterCache(maxsize=get_settings().filter_cache_size)
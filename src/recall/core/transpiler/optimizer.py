@@ -0,0 +1,338 @@
+"""Rewriting pass that shrinks filter DSL trees before transpilation."""
+
+import json
+from collections.abc import Collection, Iterable
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from recall.models.search import (
+    AndFilter,
+    EqCondition,
+    FilterCondition,
+    InCondition,
+    OrFilter,
+)
+
+RANGE_OPS = {"LT", "LTE", "GT", "GTE", "RANGE"}
+
+
+class RangeCondition(BaseModel):
+    """Internal node: several range bounds on one field merged into a single range."""
+
+    op: Literal["RANGE"] = "RANGE"
+    field: str
+    gt: int | float | None = None
+    gte: int | float | None = None
+    lt: int | float | None = None
+    lte: int | float | None = None
+
+
+class NeverCondition(BaseModel):
+    """Internal node: a filter that no point can satisfy."""
+
+    op: Literal["NEVER"] = "NEVER"
+
+
+OptimizedFilter = FilterCondition | RangeCondition | NeverCondition
+
+
+def _kind(value: Any) -> str:
+    """Payload type class of a value; Qdrant never matches across these."""
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int | float):
+        return "number"
+    return "str"
+
+
+def _typed(value: Any) -> tuple[str, Any]:
+    return _kind(value), value
+
+
+def _foldable_kind(values: list[Any]) -> str | None:
+    """Kind of a value list that Qdrant's MatchAny accepts (all strings or all ints)."""
+    if all(isinstance(v, str) for v in values):
+        return "str"
+    if all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+        return "int"
+    return None
+
+
+def _node_data(node: Any) -> Any:
+    if node.op in ("AND", "OR"):
+        return {"op": node.op, "conditions": [_node_data(c) for c in node.conditions]}
+    return {name: getattr(node, name) for name in type(node).model_fields}
+
+
+def _node_key(node: BaseModel) -> str:
+    return json.dumps(_node_data(node), sort_keys=True)
+
+
+def _dedupe(nodes: Iterable[BaseModel]) -> list[Any]:
+    seen: set[str] = set()
+    unique = []
+    for node in nodes:
+        key = _node_key(node)
+        if key not in seen:
+            seen.add(key)
+            unique.append(node)
+    return unique
+
+
+class _Bounds:
+    """Tightest lower/upper bound seen for one field."""
+
+    def __init__(self) -> None:
+        self.lower: tuple[float, bool] | None = None  # (value, inclusive)
+        self.upper: tuple[float, bool] | None = None
+        self.sources: list[Any] = []
+
+    def add(self, node: Any) -> None:
+        self.sources.append(node)
+        if node.op == "RANGE":
+            for op in ("gt", "gte", "lt", "lte"):
+                value = getattr(node, op)
+                if value is not None:
+                    self._add_bound(op.upper(), value)
+        else:
+            self._add_bound(node.op, node.value)
+
+    def _add_bound(self, op: str, value: float) -> None:
+        if op in ("GT", "GTE"):
+            bound = (value, op == "GTE")
+            if self.lower is None or (value, not bound[1]) > (self.lower[0], not self.lower[1]):
+                self.lower = bound
+        else:
+            bound = (value, op == "LTE")
+            if self.upper is None or (value, bound[1]) < (self.upper[0], self.upper[1]):
+                self.upper = bound
+
+    def is_empty(self) -> bool:
+        if self.lower is None or self.upper is None:
+            return False
+        (lo, lo_inc), (hi, hi_inc) = self.lower, self.upper
+        return lo > hi or (lo == hi and not (lo_inc and hi_inc))
+
+    def contains(self, value: float) -> bool:
+        if self.lower is not None:
+            lo, inclusive = self.lower
+            if value < lo or (value == lo and not inclusive):
+                return False
+        if self.upper is not None:
+            hi, inclusive = self.upper
+            if value > hi or (value == hi and not inclusive):
+                return False
+        return True
+
+    def to_node(self, field: str) -> Any:
+        if len(self.sources) == 1:
+            return self.sources[0]
+        bounds: dict[str, Any] = {}
+        if self.lower is not None:
+            bounds["gte" if self.lower[1] else "gt"] = self.lower[0]
+        if self.upper is not None:
+            bounds["lte" if self.upper[1] else "lt"] = self.upper[0]
+        return RangeCondition.model_construct(field=field, **bounds)
+
+
+class FilterOptimizer:
+    """Rewrites a DSL tree into the smallest equivalent tree.
+
+    The pass flattens nested AND/OR nodes, drops duplicate clauses, folds
+    OR-ed equalities on one field into an ``IN``, and short-circuits
+    contradictions. Rewrites that rely on a field holding a single value
+    (merging range bounds, intersecting ``IN`` lists, conflicting equalities,
+    dropping conditions an equality implies) apply only to ``scalar_fields``:
+    a list-valued field matches a condition when any of its elements does, so
+    ``tags = a AND tags = b`` is satisfiable.
+
+    ``optimize`` returns ``None`` when the filter matches every point, and a
+    :class:`NeverCondition` when it can match none.
+    """
+
+    @classmethod
+    def optimize(
+        cls,
+        dsl: FilterCondition | None,
+        scalar_fields: Collection[str] = frozenset(),
+    ) -> OptimizedFilter | None:
+        """Optimize a DSL filter.
+
+        Args:
+            dsl: Recall DSL filter condition
+            scalar_fields: Fields known to hold one value per point, such as the
+                collection's ``index_schema`` fields
+
+        Returns:
+            Equivalent, simplified filter, or None if it matches everything
+        """
+        if dsl is None:
+            return None
+        return cls._rewrite(dsl, scalar_fields)
+
+    @classmethod
+    def _rewrite(cls, node: Any, scalar_fields: Collection[str]) -> Any:
+        match node.op:
+            case "AND":
+                return cls._rewrite_and(node, scalar_fields)
+            case "OR":
+                return cls._rewrite_or(node, scalar_fields)
+            case "IN":
+                return cls._rewrite_in(node.field, node.value)
+            case _:
+                return node
+
+    @classmethod
+    def _rewrite_in(cls, field: str, values: list[Any]) -> Any:
+        unique = list(dict.fromkeys(_typed(v) for v in values))
+        if not unique:
+            return NeverCondition()
+        if len(unique) == 1:
+            return EqCondition.model_construct(field=field, value=unique[0][1])
+        return InCondition.model_construct(field=field, value=[v for _, v in unique])
+
+    @classmethod
+    def _rewrite_and(cls, node: AndFilter, scalar_fields: Collection[str]) -> Any:
+        children: list[Any] = []
+        for child in (cls._rewrite(c, scalar_fields) for c in node.conditions):
+            if child is None:
+                continue
+            if child.op == "NEVER":
+                return child
+            children.extend(child.conditions if child.op == "AND" else [child])
+
+        children = cls._merge_and(_dedupe(children), scalar_fields)
+        if any(c.op == "NEVER" for c in children):
+            return NeverCondition()
+        if not children:
+            return None
+        if len(children) == 1:
+            return children[0]
+        return AndFilter.model_construct(conditions=children)
+
+    @classmethod
+    def _merge_and(cls, children: list[Any], scalar_fields: Collection[str]) -> list[Any]:
+        bounds: dict[str, _Bounds] = {}
+        eqs: dict[str, set[tuple[str, Any]]] = {}
+        ins: dict[str, list[InCondition]] = {}
+        neqs: dict[str, set[tuple[str, Any]]] = {}
+        others: list[Any] = []
+        order: list[tuple[str, str]] = []
+
+        for child in children:
+            if getattr(child, "field", None) not in scalar_fields:
+                # Conditions on a list-valued field may each match a different element.
+                others.append(child)
+                order.append(("other", str(len(others) - 1)))
+            elif child.op in RANGE_OPS:
+                if child.field not in bounds:
+                    bounds[child.field] = _Bounds()
+                    order.append(("range", child.field))
+                bounds[child.field].add(child)
+            elif child.op == "EQ":
+                if child.field not in eqs:
+                    eqs[child.field] = set()
+                    order.append(("eq", child.field))
+                eqs[child.field].add(_typed(child.value))
+            elif child.op == "IN":
+                if child.field not in ins:
+                    ins[child.field] = []
+                    order.append(("in", child.field))
+                ins[child.field].append(child)
+            else:
+                if child.op == "NEQ":
+                    neqs.setdefault(child.field, set()).add(_typed(child.value))
+                others.append(child)
+                order.append(("other", str(len(others) - 1)))
+
+        never = [NeverCondition()]
+        pinned: dict[str, tuple[str, Any]] = {}
+        for field, values in eqs.items():
+            if len(values) > 1 or values & neqs.get(field, set()):
+                return never
+            pinned[field] = next(iter(values))
+
+        for field, in_nodes in ins.items():
+            allowed = [_typed(v) for v in in_nodes[0].value]
+            for other in in_nodes[1:]:
+                other_values = {_typed(v) for v in other.value}
+                allowed = [v for v in allowed if v in other_values]
+            if field in pinned:
+                if pinned[field] not in allowed:
+                    return never
+                ins[field] = []
+            else:
+                ins[field] = [cls._rewrite_in(field, [v for _, v in allowed])]
+
+        for field, rng in bounds.items():
+            if rng.is_empty():
+                return never
+            pinned_value = pinned.get(field)
+            if pinned_value is not None and pinned_value[0] == "number":
+                if not rng.contains(pinned_value[1]):
+                    return never
+                bounds[field] = None  # implied by the equality
+
+        merged: list[Any] = []
+        for kind, ref in order:
+            if kind == "range" and bounds[ref] is not None:
+                merged.append(bounds[ref].to_node(ref))
+            elif kind == "eq":
+                merged.append(EqCondition.model_construct(field=ref, value=pinned[ref][1]))
+            elif kind == "in":
+                merged.extend(ins[ref])
+            elif kind == "other":
+                child = others[int(ref)]
+                # A pinned field makes "not equal to something else" redundant.
+                if child.op == "NEQ" and child.field in pinned:
+                    continue
+                merged.append(child)
+        return merged
+
+    @classmethod
+    def _rewrite_or(cls, node: OrFilter, scalar_fields: Collection[str]) -> Any:
+        if not node.conditions:
+            return node
+
+        children: list[Any] = []
+        for child in (cls._rewrite(c, scalar_fields) for c in node.conditions):
+            if child is None:
+                return None
+            if child.op == "NEVER":
+                continue
+            children.extend(child.conditions if child.op == "OR" else [child])
+
+        children = _dedupe(children)
+        eq_values = {(c.field, _typed(c.value)) for c in children if c.op == "EQ"}
+        if any((c.field, _typed(c.value)) in eq_values for c in children if c.op == "NEQ"):
+            return None
+
+        children = cls._merge_or(children)
+        if not children:
+            return NeverCondition()
+        if len(children) == 1:
+            return children[0]
+        return OrFilter.model_construct(conditions=children)
+
+    @classmethod
+    def _merge_or(cls, children: list[Any]) -> list[Any]:
+        groups: dict[tuple[str, str], list[Any]] = {}
+        merged: list[Any] = []
+        for child in children:
+            if child.op in ("EQ", "IN"):
+                values = [child.value] if child.op == "EQ" else list(child.value)
+                kind = _foldable_kind(values)
+                if kind is not None:
+                    key = (child.field, kind)
+                    if key not in groups:
+                        groups[key] = []
+                        merged.append(key)
+                    groups[key].extend(values)
+                    continue
+            merged.append(child)
+
+        return [
+            cls._rewrite_in(item[0], groups[item]) if isinstance(item, tuple) else item
+            for item in merged
+        ]
@@ -5,15 +5,16 @@ from itertools import chain
 from qdrant_client.models import (
     FieldCondition,
     Filter,
+    HasIdCondition,
     MatchAny,
     MatchValue,
     Range,
 )
 
+from recall.core.transpiler.optimizer import NeverCondition, OptimizedFilter, RangeCondition
 from recall.models.search import (
     AndFilter,
     EqCondition,
-    FilterCondition,
     GtCondition,
     GteCondition,
     InCondition,
@@ -28,11 +29,11 @@ class QdrantTranspiler:
     """Transpiles Recall DSL filters to Qdrant Filter objects."""
 
     @classmethod
-    def transpile(cls, dsl: FilterCondition | None) -> Filter | None:
+    def transpile(cls, dsl: OptimizedFilter | None) -> Filter | None:
         """Convert DSL filter to Qdrant Filter.
 
         Args:
-            dsl: Recall DSL filter condition
+            dsl: Recall DSL filter condition, optionally rewritten by FilterOptimizer
 
         Returns:
             Qdrant Filter object or None
@@ -42,7 +43,7 @@ class QdrantTranspiler:
         return cls._transpile_condition(dsl)
 
     @classmethod
-    def _transpile_condition(cls, condition: FilterCondition) -> Filter:
+    def _transpile_condition(cls, condition: OptimizedFilter) -> Filter:
         match condition.op:
             case "EQ":
                 return cls._transpile_eq(condition)
@@ -62,6 +63,10 @@ class QdrantTranspiler:
                 return cls._transpile_and(condition)
             case "OR":
                 return cls._transpile_or(condition)
+            case "RANGE":
+                return cls._transpile_range(condition)
+            case "NEVER":
+                return cls._transpile_never(condition)
             case _:
                 raise ValueError(f"Unknown operation: {condition.op}")
 
@@ -142,11 +147,34 @@ class QdrantTranspiler:
             ]
         )
 
+    @classmethod
+    def _transpile_range(cls, condition: RangeCondition) -> Filter:
+        return Filter(
+            must=[
+                FieldCondition(
+                    key=condition.field,
+                    range=Range(
+                        gt=condition.gt,
+                        gte=condition.gte,
+                        lt=condition.lt,
+                        lte=condition.lte,
+                    ),
+                )
+            ]
+        )
+
+    @classmethod
+    def _transpile_never(cls, condition: NeverCondition) -> Filter:
+        # No point id is in the empty set, so this matches nothing.
+        return Filter(must=[HasIdCondition(has_id=[])])
+
     @classmethod
     def _transpile_and(cls, condition: AndFilter) -> Filter:
         sub_filters = [cls._transpile_condition(sub) for sub in condition.conditions]
         must_conditions = list(chain.from_iterable(f.must or [] for f in sub_filters))
         must_not_conditions = list(chain.from_iterable(f.must_not or [] for f in sub_filters))
+        # A nested OR only has `should`; keep it as a sub-filter rather than dropping it.
+        must_conditions.extend(Filter(should=f.should) for f in sub_filters if f.should)
 
         return Filter(
             must=must_conditions or None,
@@ -155,9 +183,17 @@ class QdrantTranspiler:
 
     @classmethod
     def _transpile_or(cls, condition: OrFilter) -> Filter:
-        should_filters: list[Filter] = []
+        should: list[Filter | FieldCondition] = []
 
         for sub in condition.conditions:
-            should_filters.append(cls._transpile_condition(sub))
-
-        return Filter(should=should_filters)
+            sub_filter = cls._transpile_condition(sub)
+            if (
+                sub_filter.must
+                and len(sub_filter.must) == 1
+                and not (sub_filter.should or sub_filter.must_not)
+            ):
+                should.append(sub_filter.must[0])
+            else:
+                should.append(sub_filter)
+
+        return Filter(should=should)
@@ -1,7 +1,15 @@
 """Vector database abstractions and implementations."""
 
 from recall.core.vectordb.base import Point, SearchResult, VectorDBClient
+from recall.core.vectordb.embedded import EmbeddedAdapter
 from recall.core.vectordb.factory import VectorDBFactory
 from recall.core.vectordb.qdrant import QdrantAdapter
 
-__all__ = ["Point", "QdrantAdapter", "SearchResult", "VectorDBClient", "VectorDBFactory"]
+__all__ = [
+    "EmbeddedAdapter",
+    "Point",
+    "QdrantAdapter",
+    "SearchResult",
+    "VectorDBClient",
+    "VectorDBFactory",
+]
@@ -43,6 +43,17 @@ class VectorDBClient(ABC):
         """
         ...
 
+    @abstractmethod
+    async def create_payload_index(self, collection: str, field: str, field_type: str) -> None:
+        """Index a payload field so filters on it avoid full payload scans.
+
+        Args:
+            collection: Collection name
+            field: Payload field name
+            field_type: Index type (a FieldType value)
+        """
+        ...
+
     @abstractmethod
     async def delete_collection(self, name: str) -> bool:
         """Delete a collection.
@@ -80,6 +91,25 @@ class VectorDBClient(ABC):
         """
         ...
 
+    @abstractmethod
+    async def set_payload(
+        self,
+        collection: str,
+        payloads: dict[str, dict[str, Any]],
+        overwrite: bool = False,
+    ) -> list[str]:
+        """Update the payloads of existing points without touching their vectors.
+
+        Args:
+            collection: Collection name
+            payloads: Payload per point id
+            overwrite: Replace each point's payload instead of merging into it
+
+        Returns:
+            Ids of the points updated; ids of missing points are skipped
+        """
+        ...
+
     @abstractmethod
     async def search(
         self,
@@ -89,6 +119,8 @@ class VectorDBClient(ABC):
         limit: int = 10,
         with_payload: bool = True,
         with_vectors: bool = False,
+        exact: bool = False,
+        hnsw_ef: int | None = None,
     ) -> list[SearchResult]:
         """Search for similar vectors.
 
@@ -99,6 +131,8 @@ class VectorDBClient(ABC):
             limit: Maximum results to return
             with_payload: Include payload in results
             with_vectors: Include vectors in results
+            exact: Score every point matching the filter instead of walking the index
+            hnsw_ef: Size of the HNSW candidate list (None uses the backend default)
 
         Returns:
             List of search results
@@ -129,14 +163,21 @@ class VectorDBClient(ABC):
         ...
 
     @abstractmethod
-    async def count(self, collection: str) -> int:
-        """Count total points in a collection.
+    async def count(
+        self,
+        collection: str,
+        filter: Any | None = None,
+        exact: bool = True,
+    ) -> int:
+        """Count points in a collection.
 
         Args:
             collection: Collection name
+            filter: Optional filter conditions; only matching points are counted
+            exact: If False, the backend may return a cheaper estimate
 
         Returns:
-            Total number of points
+            Number of (matching) points
         """
         ...
 
@@ -0,0 +1,578 @@
+"""Embedded in-process vector database backed by memory-mapped NumPy arrays."""
+
+import fcntl
+import json
+import os
+import shutil
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from qdrant_client import models
+
+from recall.core.vectordb.base import Point, SearchResult, VectorDBClient
+from recall.models.errors import VectorDBError
+
+_MISSING = object()
+
+META_FILE = "meta.json"
+VECTORS_FILE = "vectors.f32"
+JOURNAL_FILE = "points.jsonl"
+LOCK_FILE = "write.lock"
+
+INITIAL_CAPACITY = 1024
+COMPACT_MIN_DEAD = 1024
+
+
+def _same(a: Any, b: Any) -> bool:
+    """Payload equality that, unlike ``==``, keeps ``True`` and ``1`` apart."""
+    return a == b and isinstance(a, bool) == isinstance(b, bool)
+
+
+def _in_range(value: Any, rng: models.Range) -> bool:
+    if not isinstance(value, int | float) or isinstance(value, bool):
+        return False
+    return (
+        (rng.lt is None or value < rng.lt)
+        and (rng.lte is None or value <= rng.lte)
+        and (rng.gt is None or value > rng.gt)
+        and (rng.gte is None or value >= rng.gte)
+    )
+
+
+@dataclass
+class _Collection:
+    """In-memory view of one on-disk collection.
+
+    Vectors live in a memory-mapped ``(capacity, dim)`` float32 matrix whose rows
+    are L2-normalized, so cosine similarity is a single matmul. Payloads are kept
+    column-wise (one object array per field) so filters evaluate as boolean masks.
+    """
+
+    path: Path
+    dim: int
+    capacity: int
+    vectors: np.memmap
+    schema: dict[str, str] = field(default_factory=dict)
+    ids: list[str] = field(default_factory=list)
+    rows: dict[str, int] = field(default_factory=dict)
+    columns: dict[str, np.ndarray] = field(default_factory=dict)
+    journal_offset: int = 0
+    journal_inode: int = 0
+    journal_entries: int = 0
+    _numeric: dict[str, np.ndarray] = field(default_factory=dict)
+    _is_bool: dict[str, np.ndarray] = field(default_factory=dict)
+    _arrays: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    def column(self, name: str) -> np.ndarray:
+        col = self.columns.get(name)
+        if col is None:
+            col = np.full(self.capacity, _MISSING, dtype=object)
+            self.columns[name] = col
+        return col
+
+    def numeric(self, name: str) -> np.ndarray:
+        """Float view of a column, NaN where the value is missing or not a number."""
+        view = self._numeric.get(name)
+        if view is None:
+            col = self.columns.get(name)
+            view = np.full(self.capacity, np.nan)
+            if col is not None:
+                for i, v in enumerate(col[: self.size]):
+                    if isinstance(v, int | float) and not isinstance(v, bool):
+                        view[i] = v
+            self._numeric[name] = view
+        return view[: self.size]
+
+    def is_bool(self, name: str) -> np.ndarray:
+        view = self._is_bool.get(name)
+        if view is None:
+            col = self.columns.get(name)
+            view = np.zeros(self.capacity, dtype=bool)
+            if col is not None:
+                view[: self.size] = [isinstance(v, bool) for v in col[: self.size]]
+            self._is_bool[name] = view
+        return view[: self.size]
+
+    def array_rows(self, name: str) -> np.ndarray:
+        """Indices of the rows whose value for ``name`` is a list."""
+        rows = self._arrays.get(name)
+        if rows is None:
+            col = self.columns.get(name)
+            rows = np.zeros(0, dtype=np.intp)
+            if col is not None:
+                rows = np.flatnonzero([isinstance(v, list) for v in col[: self.size]])
+            self._arrays[name] = rows
+        return rows
+
+    def set_payload(self, row: int, payload: dict[str, Any] | None) -> None:
+        for col in self.columns.values():
+            col[row] = _MISSING
+        for key, value in (payload or {}).items():
+            self.column(key)[row] = value
+        self._clear_views()
+
+    def payload(self, row: int) -> dict[str, Any]:
+        return {key: col[row] for key, col in self.columns.items() if col[row] is not _MISSING}
+
+    def resize_columns(self, capacity: int) -> None:
+        for key, col in self.columns.items():
+            grown = np.full(capacity, _MISSING, dtype=object)
+            grown[: len(col)] = col
+            self.columns[key] = grown
+        self._clear_views()
+
+    def reset(self) -> None:
+        """Forget every point, before replaying the journal from the start."""
+        self.ids.clear()
+        self.rows.clear()
+        self.columns.clear()
+        self.journal_offset = 0
+        self.journal_entries = 0
+        self._clear_views()
+
+    def _clear_views(self) -> None:
+        self._numeric.clear()
+        self._is_bool.clear()
+        self._arrays.clear()
+
+
+class EmbeddedAdapter(VectorDBClient):
+    """In-process vector database for small deployments, CI and load tests.
+
+    Each collection is a directory holding a ``meta.json``, a memory-mapped
+    float32 vector matrix and an append-only JSONL journal of point ids and
+    payloads. Search is brute-force cosine top-k (``matmul`` + ``argpartition``)
+    and filters are the same Qdrant ``Filter`` objects the transpiler produces,
+    evaluated as vectorized boolean masks over the payload columns.
+
+    Several processes may share a collection (workers upserting, the API updating
+    payloads, ``recall load``): writers hold an exclusive ``flock`` on the
+    collection's ``write.lock`` and first catch up with the journal, so rows are
+    never assigned twice. Every process picks up points appended by the others on
+    its next call. The journal is compacted on open once more than half of its
+    entries, and at least ``COMPACT_MIN_DEAD``, are superseded.
+    """
+
+    def __init__(self, path: str = "./data/vectordb"):
+        self._root = Path(path)
+        self._collections: dict[str, _Collection] = {}
+
+    def _dir(self, name: str) -> Path:
+        return self._root / name
+
+    def _open(self, name: str, operation: str) -> _Collection:
+        coll = self._collections.get(name)
+        if coll is None:
+            meta_path = self._dir(name) / META_FILE
+            if not meta_path.exists():
+                raise VectorDBError(f"Collection '{name}' not found", operation)
+            meta = json.loads(meta_path.read_text())
+            path = self._dir(name)
+            coll = _Collection(
+                path=path,
+                dim=meta["vector_size"],
+                capacity=meta["capacity"],
+                vectors=self._map_vectors(path, meta["capacity"], meta["vector_size"]),
+                schema=meta.get("schema") or {},
+            )
+            self._collections[name] = coll
+            self._refresh(coll)
+            if coll.journal_entries - coll.size > max(COMPACT_MIN_DEAD, coll.size):
+                self._compact(coll)
+            return coll
+        self._refresh(coll)
+        return coll
+
+    @staticmethod
+    @contextmanager
+    def _lock(path: Path) -> Iterator[None]:
+        """Hold the exclusive write lock of the collection directory ``path``."""
+        with (path / LOCK_FILE).open("a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            yield
+
+    @contextmanager
+    def _writing(self, coll: _Collection) -> Iterator[None]:
+        """Hold the write lock with ``coll`` caught up with every other writer."""
+        with self._lock(coll.path):
+            self._reload_meta(coll)
+            self._refresh(coll)
+            yield
+
+    def _compact(self, coll: _Collection) -> None:
+        """Rewrite the journal with one entry per point, dropping superseded ones."""
+        with self._writing(coll):
+            tmp = coll.path / f"{JOURNAL_FILE}.tmp"
+            with tmp.open("wb") as f:
+                for row, point_id in enumerate(coll.ids):
+                    entry = {"id": point_id, "row": row, "payload": coll.payload(row)}
+                    f.write(json.dumps(entry).encode() + b"\n")
+            os.replace(tmp, coll.path / JOURNAL_FILE)
+            # The new inode makes this and every other process replay the journal.
+            self._refresh(coll)
+
+    @staticmethod
+    def _map_vectors(path: Path, capacity: int, dim: int) -> np.memmap:
+        return np.memmap(path / VECTORS_FILE, dtype=np.float32, mode="r+", shape=(capacity, dim))
+
+    @staticmethod
+    def _write_meta(coll: _Collection) -> None:
+        meta = {"vector_size": coll.dim, "capacity": coll.capacity, "schema": coll.schema}
+        tmp = coll.path / f"{META_FILE}.tmp"
+        tmp.write_text(json.dumps(meta))
+        os.replace(tmp, coll.path / META_FILE)
+
+    def _reload_meta(self, coll: _Collection) -> None:
+        """Pick up the schema and capacity other processes wrote to ``meta.json``."""
+        meta = json.loads((coll.path / META_FILE).read_text())
+        coll.schema = meta.get("schema") or {}
+        if meta["capacity"] != coll.capacity:
+            coll.capacity = meta["capacity"]
+            coll.vectors = self._map_vectors(coll.path, coll.capacity, coll.dim)
+            coll.resize_columns(coll.capacity)
+
+    def _refresh(self, coll: _Collection) -> None:
+        """Apply journal entries appended by other processes since the last read."""
+        try:
+            f = (coll.path / JOURNAL_FILE).open("rb")
+        except FileNotFoundError:
+            return
+        with f:
+            stat = os.fstat(f.fileno())
+            if stat.st_ino != coll.journal_inode:
+                # A new file means the journal was compacted: replay all of it.
+                coll.reset()
+                coll.journal_inode = stat.st_ino
+            if stat.st_size <= coll.journal_offset:
+                return
+            f.seek(coll.journal_offset)
+            chunk = f.read(stat.st_size - coll.journal_offset)
+        end = chunk.rfind(b"\n") + 1
+        if end == 0:
+            return
+
+        self._reload_meta(coll)
+        for line in chunk[:end].splitlines():
+            entry = json.loads(line)
+            self._apply(coll, entry["id"], entry["row"], entry.get("payload"))
+            coll.journal_entries += 1
+        coll.journal_offset += end
+
+    @staticmethod
+    def _apply(coll: _Collection, point_id: str, row: int, payload: dict[str, Any] | None) -> None:
+        if row == len(coll.ids):
+            coll.ids.append(point_id)
+        coll.rows[point_id] = row
+        coll.set_payload(row, payload)
+
+    def _grow(self, coll: _Collection, needed: int) -> None:
+        capacity = coll.capacity
+        while capacity < needed:
+            capacity *= 2
+
+        tmp = coll.path / f"{VECTORS_FILE}.tmp"
+        grown = np.memmap(tmp, dtype=np.float32, mode="w+", shape=(capacity, coll.dim))
+        grown[: coll.capacity] = coll.vectors
+        grown.flush()
+        del grown
+        os.replace(tmp, coll.path / VECTORS_FILE)
+
+        coll.capacity = capacity
+        coll.vectors = self._map_vectors(coll.path, capacity, coll.dim)
+        coll.resize_columns(capacity)
+        self._write_meta(coll)
+
+    async def create_collection(
+        self,
+        name: str,
+        vector_size: int,
+        schema: dict[str, str] | None = None,
+    ) -> None:
+        try:
+            path = self._dir(name)
+            if (path / META_FILE).exists():
+                return
+
+            path.mkdir(parents=True, exist_ok=True)
+            with self._lock(path):
+                if (path / META_FILE).exists():
+                    return
+                vectors = np.memmap(
+                    path / VECTORS_FILE,
+                    dtype=np.float32,
+                    mode="w+",
+                    shape=(INITIAL_CAPACITY, vector_size),
+                )
+                vectors.flush()
+                (path / JOURNAL_FILE).touch()
+
+                coll = _Collection(
+                    path=path,
+                    dim=vector_size,
+                    capacity=INITIAL_CAPACITY,
+                    vectors=vectors,
+                    schema=dict(schema or {}),
+                )
+                self._write_meta(coll)
+                self._collections[name] = coll
+        except Exception as e:
+            raise VectorDBError(str(e), "create_collection") from e
+
+    async def create_payload_index(self, collection: str, field: str, field_type: str) -> None:
+        # Filters always scan the payload columns; the schema is only recorded.
+        coll = self._open(collection, "create_payload_index")
+        with self._writing(coll):
+            coll.schema[field] = str(getattr(field_type, "value", field_type))
+            self._write_meta(coll)
+
+    async def delete_collection(self, name: str) -> bool:
+        try:
+            self._collections.pop(name, None)
+            path = self._dir(name)
+            if not (path / META_FILE).exists():
+                return False
+            shutil.rmtree(path)
+            return True
+        except Exception as e:
+            raise VectorDBError(str(e), "delete_collection") from e
+
+    async def collection_exists(self, name: str) -> bool:
+        return (self._dir(name) / META_FILE).exists()
+
+    async def upsert(self, collection: str, points: list[Point]) -> int:
+        coll = self._open(collection, "upsert")
+        if not points:
+            return 0
+
+        try:
+            matrix = np.asarray([p.vector for p in points], dtype=np.float32)
+            if matrix.ndim != 2 or matrix.shape[1] != coll.dim:
+                raise ValueError(
+                    f"Expected {coll.dim}-dim vectors, got shape {tuple(matrix.shape)}"
+                )
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = matrix / np.where(norms == 0, 1.0, norms)
+
+            with self._writing(coll):
+                new_ids = {p.id for p in points if p.id not in coll.rows}
+                if coll.size + len(new_ids) > coll.capacity:
+                    self._grow(coll, coll.size + len(new_ids))
+
+                next_row = coll.size
+                assigned: dict[str, int] = {}
+                lines = []
+                for point, vector in zip(points, matrix, strict=True):
+                    row = coll.rows.get(point.id, assigned.get(point.id))
+                    if row is None:
+                        row = assigned[point.id] = next_row
+                        next_row += 1
+                    coll.vectors[row] = vector
+                    entry = {"id": point.id, "row": row, "payload": point.payload}
+                    lines.append(json.dumps(entry))
+                coll.vectors.flush()
+
+                data = ("\n".join(lines) + "\n").encode()
+                with (coll.path / JOURNAL_FILE).open("ab") as f:
+                    f.write(data)
+                self._refresh(coll)
+            return len(points)
+        except Exception as e:
+            raise VectorDBError(str(e), "upsert") from e
+
+    async def set_payload(
+        self,
+        collection: str,
+        payloads: dict[str, dict[str, Any]],
+        overwrite: bool = False,
+    ) -> list[str]:
+        coll = self._open(collection, "set_payload")
+        try:
+            with self._writing(coll):
+                ids = [point_id for point_id in payloads if point_id in coll.rows]
+                if not ids:
+                    return []
+                lines = []
+                for point_id in ids:
+                    row = coll.rows[point_id]
+                    payload = payloads[point_id]
+                    if not overwrite:
+                        payload = {**coll.payload(row), **payload}
+                    lines.append(json.dumps({"id": point_id, "row": row, "payload": payload}))
+
+                # Journal entries for existing rows leave the vectors as they are.
+                data = ("\n".join(lines) + "\n").encode()
+                with (coll.path / JOURNAL_FILE).open("ab") as f:
+                    f.write(data)
+                self._refresh(coll)
+            return ids
+        except Exception as e:
+            raise VectorDBError(str(e), "set_payload") from e
+
+    async def search(
+        self,
+        collection: str,
+        vector: list[float],
+        filter: Any | None = None,
+        limit: int = 10,
+        with_payload: bool = True,
+        with_vectors: bool = False,
+        exact: bool = False,
+        hnsw_ef: int | None = None,
+    ) -> list[SearchResult]:
+        # Search is always a brute-force scan here, so exact/hnsw_ef are no-ops.
+        coll = self._open(collection, "search")
+        n = coll.size
+        if n == 0 or limit <= 0:
+            return []
+
+        try:
+            query = np.asarray(vector, dtype=np.float32)
+            norm = np.linalg.norm(query)
+            if norm:
+                query = query / norm
+
+            scores = coll.vectors[:n] @ query
+            candidates = n
+            if filter is not None:
+                mask = self._mask(coll, filter)
+                candidates = int(mask.sum())
+                scores = np.where(mask, scores, -np.inf)
+
+            k = min(limit, candidates)
+            if k == 0:
+                return []
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+
+            return [
+                SearchResult(
+                    id=coll.ids[row],
+                    score=float(scores[row]),
+                    payload=(coll.payload(row) or None) if with_payload else None,
+                    vector=coll.vectors[row].tolist() if with_vectors else None,
+                )
+                for row in top
+            ]
+        except VectorDBError:
+            raise
+        except Exception as e:
+            raise VectorDBError(str(e), "search") from e
+
+    async def scroll(
+        self,
+        collection: str,
+        limit: int = 20,
+        offset: int = 0,
+        with_payload: bool = True,
+        with_vectors: bool = False,
+    ) -> list[SearchResult]:
+        coll = self._open(collection, "scroll")
+        return [
+            SearchResult(
+                id=coll.ids[row],
+                score=0.0,
+                payload=(coll.payload(row) or None) if with_payload else None,
+                vector=coll.vectors[row].tolist() if with_vectors else None,
+            )
+            for row in range(offset, min(offset + limit, coll.size))
+        ]
+
+    async def count(
+        self,
+        collection: str,
+        filter: Any | None = None,
+        exact: bool = True,
+    ) -> int:
+        coll = self._open(collection, "count")
+        if filter is None:
+            return coll.size
+        return int(self._mask(coll, filter).sum())
+
+    async def close(self) -> None:
+        for coll in self._collections.values():
+            coll.vectors.flush()
+        self._collections.clear()
+
+    def _mask(self, coll: _Collection, flt: models.Filter) -> np.ndarray:
+        n = coll.size
+        mask = np.ones(n, dtype=bool)
+        for cond in flt.must or []:
+            mask &= self._condition_mask(coll, cond)
+        if flt.should:
+            any_mask = np.zeros(n, dtype=bool)
+            for cond in flt.should:
+                any_mask |= self._condition_mask(coll, cond)
+            mask &= any_mask
+        for cond in flt.must_not or []:
+            mask &= ~self._condition_mask(coll, cond)
+        return mask
+
+    def _condition_mask(self, coll: _Collection, cond: Any) -> np.ndarray:
+        if isinstance(cond, models.Filter):
+            return self._mask(coll, cond)
+        if isinstance(cond, models.HasIdCondition):
+            mask = np.zeros(coll.size, dtype=bool)
+            rows = [coll.rows[str(i)] for i in cond.has_id if str(i) in coll.rows]
+            mask[rows] = True
+            return mask
+        if isinstance(cond, models.FieldCondition):
+            if cond.match is not None:
+                return self._match_mask(coll, cond.key, cond.match)
+            if isinstance(cond.range, models.Range):
+                return self._range_mask(coll, cond.key, cond.range)
+        raise VectorDBError(f"Unsupported filter condition: {cond!r}", "search")
+
+    def _match_mask(self, coll: _Collection, key: str, match: Any) -> np.ndarray:
+        if isinstance(match, models.MatchValue):
+            values = [match.value]
+        elif isinstance(match, models.MatchAny):
+            values = list(match.any)
+        else:
+            raise VectorDBError(f"Unsupported match condition: {match!r}", "search")
+
+        col = coll.columns.get(key)
+        if col is None:
+            return np.zeros(coll.size, dtype=bool)
+        col = col[: coll.size]
+        is_bool = coll.is_bool(key)
+
+        mask = np.zeros(coll.size, dtype=bool)
+        for value in values:
+            # Object-array equality treats True == 1; keep bools and numbers apart.
+            hits = np.asarray(col == value, dtype=bool)
+            if isinstance(value, bool):
+                hits &= is_bool
+            elif isinstance(value, int | float):
+                hits &= ~is_bool
+            mask |= hits
+
+        # Like Qdrant, a list-valued field matches when any of its elements does.
+        for row in coll.array_rows(key):
+            mask[row] = any(_same(element, value) for element in col[row] for value in values)
+        return mask
+
+    @staticmethod
+    def _range_mask(coll: _Collection, key: str, rng: models.Range) -> np.ndarray:
+        values = coll.numeric(key)
+        mask = ~np.isnan(values)
+        if rng.lt is not None:
+            mask &= values < rng.lt
+        if rng.lte is not None:
+            mask &= values <= rng.lte
+        if rng.gt is not None:
+            mask &= values > rng.gt
+        if rng.gte is not None:
+            mask &= values >= rng.gte
+
+        col = coll.columns.get(key)
+        for row in coll.array_rows(key):
+            mask[row] = any(_in_range(element, rng) for element in col[row])
+        return mask
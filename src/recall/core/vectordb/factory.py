@@ -1,6 +1,8 @@
 """Factory for creating vector database clients."""
 
+from recall.config import Settings
 from recall.core.vectordb.base import VectorDBClient
+from recall.core.vectordb.embedded import EmbeddedAdapter
 from recall.core.vectordb.qdrant import QdrantAdapter
 
 
@@ -14,16 +16,25 @@ class VectorDBFactory:
         """Create a vector database client.
 
         Args:
-            backend: Database backend type (currently only 'qdrant')
-            url: Connection URL
+            backend: Database backend type ('qdrant' or 'embedded')
+            url: Connection URL, or the data directory for the embedded backend
 
         Returns:
             Configured VectorDBClient instance
         """
         if backend == "qdrant":
             return QdrantAdapter(url=url or "http://localhost:6333")
+        if backend == "embedded":
+            return EmbeddedAdapter(path=url or "./data/vectordb")
         raise ValueError(f"Unsupported backend: {backend}")
 
+    @classmethod
+    def from_settings(cls, settings: Settings) -> VectorDBClient:
+        """Create the client configured by ``VECTORDB_BACKEND``."""
+        if settings.vectordb_backend == "embedded":
+            return cls.create("embedded", settings.embedded_data_dir)
+        return cls.create(settings.vectordb_backend, settings.qdrant_url)
+
     @classmethod
     def get_singleton(cls, backend: str = "qdrant", url: str | None = None) -> VectorDBClient:
         """Get or create a singleton instance."""
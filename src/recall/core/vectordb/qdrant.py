@@ -47,6 +47,10 @@ class QdrantAdapter(VectorDBClient):
             raise VectorDBError(str(e), "create_collection") from e
 
     async def _create_payload_indexes(self, name: str, schema: dict[str, str]) -> None:
+        for field_name, field_type in schema.items():
+            await self._create_payload_index(name, field_name, field_type)
+
+    async def _create_payload_index(self, name: str, field_name: str, field_type: str) -> None:
         field_type_map = {
             FieldType.FLOAT: models.PayloadSchemaType.FLOAT,
             FieldType.INT: models.PayloadSchemaType.INTEGER,
@@ -55,16 +59,21 @@ class QdrantAdapter(VectorDBClient):
             FieldType.TEXT: models.PayloadSchemaType.TEXT,
         }
 
-        for field_name, field_type in schema.items():
-            if isinstance(field_type, str):
-                field_type = FieldType(field_type)
-            qdrant_type = field_type_map.get(field_type)
-            if qdrant_type:
-                await self.client.create_payload_index(
-                    collection_name=name,
-                    field_name=field_name,
-                    field_schema=qdrant_type,
-                )
+        if isinstance(field_type, str):
+            field_type = FieldType(field_type)
+        qdrant_type = field_type_map.get(field_type)
+        if qdrant_type:
+            await self.client.create_payload_index(
+                collection_name=name,
+                field_name=field_name,
+                field_schema=qdrant_type,
+            )
+
+    async def create_payload_index(self, collection: str, field: str, field_type: str) -> None:
+        try:
+            await self._create_payload_index(collection, field, field_type)
+        except Exception as e:
+            raise VectorDBError(str(e), "create_payload_index") from e
 
     async def delete_collection(self, name: str) -> bool:
         try:
@@ -96,6 +105,39 @@ class QdrantAdapter(VectorDBClient):
         except Exception as e:
             raise VectorDBError(str(e), "upsert") from e
 
+    async def set_payload(
+        self,
+        collection: str,
+        payloads: dict[str, dict[str, Any]],
+        overwrite: bool = False,
+    ) -> list[str]:
+        if not payloads:
+            return []
+        try:
+            # Payload operations on a missing point fail the whole batch.
+            existing = await self.client.retrieve(
+                collection_name=collection,
+                ids=list(payloads),
+                with_payload=False,
+                with_vectors=False,
+            )
+            ids = [str(point.id) for point in existing]
+            operations: list[Any] = []
+            for point_id in ids:
+                update = models.SetPayload(payload=payloads[point_id], points=[point_id])
+                operations.append(
+                    models.OverwritePayloadOperation(overwrite_payload=update)
+                    if overwrite
+                    else models.SetPayloadOperation(set_payload=update)
+                )
+            if operations:
+                await self.client.batch_update_points(
+                    collection_name=collection, update_operations=operations
+                )
+            return ids
+        except Exception as e:
+            raise VectorDBError(str(e), "set_payload") from e
+
     async def search(
         self,
         collection: str,
@@ -104,12 +146,15 @@ class QdrantAdapter(VectorDBClient):
         limit: int = 10,
         with_payload: bool = True,
         with_vectors: bool = False,
+        exact: bool = False,
+        hnsw_ef: int | None = None,
     ) -> list[SearchResult]:
         try:
             results = await self.client.query_points(
                 collection_name=collection,
                 query=vector,
                 query_filter=filter,
+                search_params=models.SearchParams(exact=exact, hnsw_ef=hnsw_ef),
                 limit=limit,
                 with_payload=with_payload,
                 with_vectors=with_vectors,
@@ -157,9 +202,19 @@ class QdrantAdapter(VectorDBClient):
         except Exception as e:
             raise VectorDBError(str(e), "scroll") from e
 
-    async def count(self, collection: str) -> int:
+    async def count(
+        self,
+        collection: str,
+        filter: Any | None = None,
+        exact: bool = True,
+    ) -> int:
         try:
-            result = await self.client.count(collection_name=collection)
+            # With exact=False Qdrant estimates from payload index cardinalities.
+            result = await self.client.count(
+                collection_name=collection,
+                count_filter=filter,
+                exact=exact,
+            )
             return result.count
         except Exception as e:
             raise VectorDBError(str(e), "count") from e
@@ -11,8 +11,15 @@ from redis.asyncio import Redis
 
 from recall.api.v1 import router as v1_router
 from recall.config import get_settings
-from recall.core.vectordb.qdrant import QdrantAdapter
-from recall.models.errors import RecallError
+from recall.core.blobstore.factory import BlobStoreFactory
+from recall.core.serialization import job_serializer_options
+from recall.core.vectordb.factory import VectorDBFactory
+from recall.models.errors import RecallError, SchemaValidationError
+from recall.services.collection_cache import CollectionCache
+from recall.services.filter_usage import FilterUsageTracker
+from recall.services.planner import get_query_planner
+from recall.services.registry import SchemaRegistry
+from recall.services.task_events import TaskEventHub
 
 
 @asynccontextmanager
@@ -21,11 +28,28 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     settings = get_settings()
 
     app.state.redis = Redis.from_url(settings.redis_url)
-    app.state.arq_redis = await create_pool(RedisSettings.from_dsn(settings.redis_url))
-    app.state.vectordb = QdrantAdapter(settings.qdrant_url)
+    app.state.arq_redis = await create_pool(
+        RedisSettings.from_dsn(settings.redis_url), **job_serializer_options(settings)
+    )
+    app.state.vectordb = VectorDBFactory.from_settings(settings)
+    app.state.blob_store = BlobStoreFactory.from_settings(settings)
+    await SchemaRegistry(app.state.redis).backfill_names()
+    app.state.collection_cache = CollectionCache(ttl=settings.collection_cache_ttl)
+    app.state.collection_cache.add_listener(get_query_planner().invalidate)
+    await app.state.collection_cache.start(app.state.redis)
+    app.state.task_events = TaskEventHub()
+    await app.state.task_events.start(app.state.redis)
+    app.state.filter_usage = FilterUsageTracker(
+        app.state.redis, flush_interval=settings.filter_usage_flush_interval
+    )
+    await app.state.filter_usage.start()
 
     yield
 
+    await app.state.filter_usage.stop()
+    await app.state.task_events.stop()
+    await app.state.collection_cache.stop()
+    await app.state.blob_store.close()
     await app.state.vectordb.close()
     await app.state.arq_redis.close()
     await app.state.redis.close()
@@ -52,6 +76,27 @@ async def recall_error_handler(request: Request, exc: RecallError) -> JSONRespon
     )
 
 
+@app.exception_handler(SchemaValidationError)
+async def schema_validation_error_handler(
+    request: Request, exc: SchemaValidationError
+) -> JSONResponse:
+    """Reject payloads that don't match the schema, listing failures per document.
+
+    ``details["documents"]`` maps each failed document id to its errors, so
+    batch clients can tell which documents to fix. ``detail`` keeps the joined
+    message for clients of the earlier response shape.
+    """
+    return JSONResponse(
+        status_code=422,
+        content={
+            "error": exc.__class__.__name__,
+            "message": exc.message,
+            "details": exc.details,
+            "detail": exc.message,
+        },
+    )
+
+
 app.include_router(v1_router)
 
 
@@ -16,7 +16,7 @@ from recall.models.errors import (
     UnsupportedModelError,
     VectorDBError,
 )
-from recall.models.search import SearchRequest, SearchResponse, SearchResult
+from recall.models.search import SearchPlan, SearchRequest, SearchResponse, SearchResult
 
 __all__ = [
     "Collection",
@@ -31,6 +31,7 @@ __all__ = [
     "Modality",
     "RecallError",
     "SchemaValidationError",
+    "SearchPlan",
     "SearchRequest",
     "SearchResponse",
     "SearchResult",
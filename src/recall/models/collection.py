@@ -31,6 +31,10 @@ class Collection(BaseModel):
     name: str = Field(..., min_length=1, max_length=128, pattern=r"^[a-z0-9_-]+$")
     embedding_config: EmbeddingConfig
     index_schema: IndexSchema = Field(default_factory=dict)
+    auto_index_schema: IndexSchema = Field(
+        default_factory=dict,
+        description="Payload indexes added automatically from observed filter usage",
+    )
     created_at: str | None = None
 
 
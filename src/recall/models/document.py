@@ -1,26 +1,78 @@
 """Document models for ingestion."""
 
+from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import Base64Bytes, BaseModel, Field
+
+
+class IngestLane(str, Enum):
+    """Queue an ingestion batch waits in; each lane has its own workers."""
+
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
 
 
 class Document(BaseModel):
     id: str | UUID = Field(..., description="Unique document identifier")
     content_uri: str | None = Field(None, description="URI to content (S3, HTTP, etc.)")
     content_raw: str | None = Field(None, description="Raw text content")
+    content_base64: Base64Bytes | None = Field(
+        None, description="Binary content (e.g. an image), base64-encoded"
+    )
     payload: dict[str, Any] = Field(default_factory=dict, description="Arbitrary metadata")
 
-    def get_content_source(self) -> str | None:
-        return self.content_raw or self.content_uri
+    def get_content_source(self) -> str | bytes | None:
+        return self.content_raw or self.content_base64 or self.content_uri
 
 
 class IngestRequest(BaseModel):
     documents: list[Document] = Field(..., min_length=1, max_length=100)
+    lane: IngestLane | None = Field(
+        None, description="Queue lane; chosen by batch size when omitted"
+    )
 
 
 class IngestResponse(BaseModel):
     task_id: str
     documents_queued: int
     status: str = "queued"
+    lane: IngestLane | None = None
+
+
+class IngestLineError(BaseModel):
+    line: int = Field(..., description="Line number in the request body, from 1")
+    id: str | None = Field(None, description="Document id, if the line could be parsed")
+    error: str = Field(..., description="Why the line was rejected")
+
+
+class StreamIngestResponse(IngestResponse):
+    documents_failed: int = Field(0, description="Lines rejected")
+    errors: list[IngestLineError] = Field(
+        default_factory=list, description="Rejected lines in body order, at most 1000"
+    )
+    resume_from_line: int | None = Field(
+        None,
+        description="For a partial ingest, the first line not handled; "
+        "send the body again from this line to resume",
+    )
+
+
+class PayloadUpdate(BaseModel):
+    id: str | UUID = Field(..., description="Identifier of an ingested document")
+    payload: dict[str, Any] = Field(..., description="Payload fields to set")
+
+
+class PayloadUpdateRequest(BaseModel):
+    documents: list[PayloadUpdate] = Field(..., min_length=1, max_length=1000)
+    overwrite: bool = Field(
+        False, description="Replace each document's payload instead of merging into it"
+    )
+
+
+class PayloadUpdateResponse(BaseModel):
+    updated: int = Field(..., description="Documents whose payload was updated")
+    not_found: list[str] = Field(
+        default_factory=list, description="Requested document ids that are not ingested"
+    )
@@ -23,8 +23,18 @@ class CollectionNotFoundError(RecallError):
 class SchemaValidationError(RecallError):
     """Raised when document payload does not match collection schema."""
 
-    def __init__(self, message: str, field: str | None = None):
-        super().__init__(message, {"field": field} if field else {})
+    def __init__(
+        self,
+        message: str,
+        field: str | None = None,
+        documents: dict[str, list[str]] | None = None,
+    ):
+        details: dict = {}
+        if field:
+            details["field"] = field
+        if documents:
+            details["documents"] = documents
+        super().__init__(message, details)
 
 
 class UnsupportedModelError(RecallError):
@@ -49,3 +59,62 @@ class VectorDBError(RecallError):
 
     def __init__(self, message: str, operation: str | None = None):
         super().__init__(message, {"operation": operation} if operation else {})
+
+
+class ContentFetchError(RecallError):
+    """Raised when document content cannot be fetched from its URI."""
+
+    def __init__(self, message: str, uri: str, status_code: int | None = None):
+        details: dict = {"uri": uri}
+        if status_code is not None:
+            details["status_code"] = status_code
+        super().__init__(message, details)
+        self.status_code = status_code
+
+
+class ContentTooLargeError(ContentFetchError):
+    """Raised when fetched content exceeds the configured size limit."""
+
+    def __init__(self, uri: str, max_bytes: int):
+        super().__init__(f"Content at '{uri}' exceeds {max_bytes} bytes", uri)
+        self.details["max_bytes"] = max_bytes
+
+
+class BlobNotFoundError(RecallError):
+    """Raised when a staged content blob does not exist."""
+
+    def __init__(self, key: str):
+        super().__init__(f"Blob '{key}' not found", {"key": key})
+
+
+class ContentStagingError(RecallError):
+    """Raised when document content must be staged but no blob store is available."""
+
+    def __init__(self, doc_id: str):
+        super().__init__(
+            f"Document '{doc_id}' has binary content but no blob store is configured",
+            {"doc_id": doc_id},
+        )
+
+
+class IngestionBackpressureError(RecallError):
+    """Raised when an ingestion lane is too far behind to accept more documents."""
+
+    def __init__(
+        self,
+        lane: str,
+        queue_depth: int,
+        retry_after: int,
+        drain_seconds: float | None = None,
+    ):
+        super().__init__(
+            f"Ingestion lane '{lane}' is backlogged ({queue_depth} jobs queued); "
+            f"retry in {retry_after}s",
+            {
+                "lane": lane,
+                "queue_depth": queue_depth,
+                "drain_seconds": drain_seconds,
+                "retry_after": retry_after,
+            },
+        )
+        self.retry_after = retry_after
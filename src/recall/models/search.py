@@ -2,7 +2,7 @@
 
 from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidatorFunctionWrapHandler, WrapValidator
 
 
 class EqCondition(BaseModel):
@@ -74,9 +74,21 @@ AndFilter.model_rebuild()
 OrFilter.model_rebuild()
 
 
+def _parse_cached_filter(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """Parse filter JSON through the compile cache so repeated filters are parsed once."""
+    if not isinstance(value, dict):
+        return handler(value)
+    # Imported lazily: the transpiler package depends on this module.
+    from recall.core.transpiler.cache import get_filter_cache
+
+    return get_filter_cache().parse(value, handler)
+
+
 class SearchRequest(BaseModel):
     query: str = Field(..., description="Search query (text or image URI)")
-    filter: FilterCondition | None = Field(None, description="Optional filter DSL")
+    filter: Annotated[FilterCondition | None, WrapValidator(_parse_cached_filter)] = Field(
+        None, description="Optional filter DSL"
+    )
     limit: int = Field(10, ge=1, le=100)
     with_payload: bool = True
     with_vectors: bool = False
@@ -89,7 +101,18 @@ class SearchResult(BaseModel):
     vector: list[float] | None = None
 
 
+class SearchPlan(BaseModel):
+    strategy: Literal["hnsw", "exact", "empty"] = Field(
+        ..., description="How the vector database was queried"
+    )
+    hnsw_ef: int | None = Field(None, description="HNSW candidate list size, if raised")
+    estimated_matches: int | None = Field(None, description="Estimated points matching the filter")
+    total_points: int | None = Field(None, description="Points in the collection")
+    selectivity: float | None = Field(None, description="Estimated fraction of points matching")
+
+
 class SearchResponse(BaseModel):
     results: list[SearchResult]
     query: str
     count: int
+    plan: SearchPlan | None = None
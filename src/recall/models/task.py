@@ -9,11 +9,14 @@ class JobStatus(BaseModel):
     """Status of a single document processing job."""
 
     doc_id: str = Field(..., description="Original document identifier")
-    status: Literal["queued", "in_progress", "complete", "failed", "not_found"] = Field(
-        ..., description="Current job status"
+    status: Literal["queued", "in_progress", "complete", "failed", "superseded", "not_found"] = (
+        Field(..., description="Current job status")
     )
     result: dict[str, Any] | None = Field(None, description="Job result on success")
     error: str | None = Field(None, description="Error message on failure")
+    superseded_by: str | None = Field(
+        None, description="Newer job for the same document that made this one redundant"
+    )
 
 
 class TaskSummary(BaseModel):
@@ -24,11 +27,97 @@ class TaskSummary(BaseModel):
     in_progress: int = Field(0, description="Jobs currently processing")
     complete: int = Field(0, description="Successfully completed jobs")
     failed: int = Field(0, description="Failed jobs")
+    superseded: int = Field(0, description="Jobs skipped for a newer job of the same document")
+
+    @property
+    def finished(self) -> int:
+        """Jobs that will not run again: complete, failed or superseded."""
+        return self.complete + self.failed + self.superseded
 
 
 class TaskStatusResponse(BaseModel):
     """Response for task status polling."""
 
     task_id: str = Field(..., description="Batch task identifier")
-    jobs: list[JobStatus] = Field(default_factory=list, description="Individual job statuses")
+    jobs: list[JobStatus] = Field(
+        default_factory=list, description="Individual job statuses, in submission order"
+    )
     summary: TaskSummary = Field(..., description="Aggregated status counts")
+    limit: int = Field(100, description="Requested page size of jobs")
+    offset: int = Field(0, description="Position of the first job in the page")
+
+
+class TaskEvent(BaseModel):
+    """A document of a batch task finishing, as pushed to task event streams."""
+
+    job: JobStatus = Field(..., description="The document's new status")
+    summary: TaskSummary = Field(..., description="Batch status counts right after the change")
+
+
+class TaskStatusListResponse(BaseModel):
+    """Response for polling several tasks at once."""
+
+    tasks: list[TaskStatusResponse] = Field(
+        default_factory=list, description="Status of each known task, in request order"
+    )
+    not_found: list[str] = Field(
+        default_factory=list, description="Requested task ids that are unknown or expired"
+    )
+
+
+class StageStats(BaseModel):
+    """Load of one ingestion pipeline stage in a worker."""
+
+    name: str = Field(..., description="Stage name: fetch, prepare, embed or upsert")
+    concurrency: int = Field(..., description="Concurrent tasks serving the stage")
+    buffer_size: int = Field(..., description="Capacity of the stage's input queue")
+    queue_depth: int = Field(..., description="Work waiting in the stage's input queue")
+    in_flight: int = Field(..., description="Work currently being processed")
+    processed: int = Field(..., description="Work completed since the worker started")
+    failed: int = Field(..., description="Work failed since the worker started")
+    utilization: float = Field(
+        ..., description="Fraction of the stage's capacity spent processing since start"
+    )
+
+
+class HostFetchStats(BaseModel):
+    """Content fetches from one origin host by a worker."""
+
+    host: str = Field(..., description="Origin host, or (other) for hosts no longer tracked")
+    requests: int = Field(..., description="Fetches since the worker started")
+    failures: int = Field(..., description="Fetches that failed after all retries")
+    retries: int = Field(..., description="Retried attempts")
+    bytes: int = Field(..., description="Body bytes downloaded")
+    avg_ms: float = Field(..., description="Average fetch time, retries included")
+
+
+class WorkerPipelineStats(BaseModel):
+    """Pipeline stage statistics last reported by one worker."""
+
+    worker_id: str = Field(..., description="Reporting worker process")
+    reported_at: float = Field(..., description="Unix time of the report")
+    stages: list[StageStats] = Field(default_factory=list, description="Stages in order")
+    fetch: list[HostFetchStats] = Field(
+        default_factory=list, description="HTTP content fetches per origin host"
+    )
+
+
+class LaneStats(BaseModel):
+    """Backlog and queueing delay of one ingestion lane."""
+
+    lane: str = Field(..., description="Lane name")
+    queue: str = Field(..., description="arq queue serving the lane")
+    queue_depth: int = Field(..., description="Jobs waiting or running in the lane")
+    head_wait_ms: float | None = Field(
+        None, description="Time the next job to run has waited so far"
+    )
+    jobs_started: int = Field(0, description="Jobs started from the lane (counter)")
+    wait_ms_total: float = Field(
+        0.0, description="Total time started jobs waited before starting (counter)"
+    )
+    mean_wait_ms: float | None = Field(None, description="wait_ms_total / jobs_started")
+    throughput_per_s: float = Field(0.0, description="Jobs started per second, recently")
+    drain_seconds: float | None = Field(
+        None,
+        description="Estimated time to empty the queue at that throughput (null if nothing ran)",
+    )
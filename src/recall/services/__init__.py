@@ -1,7 +1,8 @@
 """Service layer for Recall."""
 
 from recall.services.ingestion import IngestionService
+from recall.services.planner import QueryPlanner
 from recall.services.registry import SchemaRegistry
 from recall.services.search import SearchService
 
-__all__ = ["IngestionService", "SchemaRegistry", "SearchService"]
+__all__ = ["IngestionService", "QueryPlanner", "SchemaRegistry", "SearchService"]
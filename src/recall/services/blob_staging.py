@@ -0,0 +1,176 @@
+"""Content-addressed staging of large document content outside job payloads."""
+
+import asyncio
+import hashlib
+import time
+
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from recall.core.blobstore.base import BlobStore
+
+# Marks a blob whose last reference was released and which is being deleted.
+DELETING = -1
+
+
+class BlobStaging:
+    """Stages content in a blob store and counts the jobs that reference it.
+
+    Blobs are keyed by the SHA-256 of their content, so identical content
+    queued by many jobs is stored once. A Redis counter per blob tracks how
+    many queued jobs still need it; :meth:`release` drops one reference and
+    deletes the blob once none remain.
+
+    Staging and deletion use optimistic transactions on the counter: the
+    deleter first swaps the last reference for :data:`DELETING`, and stagers
+    wait for that marker to clear, so a blob is never deleted after a new
+    job has taken a reference to it. The marker expires after
+    ``DELETING_TTL`` seconds, so a deleter that dies midway cannot block the
+    content for good.
+
+    Every stage renews the blob's lease of ``ttl`` seconds, on its counter
+    and in a sorted set of lease deadlines. Jobs that time out or die never
+    release their reference; :meth:`collect_expired` deletes the blobs
+    whose lease has run out.
+    """
+
+    REF_PREFIX = "blob:"
+    COUNT_PREFIX = "recall:blob_refs:"
+    LEASES_KEY = "recall:blob_leases"
+    RETRY_DELAY = 0.01
+    DELETING_TTL = 60.0
+
+    def __init__(self, redis: Redis, store: BlobStore, ttl: float = 7 * 86400.0):
+        self._redis = redis
+        self._store = store
+        self._ttl = ttl
+
+    @classmethod
+    def is_ref(cls, value: str | None) -> bool:
+        return bool(value) and value.startswith(cls.REF_PREFIX)
+
+    async def stage(self, data: bytes) -> str:
+        """Store content and take a reference to it.
+
+        Args:
+            data: Content to stage
+
+        Returns:
+            Reference to pass to :meth:`load` and :meth:`release`
+
+        Raises:
+            TimeoutError: If the same content is still being deleted after
+                ``DELETING_TTL`` seconds
+        """
+        key = hashlib.sha256(data).hexdigest()
+        count_key = self.COUNT_PREFIX + key
+        deadline = time.monotonic() + self.DELETING_TTL
+        while True:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(count_key)
+                    count = await pipe.get(count_key)
+                    if count is not None and int(count) == DELETING:
+                        await pipe.reset()
+                        if time.monotonic() >= deadline:
+                            raise TimeoutError(f"Blob '{key}' is still being deleted")
+                        await asyncio.sleep(self.RETRY_DELAY)
+                        continue
+                    pipe.multi()
+                    pipe.incr(count_key)
+                    pipe.pexpire(count_key, int(self._ttl * 1000))
+                    pipe.zadd(self.LEASES_KEY, {key: time.time() + self._ttl})
+                    await pipe.execute()
+                    break
+                except WatchError:
+                    continue
+        # Our reference stops any deleter, so an existing blob is safe to reuse.
+        if count is None or not await self._store.exists(key):
+            await self._store.put(key, data)
+        return self.REF_PREFIX + key
+
+    async def load(self, ref: str) -> bytes:
+        """Read staged content.
+
+        Raises:
+            BlobNotFoundError: If the blob does not exist
+        """
+        return await self._store.get(self._key(ref))
+
+    async def release(self, ref: str) -> None:
+        """Drop one reference, deleting the blob when it was the last.
+
+        A blob whose lease ran out has no counter left; releasing it does
+        nothing, since :meth:`collect_expired` deletes it.
+        """
+        key = self._key(ref)
+        count_key = self.COUNT_PREFIX + key
+        async with self._redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(count_key)
+                    count = await pipe.get(count_key)
+                    if count is None or int(count) <= 0:
+                        return
+                    pipe.multi()
+                    if int(count) > 1:
+                        pipe.decr(count_key)
+                        await pipe.execute()
+                        return
+                    pipe.set(count_key, DELETING, px=int(self.DELETING_TTL * 1000))
+                    await pipe.execute()
+                    break
+                except WatchError:
+                    # The count changed; look again.
+                    continue
+        await self._delete(key)
+
+    async def collect_expired(self) -> int:
+        """Delete blobs whose lease ran out without their last release.
+
+        Returns:
+            Number of blobs deleted
+        """
+        expired = await self._redis.zrangebyscore(self.LEASES_KEY, "-inf", time.time())
+        deleted = 0
+        for member in expired:
+            key = member.decode() if isinstance(member, bytes) else member
+            if await self._claim_expired(key):
+                await self._delete(key)
+                deleted += 1
+        return deleted
+
+    async def _claim_expired(self, key: str) -> bool:
+        """Mark an expired blob as being deleted, unless it was staged again."""
+        count_key = self.COUNT_PREFIX + key
+        async with self._redis.pipeline(transaction=True) as pipe:
+            try:
+                # Staging renews the lease and bumps the counter in one transaction.
+                await pipe.watch(count_key)
+                count = await pipe.get(count_key)
+                lease = await pipe.zscore(self.LEASES_KEY, key)
+                if lease is None or lease > time.time():
+                    return False
+                if count is not None and int(count) == DELETING:
+                    return False
+                pipe.multi()
+                pipe.set(count_key, DELETING, px=int(self.DELETING_TTL * 1000))
+                await pipe.execute()
+                return True
+            except WatchError:
+                return False
+
+    async def _delete(self, key: str) -> None:
+        count_key = self.COUNT_PREFIX + key
+        try:
+            await self._store.delete(key)
+        finally:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.delete(count_key)
+                pipe.zrem(self.LEASES_KEY, key)
+                await pipe.execute()
+
+    def _key(self, ref: str) -> str:
+        if not self.is_ref(ref):
+            raise ValueError(f"Not a blob reference: {ref!r}")
+        return ref[len(self.REF_PREFIX) :]
@@ -0,0 +1,560 @@
+"""Bulk loading of files straight into a collection, bypassing the job queue."""
+
+import asyncio
+import contextlib
+import csv
+import json
+import mmap
+import os
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Protocol, TextIO
+
+from pydantic import ValidationError
+
+from recall.core.embedders.base import BaseEmbedder
+from recall.core.embedders.factory import EmbedderFactory
+from recall.core.utils import deterministic_vector_id
+from recall.core.vectordb.base import Point, VectorDBClient
+from recall.models.collection import Collection
+from recall.models.document import Document
+from recall.models.errors import EmbeddingError
+from recall.services.registry import SchemaRegistry
+from recall.services.schema_validator import coerce_payloads
+
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".tif", ".tiff"})
+
+
+@dataclass
+class BulkRecord:
+    """One document read from a bulk source.
+
+    ``end`` is the source position right after the record; loading resumes
+    from there once the record and everything before it is stored.
+    """
+
+    end: int
+    doc_id: str
+    content: str | bytes | None = None
+    payload: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+class BulkSource(Protocol):
+    """A file or directory of documents, readable from any saved position."""
+
+    format: str
+    path: Path
+
+    def records(self, start: int = 0) -> Iterator[BulkRecord]: ...
+
+
+class _MappedLines:
+    """Lines of a memory-mapped file, tracking the byte offset after the last one.
+
+    Each line is decoded on its own. A line that isn't valid UTF-8 is read
+    as an empty line and its error kept until :meth:`take_error`, so it
+    fails one record rather than the whole load.
+    """
+
+    LINE_COUNT_CHUNK = 1 << 20
+
+    def __init__(self, mm: mmap.mmap, pos: int = 0):
+        self._mm = mm
+        self.pos = pos
+        self._error: str | None = None
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        if self.pos >= len(self._mm):
+            raise StopIteration
+        end = self._mm.find(b"\n", self.pos)
+        end = len(self._mm) if end == -1 else end + 1
+        try:
+            line = self._mm[self.pos : end].decode("utf-8")
+        except UnicodeDecodeError as e:
+            self._error = f"Line {self._line_number(self.pos)} is not valid UTF-8: {e.reason}"
+            line = "\n"
+        self.pos = end
+        return line
+
+    def take_error(self) -> str | None:
+        """The decoding error of a line read since the last call, if any."""
+        error, self._error = self._error, None
+        return error
+
+    def _line_number(self, pos: int) -> int:
+        # Only counted when a line fails, so resumed loads never scan the prefix.
+        newlines = 0
+        for chunk in range(0, pos, self.LINE_COUNT_CHUNK):
+            newlines += self._mm[chunk : min(chunk + self.LINE_COUNT_CHUNK, pos)].count(b"\n")
+        return newlines + 1
+
+
+@contextlib.contextmanager
+def _mapped(path: Path) -> Iterator[mmap.mmap | None]:
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield None
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _document_record(end: int, data: dict[str, Any]) -> BulkRecord:
+    """A record from ``Document`` fields; content must be inline."""
+    doc_id = str(data.get("id", "")) if isinstance(data, dict) else ""
+    try:
+        doc = Document.model_validate(data)
+    except ValidationError as e:
+        return BulkRecord(end, doc_id, error=str(e.errors()[0]["msg"]))
+    content = doc.content_raw or doc.content_base64
+    if content is None:
+        return BulkRecord(end, str(doc.id), error="No inline content (content_uri is not loaded)")
+    return BulkRecord(end, str(doc.id), content, doc.payload)
+
+
+class JsonlSource:
+    """JSON Lines file of ``Document`` objects; positions are byte offsets."""
+
+    format = "jsonl"
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def records(self, start: int = 0) -> Iterator[BulkRecord]:
+        with _mapped(self.path) as mm:
+            if mm is None:
+                return
+            lines = _MappedLines(mm, start)
+            for line in lines:
+                error = lines.take_error()
+                if error is not None:
+                    yield BulkRecord(lines.pos, "", error=error)
+                    continue
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield BulkRecord(lines.pos, "", error=f"Invalid JSON: {e}")
+                    continue
+                yield _document_record(lines.pos, data)
+
+
+class CsvSource:
+    """CSV file with a header row; positions are byte offsets.
+
+    ``id_column`` and ``content_column`` give each document's id and text;
+    every other column becomes a payload field.
+    """
+
+    format = "csv"
+
+    def __init__(self, path: Path, id_column: str = "id", content_column: str = "content"):
+        self.path = path
+        self.id_column = id_column
+        self.content_column = content_column
+
+    def records(self, start: int = 0) -> Iterator[BulkRecord]:
+        with _mapped(self.path) as mm:
+            if mm is None:
+                return
+            lines = _MappedLines(mm)
+            # csv.reader pulls one line at a time, so lines.pos is the end of each row.
+            reader = csv.reader(lines)
+            header = next(reader, None)
+            if header is None:
+                return
+            error = lines.take_error()
+            if error is not None:
+                raise ValueError(f"{self.path}: CSV header: {error}")
+            header[0] = header[0].removeprefix("\ufeff")
+            missing = {self.id_column, self.content_column} - set(header)
+            if missing:
+                raise ValueError(f"{self.path}: missing CSV columns {sorted(missing)}")
+            lines.pos = max(start, lines.pos)
+            for row in reader:
+                error = lines.take_error()
+                if error is not None:
+                    yield BulkRecord(lines.pos, "", error=error)
+                    continue
+                if not row:
+                    continue
+                if len(row) != len(header):
+                    yield BulkRecord(lines.pos, "", error=f"Expected {len(header)} columns")
+                    continue
+                values = dict(zip(header, row, strict=True))
+                doc_id = values.pop(self.id_column)
+                content = values.pop(self.content_column)
+                if not doc_id or not content:
+                    yield BulkRecord(lines.pos, doc_id, error="Missing id or content")
+                    continue
+                yield BulkRecord(lines.pos, doc_id, content, values)
+
+
+class ImageDirectorySource:
+    """Image files under a directory, in path order; positions count files.
+
+    Each file is one document whose id is its path relative to the
+    directory, also stored in the payload as ``path``.
+    """
+
+    format = "images"
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def records(self, start: int = 0) -> Iterator[BulkRecord]:
+        files = sorted(
+            p for p in self.path.rglob("*") if p.is_file() and p.suffix.lower() in IMAGE_EXTENSIONS
+        )
+        for position, file in enumerate(files[start:], start + 1):
+            doc_id = file.relative_to(self.path).as_posix()
+            try:
+                content = file.read_bytes()
+            except OSError as e:
+                yield BulkRecord(position, doc_id, error=str(e))
+                continue
+            yield BulkRecord(position, doc_id, content, {"path": doc_id})
+
+
+def open_source(
+    path: Path,
+    format: str | None = None,
+    id_column: str = "id",
+    content_column: str = "content",
+) -> BulkSource:
+    """Open a bulk source, inferring its format from the path when not given.
+
+    Raises:
+        ValueError: If the format is unknown or cannot be inferred
+    """
+    if format is None:
+        if path.is_dir():
+            format = "images"
+        elif path.suffix.lower() in (".jsonl", ".ndjson"):
+            format = "jsonl"
+        elif path.suffix.lower() == ".csv":
+            format = "csv"
+        else:
+            raise ValueError(f"Cannot infer the format of {path}; pass one explicitly")
+    if format == "jsonl":
+        return JsonlSource(path)
+    if format == "csv":
+        return CsvSource(path, id_column, content_column)
+    if format == "images":
+        return ImageDirectorySource(path)
+    raise ValueError(f"Unknown bulk source format: {format}")
+
+
+@dataclass
+class LoadStats:
+    """Progress of a bulk load; counts include documents loaded before a resume."""
+
+    loaded: int = 0
+    failed: int = 0
+    position: int = 0
+    elapsed: float = 0.0
+    loaded_this_run: int = 0
+
+    @property
+    def docs_per_second(self) -> float:
+        """Documents stored per second by this run."""
+        return self.loaded_this_run / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class Checkpoint:
+    """Position of a bulk load in its source, saved after every stored batch.
+
+    The file is replaced atomically, so a crash leaves the last saved
+    position. Upserts are idempotent, so documents stored after it are
+    simply stored again on resume.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def load(self, collection_name: str, source: BulkSource) -> LoadStats | None:
+        """The saved progress of this load, or None if there is none.
+
+        Raises:
+            ValueError: If the checkpoint belongs to another load
+        """
+        if not self.path.exists():
+            return None
+        state = json.loads(self.path.read_text())
+        expected = (collection_name, str(source.path.resolve()), source.format)
+        if (state["collection"], state["source"], state["format"]) != expected:
+            raise ValueError(f"Checkpoint {self.path} belongs to another load")
+        return LoadStats(loaded=state["loaded"], failed=state["failed"], position=state["position"])
+
+    def save(self, collection_name: str, source: BulkSource, stats: LoadStats) -> None:
+        state = {
+            "collection": collection_name,
+            "source": str(source.path.resolve()),
+            "format": source.format,
+            "position": stats.position,
+            "loaded": stats.loaded,
+            "failed": stats.failed,
+        }
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        tmp.write_text(json.dumps(state))
+        os.replace(tmp, self.path)
+
+
+@dataclass
+class _BatchResult:
+    end: int
+    loaded: int
+    failed: int
+
+
+class _Committer:
+    """Counts finished batches; saves progress over the contiguous prefix of them.
+
+    Batches finish out of order, so the saved position only moves past a
+    batch once it and every earlier batch are stored.
+    """
+
+    def __init__(self, stats: LoadStats, save: Callable[[LoadStats], None] | None):
+        self.stats = stats
+        self._committed = LoadStats(
+            loaded=stats.loaded, failed=stats.failed, position=stats.position
+        )
+        self._save = save
+        self._finished: dict[int, _BatchResult] = {}
+        self._next = 0
+
+    def finish(self, seq: int, result: _BatchResult) -> None:
+        self.stats.loaded += result.loaded
+        self.stats.loaded_this_run += result.loaded
+        self.stats.failed += result.failed
+        self._finished[seq] = result
+        if self._next not in self._finished:
+            return
+        while self._next in self._finished:
+            done = self._finished.pop(self._next)
+            self._committed.position = done.end
+            self._committed.loaded += done.loaded
+            self._committed.failed += done.failed
+            self._next += 1
+        self.stats.position = self._committed.position
+        if self._save is not None:
+            self._save(self._committed)
+
+
+class BulkLoader:
+    """Reads a bulk source, embeds it in large batches and upserts it directly.
+
+    Records are read from the source on a thread of their own, then
+    validated, coerced to the collection schema's field types and decoded
+    in batches of ``batch_size``; up to ``embed_workers`` batches are embedded
+    at once on a thread pool. Each batch's points are upserted in chunks of
+    ``upsert_batch_size``, at most ``upsert_concurrency`` at a time.
+
+    Invalid records are skipped, counted as failed and written to
+    ``errors`` as JSON lines. Embedding or database errors stop the load;
+    the checkpoint then holds the position after the last batch that was
+    stored along with every batch before it.
+    """
+
+    def __init__(
+        self,
+        registry: SchemaRegistry,
+        vectordb: VectorDBClient,
+        batch_size: int = 256,
+        embed_workers: int | None = None,
+        upsert_batch_size: int = 512,
+        upsert_concurrency: int = 4,
+        checkpoint: Checkpoint | None = None,
+        errors: TextIO | None = None,
+        on_progress: Callable[[LoadStats], None] | None = None,
+        progress_interval: float = 5.0,
+    ):
+        self._registry = registry
+        self._vectordb = vectordb
+        self._batch_size = max(1, batch_size)
+        self._embed_workers = max(1, embed_workers or os.cpu_count() or 1)
+        self._upsert_batch_size = max(1, upsert_batch_size)
+        self._upsert_concurrency = max(1, upsert_concurrency)
+        self._checkpoint = checkpoint
+        self._errors = errors
+        self._on_progress = on_progress
+        self._progress_interval = progress_interval
+
+    async def load(
+        self, collection_name: str, source: BulkSource, resume: bool = True
+    ) -> LoadStats:
+        """Load every record of ``source`` after its checkpointed position.
+
+        Args:
+            collection_name: Target collection
+            source: Records to load
+            resume: Continue from the checkpoint, if any
+
+        Returns:
+            Final progress of the load
+
+        Raises:
+            CollectionNotFoundError: If collection doesn't exist
+            EmbeddingError: If a batch cannot be embedded
+            VectorDBError: If points cannot be upserted
+        """
+        collection = await self._registry.get(collection_name)
+        embedder = EmbedderFactory.create(collection.embedding_config.model)
+        saved = (
+            self._checkpoint.load(collection_name, source) if resume and self._checkpoint else None
+        )
+        stats = saved or LoadStats()
+        save = None
+        if self._checkpoint is not None:
+            checkpoint = self._checkpoint
+
+            def save(committed: LoadStats) -> None:
+                checkpoint.save(collection_name, source, committed)
+
+        committer = _Committer(stats, save)
+        run = _Run(collection, embedder, committer, asyncio.Semaphore(self._upsert_concurrency))
+        started = time.perf_counter()
+
+        def report() -> None:
+            stats.elapsed = time.perf_counter() - started
+            if self._on_progress is not None:
+                self._on_progress(stats)
+
+        async def report_periodically() -> None:
+            while True:
+                await asyncio.sleep(self._progress_interval)
+                report()
+
+        executor = ThreadPoolExecutor(self._embed_workers, thread_name_prefix="recall-bulk")
+        # Reading and parsing the source blocks, so it runs off the event loop too.
+        reader = ThreadPoolExecutor(1, thread_name_prefix="recall-bulk-read")
+        loop = asyncio.get_running_loop()
+        batches = _batches(source.records(stats.position), self._batch_size)
+        reporter = asyncio.create_task(report_periodically())
+        pending: set[asyncio.Task[None]] = set()
+        try:
+            seq = 0
+            while (batch := await loop.run_in_executor(reader, next, batches, None)) is not None:
+                # Bounded in-flight batches keep memory flat however big the source is.
+                while len(pending) >= self._embed_workers:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        task.result()
+                pending.add(asyncio.create_task(self._load_batch(run, seq, batch, executor)))
+                seq += 1
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            reporter.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await reporter
+            executor.shutdown(wait=False, cancel_futures=True)
+            await loop.run_in_executor(reader, batches.close)
+            reader.shutdown(wait=False)
+
+        report()
+        return stats
+
+    async def _load_batch(
+        self, run: "_Run", seq: int, batch: list[BulkRecord], executor: Executor
+    ) -> None:
+        name = run.collection.name
+        failures = {i: record.error for i, record in enumerate(batch) if record.error is not None}
+        valid = [i for i in range(len(batch)) if i not in failures]
+
+        # Store the coerced payloads: CSV cells are strings whatever the field type.
+        payloads, invalid = coerce_payloads(
+            [batch[i].payload for i in valid], run.collection.index_schema
+        )
+        for j, messages in invalid.items():
+            failures[valid[j]] = "; ".join(messages)
+        for i, payload in zip(valid, payloads, strict=True):
+            batch[i].payload = payload
+        valid = [i for i in valid if i not in failures]
+
+        loop = asyncio.get_running_loop()
+        prepared = await loop.run_in_executor(
+            executor, _prepare, run.embedder, [batch[i].content for i in valid]
+        )
+        inputs = []
+        stored = []
+        for i, (model_input, error) in zip(valid, prepared, strict=True):
+            if error is not None:
+                failures[i] = error
+            else:
+                inputs.append(model_input)
+                stored.append(batch[i])
+
+        vectors = (
+            await loop.run_in_executor(executor, run.embedder.embed_batch, inputs) if inputs else []
+        )
+        points = [
+            Point(
+                id=deterministic_vector_id(name, record.doc_id),
+                vector=vector,
+                payload={**record.payload, "_doc_id": record.doc_id},
+            )
+            for record, vector in zip(stored, vectors, strict=True)
+        ]
+        chunk = self._upsert_batch_size
+        await asyncio.gather(
+            *(
+                run.upsert(self._vectordb, name, points[i : i + chunk])
+                for i in range(0, len(points), chunk)
+            )
+        )
+
+        if self._errors is not None:
+            for i, error in sorted(failures.items()):
+                line = {"position": batch[i].end, "id": batch[i].doc_id, "error": error}
+                self._errors.write(json.dumps(line) + "\n")
+        run.committer.finish(seq, _BatchResult(batch[-1].end, len(points), len(failures)))
+
+
+@dataclass
+class _Run:
+    collection: Collection
+    embedder: BaseEmbedder
+    committer: _Committer
+    upsert_slots: asyncio.Semaphore
+
+    async def upsert(self, vectordb: VectorDBClient, name: str, points: list[Point]) -> None:
+        async with self.upsert_slots:
+            await vectordb.upsert(name, points)
+
+
+def _batches(records: Iterator[BulkRecord], size: int) -> Iterator[list[BulkRecord]]:
+    batch: list[BulkRecord] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _prepare(embedder: BaseEmbedder, contents: list[Any]) -> list[tuple[Any, str | None]]:
+    """Decode each content for the model, catching per-record failures."""
+    prepared: list[tuple[Any, str | None]] = []
+    for content in contents:
+        try:
+            prepared.append((embedder.prepare(content), None))
+        except EmbeddingError as e:
+            prepared.append((None, e.message))
+        except UnicodeDecodeError as e:
+            prepared.append((None, str(e)))
+    return prepared
@@ -0,0 +1,127 @@
+"""In-process cache of collection configurations with pub/sub invalidation."""
+
+import asyncio
+import contextlib
+import time
+import uuid
+from collections.abc import Callable
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from recall.models.collection import Collection
+
+# Messages are "<collection name>[ <origin>]"; collection names have no spaces.
+INVALIDATION_CHANNEL = "recall:collection:invalidate"
+
+
+class CollectionCache:
+    """Read-through cache of parsed :class:`Collection` objects.
+
+    ``SchemaRegistry`` publishes the collection name on
+    :data:`INVALIDATION_CHANNEL` after every write, and the listener started
+    by :meth:`start` drops the matching entry in every other process (the
+    writer invalidates its own cache directly). Entries also expire after
+    ``ttl`` seconds in case a message is lost. While the listener is not
+    subscribed the cache is bypassed, since invalidations could be missed.
+    Other per-collection caches can follow the same invalidations through
+    :meth:`add_listener`.
+
+    Cached objects are shared between callers and must not be mutated.
+    """
+
+    RECONNECT_DELAY = 1.0
+
+    def __init__(self, ttl: float = 60.0):
+        self._ttl = ttl
+        self.origin = uuid.uuid4().hex
+        self._entries: dict[str, tuple[float, Collection]] = {}
+        self._generation = 0
+        self._subscribed = False
+        self._listener: asyncio.Task[None] | None = None
+        self._callbacks: list[Callable[[str | None], None]] = []
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation; see :meth:`put`."""
+        return self._generation
+
+    def get(self, name: str) -> Collection | None:
+        if not self._subscribed:
+            return None
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[name]
+            return None
+        return entry[1]
+
+    def put(self, name: str, collection: Collection, generation: int) -> None:
+        """Cache a collection loaded while the cache was at ``generation``.
+
+        A load that raced with an invalidation may have read stale data, so
+        it is not cached if any invalidation happened since.
+        """
+        if self._subscribed and generation == self._generation:
+            self._entries[name] = (time.monotonic() + self._ttl, collection)
+
+    def add_listener(self, callback: Callable[[str | None], None]) -> None:
+        """Call ``callback`` with the collection name (None for all) on every invalidation."""
+        self._callbacks.append(callback)
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Drop one entry, or all of them."""
+        self._generation += 1
+        if name is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(name, None)
+        for callback in self._callbacks:
+            callback(name)
+
+    async def start(self, redis: Redis) -> None:
+        """Start listening for invalidations.
+
+        Returns once the first subscription attempt has finished.
+        """
+        if self._listener is not None:
+            return
+        ready = asyncio.Event()
+        self._listener = asyncio.create_task(self._listen(redis, ready))
+        await ready.wait()
+
+    async def stop(self) -> None:
+        """Stop the listener and clear the cache."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        self._subscribed = False
+        self.invalidate()
+
+    async def _listen(self, redis: Redis, ready: asyncio.Event) -> None:
+        while True:
+            pubsub = redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Anything published before the subscription was missed.
+                self.invalidate()
+                self._subscribed = True
+                ready.set()
+                async for message in pubsub.listen():
+                    data = message["data"]
+                    data = data.decode() if isinstance(data, bytes) else data
+                    name, _, origin = data.partition(" ")
+                    if origin != self.origin:
+                        self.invalidate(name)
+            except (RedisError, OSError):
+                self._subscribed = False
+                self.invalidate()
+                ready.set()
+                await asyncio.sleep(self.RECONNECT_DELAY)
+            finally:
+                self._subscribed = False
+                with contextlib.suppress(RedisError, OSError):
+                    await pubsub.aclose()
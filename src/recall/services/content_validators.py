@@ -0,0 +1,64 @@
+"""Validators of the content each URI document was last embedded from."""
+
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict
+
+from redis.asyncio import Redis
+
+from recall.core.utils import deterministic_vector_id
+from recall.services.fetcher import ContentValidators
+
+
+class ContentValidatorStore:
+    """Remembers which version of its URI each stored document was embedded from.
+
+    Records are keyed by the document's deterministic vector id and hold
+    the URI with its ETag, Last-Modified and body hash, so re-ingesting an
+    unchanged URI can send a conditional request and skip the embedding.
+    Records are written only once the document's point is stored, and
+    expire after ``ttl`` seconds.
+    """
+
+    KEY_PREFIX = "recall:content_validators:"
+
+    def __init__(self, redis: Redis, ttl: float = 30 * 86400.0):
+        self._redis = redis
+        self._ttl_ms = max(1, int(ttl * 1000))
+
+    async def get(self, collection_name: str, doc_id: str) -> ContentValidators | None:
+        """The validators a document was last embedded with, if known."""
+        data = await self._redis.get(self._key(collection_name, doc_id))
+        if data is None:
+            return None
+        return ContentValidators(**json.loads(data))
+
+    async def update(
+        self,
+        collection_name: str,
+        validators: Mapping[str, ContentValidators],
+        cleared: Sequence[str] = (),
+    ) -> None:
+        """Record validators of stored documents and forget those of others.
+
+        Args:
+            collection_name: Collection the documents belong to
+            validators: Validators per document id
+            cleared: Ids of documents stored from other content, whose
+                records no longer describe their points
+        """
+        if not validators and not cleared:
+            return
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for doc_id, record in validators.items():
+                pipe.set(
+                    self._key(collection_name, doc_id),
+                    json.dumps(asdict(record), separators=(",", ":")),
+                    px=self._ttl_ms,
+                )
+            if cleared:
+                pipe.delete(*(self._key(collection_name, doc_id) for doc_id in cleared))
+            await pipe.execute()
+
+    def _key(self, collection_name: str, doc_id: str) -> str:
+        return self.KEY_PREFIX + deterministic_vector_id(collection_name, doc_id)
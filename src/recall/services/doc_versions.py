@@ -0,0 +1,98 @@
+"""Version numbers of queued documents, for coalescing superseded jobs."""
+
+from collections.abc import Iterable, Mapping
+
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+from recall.core.utils import deterministic_vector_id
+
+
+class DocumentVersions:
+    """Tracks which queued job holds the newest version of each document.
+
+    Every enqueue takes the next version number of each of its documents
+    from a per-document counter and passes it to the job. Once the jobs
+    are queued their versions are recorded, and a job records its own
+    version again when it starts. A job whose document has a higher
+    recorded version is skipped: the newer job embeds the latest content,
+    so a document updated N times before a worker reaches it costs one
+    embedding instead of N, and an older job never overwrites a newer one
+    however long it waits in its queue.
+
+    Versions taken by an enqueue that failed are never recorded, so they
+    never supersede anything. Records expire after ``ttl`` seconds without
+    a new version; the counter and the record of a document always expire
+    together, so version numbers never go back while a record exists.
+    """
+
+    SEQ_PREFIX = "recall:doc_seq:"
+    KEY_PREFIX = "recall:doc_version:"
+
+    def __init__(self, redis: Redis, ttl: float = 86400.0):
+        self._redis = redis
+        self._ttl_ms = max(1, int(ttl * 1000))
+
+    async def reserve(self, collection_name: str, doc_ids: Iterable[str]) -> dict[str, int]:
+        """Take the next version number of each document.
+
+        Args:
+            collection_name: Collection the documents belong to
+            doc_ids: Document ids; repeated ids take one version
+
+        Returns:
+            Version number per document id
+        """
+        unique = list(dict.fromkeys(doc_ids))
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for doc_id in unique:
+                seq_key, key = self._keys(collection_name, doc_id)
+                pipe.incr(seq_key)
+                pipe.pexpire(seq_key, self._ttl_ms)
+                pipe.pexpire(key, self._ttl_ms)
+            results = await pipe.execute()
+        return {doc_id: int(seq) for doc_id, seq in zip(unique, results[::3], strict=True)}
+
+    async def record(self, collection_name: str, versions: Mapping[str, tuple[str, int]]) -> None:
+        """Record queued jobs as versions of their documents.
+
+        Args:
+            collection_name: Collection the documents belong to
+            versions: Job id and version number per document id
+        """
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for doc_id, (job_id, seq) in versions.items():
+                self._add(pipe, collection_name, doc_id, job_id, seq)
+            await pipe.execute()
+
+    async def claim(self, collection_name: str, doc_id: str, job_id: str, seq: int) -> str | None:
+        """Record a starting job's version and find the job superseding it.
+
+        Returns:
+            The id of the job holding a higher version of the document, or
+            None if ``job_id`` holds the latest one
+        """
+        async with self._redis.pipeline(transaction=True) as pipe:
+            key = self._add(pipe, collection_name, doc_id, job_id, seq)
+            pipe.zrange(key, -1, -1, withscores=True)
+            *_, latest = await pipe.execute()
+        if not latest:
+            return None
+        latest_job, latest_seq = latest[0]
+        if latest_seq <= seq:
+            return None
+        return latest_job.decode() if isinstance(latest_job, bytes) else latest_job
+
+    def _add(self, pipe: Pipeline, collection_name: str, doc_id: str, job_id: str, seq: int) -> str:
+        """Queue the commands recording one version; returns the record key."""
+        seq_key, key = self._keys(collection_name, doc_id)
+        pipe.zadd(key, {job_id: seq}, gt=True)
+        # Only the latest version matters.
+        pipe.zremrangebyrank(key, 0, -2)
+        pipe.pexpire(key, self._ttl_ms)
+        pipe.pexpire(seq_key, self._ttl_ms)
+        return key
+
+    def _keys(self, collection_name: str, doc_id: str) -> tuple[str, str]:
+        vector_id = deterministic_vector_id(collection_name, doc_id)
+        return self.SEQ_PREFIX + vector_id, self.KEY_PREFIX + vector_id
@@ -0,0 +1,316 @@
+"""Shared HTTP fetcher for document content."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Protocol
+
+import httpx
+
+from recall.config import Settings, get_settings
+from recall.models.errors import ContentFetchError, ContentTooLargeError
+
+RETRY_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class ContentValidators:
+    """What identifies the version of a URI's content that was last embedded.
+
+    ``etag`` and ``last_modified`` are the origin's cache validators, sent
+    back as ``If-None-Match`` and ``If-Modified-Since``; ``sha256`` is the
+    hash of the body, for origins that send neither.
+    """
+
+    uri: str
+    etag: str | None = None
+    last_modified: str | None = None
+    sha256: str | None = None
+
+
+@dataclass
+class FetchedContent:
+    """Body of a successful fetch and what it cost.
+
+    ``content`` is bytes, or a read-only view of memory the fetcher did not
+    copy (e.g. a mapped file). A conditional fetch answered with 304 Not
+    Modified has ``not_modified`` set and an empty ``content``.
+    """
+
+    content: bytes | memoryview
+    elapsed_ms: float
+    attempts: int
+    etag: str | None = None
+    last_modified: str | None = None
+    not_modified: bool = False
+
+
+class ContentFetcher(Protocol):
+    """Downloads the content of URIs of the schemes it serves."""
+
+    async def fetch(
+        self, uri: str, validators: ContentValidators | None = None
+    ) -> FetchedContent: ...
+
+    async def aclose(self) -> None: ...
+
+
+@dataclass
+class FetchStats:
+    """Cumulative fetch counters for one host."""
+
+    requests: int = 0
+    failures: int = 0
+    retries: int = 0
+    bytes: int = 0
+    total_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.requests if self.requests else 0.0
+
+    def add(self, other: "FetchStats") -> None:
+        self.requests += other.requests
+        self.failures += other.failures
+        self.retries += other.retries
+        self.bytes += other.bytes
+        self.total_ms += other.total_ms
+
+
+@dataclass
+class _Host:
+    """Concurrency limit and counters of one origin host."""
+
+    semaphore: asyncio.Semaphore
+    stats: FetchStats = field(default_factory=FetchStats)
+    active: int = 0
+
+
+class _RetryableError(Exception):
+    def __init__(self, error: ContentFetchError, retry_after: float | None = None):
+        super().__init__(error.message)
+        self.error = error
+        self.retry_after = retry_after
+
+
+class HttpFetcher:
+    """Fetches content over one pooled HTTP client shared by all jobs.
+
+    Connections are pooled (and multiplexed over HTTP/2 where the origin
+    supports it) with at most ``per_host_limit`` requests in flight to any
+    one host, so raising worker concurrency does not hammer a single origin.
+    Bodies are streamed and abandoned as soon as they exceed ``max_bytes``
+    (checked against ``Content-Length`` first), so memory stays bounded.
+    Transport errors, timeouts and retryable status codes are retried up to
+    ``retries`` times with exponential backoff, honouring ``Retry-After`` up
+    to ``max_retry_after`` seconds; an origin asking for a longer wait fails
+    the fetch at once instead of holding the job.
+    Given the :class:`ContentValidators` of a previous fetch, requests are
+    conditional, so an unchanged body costs a 304 instead of a download.
+
+    Per-host state is kept for at most ``max_hosts`` hosts. Beyond that the
+    least recently used idle host is dropped, and its counters are folded
+    into the :data:`OTHER_HOSTS` entry of :meth:`stats`.
+    """
+
+    OTHER_HOSTS = "(other)"
+
+    def __init__(
+        self,
+        max_bytes: int = 50 * 1024 * 1024,
+        per_host_limit: int = 8,
+        max_connections: int = 100,
+        timeout: float = 30.0,
+        retries: int = 3,
+        backoff: float = 0.5,
+        http2: bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
+        max_hosts: int = 1024,
+        max_retry_after: float = 60.0,
+    ):
+        self._max_bytes = max_bytes
+        self._per_host_limit = per_host_limit
+        self._retries = retries
+        self._backoff = backoff
+        self._max_retry_after = max_retry_after
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            follow_redirects=True,
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 10.0)),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=transport,
+        )
+        self._max_hosts = max(1, max_hosts)
+        self._hosts: OrderedDict[str, _Host] = OrderedDict()
+        self._evicted = FetchStats()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "HttpFetcher":
+        return cls(
+            max_bytes=settings.fetch_max_bytes,
+            per_host_limit=settings.fetch_per_host_limit,
+            max_connections=settings.fetch_max_connections,
+            timeout=settings.fetch_timeout,
+            retries=settings.fetch_retries,
+            http2=settings.fetch_http2,
+            max_retry_after=settings.fetch_max_retry_after,
+        )
+
+    def stats(self) -> dict[str, FetchStats]:
+        """Snapshot of the per-host fetch counters."""
+        stats = {host: replace(state.stats) for host, state in self._hosts.items()}
+        if self._evicted.requests:
+            stats[self.OTHER_HOSTS] = replace(self._evicted)
+        return stats
+
+    async def fetch(self, uri: str, validators: ContentValidators | None = None) -> FetchedContent:
+        """Download the body at ``uri``.
+
+        Args:
+            uri: HTTP or HTTPS URI
+            validators: Validators of the version already held; the request
+                is then conditional, and an unchanged body is not downloaded
+
+        Returns:
+            The body with its fetch time, attempt count and validators
+
+        Raises:
+            ContentTooLargeError: If the body exceeds the size limit
+            ContentFetchError: If the fetch fails after all retries
+        """
+        try:
+            name = httpx.URL(uri).host
+        except httpx.InvalidURL as exc:
+            raise ContentFetchError(f"Invalid content URI '{uri}': {exc}", uri) from exc
+        host = self._acquire(name)
+        try:
+            return await self._fetch(uri, validators, host)
+        finally:
+            host.active -= 1
+
+    async def _fetch(
+        self, uri: str, validators: ContentValidators | None, host: _Host
+    ) -> FetchedContent:
+        stats = host.stats
+        semaphore = host.semaphore
+        headers = {}
+        if validators is not None and validators.etag:
+            headers["If-None-Match"] = validators.etag
+        if validators is not None and validators.last_modified:
+            headers["If-Modified-Since"] = validators.last_modified
+
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                async with semaphore:
+                    content, response_headers = await self._fetch_once(uri, headers)
+            except _RetryableError as exc:
+                if attempt > self._retries:
+                    self._record(stats, start, failed=True)
+                    raise exc.error from exc
+                if exc.retry_after is not None and exc.retry_after > self._max_retry_after:
+                    self._record(stats, start, failed=True)
+                    raise ContentFetchError(
+                        f"{exc.error.message}; Retry-After of {exc.retry_after:g}s exceeds "
+                        f"the {self._max_retry_after:g}s limit",
+                        uri,
+                        exc.error.status_code,
+                    ) from exc
+                stats.retries += 1
+                delay = self._backoff * 2 ** (attempt - 1)
+                if exc.retry_after is not None:
+                    delay = max(delay, exc.retry_after)
+                await asyncio.sleep(delay)
+                continue
+            except ContentFetchError:
+                self._record(stats, start, failed=True)
+                raise
+            stats.bytes += len(content or b"")
+            elapsed_ms = self._record(stats, start, failed=False)
+            return FetchedContent(
+                content=content or b"",
+                elapsed_ms=elapsed_ms,
+                attempts=attempt,
+                etag=response_headers.get("etag"),
+                last_modified=response_headers.get("last-modified"),
+                not_modified=content is None,
+            )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    def _acquire(self, name: str) -> _Host:
+        """The state of a host, marked in use until the caller releases it."""
+        host = self._hosts.get(name)
+        if host is None:
+            host = self._hosts[name] = _Host(asyncio.Semaphore(self._per_host_limit))
+        else:
+            self._hosts.move_to_end(name)
+        host.active += 1
+        if len(self._hosts) > self._max_hosts:
+            self._evict()
+        return host
+
+    def _evict(self) -> None:
+        """Drop least recently used idle hosts until within ``max_hosts``."""
+        idle = [name for name, host in self._hosts.items() if host.active == 0]
+        for name in idle[: len(self._hosts) - self._max_hosts]:
+            self._evicted.add(self._hosts.pop(name).stats)
+
+    async def _fetch_once(
+        self, uri: str, headers: dict[str, str]
+    ) -> tuple[bytes | None, httpx.Headers]:
+        """The body (None if not modified) and response headers of one attempt."""
+        try:
+            async with self._client.stream("GET", uri, headers=headers) as response:
+                if response.status_code == 304 and headers:
+                    return None, response.headers
+                if response.status_code >= 400:
+                    error = ContentFetchError(
+                        f"Fetching '{uri}' failed with HTTP {response.status_code}",
+                        uri,
+                        response.status_code,
+                    )
+                    if response.status_code in RETRY_STATUS_CODES:
+                        raise _RetryableError(error, _retry_after(response))
+                    raise error
+                length = response.headers.get("content-length")
+                if length is not None and length.isdigit() and int(length) > self._max_bytes:
+                    raise ContentTooLargeError(uri, self._max_bytes)
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body += chunk
+                    if len(body) > self._max_bytes:
+                        raise ContentTooLargeError(uri, self._max_bytes)
+                return bytes(body), response.headers
+        except httpx.TransportError as exc:
+            raise _RetryableError(ContentFetchError(f"Fetching '{uri}' failed: {exc!r}", uri))
+        except httpx.InvalidURL as exc:
+            raise ContentFetchError(f"Invalid content URI '{uri}': {exc}", uri) from exc
+
+    @staticmethod
+    def _record(stats: FetchStats, start: float, failed: bool) -> float:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        stats.requests += 1
+        stats.total_ms += elapsed_ms
+        if failed:
+            stats.failures += 1
+        return elapsed_ms
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    value = response.headers.get("retry-after", "")
+    return float(value) if value.isdigit() else None
+
+
+@lru_cache
+def get_http_fetcher() -> HttpFetcher:
+    """Get the process-wide HTTP fetcher."""
+    return HttpFetcher.from_settings(get_settings())
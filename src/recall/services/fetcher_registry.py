@@ -0,0 +1,84 @@
+"""Choice of content fetcher by URI scheme."""
+
+from collections.abc import Mapping
+
+from recall.config import Settings
+from recall.models.errors import ContentFetchError
+from recall.services.fetcher import (
+    ContentFetcher,
+    ContentValidators,
+    FetchedContent,
+    FetchStats,
+    HttpFetcher,
+)
+from recall.services.file_fetcher import FileFetcher
+from recall.services.s3_fetcher import S3Fetcher
+
+
+class FetcherRegistry:
+    """Routes each fetch to the fetcher registered for its URI's scheme."""
+
+    def __init__(self, fetchers: Mapping[str, ContentFetcher] | None = None):
+        self._fetchers: dict[str, ContentFetcher] = {}
+        for scheme, fetcher in (fetchers or {}).items():
+            self.register(scheme, fetcher)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "FetcherRegistry":
+        """HTTP(S), ``file://`` and ``s3://`` fetchers configured by ``FETCH_*``."""
+        http = HttpFetcher.from_settings(settings)
+        return cls(
+            {
+                "http": http,
+                "https": http,
+                "file": FileFetcher(settings.fetch_file_roots, settings.fetch_max_bytes),
+                "s3": S3Fetcher(
+                    endpoint_url=settings.fetch_s3_endpoint_url,
+                    region=settings.fetch_s3_region,
+                    max_bytes=settings.fetch_max_bytes,
+                    max_connections=settings.fetch_max_connections,
+                    retries=settings.fetch_retries,
+                    part_size=settings.fetch_s3_part_size,
+                    part_concurrency=settings.fetch_s3_part_concurrency,
+                ),
+            }
+        )
+
+    def register(self, scheme: str, fetcher: ContentFetcher) -> None:
+        """Serve URIs of ``scheme`` with ``fetcher``, replacing any previous one."""
+        self._fetchers[scheme.lower()] = fetcher
+
+    def schemes(self) -> list[str]:
+        return sorted(self._fetchers)
+
+    async def fetch(self, uri: str, validators: ContentValidators | None = None) -> FetchedContent:
+        """Fetch ``uri`` with the fetcher for its scheme.
+
+        Raises:
+            ContentFetchError: If no fetcher serves the scheme, or the fetch fails
+        """
+        scheme, sep, _ = uri.partition(":")
+        fetcher = self._fetchers.get(scheme.lower()) if sep else None
+        if fetcher is None:
+            raise ContentFetchError(
+                f"Unsupported content URI '{uri}'; supported schemes: {', '.join(self.schemes())}",
+                uri,
+            )
+        return await fetcher.fetch(uri, validators)
+
+    def stats(self) -> dict[str, FetchStats]:
+        """Per-host counters of the registered HTTP fetchers, merged."""
+        merged: dict[str, FetchStats] = {}
+        for fetcher in self._distinct():
+            if isinstance(fetcher, HttpFetcher):
+                for host, stats in fetcher.stats().items():
+                    merged.setdefault(host, FetchStats()).add(stats)
+        return merged
+
+    async def aclose(self) -> None:
+        for fetcher in self._distinct():
+            await fetcher.aclose()
+
+    def _distinct(self) -> list[ContentFetcher]:
+        """Registered fetchers, each once however many schemes it serves."""
+        return list({id(fetcher): fetcher for fetcher in self._fetchers.values()}.values())
@@ -0,0 +1,82 @@
+"""Fetcher for file:// URIs on volumes shared with the worker."""
+
+import asyncio
+import mmap
+import os
+import stat
+import time
+from collections.abc import Sequence
+from email.utils import formatdate
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from recall.models.errors import ContentFetchError, ContentTooLargeError
+from recall.services.fetcher import ContentValidators, FetchedContent
+
+
+class FileFetcher:
+    """Maps files under ``roots`` into memory instead of reading them.
+
+    A ``file://`` URI must resolve, symlinks included, to a regular file
+    inside one of ``roots``; with no roots every file URI is refused, so
+    API clients cannot read arbitrary files on worker hosts.
+
+    The content is a read-only view of an mmap of the file: its pages come
+    from the page cache without being copied into a Python buffer, and the
+    mapping is released once the last reference to the view is dropped.
+    The ETag is the file's modification time and size, so a conditional
+    fetch of an unchanged file is answered from ``stat`` alone.
+    """
+
+    def __init__(self, roots: Sequence[str] = (), max_bytes: int = 50 * 1024 * 1024):
+        self._roots = [Path(root).resolve() for root in roots]
+        self._max_bytes = max_bytes
+
+    async def fetch(self, uri: str, validators: ContentValidators | None = None) -> FetchedContent:
+        """Map the file at ``uri``.
+
+        Raises:
+            ContentTooLargeError: If the file exceeds the size limit
+            ContentFetchError: If the URI is outside the roots or cannot be read
+        """
+        start = time.perf_counter()
+        # stat and mmap can block on network filesystems.
+        fetched = await asyncio.to_thread(self._fetch, uri, validators)
+        fetched.elapsed_ms = (time.perf_counter() - start) * 1000
+        return fetched
+
+    async def aclose(self) -> None:
+        pass
+
+    def _fetch(self, uri: str, validators: ContentValidators | None) -> FetchedContent:
+        path = self._path(uri)
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError as e:
+            status = 404 if isinstance(e, FileNotFoundError) else None
+            raise ContentFetchError(f"Reading '{uri}' failed: {e.strerror}", uri, status) from e
+        try:
+            info = os.fstat(fd)
+            if not stat.S_ISREG(info.st_mode):
+                raise ContentFetchError(f"'{uri}' is not a regular file", uri)
+            etag = f'"{info.st_mtime_ns:x}-{info.st_size:x}"'
+            last_modified = formatdate(info.st_mtime, usegmt=True)
+            if validators is not None and validators.etag == etag:
+                return FetchedContent(b"", 0.0, 1, etag, last_modified, not_modified=True)
+            if info.st_size > self._max_bytes:
+                raise ContentTooLargeError(uri, self._max_bytes)
+            content: bytes | memoryview = b""
+            if info.st_size:
+                content = memoryview(mmap.mmap(fd, 0, access=mmap.ACCESS_READ))
+        finally:
+            os.close(fd)
+        return FetchedContent(content, 0.0, 1, etag, last_modified)
+
+    def _path(self, uri: str) -> Path:
+        parts = urlsplit(uri)
+        if parts.netloc not in ("", "localhost"):
+            raise ContentFetchError(f"File URI '{uri}' names a remote host", uri)
+        path = Path(unquote(parts.path)).resolve()
+        if not any(path.is_relative_to(root) for root in self._roots):
+            raise ContentFetchError(f"File URI '{uri}' is outside the allowed roots", uri, 403)
+        return path
@@ -0,0 +1,153 @@
+"""Per-collection statistics on which payload fields searches filter on."""
+
+import asyncio
+import contextlib
+from collections import Counter
+from dataclasses import dataclass, field
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from recall.core.transpiler.cache import CompiledFilter
+from recall.models.collection import FieldType
+
+
+@dataclass
+class FieldUsage:
+    """How often, and how slowly, filters on one payload field ran."""
+
+    uses: int = 0
+    total_ms: float = 0.0
+    types: Counter[FieldType] = field(default_factory=Counter)
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.uses if self.uses else 0.0
+
+    def index_type(self) -> FieldType | None:
+        """Index type matching the filter values seen, or None if they disagree."""
+        seen = set(self.types)
+        if seen <= {FieldType.INT}:
+            return FieldType.INT if seen else None
+        if seen <= {FieldType.INT, FieldType.FLOAT}:
+            return FieldType.FLOAT
+        if len(seen) == 1:
+            return seen.pop()
+        return None
+
+
+class FilterUsageTracker:
+    """Redis-backed counters of filter usage, one hash per collection.
+
+    Hash fields are ``<field>|uses``, ``<field>|ms`` and ``<field>|type:<type>``.
+    Counters accumulate until :meth:`drain` reads and resets them, so each
+    drain sees one observation window.
+
+    Searches only count usage in process; :meth:`flush`, run every
+    ``flush_interval`` seconds once :meth:`start` is called, adds the counts
+    to Redis. Usage only feeds the index advisor, so it is best-effort:
+    counts that cannot be flushed are kept for the next attempt, and a
+    Redis outage never reaches the search path.
+    """
+
+    KEY_PREFIX = "recall:filter_usage:"
+
+    def __init__(self, redis: Redis, flush_interval: float = 5.0):
+        self._redis = redis
+        self._flush_interval = flush_interval
+        self._pending: dict[str, Counter[str]] = {}
+        self._flusher: asyncio.Task[None] | None = None
+
+    def _key(self, collection: str) -> str:
+        return f"{self.KEY_PREFIX}{collection}"
+
+    def record(self, collection: str, compiled: CompiledFilter, elapsed_ms: float) -> None:
+        """Count one search filtering on the fields of ``compiled``.
+
+        Args:
+            collection: Searched collection
+            compiled: Compiled search filter
+            elapsed_ms: Time the vector database took to answer the search
+        """
+        if not compiled.fields:
+            return
+
+        counts = self._pending.setdefault(collection, Counter())
+        for name, types in compiled.fields.items():
+            counts[f"{name}|uses"] += 1
+            counts[f"{name}|ms"] += elapsed_ms
+            for field_type in types:
+                counts[f"{name}|type:{field_type.value}"] += 1
+
+    async def flush(self) -> None:
+        """Add the counts recorded since the last flush to Redis.
+
+        Raises:
+            RedisError: If Redis fails; the counts are kept for the next flush
+        """
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for collection, counts in pending.items():
+                    key = self._key(collection)
+                    for hash_field, value in counts.items():
+                        if hash_field.endswith("|ms"):
+                            pipe.hincrbyfloat(key, hash_field, value)
+                        else:
+                            pipe.hincrby(key, hash_field, int(value))
+                await pipe.execute()
+        except BaseException:
+            for collection, counts in pending.items():
+                self._pending.setdefault(collection, Counter()).update(counts)
+            raise
+
+    async def start(self) -> None:
+        """Start flushing counts every ``flush_interval`` seconds."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and flush what is left, if Redis allows."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        with contextlib.suppress(RedisError, OSError):
+            await self.flush()
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            with contextlib.suppress(RedisError, OSError):
+                await self.flush()
+
+    async def drain(self, collection: str) -> dict[str, FieldUsage]:
+        """Read and reset the usage counters of a collection.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            Usage per payload field since the previous drain
+        """
+        key = self._key(collection)
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.hgetall(key)
+        pipe.delete(key)
+        raw, _ = await pipe.execute()
+
+        usage: dict[str, FieldUsage] = {}
+        for hash_field, value in raw.items():
+            hash_field = hash_field.decode() if isinstance(hash_field, bytes) else hash_field
+            name, _, stat = hash_field.rpartition("|")
+            entry = usage.setdefault(name, FieldUsage())
+            if stat == "uses":
+                entry.uses = int(value)
+            elif stat == "ms":
+                entry.total_ms = float(value)
+            elif stat.startswith("type:"):
+                entry.types[FieldType(stat.removeprefix("type:"))] = int(value)
+        return usage
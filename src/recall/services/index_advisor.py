@@ -0,0 +1,93 @@
+"""Background creation of payload indexes for hot unindexed filter fields."""
+
+from recall.core.vectordb.base import VectorDBClient
+from recall.models.collection import FieldType
+from recall.models.errors import CollectionNotFoundError
+from recall.services.filter_usage import FieldUsage, FilterUsageTracker
+from recall.services.registry import SchemaRegistry
+
+
+class IndexAdvisor:
+    """Indexes payload fields that searches filter on often and slowly.
+
+    Each run drains the usage window of every collection, picks fields that
+    are not yet indexed, were filtered on at least ``min_uses`` times and
+    averaged at least ``min_avg_ms`` per search, and indexes the ones that
+    cost the most total search time. Created indexes are recorded in the
+    collection's ``auto_index_schema``.
+    """
+
+    def __init__(
+        self,
+        registry: SchemaRegistry,
+        vectordb: VectorDBClient,
+        usage: FilterUsageTracker,
+        min_uses: int = 50,
+        min_avg_ms: float = 5.0,
+        max_per_run: int = 3,
+    ):
+        self._registry = registry
+        self._vectordb = vectordb
+        self._usage = usage
+        self._min_uses = min_uses
+        self._min_avg_ms = min_avg_ms
+        self._max_per_run = max_per_run
+
+    async def run(self) -> dict[str, dict[str, FieldType]]:
+        """Create indexes for hot fields across all collections.
+
+        Returns:
+            Indexes created in this run, per collection
+        """
+        created: dict[str, dict[str, FieldType]] = {}
+        for name in await self._registry.list_all():
+            fields = await self.run_collection(name)
+            if fields:
+                created[name] = fields
+        return created
+
+    async def run_collection(self, name: str) -> dict[str, FieldType]:
+        """Create indexes for hot fields of one collection.
+
+        Args:
+            name: Collection name
+
+        Returns:
+            Indexes created, mapping field name to index type
+        """
+        usage = await self._usage.drain(name)
+        if not usage:
+            return {}
+        try:
+            config = await self._registry.get(name)
+        except CollectionNotFoundError:
+            return {}
+
+        indexed = config.index_schema.keys() | config.auto_index_schema.keys()
+        created: dict[str, FieldType] = {}
+        for field, field_type in self._candidates(usage, indexed):
+            await self._vectordb.create_payload_index(name, field, field_type)
+            await self._registry.record_auto_index(name, field, field_type)
+            created[field] = field_type
+        return created
+
+    def _candidates(
+        self, usage: dict[str, FieldUsage], indexed: set[str]
+    ) -> list[tuple[str, FieldType]]:
+        hot = sorted(
+            (
+                (field, stats)
+                for field, stats in usage.items()
+                if field not in indexed
+                and stats.uses >= self._min_uses
+                and stats.avg_ms >= self._min_avg_ms
+            ),
+            key=lambda item: item[1].total_ms,
+            reverse=True,
+        )
+        candidates = []
+        for field, stats in hot:
+            field_type = stats.index_type()
+            if field_type is not None:
+                candidates.append((field, field_type))
+        return candidates[: self._max_per_run]
@@ -1,25 +1,98 @@
 """Ingestion service for document processing."""
 
+import asyncio
+import contextlib
+import math
+from collections.abc import AsyncGenerator, AsyncIterable
+from dataclasses import dataclass, field
 from uuid import uuid4
 
-import httpx
 from arq import ArqRedis
+from pydantic import ValidationError
+from redis.exceptions import RedisError
 
-from recall.models.document import IngestRequest, IngestResponse
+from recall.core.queue import JobSpec, enqueue_jobs
+from recall.models.collection import Collection
+from recall.models.document import (
+    Document,
+    IngestLane,
+    IngestLineError,
+    IngestRequest,
+    IngestResponse,
+    StreamIngestResponse,
+)
+from recall.models.errors import (
+    ContentStagingError,
+    IngestionBackpressureError,
+    SchemaValidationError,
+)
+from recall.services.blob_staging import BlobStaging
+from recall.services.doc_versions import DocumentVersions
+from recall.services.fetcher import get_http_fetcher
+from recall.services.lanes import LANE_QUEUES, LaneScheduler, drain_seconds
 from recall.services.registry import SchemaRegistry
-from recall.services.schema_validator import validate_payload
+from recall.services.schema_validator import validate_payloads
+from recall.services.task_progress import TaskProgressStore
 
 
 class IngestionService:
-    """Service for handling document ingestion."""
+    """Service for handling document ingestion.
+
+    Text content of at least ``blob_min_bytes`` (UTF-8) and all binary
+    content are staged in the blob store, so jobs in Redis carry only a
+    reference. Without ``staging``, text always travels inline and binary
+    content is rejected. With ``progress``, each batch gets a progress
+    record that its jobs update as they run. With ``versions``, each job
+    carries a new version number of its document, so workers skip older
+    jobs for the same document that have not started yet.
+
+    Batches go to the lane named in the request, or else to the interactive
+    lane if they have at most ``interactive_max_docs`` documents and the
+    bulk lane otherwise. With ``scheduler``, jobs are ordered fairly across
+    collections within their lane, and a batch is refused while its lane
+    already holds ``max_queue_depth`` jobs or more than ``max_drain_seconds``
+    of work at the lane's recent throughput. An empty lane accepts any
+    batch, and the drain-time limit applies only once throughput has been
+    observed, so a lane without running workers is bounded by depth alone.
+
+    NDJSON bodies (:meth:`ingest_stream`) have no size limit: they are
+    queued in chunks of ``stream_chunk_size`` documents, and lines longer
+    than ``stream_max_line_bytes`` are rejected without being buffered. A
+    stream waits at most ``stream_max_wait`` seconds in all for its lane.
+    """
+
+    MAX_RETRY_AFTER = 300
+    MAX_REPORTED_ERRORS = 1000
 
     def __init__(
         self,
         registry: SchemaRegistry,
         arq_redis: ArqRedis,
+        staging: BlobStaging | None = None,
+        blob_min_bytes: int = 16 * 1024,
+        progress: TaskProgressStore | None = None,
+        scheduler: LaneScheduler | None = None,
+        interactive_max_docs: int = 10,
+        max_queue_depth: int | None = None,
+        max_drain_seconds: float | None = None,
+        versions: DocumentVersions | None = None,
+        stream_chunk_size: int = 500,
+        stream_max_line_bytes: int = 64 * 1024 * 1024,
+        stream_max_wait: float = 600.0,
     ):
         self._registry = registry
         self._arq_redis = arq_redis
+        self._staging = staging
+        self._blob_min_bytes = blob_min_bytes
+        self._progress = progress
+        self._scheduler = scheduler
+        self._interactive_max_docs = interactive_max_docs
+        self._max_queue_depth = max_queue_depth
+        self._max_drain_seconds = max_drain_seconds
+        self._versions = versions
+        self._stream_chunk_size = max(1, stream_chunk_size)
+        self._stream_max_line_bytes = stream_max_line_bytes
+        self._stream_max_wait = stream_max_wait
 
     async def ingest(self, collection_name: str, request: IngestRequest) -> IngestResponse:
         """Queue documents for ingestion.
@@ -34,30 +107,311 @@ class IngestionService:
         Raises:
             CollectionNotFoundError: If collection doesn't exist
             SchemaValidationError: If document payload doesn't match schema
+            ContentStagingError: If binary content is sent but no blob store is configured
+            IngestionBackpressureError: If the batch's lane is too far behind
         """
         collection = await self._registry.get(collection_name)
 
-        for doc in request.documents:
-            validate_payload(doc.payload, collection.index_schema, str(doc.id))
+        validate_payloads(
+            [doc.payload for doc in request.documents],
+            collection.index_schema,
+            [str(doc.id) for doc in request.documents],
+        )
 
         batch_id = str(uuid4())
-
-        for doc in request.documents:
-            await self._arq_redis.enqueue_job(
-                "embed_document",
-                collection_name=collection_name,
-                doc_id=str(doc.id),
-                content_uri=doc.content_uri,
-                content_raw=doc.content_raw,
-                payload=doc.payload,
-                _job_id=f"{batch_id}:{doc.id}",
-            )
+        documents = _unique(request.documents)
+        lane = request.lane or self._lane_for(len(documents))
+        await self._admit(lane, len(documents))
+        await self._enqueue(collection_name, batch_id, batch_id, lane, documents)
 
         return IngestResponse(
             task_id=batch_id,
             documents_queued=len(request.documents),
             status="queued",
+            lane=lane,
+        )
+
+    async def ingest_stream(
+        self,
+        collection_name: str,
+        body: AsyncIterable[bytes],
+        lane: IngestLane | None = None,
+    ) -> StreamIngestResponse:
+        """Queue documents from an NDJSON body, one ``Document`` per line.
+
+        Lines are parsed and validated as the body arrives and queued in
+        chunks of ``stream_chunk_size`` documents, each while the next one
+        is being read, so memory stays bounded whatever the body size. All
+        chunks share one task. Invalid lines are skipped and reported; a
+        document repeated within a chunk shares one job as in :meth:`ingest`,
+        while a repeat in a later chunk is queued again.
+
+        Without ``lane``, a body that fits in one chunk is routed by size as
+        in :meth:`ingest`, and longer ones go to the bulk lane. The first
+        chunk is admitted like a batch; later chunks wait for their lane to
+        catch up, which stops reading the body and so slows the producer.
+        Once the stream has waited ``stream_max_wait`` seconds in all, it
+        stops reading: the response is ``partial``, ends with an error
+        record for the first line not handled, and gives that line as
+        ``resume_from_line`` so the client can send the rest again.
+
+        Args:
+            collection_name: Target collection
+            body: Request body, in chunks of any size
+            lane: Queue lane; chosen by size when omitted
+
+        Returns:
+            Ingestion response with task ID and rejected lines
+
+        Raises:
+            CollectionNotFoundError: If collection doesn't exist
+            SchemaValidationError: If the body holds no documents
+            IngestionBackpressureError: If the lane is too far behind for the first chunk
+        """
+        collection = await self._registry.get(collection_name)
+        stream = _Stream(str(uuid4()), lane)
+        try:
+            lines = _ndjson_lines(body, self._stream_max_line_bytes)
+            async for line_number, line in lines:
+                stream.lines += 1
+                stream.last_line = line_number
+                if line is None:
+                    stream.reject(
+                        line_number, None, f"Line exceeds {self._stream_max_line_bytes} bytes"
+                    )
+                    continue
+                try:
+                    doc = Document.model_validate_json(line)
+                except ValidationError as e:
+                    stream.reject(line_number, None, _validation_message(e))
+                    continue
+                if doc.content_base64 is not None and self._staging is None:
+                    stream.reject(
+                        line_number, str(doc.id), ContentStagingError(str(doc.id)).message
+                    )
+                    continue
+                stream.chunk.append((line_number, doc))
+                if len(stream.chunk) >= self._stream_chunk_size:
+                    stream.lane = stream.lane or IngestLane.BULK
+                    if not await self._queue_chunk(collection, stream):
+                        await lines.aclose()
+                        break
+            else:
+                if stream.chunk:
+                    await self._queue_chunk(collection, stream)
+            if stream.enqueueing is not None:
+                await stream.enqueueing
+        except BaseException:
+            if stream.enqueueing is not None:
+                stream.enqueueing.cancel()
+                await asyncio.gather(stream.enqueueing, return_exceptions=True)
+            raise
+
+        if not stream.lines:
+            raise SchemaValidationError("Request body contains no documents")
+        if stream.resume_from_line is not None:
+            status = "partial"
+        else:
+            status = "queued" if stream.queued else "rejected"
+        # Payloads are validated per chunk, after the chunk's parse errors.
+        errors = sorted(stream.errors, key=lambda error: error.line)
+        if stream.stalled is not None:
+            errors.append(stream.stalled)
+        return StreamIngestResponse(
+            task_id=stream.task_id,
+            documents_queued=stream.queued,
+            status=status,
+            lane=stream.lane,
+            documents_failed=stream.failed,
+            errors=errors,
+            resume_from_line=stream.resume_from_line,
+        )
+
+    async def _queue_chunk(self, collection: Collection, stream: "_Stream") -> bool:
+        """Validate a stream's current chunk and start enqueueing it.
+
+        Waits for the previous chunk's enqueue first, so chunks reach the
+        queue (and the document version records) in body order.
+
+        Returns:
+            False if the stream ran out of time waiting for its lane; the
+            chunk is not queued and the stream is marked for resuming
+        """
+        chunk, stream.chunk = stream.chunk, []
+        try:
+            validate_payloads(
+                [doc.payload for _, doc in chunk],
+                collection.index_schema,
+                [str(line_number) for line_number, _ in chunk],
+            )
+        except SchemaValidationError as e:
+            invalid = e.details.get("documents", {})
+            for line_number, doc in chunk:
+                if str(line_number) in invalid:
+                    stream.reject(line_number, str(doc.id), "; ".join(invalid[str(line_number)]))
+            chunk = [(n, doc) for n, doc in chunk if str(n) not in invalid]
+        if not chunk:
+            stream.handled()
+            return True
+
+        if stream.enqueueing is not None:
+            await stream.enqueueing
+            stream.enqueueing = None
+        documents = _unique([doc for _, doc in chunk])
+        lane = stream.lane = stream.lane or self._lane_for(len(documents))
+        if stream.positions == 0:
+            await self._admit(lane, len(documents))
+        else:
+            while True:
+                try:
+                    await self._admit(lane, len(documents))
+                    break
+                except IngestionBackpressureError as e:
+                    remaining = self._stream_max_wait - stream.waited
+                    if remaining <= 0:
+                        stream.stall(lane, self._stream_max_wait)
+                        return False
+                    await asyncio.sleep(min(e.retry_after, remaining))
+                    stream.waited += min(e.retry_after, remaining)
+
+        start = stream.positions
+        stream.positions += len(documents)
+        stream.queued += len(chunk)
+        stream.enqueueing = asyncio.create_task(
+            self._enqueue(
+                collection.name,
+                stream.task_id,
+                f"{stream.task_id}:{stream.chunks}",
+                lane,
+                documents,
+                start,
+            )
         )
+        stream.chunks += 1
+        stream.handled()
+        return True
+
+    async def _enqueue(
+        self,
+        collection_name: str,
+        task_id: str,
+        job_prefix: str,
+        lane: IngestLane,
+        documents: list[Document],
+        start: int = 0,
+    ) -> None:
+        """Queue one job per document, at progress positions from ``start``.
+
+        Staged blobs are released if enqueueing fails, and so is the
+        progress record unless earlier documents of the task are queued.
+        """
+        staged: list[str] = []
+        try:
+            if self._progress is not None:
+                # Before enqueueing, so no job reports progress ahead of the record.
+                await self._progress.create(task_id, [str(doc.id) for doc in documents], start)
+            tags: list[float | None] = [None] * len(documents)
+            if self._scheduler is not None:
+                tags = list(await self._scheduler.assign(lane, collection_name, len(documents)))
+            seqs: dict[str, int] = {}
+            if self._versions is not None:
+                seqs = await self._versions.reserve(
+                    collection_name, (str(doc.id) for doc in documents)
+                )
+            jobs = [
+                JobSpec(
+                    "embed_document",
+                    job_id=f"{job_prefix}:{doc.id}",
+                    kwargs={
+                        "collection_name": collection_name,
+                        "doc_id": str(doc.id),
+                        "payload": doc.payload,
+                        **await self._content_kwargs(doc, staged),
+                        **self._progress_kwargs(task_id, start + position),
+                        **self._lane_kwargs(lane, tag),
+                        **({"doc_seq": seqs[str(doc.id)]} if seqs else {}),
+                    },
+                    score=tag,
+                )
+                for position, (doc, tag) in enumerate(zip(documents, tags, strict=True))
+            ]
+            await enqueue_jobs(self._arq_redis, jobs, queue_name=LANE_QUEUES[lane])
+        except BaseException:
+            if self._staging is not None:
+                for ref in staged:
+                    await self._staging.release(ref)
+            if self._progress is not None and start == 0:
+                await self._progress.delete(task_id)
+            raise
+        if self._versions is not None:
+            # After enqueueing, so a failed enqueue supersedes nothing. The jobs
+            # record their versions again when they start, should this fail.
+            with contextlib.suppress(RedisError, OSError):
+                await self._versions.record(
+                    collection_name,
+                    {
+                        str(doc.id): (job.job_id, seqs[str(doc.id)])
+                        for doc, job in zip(documents, jobs)
+                    },
+                )
+
+    def _lane_for(self, count: int) -> IngestLane:
+        """The lane for a batch of ``count`` documents that names none."""
+        return IngestLane.INTERACTIVE if count <= self._interactive_max_docs else IngestLane.BULK
+
+    async def _admit(self, lane: IngestLane, count: int) -> None:
+        """Refuse ``count`` more jobs if the lane is over its backlog limits."""
+        if self._scheduler is None or (
+            self._max_queue_depth is None and self._max_drain_seconds is None
+        ):
+            return
+        depth, throughput = await self._scheduler.load(lane)
+        if depth == 0:
+            return
+        # Seconds until the lane is back under each limit it would exceed.
+        waits: list[float] = []
+        if self._max_queue_depth is not None:
+            excess = depth + count - self._max_queue_depth
+            if excess > 0:
+                waits.append(excess / throughput if throughput > 0 else math.inf)
+        drain = drain_seconds(depth + count, throughput)
+        if self._max_drain_seconds is not None and drain is not None:
+            if drain > self._max_drain_seconds:
+                waits.append(drain - self._max_drain_seconds)
+        if waits:
+            retry_after = max(1, math.ceil(min(max(waits), self.MAX_RETRY_AFTER)))
+            raise IngestionBackpressureError(
+                lane.value, depth, retry_after, drain_seconds(depth, throughput)
+            )
+
+    def _progress_kwargs(self, batch_id: str, position: int) -> dict[str, str | int]:
+        """Job arguments locating a document in its batch's progress record."""
+        if self._progress is None:
+            return {}
+        return {"task_id": batch_id, "task_position": position}
+
+    @staticmethod
+    def _lane_kwargs(lane: IngestLane, tag: float | None) -> dict[str, str | float]:
+        """Job arguments with which the worker advances the lane's fair-queuing clock."""
+        if tag is None:
+            return {}
+        return {"lane": lane.value, "lane_tag": tag}
+
+    async def _content_kwargs(self, doc: Document, staged: list[str]) -> dict[str, str | None]:
+        """Job arguments carrying a document's content, staging it if large."""
+        data: bytes | None = doc.content_base64
+        # A character encodes to at most 4 bytes, so short text skips encoding.
+        if data is None and doc.content_raw and len(doc.content_raw) * 4 >= self._blob_min_bytes:
+            encoded = doc.content_raw.encode("utf-8")
+            if len(encoded) >= self._blob_min_bytes:
+                data = encoded
+        if data is None:
+            return {"content_uri": doc.content_uri, "content_raw": doc.content_raw}
+        if self._staging is None:
+            raise ContentStagingError(str(doc.id))
+        ref = await self._staging.stage(data)
+        staged.append(ref)
+        return {"content_uri": doc.content_uri, "content_ref": ref}
 
     @staticmethod
     async def fetch_content(uri: str) -> bytes:
@@ -68,8 +422,110 @@ class IngestionService:
 
         Returns:
             Raw content bytes
+
+        Raises:
+            ContentFetchError: If the content cannot be fetched
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(uri, follow_redirects=True)
-            response.raise_for_status()
-            return response.content
+        return (await get_http_fetcher().fetch(uri)).content
+
+
+@dataclass
+class _Stream:
+    """State of an NDJSON ingestion while its body is being read."""
+
+    task_id: str
+    lane: IngestLane | None
+    chunk: list[tuple[int, Document]] = field(default_factory=list)
+    enqueueing: asyncio.Task[None] | None = None
+    lines: int = 0
+    queued: int = 0
+    positions: int = 0
+    chunks: int = 0
+    failed: int = 0
+    errors: list[IngestLineError] = field(default_factory=list)
+    last_line: int = 0
+    waited: float = 0.0
+    # Lines, rejections and reported errors up to the last chunk handled.
+    handled_line: int = 0
+    handled_failed: int = 0
+    handled_errors: int = 0
+    resume_from_line: int | None = None
+    stalled: IngestLineError | None = None
+
+    def reject(self, line: int, doc_id: str | None, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < IngestionService.MAX_REPORTED_ERRORS:
+            self.errors.append(IngestLineError(line=line, id=doc_id, error=error))
+
+    def handled(self) -> None:
+        """Mark every line read so far as queued or rejected."""
+        self.handled_line = self.last_line
+        self.handled_failed = self.failed
+        self.handled_errors = len(self.errors)
+
+    def stall(self, lane: IngestLane, max_wait: float) -> None:
+        """Stop after the last chunk handled, to be resumed from the line after it.
+
+        Rejections of the unhandled lines are dropped; a resumed stream
+        reports them again.
+        """
+        self.resume_from_line = self.handled_line + 1
+        self.failed = self.handled_failed
+        del self.errors[self.handled_errors :]
+        self.stalled = IngestLineError(
+            line=self.resume_from_line,
+            error=f"The {lane.value} lane is still backlogged after {max_wait:g}s; "
+            f"stopped after {self.queued} documents. "
+            f"Send the body again from line {self.resume_from_line} to resume",
+        )
+
+
+def _unique(documents: list[Document]) -> list[Document]:
+    """Documents with repeated ids removed; a repeated id keeps its first occurrence."""
+    unique: dict[str, Document] = {}
+    for doc in documents:
+        unique.setdefault(str(doc.id), doc)
+    return list(unique.values())
+
+
+async def _ndjson_lines(
+    body: AsyncIterable[bytes], max_line_bytes: int
+) -> AsyncGenerator[tuple[int, bytes | None], None]:
+    """Non-blank lines of an NDJSON body as they arrive, numbered from 1.
+
+    A line longer than ``max_line_bytes`` is yielded as None without being
+    buffered, so memory stays bounded by the longest accepted line.
+    """
+    buffer = bytearray()
+    number = 0
+    oversized = False
+    async for data in body:
+        start = 0
+        while (end := data.find(b"\n", start)) != -1:
+            number += 1
+            if not oversized:
+                buffer += data[start:end]
+            if oversized or len(buffer) > max_line_bytes:
+                yield number, None
+            elif buffer.strip():
+                yield number, bytes(buffer)
+            buffer.clear()
+            oversized = False
+            start = end + 1
+        if not oversized:
+            buffer += data[start:]
+            if len(buffer) > max_line_bytes:
+                oversized = True
+                buffer.clear()
+    if oversized:
+        yield number + 1, None
+    elif buffer.strip():
+        yield number + 1, bytes(buffer)
+
+
+def _validation_message(error: ValidationError) -> str:
+    messages = []
+    for detail in error.errors():
+        location = ".".join(str(part) for part in detail["loc"])
+        messages.append(f"{location}: {detail['msg']}" if location else detail["msg"])
+    return "; ".join(messages)
@@ -0,0 +1,186 @@
+"""Ingestion lanes with weighted fair ordering across collections."""
+
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from arq.constants import job_key_prefix
+from arq.jobs import deserialize_job_raw
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+from recall.models.document import IngestLane
+from recall.models.task import LaneStats
+
+# Fair-queued lanes get queues of their own: their scores are virtual tags,
+# not times, so they must not share a queue with time-scored jobs.
+LANE_QUEUES = {
+    IngestLane.INTERACTIVE: "recall:queue:interactive",
+    IngestLane.BULK: "recall:queue:bulk",
+}
+
+
+class LaneScheduler:
+    """Orders each lane's queue by start-time fair queuing across collections.
+
+    arq runs a queue's jobs in score order, so instead of enqueue times the
+    jobs get virtual start tags. Every lane has a virtual clock (the tag of
+    the latest job started) and every collection a finish tag. A collection
+    queueing ``n`` jobs gets consecutive tags from ``max(clock, finish)``,
+    each ``1 / weight`` apart, and its finish tag moves past them. A
+    collection that was idle therefore starts at the clock, ahead of any
+    backlog queued earlier, and backlogged collections are interleaved in
+    proportion to their weights.
+
+    Tags start at 1 and grow by one per job at weight 1, so they stay far
+    below wall-clock milliseconds and arq treats every job as due. A lane's
+    queue therefore holds only fair-queued jobs: a job scored by time (a
+    cron job, a plain ``enqueue_job``) would sort after the whole backlog.
+    Those go to arq's default queue. For the same reason the ``delayed``
+    times arq logs for lane jobs are meaningless; :meth:`stats` reports the
+    real waits.
+
+    Workers report each started job with :meth:`job_started`, which
+    advances the clock and counts the job's queueing delay for
+    :meth:`stats`. Started jobs are also counted in ``BUCKET_SECONDS``
+    buckets, from which :meth:`load` estimates how fast a lane drains over
+    the last ``throughput_window`` seconds.
+    """
+
+    KEY_PREFIX = "recall:lane:"
+    CLOCK_MEMBER = "v"
+    BUCKET_SECONDS = 5
+
+    def __init__(
+        self,
+        redis: Redis,
+        weights: Mapping[str, float] | None = None,
+        job_deserializer: Callable[[bytes], Any] | None = None,
+        throughput_window: float = 60.0,
+    ):
+        self._redis = redis
+        self._weights = weights or {}
+        self._job_deserializer = job_deserializer
+        self._buckets = max(1, round(throughput_window / self.BUCKET_SECONDS))
+
+    async def assign(self, lane: IngestLane, collection: str, count: int) -> list[float]:
+        """Reserve start tags for ``count`` jobs of a collection.
+
+        Args:
+            lane: Lane the jobs are queued in
+            collection: Collection the jobs belong to
+            count: Number of jobs
+
+        Returns:
+            Queue scores for the jobs, in order
+        """
+        cost = 1.0 / max(self._weights.get(collection, 1.0), 1e-6)
+        clock = await self._redis.zscore(self._key(lane, "clock"), self.CLOCK_MEMBER)
+        finish_key = self._key(lane, "finish")
+        async with self._redis.pipeline(transaction=True) as pipe:
+            # A stale clock only makes the collection's start earlier than
+            # max(clock, finish) would, never later.
+            pipe.zadd(finish_key, {collection: clock or 1.0}, gt=True)
+            pipe.zincrby(finish_key, count * cost, collection)
+            _, finish = await pipe.execute()
+        start = finish - count * cost
+        return [start + i * cost for i in range(count)]
+
+    async def job_started(self, lane: str, tag: float, wait_ms: float) -> None:
+        """Advance a lane's clock to a started job's tag and record its wait."""
+        stats_key = self._key(lane, "stats")
+        bucket_key = self._key(lane, f"started:{int(time.time() // self.BUCKET_SECONDS)}")
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.zadd(self._key(lane, "clock"), {self.CLOCK_MEMBER: tag}, gt=True)
+            pipe.hincrby(stats_key, "jobs_started", 1)
+            pipe.hincrbyfloat(stats_key, "wait_ms_total", max(0.0, wait_ms))
+            pipe.incr(bucket_key)
+            pipe.expire(bucket_key, (self._buckets + 2) * self.BUCKET_SECONDS)
+            await pipe.execute()
+
+    async def load(self, lane: IngestLane) -> tuple[int, float]:
+        """A lane's queue depth and recent throughput, in one round trip.
+
+        Returns:
+            Jobs in the lane's queue, and jobs started per second
+        """
+        now = time.time()
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.zcard(LANE_QUEUES[lane])
+            self._read_started(pipe, lane, now)
+            depth, buckets = await pipe.execute()
+        return depth, self._throughput(buckets, now)
+
+    async def stats(self) -> list[LaneStats]:
+        """Queue depth, throughput and wait times of every lane."""
+        lanes = list(LANE_QUEUES.items())
+        now = time.time()
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for lane, queue in lanes:
+                pipe.zcard(queue)
+                pipe.zrange(queue, 0, 0)
+                pipe.hgetall(self._key(lane, "stats"))
+                self._read_started(pipe, lane, now)
+            replies = await pipe.execute()
+
+        heads = [head[0] if head else None for head in replies[1::4]]
+        head_keys = [job_key_prefix + _decode(head) for head in heads if head is not None]
+        head_data = iter(await self._redis.mget(head_keys) if head_keys else [])
+        now_ms = now * 1000
+
+        stats = []
+        for (lane, queue), depth, head, counters, buckets in zip(
+            lanes, replies[0::4], heads, replies[2::4], replies[3::4], strict=True
+        ):
+            head_wait_ms = None
+            data = next(head_data) if head is not None else None
+            if data is not None:
+                *_, enqueue_time_ms = deserialize_job_raw(data, deserializer=self._job_deserializer)
+                head_wait_ms = round(max(0.0, now_ms - enqueue_time_ms), 1)
+            counters = {_decode(k): float(v) for k, v in counters.items()}
+            started = int(counters.get("jobs_started", 0))
+            wait_total = counters.get("wait_ms_total", 0.0)
+            throughput = self._throughput(buckets, now)
+            stats.append(
+                LaneStats(
+                    lane=lane.value,
+                    queue=queue,
+                    queue_depth=depth,
+                    head_wait_ms=head_wait_ms,
+                    jobs_started=started,
+                    wait_ms_total=round(wait_total, 1),
+                    mean_wait_ms=round(wait_total / started, 1) if started else None,
+                    throughput_per_s=round(throughput, 3),
+                    drain_seconds=drain_seconds(depth, throughput),
+                )
+            )
+        return stats
+
+    def _read_started(self, pipe: Pipeline, lane: IngestLane, now: float) -> None:
+        """Queue a read of the started-job buckets of the throughput window."""
+        current = int(now // self.BUCKET_SECONDS)
+        pipe.mget(
+            [self._key(lane, f"started:{b}") for b in range(current - self._buckets, current + 1)]
+        )
+
+    def _throughput(self, buckets: list[bytes | None], now: float) -> float:
+        # The window spans the full buckets plus the elapsed part of the current one.
+        elapsed = self._buckets * self.BUCKET_SECONDS + now % self.BUCKET_SECONDS
+        return sum(int(count) for count in buckets if count is not None) / elapsed
+
+    def _key(self, lane: str, name: str) -> str:
+        lane = lane.value if isinstance(lane, IngestLane) else lane
+        return f"{self.KEY_PREFIX}{lane}:{name}"
+
+
+def drain_seconds(depth: int, throughput: float) -> float | None:
+    """Estimated time to empty a queue at its recent throughput; None if unknown."""
+    if depth == 0:
+        return 0.0
+    if throughput <= 0:
+        return None
+    return round(depth / throughput, 1)
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
@@ -0,0 +1,70 @@
+"""Payload-only updates of ingested documents."""
+
+from typing import Any
+
+from recall.core.utils import deterministic_vector_id
+from recall.core.vectordb.base import VectorDBClient
+from recall.models.document import PayloadUpdateRequest, PayloadUpdateResponse
+from recall.services.registry import SchemaRegistry
+from recall.services.schema_validator import validate_payloads
+
+
+class PayloadUpdateService:
+    """Updates document payloads in place, without fetching or re-embedding.
+
+    Documents are addressed by their deterministic vector ids and updated in
+    one vector database call. By default the given fields are merged into
+    each payload, so only those fields are validated against the schema;
+    with ``overwrite`` each payload is replaced and must be complete.
+
+    A queued ingestion job for the same document still writes its own
+    payload when it runs.
+    """
+
+    def __init__(self, registry: SchemaRegistry, vectordb: VectorDBClient):
+        self._registry = registry
+        self._vectordb = vectordb
+
+    async def update(
+        self, collection_name: str, request: PayloadUpdateRequest
+    ) -> PayloadUpdateResponse:
+        """Apply payload updates to ingested documents.
+
+        Args:
+            collection_name: Target collection
+            request: Payload updates
+
+        Returns:
+            Number of documents updated and ids of those not ingested
+
+        Raises:
+            CollectionNotFoundError: If collection doesn't exist
+            SchemaValidationError: If a payload doesn't match the schema
+            VectorDBError: If the vector database update fails
+        """
+        collection = await self._registry.get(collection_name)
+
+        validate_payloads(
+            [doc.payload for doc in request.documents],
+            collection.index_schema,
+            [str(doc.id) for doc in request.documents],
+            partial=not request.overwrite,
+        )
+
+        # Updates of the same document apply in order.
+        doc_ids: dict[str, str] = {}
+        payloads: dict[str, dict[str, Any]] = {}
+        for doc in request.documents:
+            doc_id = str(doc.id)
+            point_id = deterministic_vector_id(collection_name, doc_id)
+            doc_ids[point_id] = doc_id
+            earlier = {} if request.overwrite else payloads.get(point_id, {})
+            payloads[point_id] = {**earlier, **doc.payload, "_doc_id": doc_id}
+
+        updated = set(
+            await self._vectordb.set_payload(collection_name, payloads, request.overwrite)
+        )
+        return PayloadUpdateResponse(
+            updated=len(updated),
+            not_found=[doc_id for point_id, doc_id in doc_ids.items() if point_id not in updated],
+        )
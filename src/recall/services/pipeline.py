@@ -0,0 +1,438 @@
+"""Staged ingestion pipeline run by the worker: fetch, prepare, embed, upsert."""
+
+import asyncio
+import contextlib
+import hashlib
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Generic, Protocol, TypeVar
+
+from recall.core.embedders.base import BaseEmbedder
+from recall.core.utils import deterministic_vector_id
+from recall.core.vectordb.base import Point, VectorDBClient
+from recall.models.task import StageStats
+from recall.services.blob_staging import BlobStaging
+from recall.services.content_validators import ContentValidatorStore
+from recall.services.fetcher import ContentFetcher, ContentValidators
+
+
+class _Work(Protocol):
+    def fail(self, exc: BaseException) -> None: ...
+
+
+In = TypeVar("In", bound=_Work)
+Out = TypeVar("Out")
+
+
+@dataclass
+class IngestResult:
+    """Outcome of one document's trip through the pipeline.
+
+    A document whose URI content is unchanged since it was last embedded
+    has ``unchanged`` set and no vector: only its payload was rewritten.
+    """
+
+    vector: list[float]
+    fetch_ms: float = 0.0
+    unchanged: bool = False
+
+
+@dataclass
+class _Item:
+    collection: str
+    embedder: BaseEmbedder
+    doc_id: str
+    payload: dict[str, Any] | None
+    future: asyncio.Future[IngestResult]
+    content_uri: str | None = None
+    content_ref: str | None = None
+    content: Any = None
+    fetch_ms: float = 0.0
+    validators: ContentValidators | None = None
+
+    def fail(self, exc: BaseException) -> None:
+        if not self.future.done():
+            self.future.set_exception(exc)
+
+
+@dataclass
+class _Batch:
+    collection: str
+    embedder: BaseEmbedder
+    items: list[_Item] = field(default_factory=list)
+    vectors: list[list[float]] = field(default_factory=list)
+    timer: asyncio.Task[None] | None = None
+
+    def fail(self, exc: BaseException) -> None:
+        for item in self.items:
+            item.fail(exc)
+
+
+class _Stage(Generic[In, Out]):
+    """A bounded queue drained by ``concurrency`` worker tasks.
+
+    Each task applies ``handler`` to one unit of work and passes a non-None
+    result to ``forward``; a full downstream queue therefore stalls this
+    stage, which in turn fills this stage's queue and stalls its producers.
+    Utilization counts only time spent in ``handler``, not time blocked on
+    the next stage, so the busiest stage is the bottleneck.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: int,
+        buffer_size: int,
+        handler: Callable[[In], Awaitable[Out | None]],
+    ):
+        self.name = name
+        self.concurrency = max(1, concurrency)
+        self.buffer_size = max(1, buffer_size)
+        self.queue: asyncio.Queue[In] = asyncio.Queue(self.buffer_size)
+        self.forward: Callable[[Out], Awaitable[None]] | None = None
+        self._handler = handler
+        self._tasks: list[asyncio.Task[None]] = []
+        self._in_flight = 0
+        self._processed = 0
+        self._failed = 0
+        self._busy = 0.0
+        self._started = 0.0
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.concurrency)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+
+    def stats(self) -> StageStats:
+        elapsed = time.perf_counter() - self._started if self._started else 0.0
+        capacity = elapsed * self.concurrency
+        return StageStats(
+            name=self.name,
+            concurrency=self.concurrency,
+            buffer_size=self.buffer_size,
+            queue_depth=self.queue.qsize(),
+            in_flight=self._in_flight,
+            processed=self._processed,
+            failed=self._failed,
+            utilization=round(min(1.0, self._busy / capacity), 4) if capacity else 0.0,
+        )
+
+    async def _run(self) -> None:
+        while True:
+            work = await self.queue.get()
+            try:
+                self._in_flight += 1
+                start = time.perf_counter()
+                try:
+                    out = await self._handler(work)
+                except Exception as exc:
+                    self._failed += 1
+                    work.fail(exc)
+                    continue
+                finally:
+                    self._busy += time.perf_counter() - start
+                    self._in_flight -= 1
+                self._processed += 1
+                if out is not None and self.forward is not None:
+                    await self.forward(out)
+            finally:
+                self.queue.task_done()
+
+
+class IngestionPipeline:
+    """Runs worker ingestion as four concurrent stages joined by bounded queues.
+
+    ``fetch`` downloads content for URI documents with ``fetcher`` (a
+    :class:`~recall.services.fetcher_registry.FetcherRegistry` in workers,
+    covering every supported scheme) and loads blob-staged content;
+    ``prepare`` decodes it into model input (image decoding, text
+    decoding); ``embed`` runs one ``embed_batch`` call per batch of
+    documents sharing a collection and model; ``upsert`` writes each batch
+    with one bulk upsert. Every stage has its own concurrency and buffer
+    size, so network I/O, decoding and inference for different documents
+    overlap.
+
+    With ``validators``, URI documents are fetched conditionally on the
+    validators of the content they were last embedded from. If the origin
+    answers 304, or the body hashes the same, the document's point only has
+    its payload rewritten, skipping the download or at least the embedding.
+    A point that no longer exists is embedded again from a full fetch.
+
+    Batches close when ``batch_size`` documents are waiting or the oldest
+    has waited ``linger`` seconds. Inference runs on ``executor`` (sized to
+    the CPU budget) and decoding on the loop's default executor, so neither
+    blocks the event loop. Each job awaits its
+    own :class:`IngestResult` (or its own exception) from :meth:`submit`; a
+    document that cannot be decoded or embedded fails only its own job.
+    """
+
+    def __init__(
+        self,
+        vectordb: VectorDBClient,
+        fetcher: ContentFetcher,
+        staging: BlobStaging | None = None,
+        executor: Executor | None = None,
+        batch_size: int = 32,
+        linger: float = 0.02,
+        fetch_concurrency: int = 32,
+        prepare_concurrency: int = 4,
+        embed_concurrency: int = 1,
+        upsert_concurrency: int = 4,
+        buffer_size: int = 64,
+        validators: ContentValidatorStore | None = None,
+    ):
+        self._vectordb = vectordb
+        self._fetcher = fetcher
+        self._staging = staging
+        self._validators = validators
+        self._executor = executor
+        self._batch_size = max(1, batch_size)
+        self._linger = linger
+        self._pending: dict[tuple[str, str], _Batch] = {}
+        self._timers: set[asyncio.Task[None]] = set()
+
+        self._fetch = _Stage("fetch", fetch_concurrency, buffer_size, self._fetch_item)
+        self._prepare = _Stage("prepare", prepare_concurrency, buffer_size, self._prepare_item)
+        # Embed and upsert queues hold batches, so their buffers are in batches.
+        batch_buffer = max(1, buffer_size // self._batch_size)
+        self._embed = _Stage("embed", embed_concurrency, batch_buffer, self._embed_batch)
+        self._upsert = _Stage("upsert", upsert_concurrency, batch_buffer, self._upsert_batch)
+        self._fetch.forward = self._prepare.queue.put
+        self._prepare.forward = self._add_to_batch
+        self._embed.forward = self._upsert.queue.put
+        self._stages: list[_Stage[Any, Any]] = [
+            self._fetch,
+            self._prepare,
+            self._embed,
+            self._upsert,
+        ]
+        self._started = False
+
+    def start(self) -> None:
+        """Start the stage workers; must be called from the running loop."""
+        if not self._started:
+            for stage in self._stages:
+                stage.start()
+            self._started = True
+
+    async def close(self) -> None:
+        """Finish every submitted document, then stop the stage workers."""
+        if not self._started:
+            return
+        await self._fetch.queue.join()
+        await self._prepare.queue.join()
+        for key, batch in list(self._pending.items()):
+            if batch.timer is not None:
+                batch.timer.cancel()
+            await self._close_batch(key, batch)
+        if self._timers:
+            await asyncio.gather(*self._timers, return_exceptions=True)
+        await self._embed.queue.join()
+        await self._upsert.queue.join()
+        for stage in self._stages:
+            await stage.stop()
+        self._started = False
+
+    def stats(self) -> list[StageStats]:
+        """Queue depth and utilization of each stage, in pipeline order."""
+        return [stage.stats() for stage in self._stages]
+
+    async def submit(
+        self,
+        collection: str,
+        embedder: BaseEmbedder,
+        doc_id: str,
+        content: bytes | str | None = None,
+        content_uri: str | None = None,
+        content_ref: str | None = None,
+        payload: dict[str, Any] | None = None,
+    ) -> IngestResult:
+        """Run one document through the pipeline.
+
+        Args:
+            collection: Target collection
+            embedder: Embedder for the collection's model
+            doc_id: Document identifier
+            content: Document content, if already available
+            content_uri: URI to fetch the content from otherwise
+            content_ref: Blob staging reference to load the content from otherwise
+            payload: Document metadata
+
+        Returns:
+            The document's vector and fetch time, once it has been upserted
+        """
+        self.start()
+        future: asyncio.Future[IngestResult] = asyncio.get_running_loop().create_future()
+        item = _Item(
+            collection, embedder, doc_id, payload, future, content_uri, content_ref, content
+        )
+        if content is None:
+            await self._fetch.queue.put(item)
+        else:
+            await self._prepare.queue.put(item)
+        return await future
+
+    async def _fetch_item(self, item: _Item) -> _Item | None:
+        if item.future.done():
+            return None
+        if item.content_ref is not None:
+            if self._staging is None:
+                raise ValueError("Blob-staged content needs a BlobStaging")
+            start = time.perf_counter()
+            item.content = await self._staging.load(item.content_ref)
+            item.fetch_ms = (time.perf_counter() - start) * 1000
+            return item
+        uri = item.content_uri or ""
+        if self._validators is None:
+            fetched = await self._fetcher.fetch(uri)
+            item.content = fetched.content
+            item.fetch_ms = fetched.elapsed_ms
+            return item
+
+        known = await self._validators.get(item.collection, item.doc_id)
+        if known is not None and known.uri != uri:
+            known = None
+        fetched = await self._fetcher.fetch(uri, known)
+        item.fetch_ms = fetched.elapsed_ms
+        if fetched.not_modified:
+            item.validators = known
+            if await self._keep_vector(item):
+                return None
+            item.validators = None
+            fetched = await self._fetcher.fetch(uri)
+            item.fetch_ms += fetched.elapsed_ms
+        digest = await asyncio.get_running_loop().run_in_executor(None, _sha256, fetched.content)
+        item.content = fetched.content
+        item.validators = ContentValidators(uri, fetched.etag, fetched.last_modified, digest)
+        if known is not None and known.sha256 == digest and await self._keep_vector(item):
+            return None
+        return item
+
+    async def _keep_vector(self, item: _Item) -> bool:
+        """Rewrite the payload of an unchanged document's point, keeping its vector.
+
+        The document's validators are saved again, which refreshes their TTL.
+
+        Returns:
+            False if the point no longer exists, so the document must be embedded
+        """
+        point_id = deterministic_vector_id(item.collection, item.doc_id)
+        payload = {**(item.payload or {}), "_doc_id": item.doc_id}
+        if not await self._vectordb.set_payload(
+            item.collection, {point_id: payload}, overwrite=True
+        ):
+            return False
+        if self._validators is not None and item.validators is not None:
+            await self._validators.update(item.collection, {item.doc_id: item.validators})
+        if not item.future.done():
+            item.future.set_result(IngestResult(vector=[], fetch_ms=item.fetch_ms, unchanged=True))
+        return True
+
+    async def _prepare_item(self, item: _Item) -> _Item | None:
+        if item.future.done():
+            return None
+        loop = asyncio.get_running_loop()
+        item.content = await loop.run_in_executor(None, item.embedder.prepare, item.content)
+        return item
+
+    async def _add_to_batch(self, item: _Item) -> None:
+        key = (item.collection, item.embedder.model_name)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _Batch(item.collection, item.embedder)
+            if self._batch_size > 1:
+                batch.timer = self._spawn_timer(self._close_after_linger(key, batch))
+        batch.items.append(item)
+        if len(batch.items) >= self._batch_size:
+            if batch.timer is not None:
+                batch.timer.cancel()
+            await self._close_batch(key, batch)
+
+    async def _close_after_linger(self, key: tuple[str, str], batch: _Batch) -> None:
+        await asyncio.sleep(self._linger)
+        batch.timer = None
+        await self._close_batch(key, batch)
+
+    async def _close_batch(self, key: tuple[str, str], batch: _Batch) -> None:
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+            await self._embed.queue.put(batch)
+
+    async def _embed_batch(self, batch: _Batch) -> _Batch | None:
+        # Items whose job was cancelled while waiting are dropped.
+        items = [item for item in batch.items if not item.future.done()]
+        if not items:
+            return None
+        vectors = await asyncio.get_running_loop().run_in_executor(
+            self._executor, _embed_contents, batch.embedder, [item.content for item in items]
+        )
+        batch.items, batch.vectors = [], []
+        for item, vec in zip(items, vectors):
+            if isinstance(vec, Exception):
+                item.fail(vec)
+            else:
+                batch.items.append(item)
+                batch.vectors.append(vec)
+        return batch if batch.items else None
+
+    async def _upsert_batch(self, batch: _Batch) -> None:
+        await self._vectordb.upsert(
+            batch.collection,
+            [
+                Point(
+                    id=deterministic_vector_id(batch.collection, item.doc_id),
+                    vector=vec,
+                    payload={**(item.payload or {}), "_doc_id": item.doc_id},
+                )
+                for item, vec in zip(batch.items, batch.vectors)
+            ],
+        )
+        if self._validators is not None:
+            await self._validators.update(
+                batch.collection,
+                {item.doc_id: item.validators for item in batch.items if item.validators},
+                cleared=[item.doc_id for item in batch.items if item.validators is None],
+            )
+        for item, vec in zip(batch.items, batch.vectors):
+            if not item.future.done():
+                item.future.set_result(IngestResult(vector=vec, fetch_ms=item.fetch_ms))
+
+    def _spawn_timer(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        task = asyncio.create_task(coro)
+        self._timers.add(task)
+        task.add_done_callback(self._timers.discard)
+        return task
+
+
+def _sha256(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _embed_contents(embedder: BaseEmbedder, contents: list[Any]) -> list[list[float] | Exception]:
+    """Embed contents in one call, isolating failures to the items that caused them.
+
+    Runs on the executor. If the batch call fails, items are embedded one at
+    a time so a single bad document fails only its own job; failed items get
+    their exception in place of a vector.
+    """
+    if len(contents) > 1:
+        try:
+            return list(embedder.embed_batch(contents))
+        except Exception:
+            pass
+    vectors: list[list[float] | Exception] = []
+    for content in contents:
+        try:
+            vectors.append(embedder.embed(content))
+        except Exception as exc:
+            vectors.append(exc)
+    return vectors
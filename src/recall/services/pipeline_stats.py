@@ -0,0 +1,73 @@
+"""Redis-backed reports of worker ingestion pipeline load."""
+
+import time
+from collections.abc import Mapping
+
+from redis.asyncio import Redis
+
+from recall.models.task import HostFetchStats, StageStats, WorkerPipelineStats
+from recall.services.fetcher import FetchStats
+
+
+class PipelineStatsStore:
+    """Latest pipeline stage and fetch statistics of every live worker.
+
+    Each worker overwrites its own ``<prefix><worker_id>`` key on every
+    report, with a TTL a few report intervals long, so workers that stop
+    reporting drop out on their own. Reporting worker ids are kept in a
+    sorted set scored by when their report expires, so reading the reports
+    never scans the keyspace.
+    """
+
+    KEY_PREFIX = "recall:pipeline_stats:"
+    WORKERS_KEY = "recall:pipeline_workers"
+
+    def __init__(self, redis: Redis):
+        self._redis = redis
+
+    async def publish(
+        self,
+        worker_id: str,
+        stages: list[StageStats],
+        ttl: float,
+        fetch: Mapping[str, FetchStats] | None = None,
+    ) -> None:
+        report = WorkerPipelineStats(
+            worker_id=worker_id,
+            reported_at=time.time(),
+            stages=stages,
+            fetch=[
+                HostFetchStats(
+                    host=host,
+                    requests=stats.requests,
+                    failures=stats.failures,
+                    retries=stats.retries,
+                    bytes=stats.bytes,
+                    avg_ms=round(stats.avg_ms, 2),
+                )
+                for host, stats in sorted((fetch or {}).items())
+            ],
+        )
+        now = time.time()
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(
+                f"{self.KEY_PREFIX}{worker_id}",
+                report.model_dump_json(),
+                px=max(1, int(ttl * 1000)),
+            )
+            pipe.zadd(self.WORKERS_KEY, {worker_id: now + ttl})
+            pipe.zremrangebyscore(self.WORKERS_KEY, "-inf", now)
+            await pipe.execute()
+
+    async def read_all(self) -> list[WorkerPipelineStats]:
+        """Reports of all workers that reported recently, by worker id."""
+        worker_ids = await self._redis.zrangebyscore(self.WORKERS_KEY, time.time(), "+inf")
+        if not worker_ids:
+            return []
+        keys = [f"{self.KEY_PREFIX}{w.decode() if isinstance(w, bytes) else w}" for w in worker_ids]
+        reports = [
+            WorkerPipelineStats.model_validate_json(raw)
+            for raw in await self._redis.mget(keys)
+            if raw is not None
+        ]
+        return sorted(reports, key=lambda report: report.worker_id)
@@ -0,0 +1,138 @@
+"""Selectivity-aware query planning for filtered search."""
+
+import math
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from recall.config import get_settings
+from recall.core.transpiler.cache import CompiledFilter
+from recall.core.vectordb.base import VectorDBClient
+from recall.models.errors import VectorDBError
+from recall.models.search import SearchPlan
+
+
+class QueryPlanner:
+    """Chooses between exact and HNSW search from estimated filter selectivity.
+
+    HNSW traversal degrades when a filter leaves only a few reachable points,
+    so filters estimated to match at most ``exact_max_matches`` points are
+    answered by exact search over the filtered subset. Broader filters keep
+    HNSW but widen the candidate list in proportion to how much of the graph
+    the filter prunes.
+
+    Match counts are approximate counts from the vector database (Qdrant
+    derives them from payload index cardinalities) and are cached per
+    collection and compiled filter for ``ttl`` seconds. Counts of a collection
+    are dropped when it is recreated, deleted or re-indexed (see
+    :meth:`invalidate`); points upserted since are reflected once they expire.
+    """
+
+    def __init__(
+        self,
+        exact_max_matches: int = 5000,
+        hnsw_ef: int = 128,
+        max_hnsw_ef: int = 1024,
+        ttl: float = 60.0,
+        maxsize: int = 4096,
+    ):
+        self._exact_max_matches = exact_max_matches
+        self._hnsw_ef = hnsw_ef
+        self._max_hnsw_ef = max_hnsw_ef
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._counts: OrderedDict[tuple[str, str | None], tuple[float, int]] = OrderedDict()
+
+    async def plan(
+        self,
+        vectordb: VectorDBClient,
+        collection: str,
+        compiled: CompiledFilter | None,
+        limit: int,
+    ) -> SearchPlan:
+        """Pick a search strategy for a query.
+
+        Args:
+            vectordb: Vector database to estimate counts with
+            collection: Target collection
+            compiled: Compiled search filter, if any
+            limit: Number of results requested
+
+        Returns:
+            Chosen search plan
+        """
+        if compiled is None or compiled.filter is None:
+            return SearchPlan(strategy="hnsw")
+        if compiled.matches_nothing:
+            return SearchPlan(strategy="empty", estimated_matches=0)
+
+        try:
+            total = await self._count(vectordb, collection, None)
+            matches = await self._count(vectordb, collection, compiled)
+        except VectorDBError:
+            # Planning is best effort; fall back to the backend's defaults.
+            return SearchPlan(strategy="hnsw")
+
+        matches = min(matches, total)
+        selectivity = matches / total if total else 0.0
+        plan = SearchPlan(
+            strategy="exact",
+            estimated_matches=matches,
+            total_points=total,
+            selectivity=round(selectivity, 6),
+        )
+        if matches <= self._exact_max_matches:
+            return plan
+
+        ef = math.ceil(self._hnsw_ef / max(selectivity, 1e-9))
+        plan.strategy = "hnsw"
+        plan.hnsw_ef = max(limit, min(ef, self._max_hnsw_ef))
+        return plan
+
+    def invalidate(self, collection: str | None = None) -> None:
+        """Drop cached counts for one collection, or for all of them.
+
+        Registered as a :class:`CollectionCache` listener, so it runs on every
+        collection write in any process.
+        """
+        if collection is None:
+            self._counts.clear()
+            return
+        for key in [k for k in self._counts if k[0] == collection]:
+            del self._counts[key]
+
+    async def _count(
+        self,
+        vectordb: VectorDBClient,
+        collection: str,
+        compiled: CompiledFilter | None,
+    ) -> int:
+        key = (collection, compiled.key if compiled else None)
+        now = time.monotonic()
+        cached = self._counts.get(key)
+        if cached is not None and cached[0] > now:
+            self._counts.move_to_end(key)
+            return cached[1]
+
+        if compiled is None:
+            count = await vectordb.count(collection)
+        else:
+            count = await vectordb.count(collection, filter=compiled.filter, exact=False)
+
+        self._counts[key] = (now + self._ttl, count)
+        self._counts.move_to_end(key)
+        while len(self._counts) > self._maxsize:
+            self._counts.popitem(last=False)
+        return count
+
+
+@lru_cache
+def get_query_planner() -> QueryPlanner:
+    """Get the process-wide query planner."""
+    settings = get_settings()
+    return QueryPlanner(
+        exact_max_matches=settings.search_exact_max_matches,
+        hnsw_ef=settings.search_hnsw_ef,
+        max_hnsw_ef=settings.search_max_hnsw_ef,
+        ttl=settings.search_plan_ttl,
+    )
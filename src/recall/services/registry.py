@@ -4,17 +4,27 @@ from datetime import UTC, datetime
 
 from redis.asyncio import Redis
 
-from recall.models.collection import Collection, CreateCollectionRequest
+from recall.models.collection import Collection, CreateCollectionRequest, FieldType
 from recall.models.errors import CollectionNotFoundError
+from recall.services.collection_cache import INVALIDATION_CHANNEL, CollectionCache
 
 
 class SchemaRegistry:
-    """Redis-backed schema registry for collection configurations."""
+    """Redis-backed schema registry for collection configurations.
+
+    With a :class:`CollectionCache`, ``get`` is served from process memory
+    and every write publishes an invalidation for the other processes.
+    """
 
     KEY_PREFIX = "recall:collection:"
+    NAMES_KEY = "recall:collections"
+    NAMES_BACKFILLED_KEY = "recall:collections:backfilled"
+    SCAN_COUNT = 500
+    MGET_CHUNK = 500
 
-    def __init__(self, redis: Redis):
+    def __init__(self, redis: Redis, cache: CollectionCache | None = None):
         self._redis = redis
+        self._cache = cache
 
     def _key(self, name: str) -> str:
         return f"{self.KEY_PREFIX}{name}"
@@ -35,10 +45,11 @@ class SchemaRegistry:
             created_at=datetime.now(UTC).isoformat(),
         )
 
-        await self._redis.set(
-            self._key(collection.name),
-            collection.model_dump_json(),
-        )
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.set(self._key(collection.name), collection.model_dump_json())
+        pipe.sadd(self.NAMES_KEY, collection.name)
+        await pipe.execute()
+        await self._invalidate(collection.name)
 
         return collection
 
@@ -54,11 +65,37 @@ class SchemaRegistry:
         Raises:
             CollectionNotFoundError: If collection doesn't exist
         """
-        data = await self._redis.get(self._key(name))
-        if data is None:
-            raise CollectionNotFoundError(name)
+        if self._cache is None:
+            return await self._load(name)
+
+        collection = self._cache.get(name)
+        if collection is None:
+            generation = self._cache.generation
+            collection = await self._load(name)
+            self._cache.put(name, collection, generation)
+        return collection
 
-        return Collection.model_validate_json(data)
+    async def record_auto_index(self, name: str, field: str, field_type: FieldType) -> Collection:
+        """Record a payload index that was added after the collection was created.
+
+        Args:
+            name: Collection name
+            field: Indexed payload field
+            field_type: Index type
+
+        Returns:
+            Updated collection configuration
+
+        Raises:
+            CollectionNotFoundError: If collection doesn't exist
+        """
+        collection = await self._load(name)
+        collection.auto_index_schema[field] = field_type
+        # xx: don't resurrect a collection deleted since the read above.
+        if not await self._redis.set(self._key(name), collection.model_dump_json(), xx=True):
+            raise CollectionNotFoundError(name)
+        await self._invalidate(name)
+        return collection
 
     async def exists(self, name: str) -> bool:
         """Check if a collection exists.
@@ -80,15 +117,109 @@ class SchemaRegistry:
         Returns:
             True if deleted, False if not found
         """
-        result = await self._redis.delete(self._key(name))
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.delete(self._key(name))
+        pipe.srem(self.NAMES_KEY, name)
+        result, _ = await pipe.execute()
+        await self._invalidate(name)
         return result > 0
 
+    async def _load(self, name: str) -> Collection:
+        data = await self._redis.get(self._key(name))
+        if data is None:
+            raise CollectionNotFoundError(name)
+        return Collection.model_validate_json(data)
+
+    async def _invalidate(self, name: str) -> None:
+        message = name
+        if self._cache is not None:
+            self._cache.invalidate(name)
+            message = f"{name} {self._cache.origin}"
+        await self._redis.publish(INVALIDATION_CHANNEL, message)
+
     async def list_all(self) -> list[str]:
         """List all collection names.
 
         Returns:
-            List of collection names
+            Sorted list of collection names
         """
-        keys = await self._redis.keys(f"{self.KEY_PREFIX}*")
+        names: list[str] = []
+        cursor = 0
+        while True:
+            cursor, page = await self.scan(cursor)
+            names.extend(page)
+            if cursor == 0:
+                return sorted(names)
+
+    async def scan(self, cursor: int = 0, count: int | None = None) -> tuple[int, list[str]]:
+        """Page through collection names with an SSCAN cursor.
+
+        Args:
+            cursor: Cursor returned by the previous call (0 to start)
+            count: Hint for how many names to return per page
+
+        Returns:
+            Next cursor (0 when done) and a page of collection names
+        """
+        cursor, members = await self._redis.sscan(
+            self.NAMES_KEY, cursor=cursor, count=count or self.SCAN_COUNT
+        )
+        return int(cursor), [_decode(m) for m in members]
+
+    async def get_many(self, names: list[str]) -> list[Collection]:
+        """Get several collection configurations in one round trip.
+
+        Args:
+            names: Collection names
+
+        Returns:
+            Configurations of the collections that exist, in the order given
+        """
+        found: dict[str, Collection] = {}
+        missing = list(dict.fromkeys(names))
+        if self._cache is not None:
+            for name in names:
+                cached = self._cache.get(name)
+                if cached is not None:
+                    found[name] = cached
+            missing = [name for name in missing if name not in found]
+
+        if missing:
+            generation = self._cache.generation if self._cache is not None else 0
+            pipe = self._redis.pipeline(transaction=False)
+            for start in range(0, len(missing), self.MGET_CHUNK):
+                chunk = missing[start : start + self.MGET_CHUNK]
+                pipe.mget([self._key(name) for name in chunk])
+            values = [v for chunk in await pipe.execute() for v in chunk]
+            for name, data in zip(missing, values, strict=True):
+                if data is None:
+                    continue
+                found[name] = Collection.model_validate_json(data)
+                if self._cache is not None:
+                    self._cache.put(name, found[name], generation)
+
+        return [found[name] for name in names if name in found]
+
+    async def backfill_names(self) -> int:
+        """Index collections saved before the name set existed.
+
+        Walks the keyspace once with SCAN (never KEYS) and records that it
+        did, so later calls return immediately.
+
+        Returns:
+            Number of collection names added to the set
+        """
+        if await self._redis.exists(self.NAMES_BACKFILLED_KEY):
+            return 0
+
+        added = 0
         prefix_len = len(self.KEY_PREFIX)
-        return [k.decode()[prefix_len:] if isinstance(k, bytes) else k[prefix_len:] for k in keys]
+        async for key in self._redis.scan_iter(match=f"{self.KEY_PREFIX}*", count=1000):
+            name = _decode(key)[prefix_len:]
+            added += await self._redis.sadd(self.NAMES_KEY, name)
+        await self._redis.set(self.NAMES_BACKFILLED_KEY, 1)
+        return added
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
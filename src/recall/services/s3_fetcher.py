@@ -0,0 +1,148 @@
+"""Fetcher for s3:// URIs on S3 or an S3-compatible object store."""
+
+import asyncio
+import time
+from email.utils import format_datetime
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+from recall.models.errors import ContentFetchError, ContentTooLargeError
+from recall.services.fetcher import ContentValidators, FetchedContent
+
+MISSING_CODES = frozenset({"404", "NoSuchKey", "NotFound", "NoSuchBucket"})
+
+
+class S3Fetcher:
+    """Downloads ``s3://bucket/key`` objects over one pooled boto3 client.
+
+    The client is created on first use (requires the ``s3`` extra), keeps
+    up to ``max_connections`` connections and retries throttling and
+    transient errors itself; its blocking calls run in threads. Each fetch
+    starts with a HEAD, which answers conditional fetches without a
+    download. Objects larger than ``part_size`` are downloaded as ranged
+    GETs, ``part_concurrency`` at a time, each pinned to the ETag of the
+    HEAD so an object overwritten mid-download fails instead of mixing
+    versions.
+    """
+
+    def __init__(
+        self,
+        endpoint_url: str | None = None,
+        region: str | None = None,
+        max_bytes: int = 50 * 1024 * 1024,
+        max_connections: int = 100,
+        retries: int = 3,
+        part_size: int = 8 * 1024 * 1024,
+        part_concurrency: int = 8,
+        client: Any = None,
+    ):
+        self._endpoint_url = endpoint_url
+        self._region = region
+        self._max_bytes = max_bytes
+        self._max_connections = max_connections
+        self._retries = retries
+        self._part_size = max(1, part_size)
+        self._part_concurrency = max(1, part_concurrency)
+        self._client = client
+
+    async def fetch(self, uri: str, validators: ContentValidators | None = None) -> FetchedContent:
+        """Download the object at ``uri``.
+
+        Raises:
+            ContentTooLargeError: If the object exceeds the size limit
+            ContentFetchError: If the object cannot be read
+        """
+        bucket, key = _location(uri)
+        try:
+            from botocore.exceptions import BotoCoreError, ClientError
+
+            client = self._get_client()
+        except ImportError as e:
+            raise ContentFetchError(
+                "Fetching s3:// URIs requires boto3: pip install 'recall[s3]'", uri
+            ) from e
+
+        start = time.perf_counter()
+        try:
+            head = await asyncio.to_thread(client.head_object, Bucket=bucket, Key=key)
+            etag = head.get("ETag")
+            modified = head.get("LastModified")
+            last_modified = format_datetime(modified, usegmt=True) if modified else None
+            if validators is not None and etag is not None and validators.etag == etag:
+                return FetchedContent(
+                    b"", _elapsed_ms(start), 1, etag, last_modified, not_modified=True
+                )
+            size = head["ContentLength"]
+            if size > self._max_bytes:
+                raise ContentTooLargeError(uri, self._max_bytes)
+            if size <= self._part_size:
+                content: bytes | memoryview = await self._get(bucket, key, etag)
+            else:
+                content = await self._get_parts(bucket, key, etag, size)
+        except ClientError as e:
+            error = e.response.get("Error", {})
+            status = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            if error.get("Code") in MISSING_CODES:
+                status = 404
+            raise ContentFetchError(
+                f"Fetching '{uri}' failed: {error.get('Message', e)}", uri, status
+            ) from e
+        except BotoCoreError as e:
+            raise ContentFetchError(f"Fetching '{uri}' failed: {e}", uri) from e
+        return FetchedContent(content, _elapsed_ms(start), 1, etag, last_modified)
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            import boto3
+            from botocore.config import Config
+
+            self._client = boto3.client(
+                "s3",
+                endpoint_url=self._endpoint_url,
+                region_name=self._region,
+                config=Config(
+                    max_pool_connections=self._max_connections,
+                    retries={"max_attempts": self._retries + 1, "mode": "standard"},
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await asyncio.to_thread(self._client.close)
+
+    async def _get(
+        self, bucket: str, key: str, etag: str | None, byte_range: str | None = None
+    ) -> bytes:
+        params: dict[str, str] = {"Bucket": bucket, "Key": key}
+        if etag is not None:
+            params["IfMatch"] = etag
+        if byte_range is not None:
+            params["Range"] = byte_range
+        response = await asyncio.to_thread(self._client.get_object, **params)
+        return await asyncio.to_thread(response["Body"].read)
+
+    async def _get_parts(self, bucket: str, key: str, etag: str | None, size: int) -> memoryview:
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        slots = asyncio.Semaphore(self._part_concurrency)
+
+        async def get_part(first: int) -> None:
+            last = min(first + self._part_size, size) - 1
+            async with slots:
+                view[first : last + 1] = await self._get(bucket, key, etag, f"bytes={first}-{last}")
+
+        await asyncio.gather(*(get_part(first) for first in range(0, size, self._part_size)))
+        return view
+
+
+def _location(uri: str) -> tuple[str, str]:
+    parts = urlsplit(uri)
+    key = unquote(parts.path.lstrip("/"))
+    if not parts.netloc or not key:
+        raise ContentFetchError(f"S3 URI '{uri}' needs a bucket and a key", uri)
+    return parts.netloc, key
+
+
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
@@ -1,9 +1,10 @@
 """Dynamic schema validation for document payloads."""
 
+from collections.abc import Sequence
 from functools import lru_cache
 from typing import Any
 
-from pydantic import ValidationError, create_model
+from pydantic import TypeAdapter, ValidationError, create_model
 
 from recall.models.collection import FieldType, IndexSchema
 from recall.models.errors import SchemaValidationError
@@ -16,6 +17,16 @@ FIELD_TYPE_MAP: dict[FieldType, type] = {
     FieldType.TEXT: str,
 }
 
+# Value types accepted without coercion. A payload whose values all have one of
+# these exact types is valid, so only the remaining payloads need pydantic.
+FAST_PATH_TYPES: dict[FieldType, frozenset[type]] = {
+    FieldType.FLOAT: frozenset({float, int}),
+    FieldType.INT: frozenset({int}),
+    FieldType.KEYWORD: frozenset({str}),
+    FieldType.BOOL: frozenset({bool}),
+    FieldType.TEXT: frozenset({str}),
+}
+
 
 def _schema_to_tuple(schema: IndexSchema) -> tuple[tuple[str, str], ...]:
     """Convert schema dict to hashable tuple for caching."""
@@ -66,10 +77,178 @@ def validate_payload(payload: dict[str, Any], schema: IndexSchema, doc_id: str)
     try:
         model.model_validate(payload)
     except ValidationError as e:
-        errors = []
-        for error in e.errors():
-            field = ".".join(str(loc) for loc in error["loc"])
-            errors.append(f"{field}: {error['msg']}")
+        errors = _format_errors(e)
         raise SchemaValidationError(
             f"Document '{doc_id}' payload validation failed: {'; '.join(errors)}"
         ) from e
+
+
+def _format_errors(e: ValidationError, skip: int = 0) -> list[str]:
+    errors = []
+    for error in e.errors():
+        field = ".".join(str(loc) for loc in error["loc"][skip:])
+        errors.append(f"{field}: {error['msg']}")
+    return errors
+
+
+class PayloadBatchValidator:
+    """Validates every payload of an ingest batch against one schema in one pass.
+
+    Payloads whose values already have the exact field types are accepted by
+    a plain type check. The rest go through a single ``list[Model]`` validation,
+    which accepts exactly what per-document validation accepts and reports
+    every failing payload rather than the first.
+    """
+
+    def __init__(self, schema_tuple: tuple[tuple[str, str], ...]):
+        self._checks = tuple(
+            (name, FAST_PATH_TYPES[FieldType(field_type)]) for name, field_type in schema_tuple
+        )
+        self._adapter = TypeAdapter(list[_build_model_cached(schema_tuple)])
+
+    def errors(self, payloads: Sequence[dict[str, Any]]) -> dict[int, list[str]]:
+        """Validate payloads.
+
+        Args:
+            payloads: Document payloads
+
+        Returns:
+            Error messages keyed by the index of each invalid payload
+        """
+        suspects = self._suspects(payloads)
+        if not suspects:
+            return {}
+
+        try:
+            self._adapter.validate_python([payloads[i] for i in suspects])
+        except ValidationError as e:
+            return self._by_index(e, suspects)
+        return {}
+
+    def coerce(
+        self, payloads: Sequence[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], dict[int, list[str]]]:
+        """Validate payloads and convert their schema fields to the field types.
+
+        Args:
+            payloads: Document payloads
+
+        Returns:
+            The payloads with schema fields coerced (invalid ones as given),
+            and error messages keyed by the index of each invalid payload
+        """
+        coerced = list(payloads)
+        suspects = self._suspects(coerced)
+        errors: dict[int, list[str]] = {}
+        while suspects:
+            try:
+                models = self._adapter.validate_python([coerced[i] for i in suspects])
+            except ValidationError as e:
+                errors.update(self._by_index(e, suspects))
+                suspects = [i for i in suspects if i not in errors]
+                continue
+            for i, model in zip(suspects, models, strict=True):
+                coerced[i] = {**coerced[i], **model.model_dump()}
+            break
+        return coerced, dict(sorted(errors.items()))
+
+    def _suspects(self, payloads: Sequence[dict[str, Any]]) -> list[int]:
+        """Indexes of payloads the fast type check cannot accept."""
+        checks = self._checks
+        return [
+            i
+            for i, payload in enumerate(payloads)
+            if not all(type(payload.get(name)) in types for name, types in checks)
+        ]
+
+    @staticmethod
+    def _by_index(e: ValidationError, suspects: list[int]) -> dict[int, list[str]]:
+        by_index: dict[int, list[str]] = {}
+        for error, message in zip(e.errors(), _format_errors(e, skip=1), strict=True):
+            by_index.setdefault(suspects[error["loc"][0]], []).append(message)
+        return by_index
+
+
+@lru_cache(maxsize=128)
+def _batch_validator_cached(schema_tuple: tuple[tuple[str, str], ...]) -> PayloadBatchValidator:
+    return PayloadBatchValidator(schema_tuple)
+
+
+def coerce_payloads(
+    payloads: Sequence[dict[str, Any]], schema: IndexSchema
+) -> tuple[list[dict[str, Any]], dict[int, list[str]]]:
+    """Validate payloads and convert their schema fields to the field types.
+
+    Unlike ``validate_payloads`` this does not raise: sources such as CSV
+    files give every value as a string, and the loader stores the coerced
+    payloads of the valid documents while reporting the rest.
+
+    Args:
+        payloads: Document payloads
+        schema: Collection index schema
+
+    Returns:
+        The payloads with schema fields coerced (invalid ones as given),
+        and error messages keyed by the index of each invalid payload
+    """
+    if not schema:
+        return list(payloads), {}
+    return _batch_validator_cached(_schema_to_tuple(schema)).coerce(payloads)
+
+
+def validate_payloads(
+    payloads: Sequence[dict[str, Any]],
+    schema: IndexSchema,
+    doc_ids: Sequence[str],
+    partial: bool = False,
+) -> None:
+    """Validate the payloads of a batch of documents against the collection schema.
+
+    Args:
+        payloads: Document payloads to validate
+        schema: Collection index schema
+        doc_ids: Document IDs for error reporting, aligned with ``payloads``
+        partial: Validate only the schema fields present in each payload, as
+            for updates merged into existing payloads
+
+    Raises:
+        SchemaValidationError: If any payload doesn't match the schema; the
+            message lists every failing document
+    """
+    if not schema:
+        return
+
+    if partial:
+        errors = _partial_errors(payloads, schema)
+    else:
+        errors = _batch_validator_cached(_schema_to_tuple(schema)).errors(payloads)
+    if not errors:
+        return
+
+    failures = {doc_ids[i]: messages for i, messages in sorted(errors.items())}
+    if len(failures) == 1:
+        ((doc_id, messages),) = failures.items()
+        message = f"Document '{doc_id}' payload validation failed: {'; '.join(messages)}"
+    else:
+        message = f"{len(failures)} documents failed payload validation: " + " | ".join(
+            f"Document '{doc_id}': {'; '.join(messages)}" for doc_id, messages in failures.items()
+        )
+    raise SchemaValidationError(message, documents=failures)
+
+
+def _partial_errors(
+    payloads: Sequence[dict[str, Any]], schema: IndexSchema
+) -> dict[int, list[str]]:
+    """Errors of payloads checked against just the schema fields each one sets."""
+    groups: dict[tuple[tuple[str, str], ...], list[int]] = {}
+    for i, payload in enumerate(payloads):
+        present = {name: schema[name] for name in payload if name in schema}
+        if present:
+            groups.setdefault(_schema_to_tuple(present), []).append(i)
+
+    errors: dict[int, list[str]] = {}
+    for schema_tuple, indexes in groups.items():
+        group_errors = _batch_validator_cached(schema_tuple).errors([payloads[i] for i in indexes])
+        for j, messages in group_errors.items():
+            errors[indexes[j]] = messages
+    return dict(sorted(errors.items()))
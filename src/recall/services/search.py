@@ -1,9 +1,13 @@
 """Search service for semantic queries."""
 
+import time
+
 from recall.core.embedders.factory import EmbedderFactory
-from recall.core.transpiler.qdrant import QdrantTranspiler
+from recall.core.transpiler.cache import FilterCache, get_filter_cache
 from recall.core.vectordb.base import VectorDBClient
 from recall.models.search import SearchRequest, SearchResponse, SearchResult
+from recall.services.filter_usage import FilterUsageTracker
+from recall.services.planner import QueryPlanner, get_query_planner
 from recall.services.registry import SchemaRegistry
 
 
@@ -14,9 +18,15 @@ class SearchService:
         self,
         registry: SchemaRegistry,
         vectordb: VectorDBClient,
+        filter_cache: FilterCache | None = None,
+        planner: QueryPlanner | None = None,
+        usage: FilterUsageTracker | None = None,
     ):
         self._registry = registry
         self._vectordb = vectordb
+        self._filter_cache = filter_cache or get_filter_cache()
+        self._planner = planner or get_query_planner()
+        self._usage = usage
 
     async def search(self, collection_name: str, request: SearchRequest) -> SearchResponse:
         """Perform semantic search on a collection.
@@ -33,21 +43,32 @@ class SearchService:
         """
         config = await self._registry.get(collection_name)
 
+        # Only index_schema fields are validated to hold a single value.
+        compiled = self._filter_cache.compile(request.filter, config.index_schema.keys())
+        plan = await self._planner.plan(self._vectordb, collection_name, compiled, request.limit)
+        if plan.strategy == "empty":
+            return SearchResponse(results=[], query=request.query, count=0, plan=plan)
+
         embedder = EmbedderFactory.create(config.embedding_config.model)
 
         query_vector = embedder.embed(request.query)
 
-        qdrant_filter = QdrantTranspiler.transpile(request.filter)
-
+        started = time.perf_counter()
         results = await self._vectordb.search(
             collection=collection_name,
             vector=query_vector,
-            filter=qdrant_filter,
+            filter=compiled.filter if compiled else None,
             limit=request.limit,
             with_payload=request.with_payload,
             with_vectors=request.with_vectors,
+            exact=plan.strategy == "exact",
+            hnsw_ef=plan.hnsw_ef,
         )
 
+        if self._usage is not None and compiled is not None:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._usage.record(collection_name, compiled, elapsed_ms)
+
         return SearchResponse(
             results=[
                 SearchResult(
@@ -60,4 +81,5 @@ class SearchService:
             ],
             query=request.query,
             count=len(results),
+            plan=plan,
         )
@@ -0,0 +1,123 @@
+"""Fan-out of batch task events from Redis pub/sub to in-process watchers."""
+
+import asyncio
+import contextlib
+import uuid
+from collections.abc import AsyncIterator
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from recall.models.task import TaskEvent
+from recall.services.task_progress import TaskProgressStore
+
+
+class TaskEventHub:
+    """Shares one Redis subscription per task among all of its watchers.
+
+    :meth:`watch` subscribes to a task's events channel for its first
+    watcher and unsubscribes after its last, so a process holds a single
+    subscription per watched task however many clients stream it. Each
+    watcher gets its own bounded queue of :class:`TaskEvent` objects.
+
+    A ``None`` in a queue means events may have been missed (the watcher
+    fell ``queue_size`` events behind, or the connection was lost and
+    re-established), so the watcher should re-read the task's progress.
+    """
+
+    RECONNECT_DELAY = 1.0
+
+    def __init__(self, queue_size: int = 1000):
+        self._queue_size = queue_size
+        # listen() ends when nothing is subscribed, so the listener always
+        # holds a subscription to this process's own (silent) channel.
+        self._idle_channel = f"recall:task_events:{uuid.uuid4().hex}"
+        self._watchers: dict[str, set[asyncio.Queue[TaskEvent | None]]] = {}
+        self._lock = asyncio.Lock()
+        self._pubsub: PubSub | None = None
+        self._listener: asyncio.Task[None] | None = None
+
+    async def start(self, redis: Redis) -> None:
+        """Start the listener; returns once the first connection attempt has finished."""
+        if self._listener is not None:
+            return
+        ready = asyncio.Event()
+        self._listener = asyncio.create_task(self._listen(redis, ready))
+        await ready.wait()
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
+    @contextlib.asynccontextmanager
+    async def watch(self, task_id: str) -> AsyncIterator[asyncio.Queue[TaskEvent | None]]:
+        """Receive a task's events for the duration of the ``async with`` block.
+
+        The subscription is in place when the block starts, so progress
+        read inside the block is never older than the first queued event.
+        """
+        channel = TaskProgressStore.events_channel(task_id)
+        queue: asyncio.Queue[TaskEvent | None] = asyncio.Queue(self._queue_size)
+        async with self._lock:
+            watchers = self._watchers.setdefault(channel, set())
+            if not watchers and self._pubsub is not None:
+                # On failure the listener reconnects and subscribes every watched channel.
+                with contextlib.suppress(RedisError, OSError):
+                    await self._pubsub.subscribe(channel)
+            watchers.add(queue)
+        try:
+            yield queue
+        finally:
+            async with self._lock:
+                watchers.discard(queue)
+                if not watchers and self._watchers.get(channel) is watchers:
+                    del self._watchers[channel]
+                    if self._pubsub is not None:
+                        with contextlib.suppress(RedisError, OSError):
+                            await self._pubsub.unsubscribe(channel)
+
+    async def _listen(self, redis: Redis, ready: asyncio.Event) -> None:
+        while True:
+            pubsub = redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                async with self._lock:
+                    await pubsub.subscribe(self._idle_channel, *self._watchers)
+                    self._pubsub = pubsub
+                    # Anything published while disconnected was missed.
+                    for queues in self._watchers.values():
+                        for queue in queues:
+                            _put(queue, None)
+                ready.set()
+                async for message in pubsub.listen():
+                    self._dispatch(message)
+            except (RedisError, OSError):
+                ready.set()
+                await asyncio.sleep(self.RECONNECT_DELAY)
+            finally:
+                self._pubsub = None
+                with contextlib.suppress(RedisError, OSError):
+                    await pubsub.aclose()
+
+    def _dispatch(self, message: dict) -> None:
+        channel = message["channel"]
+        channel = channel.decode() if isinstance(channel, bytes) else channel
+        queues = self._watchers.get(channel)
+        if not queues:
+            return
+        event = TaskEvent.model_validate_json(message["data"])
+        for queue in queues:
+            _put(queue, event)
+
+
+def _put(queue: asyncio.Queue[TaskEvent | None], event: TaskEvent | None) -> None:
+    """Queue an event; a full queue is replaced by a single resync marker."""
+    try:
+        queue.put_nowait(event)
+    except asyncio.QueueFull:
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
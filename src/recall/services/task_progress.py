@@ -0,0 +1,245 @@
+"""Redis-backed progress records of ingestion batches."""
+
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from redis.asyncio import Redis
+
+from recall.models.task import JobStatus, TaskEvent, TaskStatusResponse, TaskSummary
+
+# Status codes that start each document entry; complete, failed and
+# superseded entries end with the job result (JSON), the error message or
+# the id of the superseding job.
+QUEUED = "q"
+IN_PROGRESS = "p"
+COMPLETE = "c"
+FAILED = "f"
+SUPERSEDED = "s"
+
+_STATUS_NAMES = {
+    QUEUED: "queued",
+    IN_PROGRESS: "in_progress",
+    COMPLETE: "complete",
+    FAILED: "failed",
+    SUPERSEDED: "superseded",
+}
+
+
+class TaskProgressStore:
+    """Progress of each ingestion batch, readable in one round trip.
+
+    A batch ``<task_id>`` is stored under ``<prefix><task_id>:``:
+
+    - ``docs``: hash of each document's position in the batch to a compact
+      entry holding its status code, document id and result or error
+    - ``started``, ``complete``, ``failed``, ``superseded``: sets of
+      document positions
+
+    Keying documents by position lets a page of statuses be read with one
+    HMGET, pipelined with the counts. Workers update a document's sets and
+    entry in one MULTI transaction. Counts come from set cardinalities, so
+    a job that arq runs twice (e.g. after a worker crash) is never counted
+    twice. Every write refreshes the record's TTL.
+
+    When a document completes, fails or is superseded by a newer job for
+    the same document, a :class:`TaskEvent` with the
+    batch's counts as of that transition is published on
+    :meth:`events_channel`.
+    """
+
+    KEY_PREFIX = "recall:task:"
+    SETS = ("started", "complete", "failed", "superseded")
+    OUTCOMES = ("complete", "failed", "superseded")
+
+    def __init__(self, redis: Redis, ttl: float = 86400.0):
+        self._redis = redis
+        self._ttl_ms = max(1, int(ttl * 1000))
+
+    @classmethod
+    def events_channel(cls, task_id: str) -> str:
+        return f"{cls.KEY_PREFIX}{task_id}:events"
+
+    async def create(self, task_id: str, doc_ids: Sequence[str], start: int = 0) -> None:
+        """Record a new batch with every document queued.
+
+        Args:
+            task_id: Batch identifier
+            doc_ids: Document ids; a document's position here, plus ``start``,
+                is the ``position`` its job reports progress under
+            start: Position of the first document, to add documents to a
+                batch that is still being received
+        """
+        keys = self._keys(task_id)
+        entries = {start + i: _entry(QUEUED, doc_id) for i, doc_id in enumerate(doc_ids)}
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(keys["docs"], mapping=entries)
+            pipe.pexpire(keys["docs"], self._ttl_ms)
+            await pipe.execute()
+
+    async def delete(self, task_id: str) -> None:
+        await self._redis.delete(*self._keys(task_id).values())
+
+    async def mark_started(self, task_id: str, position: int, doc_id: str) -> None:
+        await self._transition(
+            task_id,
+            position,
+            _entry(IN_PROGRESS, doc_id),
+            outcome=None,
+        )
+
+    async def mark_complete(
+        self, task_id: str, position: int, doc_id: str, result: dict[str, Any]
+    ) -> None:
+        detail = json.dumps(result, separators=(",", ":"))
+        await self._transition(
+            task_id,
+            position,
+            _entry(COMPLETE, doc_id, detail),
+            outcome="complete",
+        )
+
+    async def mark_failed(self, task_id: str, position: int, doc_id: str, error: str) -> None:
+        await self._transition(
+            task_id,
+            position,
+            _entry(FAILED, doc_id, error),
+            outcome="failed",
+        )
+
+    async def mark_superseded(
+        self, task_id: str, position: int, doc_id: str, superseded_by: str
+    ) -> None:
+        """Record that a newer job for the document made this one redundant."""
+        await self._transition(
+            task_id,
+            position,
+            _entry(SUPERSEDED, doc_id, superseded_by),
+            outcome="superseded",
+        )
+
+    async def get(
+        self, task_id: str, limit: int = 100, offset: int = 0
+    ) -> TaskStatusResponse | None:
+        """Summary and one page of document statuses of a batch.
+
+        Returns:
+            The batch's progress, or None if it is unknown or expired
+        """
+        (status,) = await self.get_many([task_id], limit, offset)
+        return status
+
+    async def get_many(
+        self, task_ids: Sequence[str], limit: int = 100, offset: int = 0
+    ) -> list[TaskStatusResponse | None]:
+        """Progress of several batches, in one round trip.
+
+        Args:
+            task_ids: Batch identifiers
+            limit: Document statuses to return per batch (0 for summaries only)
+            offset: Position of the first document status per batch
+
+        Returns:
+            Progress per task id, in order; None for unknown or expired batches
+        """
+        positions = list(range(offset, offset + limit))
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for task_id in task_ids:
+                keys = self._keys(task_id)
+                pipe.hlen(keys["docs"])
+                for name in self.SETS:
+                    pipe.scard(keys[name])
+                if positions:
+                    pipe.hmget(keys["docs"], positions)
+            replies = await pipe.execute()
+
+        step = 1 + len(self.SETS) + (1 if positions else 0)
+        statuses: list[TaskStatusResponse | None] = []
+        for i, task_id in enumerate(task_ids):
+            counts = replies[i * step : i * step + 1 + len(self.SETS)]
+            page = replies[i * step + len(counts) : (i + 1) * step]
+            if not counts[0]:
+                statuses.append(None)
+                continue
+            entries = [entry for entry in (page[0] if page else []) if entry is not None]
+            statuses.append(
+                TaskStatusResponse(
+                    task_id=task_id,
+                    jobs=[_job_status(entry) for entry in entries],
+                    summary=_summary(*counts),
+                    limit=limit,
+                    offset=offset,
+                )
+            )
+        return statuses
+
+    async def _transition(
+        self,
+        task_id: str,
+        position: int,
+        entry: str,
+        outcome: str | None,
+    ) -> None:
+        """Move a document to ``outcome``, or back to in progress if None.
+
+        Only finished documents (with an outcome) are published.
+        """
+        publish = outcome is not None
+        keys = self._keys(task_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.sadd(keys["started"], position)
+            for name in self.OUTCOMES:
+                if name == outcome:
+                    pipe.sadd(keys[name], position)
+                else:
+                    pipe.srem(keys[name], position)
+            pipe.hset(keys["docs"], position, entry)
+            for key in keys.values():
+                pipe.pexpire(key, self._ttl_ms)
+            if publish:
+                # Counted in the same transaction, so they include this change.
+                pipe.hlen(keys["docs"])
+                for name in self.SETS:
+                    pipe.scard(keys[name])
+            replies = await pipe.execute()
+        if publish:
+            event = TaskEvent(
+                job=_job_status(entry),
+                summary=_summary(*replies[-1 - len(self.SETS) :]),
+            )
+            await self._redis.publish(self.events_channel(task_id), event.model_dump_json())
+
+    def _keys(self, task_id: str) -> dict[str, str]:
+        base = f"{self.KEY_PREFIX}{task_id}:"
+        return {name: base + name for name in ("docs", *self.SETS)}
+
+
+def _entry(code: str, doc_id: str, detail: str = "") -> str:
+    # Length-prefixed, since document ids may contain any character.
+    return f"{code}{len(doc_id)}:{doc_id}{detail}"
+
+
+def _summary(total: int, started: int, complete: int, failed: int, superseded: int) -> TaskSummary:
+    return TaskSummary(
+        total=total,
+        queued=total - started,
+        in_progress=started - complete - failed - superseded,
+        complete=complete,
+        failed=failed,
+        superseded=superseded,
+    )
+
+
+def _job_status(entry: bytes | str) -> JobStatus:
+    if isinstance(entry, bytes):
+        entry = entry.decode()
+    code = entry[0]
+    length, rest = entry[1:].split(":", 1)
+    doc_id, detail = rest[: int(length)], rest[int(length) :]
+    if code == COMPLETE:
+        return JobStatus(doc_id=doc_id, status="complete", result=json.loads(detail))
+    if code == FAILED:
+        return JobStatus(doc_id=doc_id, status="failed", error=detail)
+    if code == SUPERSEDED:
+        return JobStatus(doc_id=doc_id, status="superseded", superseded_by=detail)
+    return JobStatus(doc_id=doc_id, status=_STATUS_NAMES.get(code, "queued"))
@@ -1,17 +1,36 @@
 """Arq worker tasks for document embedding."""
 
+import asyncio
+import contextlib
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-import httpx
+from arq import cron
 from arq.connections import RedisSettings
 from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from recall.config import get_settings
+from recall.core.blobstore.factory import BlobStoreFactory
 from recall.core.embedders.factory import EmbedderFactory
-from recall.core.utils import deterministic_vector_id
-from recall.core.vectordb.base import Point
-from recall.core.vectordb.qdrant import QdrantAdapter
+from recall.core.serialization import job_serializer_options
+from recall.core.vectordb.factory import VectorDBFactory
+from recall.models.document import IngestLane
+from recall.services.blob_staging import BlobStaging
+from recall.services.collection_cache import CollectionCache
+from recall.services.content_validators import ContentValidatorStore
+from recall.services.doc_versions import DocumentVersions
+from recall.services.fetcher_registry import FetcherRegistry
+from recall.services.filter_usage import FilterUsageTracker
+from recall.services.index_advisor import IndexAdvisor
+from recall.services.lanes import LANE_QUEUES, LaneScheduler
+from recall.services.pipeline import IngestionPipeline
+from recall.services.pipeline_stats import PipelineStatsStore
 from recall.services.registry import SchemaRegistry
+from recall.services.task_progress import TaskProgressStore
 
 
 async def startup(ctx: dict[str, Any]) -> None:
@@ -19,15 +38,68 @@ async def startup(ctx: dict[str, Any]) -> None:
     settings = get_settings()
 
     ctx["redis"] = Redis.from_url(settings.redis_url)
-    ctx["registry"] = SchemaRegistry(ctx["redis"])
-    ctx["vectordb"] = QdrantAdapter(settings.qdrant_url)
-    ctx["http_client"] = httpx.AsyncClient()
+    ctx["collection_cache"] = CollectionCache(ttl=settings.collection_cache_ttl)
+    await ctx["collection_cache"].start(ctx["redis"])
+    ctx["registry"] = SchemaRegistry(ctx["redis"], ctx["collection_cache"])
+    ctx["task_progress"] = TaskProgressStore(ctx["redis"], ttl=settings.task_progress_ttl)
+    ctx["doc_versions"] = DocumentVersions(ctx["redis"], ttl=settings.doc_versions_ttl)
+    ctx["lanes"] = LaneScheduler(
+        ctx["redis"],
+        settings.ingest_collection_weights,
+        throughput_window=settings.lane_throughput_window,
+    )
+    ctx["vectordb"] = VectorDBFactory.from_settings(settings)
+    ctx["fetcher"] = FetcherRegistry.from_settings(settings)
+    ctx["blob_store"] = BlobStoreFactory.from_settings(settings)
+    ctx["blob_staging"] = BlobStaging(
+        ctx["redis"], ctx["blob_store"], ttl=settings.blob_staging_ttl
+    )
+    # Inference holds the CPU for long stretches; keep it off the event loop
+    # so fetches, Redis calls and arq heartbeats are not starved.
+    embed_workers = settings.embed_workers or os.cpu_count() or 1
+    ctx["embed_executor"] = ThreadPoolExecutor(
+        max_workers=embed_workers,
+        thread_name_prefix="recall-embed",
+    )
+    ctx["pipeline"] = IngestionPipeline(
+        ctx["vectordb"],
+        ctx["fetcher"],
+        staging=ctx["blob_staging"],
+        executor=ctx["embed_executor"],
+        batch_size=settings.embed_batch_size,
+        linger=settings.embed_batch_linger_ms / 1000,
+        fetch_concurrency=settings.pipeline_fetch_concurrency,
+        prepare_concurrency=settings.pipeline_prepare_concurrency,
+        embed_concurrency=embed_workers,
+        upsert_concurrency=settings.pipeline_upsert_concurrency,
+        buffer_size=settings.pipeline_buffer_size,
+        validators=(
+            ContentValidatorStore(ctx["redis"], ttl=settings.fetch_validators_ttl)
+            if settings.fetch_conditional
+            else None
+        ),
+    )
+    ctx["pipeline"].start()
+    ctx["worker_id"] = uuid.uuid4().hex
+    ctx["stats_reporter"] = asyncio.create_task(_report_pipeline_stats(ctx))
 
 
 async def shutdown(ctx: dict[str, Any]) -> None:
     """Cleanup worker context on shutdown."""
-    if "http_client" in ctx:
-        await ctx["http_client"].aclose()
+    if "stats_reporter" in ctx:
+        ctx["stats_reporter"].cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await ctx["stats_reporter"]
+    if "pipeline" in ctx:
+        await ctx["pipeline"].close()
+    if "embed_executor" in ctx:
+        ctx["embed_executor"].shutdown(wait=False, cancel_futures=True)
+    if "collection_cache" in ctx:
+        await ctx["collection_cache"].stop()
+    if "fetcher" in ctx:
+        await ctx["fetcher"].aclose()
+    if "blob_store" in ctx:
+        await ctx["blob_store"].close()
     if "vectordb" in ctx:
         await ctx["vectordb"].close()
     if "redis" in ctx:
@@ -41,9 +113,31 @@ async def embed_document(
     content_uri: str | None = None,
     content_raw: str | None = None,
     payload: dict[str, Any] | None = None,
+    content_ref: str | None = None,
+    task_id: str | None = None,
+    task_position: int | None = None,
+    lane: str | None = None,
+    lane_tag: float | None = None,
+    doc_seq: int | None = None,
 ) -> dict[str, Any]:
     """Embed a document and store in vector database.
 
+    The document runs through the worker's :class:`IngestionPipeline`,
+    where it is embedded and upserted together with other jobs for the
+    same collection and model. Blob-staged content is released exactly once
+    when the job finishes, whether it stored the document, was superseded or
+    failed. Cancelled jobs (timeouts, worker shutdown) keep their blob, since
+    arq may run them again, and leave it to :func:`collect_staged_blobs`.
+    Jobs queued with a ``task_id`` report their progress to the batch's
+    progress record, and jobs queued with a ``lane_tag`` advance their lane's
+    fair-queuing clock.
+
+    A job whose document has been queued again since (with a higher
+    ``doc_seq``) is skipped and reported as superseded, since the newer job
+    embeds the latest content.
+    A URI document whose content is unchanged since it was last embedded
+    only has its payload rewritten, and its result is marked ``unchanged``.
+
     Args:
         ctx: Worker context with dependencies
         collection_name: Target collection
@@ -51,49 +145,182 @@ async def embed_document(
         content_uri: URI to fetch content from
         content_raw: Raw text content
         payload: Document metadata
+        content_ref: Reference to content staged in the blob store
+        task_id: Batch the document was queued in
+        task_position: Position of the document in its batch
+        lane: Ingestion lane the job was queued in
+        lane_tag: The job's fair-queuing start tag in its lane
+        doc_seq: Version number of the document this job embeds
 
     Returns:
         Result dict with status and details
     """
+    # The staged blob is reference counted and may be shared with other
+    # documents, so this job must give up its reference exactly once.
+    released = not content_ref
+    try:
+        if lane is not None and lane_tag is not None:
+            lanes: LaneScheduler = ctx["lanes"]
+            wait_ms = time.time() * 1000 - ctx["enqueue_time"].timestamp() * 1000
+            await lanes.job_started(lane, lane_tag, wait_ms)
+
+        progress: TaskProgressStore | None = None
+        if task_id is not None and task_position is not None:
+            progress = ctx["task_progress"]
+
+        newer = None
+        if doc_seq is not None:
+            versions: DocumentVersions = ctx["doc_versions"]
+            newer = await versions.claim(collection_name, doc_id, ctx["job_id"], doc_seq)
+        if newer is not None:
+            if progress is not None:
+                await progress.mark_superseded(task_id, task_position, doc_id, newer)
+            return {"status": "superseded", "doc_id": doc_id, "superseded_by": newer}
+
+        if progress is not None:
+            await progress.mark_started(task_id, task_position, doc_id)
+
+        try:
+            result = await _embed_document(
+                ctx, collection_name, doc_id, content_uri, content_raw, payload, content_ref
+            )
+        except Exception as exc:
+            if progress is not None:
+                await progress.mark_failed(task_id, task_position, doc_id, str(exc))
+            raise
+
+        if progress is not None:
+            if result["status"] == "success":
+                await progress.mark_complete(task_id, task_position, doc_id, result)
+            else:
+                await progress.mark_failed(task_id, task_position, doc_id, result["error"])
+        return result
+    except asyncio.CancelledError:
+        # arq may run a cancelled job again, and it will need the blob.
+        released = True
+        raise
+    finally:
+        if not released:
+            released = True
+            # A lease left behind is collected by collect_staged_blobs.
+            staging: BlobStaging = ctx["blob_staging"]
+            with contextlib.suppress(RedisError, OSError):
+                await staging.release(content_ref)
+
+
+async def _embed_document(
+    ctx: dict[str, Any],
+    collection_name: str,
+    doc_id: str,
+    content_uri: str | None,
+    content_raw: str | None,
+    payload: dict[str, Any] | None,
+    content_ref: str | None,
+) -> dict[str, Any]:
     registry: SchemaRegistry = ctx["registry"]
-    vectordb: QdrantAdapter = ctx["vectordb"]
-    http_client: httpx.AsyncClient = ctx["http_client"]
+    pipeline: IngestionPipeline = ctx["pipeline"]
 
     config = await registry.get(collection_name)
 
     embedder = EmbedderFactory.create(config.embedding_config.model)
 
-    if content_raw:
-        content: bytes | str = content_raw
-    elif content_uri:
-        response = await http_client.get(content_uri, follow_redirects=True)
-        response.raise_for_status()
-        content = response.content
-    else:
+    if not content_raw and not content_ref and not content_uri:
         return {"status": "error", "doc_id": doc_id, "error": "No content provided"}
 
-    vector = embedder.embed(content)
-
-    vector_id = deterministic_vector_id(collection_name, doc_id)
-    point = Point(
-        id=vector_id,
-        vector=vector,
-        payload={**(payload or {}), "_doc_id": doc_id},
+    result = await pipeline.submit(
+        collection_name,
+        embedder,
+        doc_id,
+        content=content_raw or None,
+        content_uri=content_uri,
+        content_ref=content_ref,
+        payload=payload,
     )
 
-    await vectordb.upsert(collection_name, [point])
-
+    if result.unchanged:
+        return {
+            "status": "success",
+            "doc_id": doc_id,
+            "collection": collection_name,
+            "unchanged": True,
+            "fetch_ms": round(result.fetch_ms, 2),
+        }
     return {
         "status": "success",
         "doc_id": doc_id,
         "collection": collection_name,
-        "vector_dim": len(vector),
+        "vector_dim": len(result.vector),
+        "fetch_ms": round(result.fetch_ms, 2),
     }
 
 
+async def optimize_payload_indexes(ctx: dict[str, Any]) -> dict[str, Any]:
+    """Index payload fields that searches filter on often and slowly.
+
+    Args:
+        ctx: Worker context with dependencies
+
+    Returns:
+        Result dict with the indexes created per collection
+    """
+    settings = get_settings()
+    advisor = IndexAdvisor(
+        ctx["registry"],
+        ctx["vectordb"],
+        FilterUsageTracker(ctx["redis"]),
+        min_uses=settings.index_advisor_min_uses,
+        min_avg_ms=settings.index_advisor_min_latency_ms,
+    )
+    created = await advisor.run()
+    return {"status": "success", "created": created}
+
+
+async def collect_staged_blobs(ctx: dict[str, Any]) -> dict[str, Any]:
+    """Delete staged blobs whose lease ran out without being released.
+
+    Args:
+        ctx: Worker context with dependencies
+
+    Returns:
+        Result dict with the number of blobs deleted
+    """
+    staging: BlobStaging = ctx["blob_staging"]
+    deleted = await staging.collect_expired()
+    return {"status": "success", "deleted": deleted}
+
+
+async def _report_pipeline_stats(ctx: dict[str, Any]) -> None:
+    """Publish this worker's pipeline stage and fetch statistics until cancelled."""
+    interval = get_settings().pipeline_stats_interval
+    store = PipelineStatsStore(ctx["redis"])
+    while True:
+        with contextlib.suppress(RedisError, OSError):
+            await store.publish(
+                ctx["worker_id"],
+                ctx["pipeline"].stats(),
+                ttl=interval * 3,
+                fetch=ctx["fetcher"].stats(),
+            )
+        await asyncio.sleep(interval)
+
+
+def _cron_jobs() -> list[Any]:
+    settings = get_settings()
+    jobs = [cron(collect_staged_blobs, minute=30)]
+    if settings.index_advisor_enabled:
+        interval = max(1, settings.index_advisor_interval_minutes)
+        jobs.append(cron(optimize_payload_indexes, minute=set(range(0, 60, interval))))
+    return jobs
+
+
 class WorkerSettings:
-    """Arq worker configuration."""
+    """Arq worker configuration for the interactive ingestion lane.
 
+    Run :class:`BulkWorkerSettings` workers as well to serve the bulk lane,
+    and one :class:`MaintenanceWorkerSettings` worker for the cron jobs.
+    """
+
+    queue_name = LANE_QUEUES[IngestLane.INTERACTIVE]
     functions = [embed_document]
     on_startup = startup
     on_shutdown = shutdown
@@ -101,7 +328,56 @@ class WorkerSettings:
     # redis_settings must be a class attribute, not a method
     redis_settings = RedisSettings.from_dsn(get_settings().redis_url)
 
-    max_jobs = 10
+    # Must match the API's pool (see recall.main), which enqueues the jobs.
+    _serializers = job_serializer_options(get_settings())
+    job_serializer = _serializers["job_serializer"]
+    job_deserializer = _serializers["job_deserializer"]
+
+    # Enough concurrent jobs to keep every fetch slot busy while a full
+    # embedding batch waits for inference.
+    max_jobs = max(10, get_settings().pipeline_fetch_concurrency + get_settings().embed_batch_size)
     job_timeout = 300
     keep_result = 3600
     poll_delay = 0.5
+
+
+class BulkWorkerSettings:
+    """Arq worker configuration for the bulk ingestion lane.
+
+    Bulk work has its own workers so backfills never hold up interactive
+    ingestion. arq reads settings from the class ``__dict__``, so they are
+    copied from :class:`WorkerSettings` rather than inherited.
+    """
+
+    queue_name = LANE_QUEUES[IngestLane.BULK]
+    functions = WorkerSettings.functions
+    on_startup = WorkerSettings.on_startup
+    on_shutdown = WorkerSettings.on_shutdown
+    redis_settings = WorkerSettings.redis_settings
+    job_serializer = WorkerSettings.job_serializer
+    job_deserializer = WorkerSettings.job_deserializer
+    max_jobs = WorkerSettings.max_jobs
+    job_timeout = WorkerSettings.job_timeout
+    keep_result = WorkerSettings.keep_result
+    poll_delay = WorkerSettings.poll_delay
+
+
+class MaintenanceWorkerSettings:
+    """Arq worker configuration for cron jobs and arq's default queue.
+
+    Lane queues are scored by fair-queuing tags, so cron jobs, which arq
+    scores by time, run from arq's default queue instead. These workers
+    also serve jobs queued there before the lanes had queues of their own.
+    """
+
+    functions = WorkerSettings.functions
+    cron_jobs = _cron_jobs()
+    on_startup = WorkerSettings.on_startup
+    on_shutdown = WorkerSettings.on_shutdown
+    redis_settings = WorkerSettings.redis_settings
+    job_serializer = WorkerSettings.job_serializer
+    job_deserializer = WorkerSettings.job_deserializer
+    max_jobs = WorkerSettings.max_jobs
+    job_timeout = WorkerSettings.job_timeout
+    keep_result = WorkerSettings.keep_result
+    poll_delay = WorkerSettings.poll_delay
@@ -14,6 +14,7 @@ const statusConfig: Record<JobStatusType, { color: string; bg: string; icon: str
     in_progress: { color: 'text-apple', bg: 'bg-apple-50', icon: '◐' },
     complete: { color: 'text-emerald-600', bg: 'bg-emerald-50', icon: '✓' },
     failed: { color: 'text-red-500', bg: 'bg-red-50', icon: '✗' },
+    superseded: { color: 'text-ink-50', bg: 'bg-cloud-200', icon: '↷' },
     not_found: { color: 'text-ink-50', bg: 'bg-cloud-200', icon: '?' },
 };
 
@@ -56,8 +57,10 @@ export function TaskProgress({ taskId, onComplete, onClose }: TaskProgressProps)
     // Narrow dependencies: trigger onComplete only when complete count changes (Section 5.3)
     const completeCount = data?.summary.complete ?? 0;
     const failedCount = data?.summary.failed ?? 0;
+    const supersededCount = data?.summary.superseded ?? 0;
     const totalCount = data?.summary.total ?? 0;
-    const isFinished = totalCount > 0 && completeCount + failedCount >= totalCount;
+    const isFinished =
+        totalCount > 0 && completeCount + failedCount + supersededCount >= totalCount;
 
     useEffect(() => {
         if (isFinished && onComplete) {
@@ -85,9 +88,11 @@ export function TaskProgress({ taskId, onComplete, onClose }: TaskProgressProps)
     }
 
     const { summary, jobs } = data;
-    const progress = totalCount > 0 ? ((completeCount + failedCount) / totalCount) * 100 : 0;
+    const finishedCount = completeCount + failedCount + supersededCount;
+    const progress = totalCount > 0 ? (finishedCount / totalCount) * 100 : 0;
     const hasFailures = failedCount > 0;
-    const allComplete = completeCount === totalCount && totalCount > 0;
+    // Superseded jobs were replaced by a newer job for the same document.
+    const allComplete = completeCount + supersededCount === totalCount && totalCount > 0;
 
     return (
         <motion.div
@@ -76,9 +76,9 @@ export function useTaskStatus(taskId: string | null) {
     refetchInterval: (query) => {
       const data = query.state.data;
       if (!data) return 1000;
-      // Stop polling when all jobs are complete or failed
-      const { complete, failed, total } = data.summary;
-      return complete + failed >= total ? false : 1000;
+      // Stop polling when all jobs are complete, failed or superseded
+      const { complete, failed, superseded, total } = data.summary;
+      return complete + failed + superseded >= total ? false : 1000;
     },
   });
 }
@@ -88,13 +88,20 @@ export interface ApiError {
 }
 
 // Task tracking types
-export type JobStatusType = 'queued' | 'in_progress' | 'complete' | 'failed' | 'not_found';
+export type JobStatusType =
+  | 'queued'
+  | 'in_progress'
+  | 'complete'
+  | 'failed'
+  | 'superseded'
+  | 'not_found';
 
 export interface JobStatus {
   doc_id: string;
   status: JobStatusType;
   result?: Record<string, unknown>;
   error?: string;
+  superseded_by?: string;
 }
 
 export interface TaskSummary {
@@ -103,6 +110,7 @@ export interface TaskSummary {
   in_progress: number;
   complete: number;
   failed: number;
+  superseded: number;
 }
 
 export interface TaskStatusResponse {
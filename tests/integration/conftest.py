@@ -1,11 +1,19 @@
 """Integration test fixtures."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import fakeredis.aioredis
 import pytest
+from arq import ArqRedis
 from httpx import ASGITransport, AsyncClient
 
+from recall.config import get_settings
+from recall.core.blobstore.local import LocalBlobStore
+from recall.core.serialization import job_serializer_options
+from recall.services.collection_cache import CollectionCache
+from recall.services.filter_usage import FilterUsageTracker
+from recall.services.task_events import TaskEventHub
+
 
 @pytest.fixture
 async def fake_redis():
@@ -16,28 +24,36 @@ async def fake_redis():
 
 
 @pytest.fixture
-async def mock_app(fake_redis):
+async def mock_app(fake_redis, tmp_path):
     """Create a test application with mocked dependencies."""
     from recall.main import app
 
-    mock_arq = AsyncMock()
-    mock_arq.enqueue_job = AsyncMock(return_value=MagicMock(job_id="test-job"))
-    mock_arq.close = AsyncMock()
+    arq_redis = ArqRedis(
+        connection_pool=fake_redis.connection_pool, **job_serializer_options(get_settings())
+    )
 
     mock_vectordb = AsyncMock()
     mock_vectordb.create_collection = AsyncMock(return_value=None)
     mock_vectordb.delete_collection = AsyncMock(return_value=True)
     mock_vectordb.collection_exists = AsyncMock(return_value=True)
     mock_vectordb.search = AsyncMock(return_value=[])
+    mock_vectordb.count = AsyncMock(return_value=0)
     mock_vectordb.close = AsyncMock()
 
     app.state.redis = fake_redis
-    app.state.arq_redis = mock_arq
+    app.state.arq_redis = arq_redis
     app.state.vectordb = mock_vectordb
+    app.state.blob_store = LocalBlobStore(tmp_path / "blobs")
+    app.state.collection_cache = CollectionCache()
+    await app.state.collection_cache.start(fake_redis)
+    app.state.task_events = TaskEventHub()
+    await app.state.task_events.start(fake_redis)
+    app.state.filter_usage = FilterUsageTracker(fake_redis)
 
     yield app
 
-    await mock_arq.close()
+    await app.state.task_events.stop()
+    await app.state.collection_cache.stop()
     await mock_vectordb.close()
 
 
@@ -103,6 +103,22 @@ class TestCollectionsAPI:
         assert "collection-a" in collections
         assert "collection-b" in collections
 
+    async def test_list_collections_with_details(self, client: AsyncClient):
+        await client.post(
+            "/v1/collections",
+            json={
+                "name": "detailed",
+                "embedding_config": {"model": "all-MiniLM-L6-v2", "modality": "text"},
+                "index_schema": {"category": "keyword"},
+            },
+        )
+
+        response = await client.get("/v1/collections", params={"details": "true"})
+        assert response.status_code == 200
+        collections = response.json()
+        assert [c["name"] for c in collections] == ["detailed"]
+        assert collections[0]["index_schema"] == {"category": "keyword"}
+
     async def test_get_collection_success(self, client: AsyncClient):
         await client.post(
             "/v1/collections",
@@ -1,8 +1,17 @@
 """Integration tests for Documents API."""
 
+import base64
+import json
+from unittest.mock import AsyncMock
+
 import pytest
 from httpx import AsyncClient
 
+from recall.config import get_settings
+from recall.core.utils import deterministic_vector_id
+from recall.models.document import IngestLane
+from recall.services.lanes import LANE_QUEUES
+
 
 @pytest.mark.integration
 class TestDocumentsAPI:
@@ -47,6 +56,33 @@ class TestDocumentsAPI:
         assert data["documents_queued"] == 1
         assert "task_id" in data
 
+    async def test_ingested_batch_can_be_polled(self, client: AsyncClient):
+        response = await client.post(
+            "/v1/collections/docs-test/documents",
+            json={
+                "documents": [
+                    {
+                        "id": "doc-1",
+                        "content_raw": "Test document content",
+                        "payload": {"category": "test", "price": 19.99},
+                    }
+                ]
+            },
+        )
+
+        task = await client.get(f"/v1/tasks/{response.json()['task_id']}")
+
+        assert task.status_code == 200
+        assert task.json()["jobs"] == [
+            {
+                "doc_id": "doc-1",
+                "status": "queued",
+                "result": None,
+                "error": None,
+                "superseded_by": None,
+            }
+        ]
+
     async def test_ingest_multiple_documents(self, client: AsyncClient):
         response = await client.post(
             "/v1/collections/docs-test/documents",
@@ -88,15 +124,139 @@ class TestDocumentsAPI:
         )
         assert response.status_code == 202
 
+    async def test_ingest_binary_content_is_staged(self, client: AsyncClient, mock_app):
+        response = await client.post(
+            "/v1/collections/docs-test/documents",
+            json={
+                "documents": [
+                    {
+                        "id": "doc-bin",
+                        "content_base64": base64.b64encode(b"\x89PNG binary").decode(),
+                        "payload": {"category": "image", "price": 1.0},
+                    }
+                ]
+            },
+        )
+        assert response.status_code == 202
+
+        queue = LANE_QUEUES[IngestLane.INTERACTIVE]
+        (job,) = await mock_app.state.arq_redis.queued_jobs(queue_name=queue)
+        key = job.kwargs["content_ref"].removeprefix("blob:")
+        assert await mock_app.state.blob_store.get(key) == b"\x89PNG binary"
+
+    async def test_ingest_invalid_payloads_listed_per_document(self, client: AsyncClient):
+        response = await client.post(
+            "/v1/collections/docs-test/documents",
+            json={
+                "documents": [
+                    {"id": "ok", "content_raw": "x", "payload": {"category": "a", "price": 1.0}},
+                    {"id": "bad-1", "content_raw": "x", "payload": {"price": "free"}},
+                    {"id": "bad-2", "content_raw": "x", "payload": {"price": "cheap"}},
+                ]
+            },
+        )
+
+        assert response.status_code == 422
+        data = response.json()
+        assert data["error"] == "SchemaValidationError"
+        assert set(data["details"]["documents"]) == {"bad-1", "bad-2"}
+        assert all(data["details"]["documents"].values())
+        assert data["detail"] == data["message"]
+
     async def test_ingest_collection_not_found(self, client: AsyncClient):
         response = await client.post(
             "/v1/collections/nonexistent/documents",
+            json={"documents": [{"id": "doc-1", "content_raw": "Test", "payload": {}}]},
+        )
+        assert response.status_code == 404
+
+    async def test_ingest_backlogged_lane_returns_429(self, client: AsyncClient, monkeypatch):
+        monkeypatch.setattr(get_settings(), "ingest_max_queue_depth", 2)
+        docs = [
+            {"id": f"doc-{i}", "content_raw": "x", "payload": {"category": "x", "price": 1.0}}
+            for i in range(3)
+        ]
+
+        accepted = await client.post(
+            "/v1/collections/docs-test/documents", json={"documents": docs}
+        )
+        refused = await client.post(
+            "/v1/collections/docs-test/documents", json={"documents": docs[:1]}
+        )
+
+        assert accepted.status_code == 202
+        assert refused.status_code == 429
+        assert 1 <= int(refused.headers["Retry-After"]) <= 300
+        assert "backlogged" in refused.json()["detail"]
+
+    async def test_ingest_ndjson_stream(self, client: AsyncClient, monkeypatch):
+        monkeypatch.setattr(get_settings(), "ingest_stream_chunk_size", 50)
+        lines = [
+            json.dumps(
+                {"id": f"doc-{i}", "content_raw": "x", "payload": {"category": "x", "price": 1.0}}
+            )
+            for i in range(150)
+        ]
+        lines.insert(10, '{"id": "bad", "content_raw": "x", "payload": {"price": "free"}}')
+
+        response = await client.post(
+            "/v1/collections/docs-test/documents/stream",
+            content="\n".join(lines).encode(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 202
+        data = response.json()
+        assert (data["documents_queued"], data["documents_failed"]) == (150, 1)
+        assert data["lane"] == "bulk"
+        assert [(e["line"], e["id"]) for e in data["errors"]] == [(11, "bad")]
+        task = await client.get(f"/v1/tasks/{data['task_id']}", params={"limit": 0})
+        assert task.json()["summary"]["total"] == 150
+
+    async def test_ingest_stream_empty_body_rejected(self, client: AsyncClient):
+        response = await client.post("/v1/collections/docs-test/documents/stream", content=b"")
+        assert response.status_code == 422
+
+    async def test_ingest_stream_collection_not_found(self, client: AsyncClient):
+        response = await client.post(
+            "/v1/collections/nonexistent/documents/stream",
+            content=b'{"id": "doc-1", "content_raw": "x"}\n',
+        )
+        assert response.status_code == 404
+
+    async def test_update_payloads(self, client: AsyncClient, mock_app):
+        point_id = deterministic_vector_id("docs-test", "doc-1")
+        mock_app.state.vectordb.set_payload = AsyncMock(return_value=[point_id])
+
+        response = await client.patch(
+            "/v1/collections/docs-test/documents",
             json={
                 "documents": [
-                    {"id": "doc-1", "content_raw": "Test", "payload": {}}
+                    {"id": "doc-1", "payload": {"price": 9.99}},
+                    {"id": "doc-2", "payload": {"category": "sale"}},
                 ]
             },
         )
+
+        assert response.status_code == 200
+        assert response.json() == {"updated": 1, "not_found": ["doc-2"]}
+        collection, payloads, overwrite = mock_app.state.vectordb.set_payload.call_args.args
+        assert (collection, overwrite) == ("docs-test", False)
+        assert payloads[point_id] == {"price": 9.99, "_doc_id": "doc-1"}
+
+    async def test_update_payloads_validates_fields(self, client: AsyncClient):
+        response = await client.patch(
+            "/v1/collections/docs-test/documents",
+            json={"documents": [{"id": "doc-1", "payload": {"price": "free"}}]},
+        )
+        assert response.status_code == 422
+        assert "doc-1" in response.json()["details"]["documents"]
+
+    async def test_update_payloads_collection_not_found(self, client: AsyncClient):
+        response = await client.patch(
+            "/v1/collections/nonexistent/documents",
+            json={"documents": [{"id": "doc-1", "payload": {}}]},
+        )
         assert response.status_code == 404
 
     async def test_ingest_empty_documents_rejected(self, client: AsyncClient):
@@ -77,6 +77,7 @@ class TestSearchAPI:
         assert response.status_code == 200
         data = response.json()
         assert "results" in data
+        assert data["plan"]["strategy"] == "exact"
 
     async def test_search_with_complex_filter(self, client: AsyncClient):
         with patch("recall.services.search.EmbedderFactory") as mock_factory:
@@ -0,0 +1,107 @@
+"""Integration tests for Tasks API."""
+
+import asyncio
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from recall.services.task_progress import TaskProgressStore
+
+
+@pytest.mark.integration
+class TestTasksAPI:
+    """Test cases for /v1/tasks endpoints."""
+
+    @pytest.fixture
+    async def progress(self, fake_redis):
+        progress = TaskProgressStore(fake_redis)
+        await progress.create("batch", ["a", "b", "c"])
+        await progress.mark_complete("batch", 0, "a", {"doc_id": "a", "fetch_ms": 1.5})
+        await progress.mark_started("batch", 1, "b")
+        await progress.mark_failed("batch", 1, "b", "gone")
+        return progress
+
+    async def test_task_status(self, client: AsyncClient, progress):
+        response = await client.get("/v1/tasks/batch")
+
+        assert response.status_code == 200
+        body = response.json()
+        jobs = {job["doc_id"]: job for job in body["jobs"]}
+        assert jobs["a"]["status"] == "complete"
+        assert jobs["a"]["result"] == {"doc_id": "a", "fetch_ms": 1.5}
+        assert (jobs["b"]["status"], jobs["b"]["error"]) == ("failed", "gone")
+        assert jobs["c"]["status"] == "queued"
+        assert body["summary"] == {
+            "total": 3,
+            "queued": 1,
+            "in_progress": 0,
+            "complete": 1,
+            "failed": 1,
+            "superseded": 0,
+        }
+
+    async def test_task_status_pagination(self, client: AsyncClient, progress):
+        response = await client.get("/v1/tasks/batch", params={"limit": 1, "offset": 1})
+
+        body = response.json()
+        assert [job["doc_id"] for job in body["jobs"]] == ["b"]
+        assert (body["limit"], body["offset"], body["summary"]["total"]) == (1, 1, 3)
+
+    async def test_unknown_task(self, client: AsyncClient):
+        response = await client.get("/v1/tasks/missing")
+        assert response.status_code == 404
+
+    async def test_several_tasks(self, client: AsyncClient, progress):
+        await progress.create("other", ["x"])
+
+        response = await client.get("/v1/tasks", params={"ids": ["other", "missing", "batch"]})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [task["task_id"] for task in body["tasks"]] == ["other", "batch"]
+        assert all(task["jobs"] == [] for task in body["tasks"])
+        assert body["tasks"][1]["summary"]["complete"] == 1
+        assert body["not_found"] == ["missing"]
+
+    async def test_event_stream(self, client: AsyncClient, fake_redis, progress):
+        async def finish_batch():
+            channel = TaskProgressStore.events_channel("batch")
+            while (await fake_redis.pubsub_numsub(channel))[0][1] == 0:
+                await asyncio.sleep(0.01)
+            await progress.mark_complete("batch", 2, "c", {"doc_id": "c"})
+
+        finisher = asyncio.create_task(finish_batch())
+        response = await asyncio.wait_for(client.get("/v1/tasks/batch/events"), 5)
+        await finisher
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            (block.split("\n")[0].removeprefix("event: "), json.loads(block.split("data: ")[1]))
+            for block in response.text.strip().split("\n\n")
+        ]
+        assert [name for name, _ in events] == ["summary", "document", "done"]
+        assert events[0][1]["complete"] == 1
+        assert events[1][1] == {
+            "doc_id": "c",
+            "status": "complete",
+            "result": {"doc_id": "c"},
+            "error": None,
+            "superseded_by": None,
+        }
+        assert (events[2][1]["complete"], events[2][1]["failed"]) == (2, 1)
+
+    async def test_event_stream_of_finished_task(self, client: AsyncClient, progress):
+        await progress.mark_failed("batch", 2, "c", "bad")
+
+        response = await client.get("/v1/tasks/batch/events")
+
+        assert [line for line in response.text.split("\n") if line.startswith("event:")] == [
+            "event: summary",
+            "event: done",
+        ]
+
+    async def test_event_stream_of_unknown_task(self, client: AsyncClient):
+        response = await client.get("/v1/tasks/missing/events")
+        assert response.status_code == 404
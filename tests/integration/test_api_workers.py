@@ -0,0 +1,73 @@
+"""Integration tests for Workers API."""
+
+import pytest
+from httpx import AsyncClient
+
+from recall.models.task import StageStats
+from recall.services.fetcher import FetchStats
+from recall.services.pipeline_stats import PipelineStatsStore
+
+
+@pytest.mark.integration
+class TestWorkersAPI:
+    """Test cases for /v1/workers endpoints."""
+
+    async def test_pipeline_stats(self, client: AsyncClient, fake_redis):
+        stage = StageStats(
+            name="embed",
+            concurrency=2,
+            buffer_size=2,
+            queue_depth=2,
+            in_flight=2,
+            processed=40,
+            failed=0,
+            utilization=0.97,
+        )
+        fetch = {"origin.example": FetchStats(requests=4, retries=1, bytes=400, total_ms=100.0)}
+        await PipelineStatsStore(fake_redis).publish("worker-1", [stage], ttl=30, fetch=fetch)
+
+        response = await client.get("/v1/workers/pipeline")
+
+        assert response.status_code == 200
+        (report,) = response.json()
+        assert report["worker_id"] == "worker-1"
+        assert report["stages"][0]["utilization"] == 0.97
+        assert report["fetch"] == [
+            {
+                "host": "origin.example",
+                "requests": 4,
+                "failures": 0,
+                "retries": 1,
+                "bytes": 400,
+                "avg_ms": 25.0,
+            }
+        ]
+
+    async def test_pipeline_stats_without_workers(self, client: AsyncClient):
+        response = await client.get("/v1/workers/pipeline")
+        assert response.status_code == 200
+        assert response.json() == []
+
+    async def test_lane_stats(self, client: AsyncClient):
+        await client.post(
+            "/v1/collections",
+            json={
+                "name": "lanes-test",
+                "embedding_config": {"model": "all-MiniLM-L6-v2", "modality": "text"},
+            },
+        )
+        payload = {
+            "documents": [{"id": f"doc-{i}", "content_raw": "Content"} for i in range(3)],
+            "lane": "bulk",
+        }
+        ingest = await client.post("/v1/collections/lanes-test/documents", json=payload)
+        assert ingest.json()["lane"] == "bulk"
+
+        response = await client.get("/v1/workers/lanes")
+
+        assert response.status_code == 200
+        interactive, bulk = response.json()
+        assert (interactive["lane"], interactive["queue_depth"]) == ("interactive", 0)
+        assert (bulk["lane"], bulk["queue_depth"]) == ("bulk", 3)
+        assert bulk["head_wait_ms"] >= 0
+        assert bulk["mean_wait_ms"] is None
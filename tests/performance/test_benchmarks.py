@@ -1,17 +1,42 @@
 """Performance benchmark tests for critical paths."""
 
+import pickle
 import time
 
 import pytest
+from pydantic import TypeAdapter
 
+from recall.core.serialization import JobSerializer
+from recall.core.transpiler.cache import FilterCache
 from recall.core.transpiler.qdrant import QdrantTranspiler
+from recall.models.collection import FieldType
 from recall.models.search import (
     AndFilter,
     EqCondition,
+    FilterCondition,
     GtCondition,
     LtCondition,
     OrFilter,
+    SearchRequest,
 )
+from recall.services.schema_validator import validate_payload, validate_payloads
+
+DASHBOARD_FILTER = {
+    "op": "AND",
+    "conditions": [
+        {"op": "EQ", "field": "category", "value": "shoes"},
+        {
+            "op": "OR",
+            "conditions": [
+                {"op": "EQ", "field": "color", "value": "red"},
+                {"op": "EQ", "field": "color", "value": "blue"},
+                {"op": "EQ", "field": "color", "value": "green"},
+            ],
+        },
+        {"op": "LT", "field": "price", "value": 200},
+        {"op": "GT", "field": "rating", "value": 4},
+    ],
+}
 
 
 @pytest.mark.slow
@@ -72,6 +97,39 @@ class TestTranspilerPerformance:
         assert elapsed < 1.0, f"100 deeply nested transpilations took {elapsed:.2f}s"
 
 
+@pytest.mark.slow
+class TestFilterCachePerformance:
+    """Benchmark the filter compile cache against parse + transpile on every request."""
+
+    def test_cached_compile_beats_parse_and_transpile(self):
+        adapter = TypeAdapter(FilterCondition)
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            QdrantTranspiler.transpile(adapter.validate_python(DASHBOARD_FILTER))
+        uncached = time.perf_counter() - start
+
+        cache = FilterCache()
+        start = time.perf_counter()
+        for _ in range(1000):
+            cache.compile(cache.parse(DASHBOARD_FILTER))
+        cached = time.perf_counter() - start
+
+        assert cache.misses == 1
+        assert cached < uncached, f"cached {cached:.3f}s vs uncached {uncached:.3f}s"
+        assert cached < 0.2, f"1k cached compilations took {cached:.2f}s (expected <0.2s)"
+
+    def test_search_request_with_repeated_filter(self):
+        payload = {"query": "red shoes", "filter": DASHBOARD_FILTER, "limit": 10}
+
+        start = time.perf_counter()
+        for _ in range(10000):
+            SearchRequest.model_validate(payload)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0, f"10k SearchRequests with a cached filter took {elapsed:.2f}s"
+
+
 @pytest.mark.slow
 class TestEmbedderCaching:
     """Test embedder factory caching effectiveness."""
@@ -121,3 +179,100 @@ class TestModelValidation:
         elapsed = time.perf_counter() - start
 
         assert elapsed < 2.0, f"1k IngestRequest validations took {elapsed:.2f}s"
+
+
+@pytest.mark.slow
+class TestPayloadValidationPerformance:
+    """Benchmark batch payload validation against per-document validation."""
+
+    SCHEMA = {
+        "price": FieldType.FLOAT,
+        "rating": FieldType.INT,
+        "category": FieldType.KEYWORD,
+        "in_stock": FieldType.BOOL,
+    }
+
+    def _payloads(self) -> list[dict]:
+        return [
+            {"price": 9.99 + i, "rating": i % 5, "category": "shoes", "in_stock": True}
+            for i in range(100)
+        ]
+
+    def test_batch_validation_beats_per_document(self):
+        payloads = self._payloads()
+        doc_ids = [f"doc-{i}" for i in range(100)]
+
+        start = time.perf_counter()
+        for _ in range(200):
+            for payload, doc_id in zip(payloads, doc_ids, strict=True):
+                validate_payload(payload, self.SCHEMA, doc_id)
+        per_document = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(200):
+            validate_payloads(payloads, self.SCHEMA, doc_ids)
+        batch = time.perf_counter() - start
+
+        assert batch < per_document, f"batch {batch:.3f}s vs per-document {per_document:.3f}s"
+        assert batch < 0.5, f"200 batches of 100 payloads took {batch:.2f}s (expected <0.5s)"
+
+    def test_batch_validation_with_coercion(self):
+        # String-typed numbers skip the exact-type fast path and go through pydantic.
+        payloads = [{**p, "price": str(p["price"])} for p in self._payloads()]
+        doc_ids = [f"doc-{i}" for i in range(100)]
+
+        start = time.perf_counter()
+        for _ in range(200):
+            validate_payloads(payloads, self.SCHEMA, doc_ids)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 2.0, f"200 coerced batches of 100 payloads took {elapsed:.2f}s"
+
+
+@pytest.mark.slow
+class TestJobSerializationPerformance:
+    """Benchmark msgpack+zstd job serialization against arq's default pickle."""
+
+    def _jobs(self) -> list[dict]:
+        # Shaped like arq's job records for embed_document.
+        return [
+            {
+                "t": 1,
+                "f": "embed_document",
+                "a": ("products",),
+                "k": {
+                    "doc_id": f"doc-{i}",
+                    "content_raw": f"Comfortable running shoe number {i}. " * (1 + i % 40),
+                    "payload": {"category": "shoes", "price": 9.99 + i, "tags": ["a", "b"]},
+                },
+                "et": 1700000000000 + i,
+            }
+            for i in range(1000)
+        ]
+
+    def _measure(self, dumps, loads, jobs: list[dict]) -> tuple[float, float, float]:
+        start = time.perf_counter()
+        encoded = [dumps(job) for job in jobs]
+        encode = time.perf_counter() - start
+        start = time.perf_counter()
+        for data in encoded:
+            loads(data)
+        decode = time.perf_counter() - start
+        return sum(map(len, encoded)) / len(jobs), encode, decode
+
+    def test_msgpack_jobs_are_smaller_than_pickle(self):
+        jobs = self._jobs()
+        serializer = JobSerializer()
+
+        pickle_bytes, pickle_encode, pickle_decode = self._measure(
+            pickle.dumps, pickle.loads, jobs
+        )
+        msgpack_bytes, msgpack_encode, msgpack_decode = self._measure(
+            serializer.dumps, serializer.loads, jobs
+        )
+
+        assert msgpack_bytes < pickle_bytes * 0.7, (
+            f"msgpack+zstd {msgpack_bytes:.0f} B/job vs pickle {pickle_bytes:.0f} B/job"
+        )
+        assert msgpack_encode < 0.5, f"1k msgpack encodes took {msgpack_encode:.2f}s"
+        assert msgpack_decode < 0.5, f"1k msgpack decodes took {msgpack_decode:.2f}s"
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import fakeredis.aioredis
 import pytest
+from arq import ArqRedis
 
 
 @pytest.fixture
@@ -14,6 +15,12 @@ async def fake_redis():
     await redis.aclose()
 
 
+@pytest.fixture
+async def arq_redis(fake_redis):
+    """Create an Arq Redis client backed by the fake Redis server."""
+    return ArqRedis(connection_pool=fake_redis.connection_pool)
+
+
 @pytest.fixture
 def mock_arq_redis():
     """Create a mock Arq Redis client."""
@@ -0,0 +1,103 @@
+"""Tests for BlobStaging."""
+
+import hashlib
+
+import pytest
+
+from recall.core.blobstore.local import LocalBlobStore
+from recall.services.blob_staging import DELETING, BlobStaging
+
+
+@pytest.mark.unit
+class TestBlobStaging:
+    """Test cases for BlobStaging."""
+
+    @pytest.fixture
+    def store(self, tmp_path) -> LocalBlobStore:
+        return LocalBlobStore(tmp_path)
+
+    @pytest.fixture
+    def staging(self, fake_redis, store) -> BlobStaging:
+        return BlobStaging(fake_redis, store)
+
+    async def test_stage_and_load(self, staging, store):
+        ref = await staging.stage(b"big content")
+
+        assert ref == "blob:" + hashlib.sha256(b"big content").hexdigest()
+        assert BlobStaging.is_ref(ref)
+        assert await staging.load(ref) == b"big content"
+
+    async def test_identical_content_is_stored_once(self, staging, store, tmp_path):
+        first = await staging.stage(b"same")
+        second = await staging.stage(b"same")
+
+        assert first == second
+        assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
+
+    async def test_blob_deleted_after_last_release(self, staging, store, fake_redis):
+        ref = await staging.stage(b"shared")
+        await staging.stage(b"shared")
+        key = ref.removeprefix("blob:")
+
+        await staging.release(ref)
+        assert await store.exists(key)
+
+        await staging.release(ref)
+        assert not await store.exists(key)
+        assert await fake_redis.get(f"recall:blob_refs:{key}") is None
+
+    async def test_restage_after_delete(self, staging):
+        ref = await staging.stage(b"again")
+        await staging.release(ref)
+
+        assert await staging.stage(b"again") == ref
+        assert await staging.load(ref) == b"again"
+
+    async def test_rejects_non_refs(self, staging):
+        with pytest.raises(ValueError):
+            await staging.load("https://example.com/doc")
+
+    async def test_stage_leases_the_blob(self, staging, fake_redis):
+        ref = await staging.stage(b"leased")
+        key = ref.removeprefix("blob:")
+
+        assert 0 < await fake_redis.pttl(f"recall:blob_refs:{key}") <= 7 * 86400 * 1000
+        assert await fake_redis.zscore(BlobStaging.LEASES_KEY, key) is not None
+
+    async def test_expired_blobs_are_collected(self, fake_redis, store):
+        staging = BlobStaging(fake_redis, store, ttl=-1)
+        ref = await staging.stage(b"abandoned")
+        kept = await BlobStaging(fake_redis, store).stage(b"in use")
+
+        assert await staging.collect_expired() == 1
+        assert not await store.exists(ref.removeprefix("blob:"))
+        assert await store.exists(kept.removeprefix("blob:"))
+        assert await fake_redis.zcard(BlobStaging.LEASES_KEY) == 1
+        # A job that outlived the lease releases nothing.
+        await staging.release(ref)
+        assert await fake_redis.get(f"recall:blob_refs:{ref.removeprefix('blob:')}") is None
+
+    async def test_restaging_renews_the_lease(self, fake_redis, store):
+        ref = await BlobStaging(fake_redis, store, ttl=-1).stage(b"renewed")
+        await BlobStaging(fake_redis, store).stage(b"renewed")
+
+        assert await BlobStaging(fake_redis, store).collect_expired() == 0
+        assert await store.exists(ref.removeprefix("blob:"))
+
+    async def test_deleting_marker_expires(self, staging, fake_redis):
+        ref = await staging.stage(b"crashed")
+        key = ref.removeprefix("blob:")
+        await fake_redis.set(f"recall:blob_refs:{key}", DELETING, px=50)
+
+        assert await staging.stage(b"crashed") == ref
+        assert await staging.load(ref) == b"crashed"
+
+    async def test_stage_waits_for_deleting_marker_at_most_its_ttl(
+        self, staging, fake_redis, monkeypatch
+    ):
+        ref = await staging.stage(b"stuck")
+        await fake_redis.set(f"recall:blob_refs:{ref.removeprefix('blob:')}", DELETING)
+        monkeypatch.setattr(BlobStaging, "DELETING_TTL", 0.05)
+
+        with pytest.raises(TimeoutError):
+            await staging.stage(b"stuck")
@@ -0,0 +1,341 @@
+"""Tests for the bulk loader and its sources."""
+
+import base64
+import io
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from recall.cli import build_parser
+from recall.core.embedders.base import BaseEmbedder
+from recall.core.transpiler.qdrant import QdrantTranspiler
+from recall.core.utils import deterministic_vector_id
+from recall.core.vectordb.embedded import EmbeddedAdapter
+from recall.models.collection import FieldType
+from recall.models.search import EqCondition, LtCondition
+from recall.services.bulk_loader import (
+    BulkLoader,
+    Checkpoint,
+    CsvSource,
+    ImageDirectorySource,
+    JsonlSource,
+    LoadStats,
+    open_source,
+)
+from recall.services.registry import SchemaRegistry
+
+COLLECTION = "test-collection"
+
+
+class FakeEmbedder(BaseEmbedder):
+    """Embeds text by length; fails once ``fail_after`` batches are embedded."""
+
+    def __init__(self, fail_after: int | None = None):
+        self.batches = 0
+        self.fail_after = fail_after
+
+    def embed(self, content):
+        return self.embed_batch([content])[0]
+
+    def embed_batch(self, contents):
+        if self.fail_after is not None and self.batches >= self.fail_after:
+            raise RuntimeError("embedder crashed")
+        self.batches += 1
+        return [[float(len(c)), 1.0] for c in contents]
+
+    @property
+    def dimensions(self):
+        return 2
+
+    @property
+    def model_name(self):
+        return "fake"
+
+
+def _write_jsonl(path, docs):
+    path.write_text("".join(json.dumps(doc) + "\n" for doc in docs))
+
+
+def _docs(n, start=0):
+    return [
+        {
+            "id": f"doc-{i}",
+            "content_raw": f"text {i}",
+            "payload": {"category": "shoes", "price": 10.0, "rating": i},
+        }
+        for i in range(start, start + n)
+    ]
+
+
+@pytest.mark.unit
+class TestSources:
+    """Test cases for bulk sources."""
+
+    def test_jsonl_resumes_from_byte_offset(self, tmp_path):
+        path = tmp_path / "docs.jsonl"
+        _write_jsonl(path, _docs(3))
+
+        records = list(JsonlSource(path).records())
+        resumed = list(JsonlSource(path).records(records[0].end))
+
+        assert [r.doc_id for r in records] == ["doc-0", "doc-1", "doc-2"]
+        assert records[-1].end == path.stat().st_size
+        assert [r.doc_id for r in resumed] == ["doc-1", "doc-2"]
+        assert records[1].content == "text 1"
+        assert records[1].payload["rating"] == 1
+
+    def test_jsonl_invalid_lines_become_errors(self, tmp_path):
+        path = tmp_path / "docs.jsonl"
+        encoded = base64.b64encode(b"\x89PNG").decode()
+        path.write_text(
+            "not json\n"
+            "\n"
+            '{"id": "uri", "content_uri": "https://example.com/a.png"}\n'
+            f'{{"id": "img", "content_base64": "{encoded}"}}'
+        )
+
+        records = list(JsonlSource(path).records())
+
+        assert len(records) == 3
+        assert records[0].error.startswith("Invalid JSON")
+        assert records[1].doc_id == "uri"
+        assert "content_uri" in records[1].error
+        assert records[2].content == b"\x89PNG"
+
+    def test_jsonl_undecodable_line_fails_one_record(self, tmp_path):
+        path = tmp_path / "docs.jsonl"
+        path.write_bytes(
+            b'{"id": "a", "content_raw": "one"}\n'
+            b'{"id": "b", "content_raw": "\xff\xfe"}\n'
+            b'{"id": "c", "content_raw": "three"}\n'
+        )
+
+        records = list(JsonlSource(path).records())
+        resumed = list(JsonlSource(path).records(records[0].end))
+
+        assert [r.doc_id for r in records] == ["a", "", "c"]
+        assert records[1].error.startswith("Line 2 is not valid UTF-8")
+        assert resumed[0].error == records[1].error
+        assert [r.doc_id for r in JsonlSource(path).records(records[1].end)] == ["c"]
+        assert records[2].content == "three"
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.jsonl"
+        path.write_text("")
+
+        assert list(JsonlSource(path).records()) == []
+
+    def test_csv_payload_columns_and_resume(self, tmp_path):
+        path = tmp_path / "docs.csv"
+        path.write_text(
+            "\ufeffsku,description,category\n"
+            'a-1,"Red shoe, size 9",shoes\n'
+            "a-2,Blue hat,hats\n"
+            "a-3,,hats\n"
+        )
+        source = CsvSource(path, id_column="sku", content_column="description")
+
+        records = list(source.records())
+        resumed = list(source.records(records[0].end))
+
+        assert [r.doc_id for r in records] == ["a-1", "a-2", "a-3"]
+        assert records[0].content == "Red shoe, size 9"
+        assert records[0].payload == {"category": "shoes"}
+        assert records[2].error == "Missing id or content"
+        assert [r.doc_id for r in resumed] == ["a-2", "a-3"]
+
+    def test_csv_undecodable_row_fails_one_record(self, tmp_path):
+        path = tmp_path / "docs.csv"
+        path.write_bytes(b"id,content\na-1,caf\xe9\na-2,tea\n")
+
+        records = list(CsvSource(path).records())
+
+        assert len(records) == 2
+        assert records[0].error.startswith("Line 2 is not valid UTF-8")
+        assert (records[1].doc_id, records[1].content) == ("a-2", "tea")
+
+    def test_csv_missing_columns(self, tmp_path):
+        path = tmp_path / "docs.csv"
+        path.write_text("id,text\n1,hello\n")
+
+        with pytest.raises(ValueError, match="content"):
+            list(CsvSource(path).records())
+
+    def test_image_directory_in_path_order(self, tmp_path):
+        (tmp_path / "b").mkdir()
+        (tmp_path / "b" / "2.png").write_bytes(b"two")
+        (tmp_path / "1.JPG").write_bytes(b"one")
+        (tmp_path / "notes.txt").write_text("skip")
+
+        records = list(ImageDirectorySource(tmp_path).records())
+        resumed = list(ImageDirectorySource(tmp_path).records(1))
+
+        assert [(r.doc_id, r.content, r.end) for r in records] == [
+            ("1.JPG", b"one", 1),
+            ("b/2.png", b"two", 2),
+        ]
+        assert records[1].payload == {"path": "b/2.png"}
+        assert [r.doc_id for r in resumed] == ["b/2.png"]
+
+    def test_open_source_infers_format(self, tmp_path):
+        assert open_source(tmp_path / "a.ndjson").format == "jsonl"
+        assert open_source(tmp_path / "a.csv").format == "csv"
+        assert open_source(tmp_path).format == "images"
+        with pytest.raises(ValueError):
+            open_source(tmp_path / "a.parquet")
+
+
+@pytest.mark.unit
+class TestBulkLoader:
+    """Test cases for BulkLoader."""
+
+    @pytest.fixture
+    async def vectordb(self, tmp_path):
+        db = EmbeddedAdapter(str(tmp_path / "vectordb"))
+        await db.create_collection(COLLECTION, 2)
+        yield db
+        await db.close()
+
+    @pytest.fixture
+    def registry(self, sample_collection):
+        registry = AsyncMock(spec=SchemaRegistry)
+        registry.get = AsyncMock(return_value=sample_collection)
+        return registry
+
+    def _loader(self, registry, vectordb, **kwargs):
+        return BulkLoader(registry, vectordb, batch_size=4, embed_workers=2, **kwargs)
+
+    async def test_loads_all_records(self, tmp_path, registry, vectordb):
+        path = tmp_path / "docs.jsonl"
+        _write_jsonl(path, _docs(10))
+        progress = []
+
+        with patch("recall.services.bulk_loader.EmbedderFactory") as factory:
+            factory.create.return_value = FakeEmbedder()
+            stats = await self._loader(
+                registry, vectordb, upsert_batch_size=3, on_progress=progress.append
+            ).load(COLLECTION, JsonlSource(path))
+
+        assert (stats.loaded, stats.failed) == (10, 0)
+        assert stats.position == path.stat().st_size
+        assert progress[-1] is stats
+        assert await vectordb.count(COLLECTION) == 10
+        points = await vectordb.scroll(COLLECTION, limit=20)
+        point = next(p for p in points if p.id == deterministic_vector_id(COLLECTION, "doc-3"))
+        assert point.payload == {
+            "category": "shoes",
+            "price": 10.0,
+            "rating": 3,
+            "_doc_id": "doc-3",
+        }
+
+    async def test_invalid_records_are_skipped_and_reported(self, tmp_path, registry, vectordb):
+        path = tmp_path / "docs.jsonl"
+        docs = _docs(3)
+        docs[1]["payload"]["rating"] = "high"
+        _write_jsonl(path, docs)
+        path.write_text(path.read_text() + "{broken\n")
+        errors = io.StringIO()
+
+        with patch("recall.services.bulk_loader.EmbedderFactory") as factory:
+            factory.create.return_value = FakeEmbedder()
+            stats = await self._loader(registry, vectordb, errors=errors).load(
+                COLLECTION, JsonlSource(path)
+            )
+
+        assert (stats.loaded, stats.failed) == (2, 2)
+        failures = [json.loads(line) for line in errors.getvalue().splitlines()]
+        assert [f["id"] for f in failures] == ["doc-1", ""]
+        assert "rating" in failures[0]["error"]
+        assert failures[1]["position"] == path.stat().st_size
+
+    async def test_csv_values_are_stored_as_schema_types(
+        self, tmp_path, registry, vectordb, sample_collection
+    ):
+        sample_collection.index_schema["in_stock"] = FieldType.BOOL
+        path = tmp_path / "docs.csv"
+        path.write_text(
+            "id,content,category,price,rating,in_stock\n"
+            "a,Red shoe,shoes,5,4,true\n"
+            "b,Blue shoe,shoes,12.5,3,false\n"
+            "c,Hat,hats,cheap,1,true\n"
+        )
+
+        with patch("recall.services.bulk_loader.EmbedderFactory") as factory:
+            factory.create.return_value = FakeEmbedder()
+            stats = await self._loader(registry, vectordb).load(COLLECTION, CsvSource(path))
+
+        assert (stats.loaded, stats.failed) == (2, 1)
+        cheap = QdrantTranspiler.transpile(LtCondition(field="price", value=10))
+        in_stock = QdrantTranspiler.transpile(EqCondition(field="in_stock", value=True))
+        assert await vectordb.count(COLLECTION, filter=cheap) == 1
+        assert await vectordb.count(COLLECTION, filter=in_stock) == 1
+        (point,) = await vectordb.search(COLLECTION, [1.0, 1.0], filter=cheap)
+        assert point.payload == {
+            "category": "shoes",
+            "price": 5.0,
+            "rating": 4,
+            "in_stock": True,
+            "_doc_id": "a",
+        }
+
+    async def test_resumes_from_checkpoint(self, tmp_path, registry, vectordb):
+        path = tmp_path / "docs.jsonl"
+        _write_jsonl(path, _docs(12))
+        checkpoint = Checkpoint(tmp_path / "checkpoint.json")
+
+        with patch("recall.services.bulk_loader.EmbedderFactory") as factory:
+            factory.create.return_value = FakeEmbedder(fail_after=1)
+            loader = BulkLoader(
+                registry, vectordb, batch_size=4, embed_workers=1, checkpoint=checkpoint
+            )
+            with pytest.raises(RuntimeError):
+                await loader.load(COLLECTION, JsonlSource(path))
+
+            saved = checkpoint.load(COLLECTION, JsonlSource(path))
+            assert (saved.loaded, saved.failed) == (4, 0)
+
+            embedder = FakeEmbedder()
+            factory.create.return_value = embedder
+            stats = await loader.load(COLLECTION, JsonlSource(path))
+
+        assert embedder.batches == 2
+        assert (stats.loaded, stats.loaded_this_run) == (12, 8)
+        assert await vectordb.count(COLLECTION) == 12
+        assert checkpoint.load(COLLECTION, JsonlSource(path)).position == path.stat().st_size
+
+    async def test_restart_ignores_checkpoint(self, tmp_path, registry, vectordb):
+        path = tmp_path / "docs.jsonl"
+        _write_jsonl(path, _docs(4))
+        checkpoint = Checkpoint(tmp_path / "checkpoint.json")
+
+        with patch("recall.services.bulk_loader.EmbedderFactory") as factory:
+            factory.create.return_value = FakeEmbedder()
+            loader = self._loader(registry, vectordb, checkpoint=checkpoint)
+            await loader.load(COLLECTION, JsonlSource(path))
+            stats = await loader.load(COLLECTION, JsonlSource(path), resume=False)
+
+        assert stats.loaded_this_run == 4
+
+    async def test_checkpoint_of_another_load_is_rejected(self, tmp_path, registry, vectordb):
+        path = tmp_path / "docs.jsonl"
+        _write_jsonl(path, _docs(4))
+        checkpoint = Checkpoint(tmp_path / "checkpoint.json")
+        checkpoint.save("other-collection", JsonlSource(path), LoadStats())
+
+        with pytest.raises(ValueError, match="another load"):
+            await self._loader(registry, vectordb, checkpoint=checkpoint).load(
+                COLLECTION, JsonlSource(path)
+            )
+
+
+@pytest.mark.unit
+def test_cli_load_arguments():
+    args = build_parser().parse_args(
+        ["load", "articles", "docs.csv", "--id-column", "sku", "--batch-size", "64", "--restart"]
+    )
+
+    assert (args.command, args.collection, args.path.name) == ("load", "articles", "docs.csv")
+    assert (args.id_column, args.batch_size, args.restart) == ("sku", 64, True)
+    assert args.embed_workers is None
@@ -0,0 +1,107 @@
+"""Tests for CollectionCache and cached SchemaRegistry reads."""
+
+import asyncio
+
+import pytest
+
+from recall.models.collection import CreateCollectionRequest, EmbeddingConfig, FieldType, Modality
+from recall.models.errors import CollectionNotFoundError
+from recall.services.collection_cache import CollectionCache
+from recall.services.registry import SchemaRegistry
+
+
+def _request(name: str = "items") -> CreateCollectionRequest:
+    return CreateCollectionRequest(
+        name=name,
+        embedding_config=EmbeddingConfig(model="all-MiniLM-L6-v2", modality=Modality.TEXT),
+        index_schema={"category": FieldType.KEYWORD},
+    )
+
+
+async def _eventually(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.unit
+class TestCollectionCache:
+    """Test cases for CollectionCache."""
+
+    @pytest.fixture
+    async def cache(self, fake_redis):
+        cache = CollectionCache()
+        await cache.start(fake_redis)
+        yield cache
+        await cache.stop()
+
+    async def test_get_served_from_cache(self, fake_redis, cache):
+        registry = SchemaRegistry(fake_redis, cache)
+        await registry.save(_request())
+
+        first = await registry.get("items")
+        # Deleting behind the registry's back is not seen until invalidation.
+        await fake_redis.delete("recall:collection:items")
+        second = await registry.get("items")
+
+        assert second is first
+
+    async def test_write_invalidates_other_processes(self, fake_redis, cache):
+        other_cache = CollectionCache()
+        await other_cache.start(fake_redis)
+        try:
+            writer = SchemaRegistry(fake_redis, cache)
+            reader = SchemaRegistry(fake_redis, other_cache)
+            generation = other_cache.generation
+            await writer.save(_request())
+            await _eventually(lambda: other_cache.generation > generation)
+            await reader.get("items")
+            assert other_cache.get("items") is not None
+
+            await writer.delete("items")
+
+            await _eventually(lambda: other_cache.get("items") is None)
+            with pytest.raises(CollectionNotFoundError):
+                await reader.get("items")
+        finally:
+            await other_cache.stop()
+
+    async def test_record_auto_index_refreshes_cache(self, fake_redis, cache):
+        registry = SchemaRegistry(fake_redis, cache)
+        await registry.save(_request())
+        cached = await registry.get("items")
+
+        await registry.record_auto_index("items", "brand", FieldType.KEYWORD)
+
+        assert cached.auto_index_schema == {}
+        assert (await registry.get("items")).auto_index_schema == {"brand": FieldType.KEYWORD}
+
+    async def test_entries_expire(self, fake_redis):
+        cache = CollectionCache(ttl=0)
+        await cache.start(fake_redis)
+        try:
+            registry = SchemaRegistry(fake_redis, cache)
+            await registry.save(_request())
+            first = await registry.get("items")
+            assert await registry.get("items") is not first
+        finally:
+            await cache.stop()
+
+    async def test_bypassed_until_subscribed(self, fake_redis):
+        cache = CollectionCache()
+        registry = SchemaRegistry(fake_redis, cache)
+        await registry.save(_request())
+
+        await registry.get("items")
+        assert cache.get("items") is None
+
+    async def test_put_after_invalidation_is_dropped(self, fake_redis, cache):
+        registry = SchemaRegistry(fake_redis, cache)
+        collection = await registry.save(_request())
+
+        generation = cache.generation
+        cache.invalidate("items")
+        cache.put("items", collection, generation)
+
+        assert cache.get("items") is None
@@ -0,0 +1,41 @@
+"""Tests for ContentValidatorStore."""
+
+import pytest
+
+from recall.services.content_validators import ContentValidatorStore
+from recall.services.fetcher import ContentValidators
+
+URI = "https://cdn.example/a.png"
+
+
+@pytest.fixture
+def store(fake_redis):
+    return ContentValidatorStore(fake_redis, ttl=60)
+
+
+@pytest.mark.unit
+class TestContentValidatorStore:
+    """Test cases for ContentValidatorStore."""
+
+    async def test_round_trip(self, store):
+        validators = ContentValidators(URI, etag='"v1"', sha256="abc")
+
+        await store.update("c", {"doc-1": validators})
+
+        assert await store.get("c", "doc-1") == validators
+        assert await store.get("c", "doc-2") is None
+        assert await store.get("other", "doc-1") is None
+
+    async def test_cleared_documents_are_forgotten(self, store):
+        await store.update("c", {"doc-1": ContentValidators(URI), "doc-2": ContentValidators(URI)})
+
+        await store.update("c", {}, cleared=["doc-1"])
+
+        assert await store.get("c", "doc-1") is None
+        assert await store.get("c", "doc-2") is not None
+
+    async def test_records_expire(self, store, fake_redis):
+        await store.update("c", {"doc-1": ContentValidators(URI)})
+
+        (key,) = await fake_redis.keys(f"{ContentValidatorStore.KEY_PREFIX}*")
+        assert 0 < await fake_redis.pttl(key) <= 60_000
@@ -0,0 +1,75 @@
+"""Tests for DocumentVersions."""
+
+import pytest
+
+from recall.core.utils import deterministic_vector_id
+from recall.services.doc_versions import DocumentVersions
+
+
+@pytest.fixture
+def versions(arq_redis):
+    return DocumentVersions(arq_redis, ttl=60)
+
+
+@pytest.mark.unit
+class TestDocumentVersions:
+    """Test cases for DocumentVersions."""
+
+    async def test_reserve_numbers_versions_per_document(self, versions):
+        first = await versions.reserve("c", ["doc-1", "doc-2", "doc-1"])
+        second = await versions.reserve("c", ["doc-1"])
+
+        assert first == {"doc-1": 1, "doc-2": 1}
+        assert second == {"doc-1": 2}
+
+    async def test_latest_job_is_not_superseded(self, versions):
+        await versions.record("c", {"doc-1": ("b1:doc-1", 1)})
+
+        assert await versions.claim("c", "doc-1", "b1:doc-1", 1) is None
+
+    async def test_older_job_is_superseded(self, versions):
+        await versions.record("c", {"doc-1": ("b1:doc-1", 1)})
+        await versions.record("c", {"doc-1": ("b2:doc-1", 2)})
+
+        assert await versions.claim("c", "doc-1", "b1:doc-1", 1) == "b2:doc-1"
+        assert await versions.claim("c", "doc-1", "b2:doc-1", 2) is None
+
+    async def test_finished_newer_job_still_supersedes(self, versions, arq_redis):
+        await versions.record("c", {"doc-1": ("b2:doc-1", 2)})
+
+        # arq knows nothing of b2:doc-1, as after its result has expired.
+        assert not await arq_redis.keys("arq:*")
+        assert await versions.claim("c", "doc-1", "b1:doc-1", 1) == "b2:doc-1"
+
+    async def test_unrecorded_version_does_not_supersede(self, versions):
+        # The enqueue that reserved version 2 failed before recording it.
+        await versions.reserve("c", ["doc-1", "doc-1"])
+        seqs = await versions.reserve("c", ["doc-1"])
+
+        assert seqs == {"doc-1": 2}
+        assert await versions.claim("c", "doc-1", "b1:doc-1", 1) is None
+
+    async def test_starting_job_records_its_version(self, versions):
+        assert await versions.claim("c", "doc-1", "b2:doc-1", 2) is None
+
+        assert await versions.claim("c", "doc-1", "b1:doc-1", 1) == "b2:doc-1"
+
+    async def test_unknown_document(self, versions):
+        assert await versions.claim("c", "doc-1", "b1:doc-1", 1) is None
+
+    async def test_documents_are_scoped_by_collection(self, versions):
+        await versions.record("other", {"doc-1": ("b2:doc-1", 2)})
+
+        assert await versions.claim("c", "doc-1", "b1:doc-1", 1) is None
+
+    async def test_counter_and_record_expire_together(self, versions, arq_redis):
+        await versions.reserve("c", ["doc-1"])
+        await versions.record("c", {"doc-1": ("b1:doc-1", 1)})
+
+        vector_id = deterministic_vector_id("c", "doc-1")
+        seq_ttl = await arq_redis.pttl(DocumentVersions.SEQ_PREFIX + vector_id)
+        record_ttl = await arq_redis.pttl(DocumentVersions.KEY_PREFIX + vector_id)
+
+        assert 0 < seq_ttl <= 60_000
+        assert abs(seq_ttl - record_ttl) < 1000
+        assert await arq_redis.zcard(DocumentVersions.KEY_PREFIX + vector_id) == 1
@@ -0,0 +1,238 @@
+"""Tests for HttpFetcher."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from recall.models.errors import ContentFetchError, ContentTooLargeError
+from recall.services.fetcher import ContentValidators, HttpFetcher
+
+URI = "https://origin.example/doc.txt"
+
+
+@pytest.fixture
+async def fetcher():
+    fetcher = HttpFetcher(max_bytes=100, retries=2, backoff=0)
+    yield fetcher
+    await fetcher.aclose()
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+@pytest.mark.unit
+class TestHttpFetcher:
+    """Test cases for HttpFetcher."""
+
+    @respx.mock
+    async def test_fetch(self, fetcher):
+        respx.get(URI).mock(return_value=httpx.Response(200, content=b"hello"))
+
+        fetched = await fetcher.fetch(URI)
+
+        assert fetched.content == b"hello"
+        assert fetched.attempts == 1
+        stats = fetcher.stats()["origin.example"]
+        assert (stats.requests, stats.failures, stats.bytes) == (1, 0, 5)
+
+    @respx.mock
+    async def test_returns_validators(self, fetcher):
+        headers = {"ETag": '"v1"', "Last-Modified": "Wed, 01 Oct 2025 00:00:00 GMT"}
+        respx.get(URI).mock(return_value=httpx.Response(200, content=b"hello", headers=headers))
+
+        fetched = await fetcher.fetch(URI)
+
+        assert (fetched.etag, fetched.last_modified) == ('"v1"', headers["Last-Modified"])
+        assert not fetched.not_modified
+
+    @respx.mock
+    async def test_conditional_fetch_not_modified(self, fetcher):
+        route = respx.get(URI).mock(return_value=httpx.Response(304, headers={"ETag": '"v1"'}))
+        validators = ContentValidators(
+            URI, etag='"v1"', last_modified="Wed, 01 Oct 2025 00:00:00 GMT"
+        )
+
+        fetched = await fetcher.fetch(URI, validators)
+
+        assert fetched.not_modified
+        assert fetched.content == b""
+        request = route.calls.last.request
+        assert request.headers["If-None-Match"] == '"v1"'
+        assert request.headers["If-Modified-Since"] == validators.last_modified
+        assert fetcher.stats()["origin.example"].bytes == 0
+
+    @respx.mock
+    async def test_conditional_fetch_modified(self, fetcher):
+        respx.get(URI).mock(return_value=httpx.Response(200, content=b"new"))
+
+        fetched = await fetcher.fetch(URI, ContentValidators(URI, etag='"v1"'))
+
+        assert fetched.content == b"new"
+        assert not fetched.not_modified
+
+    @respx.mock
+    async def test_hash_only_validators_send_no_conditions(self, fetcher):
+        route = respx.get(URI).mock(return_value=httpx.Response(200, content=b"hello"))
+
+        await fetcher.fetch(URI, ContentValidators(URI, sha256="abc"))
+
+        assert "If-None-Match" not in route.calls.last.request.headers
+
+    @respx.mock
+    async def test_retries_server_errors(self, fetcher):
+        route = respx.get(URI).mock(
+            side_effect=[
+                httpx.Response(503),
+                httpx.ConnectError("refused"),
+                httpx.Response(200, content=b"ok"),
+            ]
+        )
+
+        fetched = await fetcher.fetch(URI)
+
+        assert fetched.content == b"ok"
+        assert fetched.attempts == 3
+        assert route.call_count == 3
+        assert fetcher.stats()["origin.example"].retries == 2
+
+    @respx.mock
+    async def test_gives_up_after_retries(self, fetcher):
+        respx.get(URI).mock(return_value=httpx.Response(502))
+
+        with pytest.raises(ContentFetchError) as exc_info:
+            await fetcher.fetch(URI)
+
+        assert exc_info.value.status_code == 502
+        assert fetcher.stats()["origin.example"].failures == 1
+
+    @respx.mock
+    async def test_honours_short_retry_after(self, monkeypatch):
+        sleeps = []
+
+        async def sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", sleep)
+        respx.get(URI).mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "5"}),
+                httpx.Response(200, content=b"ok"),
+            ]
+        )
+        fetcher = HttpFetcher(retries=2, backoff=0, max_retry_after=10)
+        try:
+            assert (await fetcher.fetch(URI)).content == b"ok"
+        finally:
+            await fetcher.aclose()
+
+        assert sleeps == [5.0]
+
+    @respx.mock
+    async def test_long_retry_after_fails_at_once(self, fetcher):
+        route = respx.get(URI).mock(
+            return_value=httpx.Response(503, headers={"Retry-After": "86400"})
+        )
+
+        with pytest.raises(ContentFetchError, match="Retry-After") as exc_info:
+            await fetcher.fetch(URI)
+
+        assert exc_info.value.status_code == 503
+        assert route.call_count == 1
+        stats = fetcher.stats()["origin.example"]
+        assert (stats.failures, stats.retries) == (1, 0)
+
+    async def test_malformed_uri_raises_fetch_error(self, fetcher):
+        with pytest.raises(ContentFetchError, match="Invalid content URI"):
+            await fetcher.fetch("http://\x00/")
+
+        assert fetcher.stats() == {}
+
+    @respx.mock
+    async def test_client_errors_are_not_retried(self, fetcher):
+        route = respx.get(URI).mock(return_value=httpx.Response(404))
+
+        with pytest.raises(ContentFetchError):
+            await fetcher.fetch(URI)
+
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_rejects_large_content_length(self, fetcher):
+        respx.get(URI).mock(return_value=httpx.Response(200, content=b"x" * 101))
+
+        with pytest.raises(ContentTooLargeError):
+            await fetcher.fetch(URI)
+
+    @respx.mock
+    async def test_stops_streaming_past_limit(self, fetcher):
+        respx.get(URI).mock(
+            return_value=httpx.Response(200, content=_chunks(b"x" * 60, b"x" * 60, b"x" * 60))
+        )
+
+        with pytest.raises(ContentTooLargeError):
+            await fetcher.fetch(URI)
+
+    @respx.mock
+    async def test_limits_concurrency_per_host(self):
+        fetcher = HttpFetcher(per_host_limit=2)
+        in_flight = peak = 0
+
+        async def slow(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, content=b"ok")
+
+        respx.get(URI).mock(side_effect=slow)
+        try:
+            await asyncio.gather(*(fetcher.fetch(URI) for _ in range(6)))
+        finally:
+            await fetcher.aclose()
+
+        assert peak == 2
+
+    @respx.mock
+    async def test_idle_hosts_are_evicted_into_other(self):
+        fetcher = HttpFetcher(max_hosts=2)
+        respx.get(url__regex=r"https://h\d\.example/").mock(
+            return_value=httpx.Response(200, content=b"ok")
+        )
+        try:
+            for host in ["h1", "h2", "h1", "h3"]:
+                await fetcher.fetch(f"https://{host}.example/")
+        finally:
+            await fetcher.aclose()
+
+        stats = fetcher.stats()
+        assert list(stats) == ["h1.example", "h3.example", HttpFetcher.OTHER_HOSTS]
+        assert stats["h1.example"].requests == 2
+        assert stats[HttpFetcher.OTHER_HOSTS].bytes == 2
+
+    @respx.mock
+    async def test_busy_hosts_are_not_evicted(self):
+        fetcher = HttpFetcher(max_hosts=1)
+        release = asyncio.Event()
+
+        async def held(request):
+            await release.wait()
+            return httpx.Response(200, content=b"ok")
+
+        respx.get("https://busy.example/").mock(side_effect=held)
+        respx.get("https://idle.example/").mock(return_value=httpx.Response(200))
+        try:
+            busy = asyncio.create_task(fetcher.fetch("https://busy.example/"))
+            await asyncio.sleep(0.01)
+            await fetcher.fetch("https://idle.example/")
+            assert "busy.example" in fetcher.stats()
+            release.set()
+            await busy
+        finally:
+            await fetcher.aclose()
+
+        assert fetcher.stats()["busy.example"].requests == 1
@@ -0,0 +1,69 @@
+"""Tests for FetcherRegistry."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from recall.config import Settings
+from recall.models.errors import ContentFetchError
+from recall.services.fetcher import FetchedContent, FetchStats, HttpFetcher
+from recall.services.fetcher_registry import FetcherRegistry
+from recall.services.file_fetcher import FileFetcher
+from recall.services.s3_fetcher import S3Fetcher
+
+
+@pytest.mark.unit
+class TestFetcherRegistry:
+    """Test cases for FetcherRegistry."""
+
+    async def test_routes_by_scheme(self):
+        http, s3 = AsyncMock(), AsyncMock()
+        s3.fetch.return_value = FetchedContent(b"object", 1.0, 1)
+        registry = FetcherRegistry({"https": http, "S3": s3})
+
+        fetched = await registry.fetch("S3://bucket/key")
+
+        assert fetched.content == b"object"
+        s3.fetch.assert_awaited_once_with("S3://bucket/key", None)
+        http.fetch.assert_not_awaited()
+
+    async def test_unsupported_scheme(self):
+        registry = FetcherRegistry({"https": AsyncMock()})
+
+        for uri in ["ftp://host/file", "no-scheme"]:
+            with pytest.raises(ContentFetchError, match="supported schemes: https"):
+                await registry.fetch(uri)
+
+    async def test_shared_fetcher_closed_once(self):
+        http = AsyncMock()
+        registry = FetcherRegistry({"http": http, "https": http})
+
+        await registry.aclose()
+
+        http.aclose.assert_awaited_once()
+
+    async def test_stats_merge_http_fetchers(self):
+        http = MagicMock(spec=HttpFetcher)
+        http.stats.return_value = {"a.example": FetchStats(requests=2, bytes=10)}
+        other = MagicMock(spec=HttpFetcher)
+        other.stats.return_value = {"a.example": FetchStats(requests=1, bytes=5)}
+        registry = FetcherRegistry({"http": http, "https": http, "x": other, "s3": AsyncMock()})
+
+        stats = registry.stats()
+
+        assert stats == {"a.example": FetchStats(requests=3, bytes=15)}
+        http.stats.assert_called_once()
+
+    async def test_from_settings(self, tmp_path):
+        registry = FetcherRegistry.from_settings(Settings(fetch_file_roots=[str(tmp_path)]))
+        (tmp_path / "doc.txt").write_bytes(b"text")
+        try:
+            assert registry.schemes() == ["file", "http", "https", "s3"]
+            assert registry._fetchers["http"] is registry._fetchers["https"]
+            assert isinstance(registry._fetchers["http"], HttpFetcher)
+            assert isinstance(registry._fetchers["file"], FileFetcher)
+            assert isinstance(registry._fetchers["s3"], S3Fetcher)
+            fetched = await registry.fetch((tmp_path / "doc.txt").as_uri())
+            assert bytes(fetched.content) == b"text"
+        finally:
+            await registry.aclose()
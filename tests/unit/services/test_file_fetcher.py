@@ -0,0 +1,86 @@
+"""Tests for FileFetcher."""
+
+import pytest
+
+from recall.models.errors import ContentFetchError, ContentTooLargeError
+from recall.services.fetcher import ContentValidators
+from recall.services.file_fetcher import FileFetcher
+
+
+@pytest.fixture
+def root(tmp_path):
+    root = tmp_path / "shared"
+    root.mkdir()
+    (root / "doc one.txt").write_bytes(b"hello")
+    return root
+
+
+@pytest.mark.unit
+class TestFileFetcher:
+    """Test cases for FileFetcher."""
+
+    async def test_maps_file(self, root):
+        fetcher = FileFetcher([str(root)])
+
+        fetched = await fetcher.fetch((root / "doc one.txt").as_uri())
+
+        assert isinstance(fetched.content, memoryview)
+        assert bytes(fetched.content) == b"hello"
+        assert fetched.etag and fetched.last_modified
+        assert not fetched.not_modified
+
+    async def test_unchanged_file_is_not_modified(self, root):
+        fetcher = FileFetcher([str(root)])
+        uri = (root / "doc one.txt").as_uri()
+        first = await fetcher.fetch(uri)
+
+        again = await fetcher.fetch(uri, ContentValidators(uri, etag=first.etag))
+        (root / "doc one.txt").write_bytes(b"changed!")
+        changed = await fetcher.fetch(uri, ContentValidators(uri, etag=first.etag))
+
+        assert again.not_modified and again.content == b""
+        assert bytes(changed.content) == b"changed!"
+
+    async def test_empty_file(self, root):
+        (root / "empty").write_bytes(b"")
+
+        fetched = await FileFetcher([str(root)]).fetch((root / "empty").as_uri())
+
+        assert fetched.content == b""
+
+    async def test_refuses_paths_outside_roots(self, root, tmp_path):
+        (tmp_path / "secret").write_bytes(b"secret")
+        (root / "link").symlink_to(tmp_path / "secret")
+        fetcher = FileFetcher([str(root)])
+
+        for uri in [
+            (tmp_path / "secret").as_uri(),
+            (root / "link").as_uri(),
+            f"file://{root}/../secret",
+        ]:
+            with pytest.raises(ContentFetchError, match="outside the allowed roots"):
+                await fetcher.fetch(uri)
+
+    async def test_refuses_everything_without_roots(self, root):
+        with pytest.raises(ContentFetchError) as exc_info:
+            await FileFetcher().fetch((root / "doc one.txt").as_uri())
+        assert exc_info.value.status_code == 403
+
+    async def test_refuses_remote_hosts(self, root):
+        with pytest.raises(ContentFetchError, match="remote host"):
+            await FileFetcher([str(root)]).fetch(f"file://fileserver{root}/doc%20one.txt")
+
+    async def test_missing_file(self, root):
+        with pytest.raises(ContentFetchError) as exc_info:
+            await FileFetcher([str(root)]).fetch((root / "missing").as_uri())
+        assert exc_info.value.status_code == 404
+
+    async def test_directory_is_not_content(self, root):
+        (root / "dir").mkdir()
+
+        with pytest.raises(ContentFetchError, match="not a regular file"):
+            await FileFetcher([str(root)]).fetch((root / "dir").as_uri())
+
+    async def test_rejects_large_files(self, root):
+        with pytest.raises(ContentTooLargeError):
+            await FileFetcher([str(root)], max_bytes=4).fetch((root / "doc one.txt").as_uri())
@@ -0,0 +1,171 @@
+"""Tests for filter usage tracking and IndexAdvisor."""
+
+from collections import Counter
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import RedisError
+
+from recall.core.transpiler.cache import FilterCache
+from recall.models.collection import CreateCollectionRequest, EmbeddingConfig, FieldType, Modality
+from recall.models.search import AndFilter, EqCondition, GtCondition, InCondition
+from recall.services.filter_usage import FieldUsage, FilterUsageTracker
+from recall.services.index_advisor import IndexAdvisor
+from recall.services.registry import SchemaRegistry
+
+
+def _compile(dsl):
+    return FilterCache().compile(dsl)
+
+
+@pytest.mark.unit
+class TestFilterUsageTracker:
+    """Test cases for FilterUsageTracker."""
+
+    @pytest.fixture
+    def tracker(self, fake_redis) -> FilterUsageTracker:
+        return FilterUsageTracker(fake_redis)
+
+    async def test_record_and_drain(self, tracker):
+        compiled = _compile(
+            AndFilter(
+                conditions=[
+                    EqCondition(field="brand", value="acme"),
+                    GtCondition(field="price", value=9.5),
+                ]
+            )
+        )
+        tracker.record("items", compiled, 12.0)
+        tracker.record("items", compiled, 8.0)
+        await tracker.flush()
+
+        usage = await tracker.drain("items")
+
+        assert usage["brand"].uses == 2
+        assert usage["brand"].avg_ms == pytest.approx(10.0)
+        assert usage["brand"].index_type() == FieldType.KEYWORD
+        assert usage["price"].index_type() == FieldType.FLOAT
+
+    async def test_drain_resets_window(self, tracker):
+        tracker.record("items", _compile(EqCondition(field="a", value=1)), 1.0)
+        await tracker.flush()
+
+        assert await tracker.drain("items")
+        assert await tracker.drain("items") == {}
+
+    async def test_field_names_with_separator(self, tracker):
+        tracker.record("items", _compile(EqCondition(field="a|b", value=True)), 1.0)
+        await tracker.flush()
+
+        usage = await tracker.drain("items")
+        assert usage["a|b"].index_type() == FieldType.BOOL
+
+    async def test_failed_flush_keeps_counts(self, tracker, fake_redis):
+        compiled = _compile(EqCondition(field="a", value=1))
+        tracker.record("items", compiled, 1.0)
+        tracker._redis = MagicMock()
+        tracker._redis.pipeline.side_effect = RedisError("down")
+
+        with pytest.raises(RedisError):
+            await tracker.flush()
+        tracker._redis = fake_redis
+        tracker.record("items", compiled, 2.0)
+        await tracker.flush()
+
+        usage = await tracker.drain("items")
+        assert usage["a"].uses == 2
+        assert usage["a"].total_ms == pytest.approx(3.0)
+
+    async def test_stop_flushes_remaining_counts(self, fake_redis):
+        tracker = FilterUsageTracker(fake_redis, flush_interval=3600)
+        await tracker.start()
+        tracker.record("items", _compile(EqCondition(field="a", value=1)), 1.0)
+
+        await tracker.stop()
+
+        assert (await tracker.drain("items"))["a"].uses == 1
+
+    @pytest.mark.parametrize(
+        "types,expected",
+        [
+            ({FieldType.INT: 3}, FieldType.INT),
+            ({FieldType.INT: 3, FieldType.FLOAT: 1}, FieldType.FLOAT),
+            ({FieldType.KEYWORD: 2}, FieldType.KEYWORD),
+            ({FieldType.KEYWORD: 2, FieldType.INT: 1}, None),
+            ({}, None),
+        ],
+    )
+    def test_index_type(self, types, expected):
+        assert FieldUsage(uses=1, types=Counter(types)).index_type() == expected
+
+
+@pytest.mark.unit
+class TestIndexAdvisor:
+    """Test cases for IndexAdvisor."""
+
+    @pytest.fixture
+    async def registry(self, fake_redis) -> SchemaRegistry:
+        registry = SchemaRegistry(fake_redis)
+        await registry.save(
+            CreateCollectionRequest(
+                name="items",
+                embedding_config=EmbeddingConfig(model="all-MiniLM-L6-v2", modality=Modality.TEXT),
+                index_schema={"category": FieldType.KEYWORD},
+            )
+        )
+        return registry
+
+    @pytest.fixture
+    def tracker(self, fake_redis) -> FilterUsageTracker:
+        return FilterUsageTracker(fake_redis)
+
+    @pytest.fixture
+    def vectordb(self):
+        vectordb = AsyncMock()
+        vectordb.create_payload_index = AsyncMock(return_value=None)
+        return vectordb
+
+    async def _observe(self, tracker, dsl, times: int, elapsed_ms: float) -> None:
+        compiled = _compile(dsl)
+        for _ in range(times):
+            tracker.record("items", compiled, elapsed_ms)
+        await tracker.flush()
+
+    async def test_indexes_hot_unindexed_field(self, registry, tracker, vectordb):
+        await self._observe(tracker, InCondition(field="brand", value=["a", "b"]), 10, 40.0)
+        advisor = IndexAdvisor(registry, vectordb, tracker, min_uses=5, min_avg_ms=10.0)
+
+        created = await advisor.run()
+
+        assert created == {"items": {"brand": FieldType.KEYWORD}}
+        vectordb.create_payload_index.assert_awaited_once_with("items", "brand", FieldType.KEYWORD)
+        config = await registry.get("items")
+        assert config.auto_index_schema == {"brand": FieldType.KEYWORD}
+        assert config.index_schema == {"category": FieldType.KEYWORD}
+
+    async def test_skips_declared_and_cold_fields(self, registry, tracker, vectordb):
+        await self._observe(tracker, EqCondition(field="category", value="x"), 10, 40.0)
+        await self._observe(tracker, EqCondition(field="rare", value="x"), 2, 40.0)
+        await self._observe(tracker, EqCondition(field="fast", value="x"), 10, 1.0)
+        advisor = IndexAdvisor(registry, vectordb, tracker, min_uses=5, min_avg_ms=10.0)
+
+        assert await advisor.run() == {}
+        vectordb.create_payload_index.assert_not_called()
+
+    async def test_skips_already_auto_indexed(self, registry, tracker, vectordb):
+        await registry.record_auto_index("items", "brand", FieldType.KEYWORD)
+        await self._observe(tracker, EqCondition(field="brand", value="x"), 10, 40.0)
+        advisor = IndexAdvisor(registry, vectordb, tracker, min_uses=5, min_avg_ms=0.0)
+
+        assert await advisor.run() == {}
+
+    async def test_limits_indexes_per_run_by_total_cost(self, registry, tracker, vectordb):
+        await self._observe(tracker, EqCondition(field="cheap", value=1), 10, 10.0)
+        await self._observe(tracker, EqCondition(field="costly", value=1), 10, 90.0)
+        advisor = IndexAdvisor(
+            registry, vectordb, tracker, min_uses=5, min_avg_ms=0.0, max_per_run=1
+        )
+
+        created = await advisor.run()
+
+        assert created == {"items": {"costly": FieldType.INT}}
@@ -1,14 +1,28 @@
 """Tests for IngestionService."""
 
-from unittest.mock import AsyncMock, MagicMock
+import base64
+import json
+from unittest.mock import AsyncMock, call, patch
 
 import pytest
 
-from recall.models.collection import Collection, EmbeddingConfig, Modality
-from recall.models.document import Document, IngestRequest
-from recall.models.errors import CollectionNotFoundError
+from recall.core.blobstore.local import LocalBlobStore
+from recall.models.collection import Collection, EmbeddingConfig, FieldType, Modality
+from recall.models.document import Document, IngestLane, IngestRequest
+from recall.models.errors import (
+    CollectionNotFoundError,
+    ContentStagingError,
+    IngestionBackpressureError,
+    SchemaValidationError,
+)
+from recall.services.blob_staging import BlobStaging
+from recall.services.doc_versions import DocumentVersions
 from recall.services.ingestion import IngestionService
+from recall.services.lanes import LANE_QUEUES, LaneScheduler
 from recall.services.registry import SchemaRegistry
+from recall.services.task_progress import TaskProgressStore
+
+INTERACTIVE_QUEUE = LANE_QUEUES[IngestLane.INTERACTIVE]
 
 
 def _make_mock_collection(name: str = "test-collection") -> Collection:
@@ -32,29 +46,20 @@ class TestIngestionService:
         return registry
 
     @pytest.fixture
-    def mock_arq_redis(self):
-        """Create a mock Arq Redis client."""
-        arq = AsyncMock()
-        arq.enqueue_job = AsyncMock(return_value=MagicMock(job_id="test-job"))
-        return arq
-
-    @pytest.fixture
-    def ingestion_service(self, mock_registry, mock_arq_redis):
-        """Create IngestionService with mocks."""
-        return IngestionService(mock_registry, mock_arq_redis)
+    def ingestion_service(self, mock_registry, arq_redis):
+        """Create IngestionService with a mock registry and fake Redis queue."""
+        return IngestionService(mock_registry, arq_redis)
 
-    async def test_ingest_single_document(self, ingestion_service, mock_arq_redis):
-        request = IngestRequest(
-            documents=[Document(id="doc-1", content_raw="Test content")]
-        )
+    async def test_ingest_single_document(self, ingestion_service, arq_redis):
+        request = IngestRequest(documents=[Document(id="doc-1", content_raw="Test content")])
         response = await ingestion_service.ingest("test-collection", request)
 
         assert response.status == "queued"
         assert response.documents_queued == 1
         assert response.task_id is not None
-        mock_arq_redis.enqueue_job.assert_called_once()
+        assert len(await arq_redis.queued_jobs(queue_name=INTERACTIVE_QUEUE)) == 1
 
-    async def test_ingest_multiple_documents(self, ingestion_service, mock_arq_redis):
+    async def test_ingest_multiple_documents(self, ingestion_service, arq_redis):
         docs = [
             Document(id="doc-1", content_raw="Content 1"),
             Document(id="doc-2", content_raw="Content 2"),
@@ -64,19 +69,35 @@ class TestIngestionService:
         response = await ingestion_service.ingest("test-collection", request)
 
         assert response.documents_queued == 3
-        assert mock_arq_redis.enqueue_job.call_count == 3
+        jobs = await arq_redis.queued_jobs(queue_name=INTERACTIVE_QUEUE)
+        assert sorted(job.kwargs["doc_id"] for job in jobs) == ["doc-1", "doc-2", "doc-3"]
+        assert {job.function for job in jobs} == {"embed_document"}
+
+    async def test_ingest_enqueues_in_one_round_trip(self, ingestion_service, arq_redis):
+        docs = [Document(id=f"doc-{i}", content_raw="Content") for i in range(100)]
+
+        with (
+            patch.object(arq_redis, "pipeline", wraps=arq_redis.pipeline) as pipeline,
+            patch.object(arq_redis, "execute_command") as execute_command,
+        ):
+            await ingestion_service.ingest("test-collection", IngestRequest(documents=docs))
+
+        pipeline.assert_called_once()
+        execute_command.assert_not_called()
+        bulk_queue = LANE_QUEUES[IngestLane.BULK]
+        assert len(await arq_redis.queued_jobs(queue_name=bulk_queue)) == 100
 
-    async def test_ingest_with_uri(self, ingestion_service, mock_arq_redis):
+    async def test_ingest_with_uri(self, ingestion_service, arq_redis):
         request = IngestRequest(
             documents=[Document(id="doc-1", content_uri="https://example.com/file.txt")]
         )
         await ingestion_service.ingest("test-collection", request)
 
-        call_kwargs = mock_arq_redis.enqueue_job.call_args.kwargs
-        assert call_kwargs["content_uri"] == "https://example.com/file.txt"
-        assert call_kwargs["content_raw"] is None
+        (job,) = await arq_redis.queued_jobs(queue_name=INTERACTIVE_QUEUE)
+        assert job.kwargs["content_uri"] == "https://example.com/file.txt"
+        assert job.kwargs["content_raw"] is None
 
-    async def test_ingest_with_payload(self, ingestion_service, mock_arq_redis):
+    async def test_ingest_with_payload(self, ingestion_service, arq_redis):
         request = IngestRequest(
             documents=[
                 Document(
@@ -88,30 +109,430 @@ class TestIngestionService:
         )
         await ingestion_service.ingest("test-collection", request)
 
-        call_kwargs = mock_arq_redis.enqueue_job.call_args.kwargs
-        assert call_kwargs["payload"] == {"category": "shoes", "price": 99.99}
+        (job,) = await arq_redis.queued_jobs(queue_name=INTERACTIVE_QUEUE)
+        assert job.kwargs["payload"] == {"category": "shoes", "price": 99.99}
 
-    async def test_ingest_collection_not_found(self, mock_arq_redis):
+    async def test_ingest_collection_not_found(self, arq_redis):
         registry = AsyncMock(spec=SchemaRegistry)
         registry.get = AsyncMock(side_effect=CollectionNotFoundError("nonexistent"))
 
-        service = IngestionService(registry, mock_arq_redis)
-        request = IngestRequest(
-            documents=[Document(id="doc-1", content_raw="Test")]
-        )
+        service = IngestionService(registry, arq_redis)
+        request = IngestRequest(documents=[Document(id="doc-1", content_raw="Test")])
 
         with pytest.raises(CollectionNotFoundError):
             await service.ingest("nonexistent", request)
 
-    async def test_job_id_format(self, ingestion_service, mock_arq_redis):
+    async def test_ingest_reports_all_invalid_payloads(self, arq_redis):
+        collection = _make_mock_collection()
+        collection.index_schema = {"price": FieldType.FLOAT}
+        registry = AsyncMock(spec=SchemaRegistry)
+        registry.get = AsyncMock(return_value=collection)
+
+        service = IngestionService(registry, arq_redis)
+        request = IngestRequest(
+            documents=[
+                Document(id="ok", content_raw="Test", payload={"price": 1.0}),
+                Document(id="bad-1", content_raw="Test", payload={"price": "cheap"}),
+                Document(id="bad-2", content_raw="Test", payload={}),
+            ]
+        )
+
+        with pytest.raises(SchemaValidationError) as exc_info:
+            await service.ingest("test-collection", request)
+
+        assert set(exc_info.value.details["documents"]) == {"bad-1", "bad-2"}
+        assert await arq_redis.queued_jobs(queue_name=INTERACTIVE_QUEUE) == []
+
+    async def test_large_and_binary_content_is_staged(
+        self, mock_registry, arq_redis, fake_redis, tmp_path
+    ):
+        staging = BlobStaging(fake_redis, LocalBlobStore(tmp_path))
+        service = IngestionService(mock_registry, arq_redis, staging=staging, blob_min_bytes=100)
+        request = IngestRequest(
+            documents=[
+                Document(id="small", content_raw="short"),
+                Document(id="large", content_raw="x" * 100),
+                Document(id="image", content_base64=base64.b64encode(b"\x89PNG")),
+            ]
+        )
+
+        await service.ingest("test-collection", request)
+
+        jobs = {
+            job.kwargs["doc_id"]: job.kwargs
+            for job in await arq_redis.queued_jobs(queue_name=INTERACTIVE_QUEUE)
+        }
+        assert jobs["small"]["content_raw"] == "short"
+        assert "content_ref" not in jobs["small"]
+        assert "content_raw" not in jobs["large"]
+        assert await staging.load(jobs["large"]["content_ref"]) == b"x" * 100
+        assert await staging.load(jobs["image"]["content_ref"]) == b"\x89PNG"
+
+    async def test_binary_content_needs_staging(self, ingestion_service, arq_redis):
+        request = IngestRequest(
+            documents=[Document(id="image", content_base64=base64.b64encode(b"img"))]
+        )
+
+        with pytest.raises(ContentStagingError):
+            await ingestion_service.ingest("test-collection", request)
+
+        assert await arq_redis.queued_jobs(queue_name=INTERACTIVE_QUEUE) == []
+
+    async def test_staged_blobs_released_when_enqueue_fails(
+        self, mock_registry, arq_redis, fake_redis, tmp_path
+    ):
+        store = LocalBlobStore(tmp_path)
+        service = IngestionService(
+            mock_registry, arq_redis, staging=BlobStaging(fake_redis, store), blob_min_bytes=1
+        )
+        request = IngestRequest(documents=[Document(id="doc", content_raw="content")])
+
+        with (
+            patch("recall.services.ingestion.enqueue_jobs", side_effect=ConnectionError),
+            pytest.raises(ConnectionError),
+        ):
+            await service.ingest("test-collection", request)
+
+        assert not [p for p in tmp_path.rglob("*") if p.is_file()]
+
+    async def test_creates_progress_record(self, mock_registry, arq_redis):
+        progress = TaskProgressStore(arq_redis)
+        service = IngestionService(mock_registry, arq_redis, progress=progress)
         request = IngestRequest(
-            documents=[Document(id="doc-123", content_raw="Test")]
+            documents=[
+                Document(id="a", content_raw="1"),
+                Document(id="b", content_raw="2"),
+                Document(id="a", content_raw="duplicate"),
+            ]
+        )
+
+        response = await service.ingest("test-collection", request)
+
+        status = await progress.get(response.task_id)
+        assert [job.doc_id for job in status.jobs] == ["a", "b"]
+        assert status.summary.queued == 2
+        jobs = {
+            job.kwargs["doc_id"]: job.kwargs
+            for job in await arq_redis.queued_jobs(queue_name=INTERACTIVE_QUEUE)
+        }
+        assert jobs["a"]["content_raw"] == "1"
+        assert (jobs["b"]["task_id"], jobs["b"]["task_position"]) == (response.task_id, 1)
+
+    async def test_progress_record_removed_when_enqueue_fails(self, mock_registry, arq_redis):
+        service = IngestionService(mock_registry, arq_redis, progress=TaskProgressStore(arq_redis))
+        request = IngestRequest(documents=[Document(id="doc", content_raw="content")])
+
+        with (
+            patch("recall.services.ingestion.enqueue_jobs", side_effect=ConnectionError),
+            pytest.raises(ConnectionError),
+        ):
+            await service.ingest("test-collection", request)
+
+        assert await arq_redis.keys("recall:task:*") == []
+
+    async def test_lane_chosen_by_batch_size(self, mock_registry, arq_redis):
+        service = IngestionService(mock_registry, arq_redis, interactive_max_docs=2)
+        small = IngestRequest(documents=[Document(id=f"s{i}", content_raw="x") for i in range(2)])
+        large = IngestRequest(documents=[Document(id=f"l{i}", content_raw="x") for i in range(3)])
+        forced = IngestRequest(
+            documents=[Document(id=f"f{i}", content_raw="x") for i in range(3)],
+            lane=IngestLane.INTERACTIVE,
+        )
+
+        responses = [await service.ingest("test-collection", r) for r in (small, large, forced)]
+
+        assert [r.lane for r in responses] == [
+            IngestLane.INTERACTIVE,
+            IngestLane.BULK,
+            IngestLane.INTERACTIVE,
+        ]
+        interactive = await arq_redis.queued_jobs(queue_name=INTERACTIVE_QUEUE)
+        bulk = await arq_redis.queued_jobs(queue_name=LANE_QUEUES[IngestLane.BULK])
+        assert sorted(job.kwargs["doc_id"] for job in interactive) == [
+            "f0",
+            "f1",
+            "f2",
+            "s0",
+            "s1",
+        ]
+        assert len(bulk) == 3
+
+    async def test_scheduler_orders_jobs_fairly(self, mock_registry, arq_redis):
+        scheduler = LaneScheduler(arq_redis)
+        service = IngestionService(mock_registry, arq_redis, scheduler=scheduler)
+        mock_registry.get.side_effect = lambda name: _make_mock_collection(name)
+        backfill = IngestRequest(
+            documents=[Document(id=f"b{i}", content_raw="x") for i in range(5)],
+            lane=IngestLane.BULK,
+        )
+        small = IngestRequest(documents=[Document(id="s0", content_raw="x")], lane=IngestLane.BULK)
+
+        await service.ingest("backfill", backfill)
+        await service.ingest("small", small)
+
+        queue = LANE_QUEUES[IngestLane.BULK]
+        order = [job_id.decode().split(":")[1] for job_id in await arq_redis.zrange(queue, 0, -1)]
+        assert order.index("s0") <= 1
+        (job,) = [
+            j for j in await arq_redis.queued_jobs(queue_name=queue) if j.job_id.endswith("s0")
+        ]
+        assert job.kwargs["lane"] == "bulk"
+        assert job.kwargs["lane_tag"] == job.score
+
+    async def test_backpressure_on_queue_depth(self, mock_registry, arq_redis):
+        scheduler = LaneScheduler(arq_redis)
+        service = IngestionService(mock_registry, arq_redis, scheduler=scheduler, max_queue_depth=5)
+        docs = [Document(id=f"doc-{i}", content_raw="x") for i in range(4)]
+        await service.ingest("test-collection", IngestRequest(documents=docs))
+        # 30 jobs started over the last minute: 0.5 jobs/s.
+        for _ in range(30):
+            await scheduler.job_started(IngestLane.INTERACTIVE, 1.0, wait_ms=0)
+
+        await service.ingest("test-collection", IngestRequest(documents=docs[:1]))
+        with pytest.raises(IngestionBackpressureError) as exc_info:
+            await service.ingest("test-collection", IngestRequest(documents=docs[:3]))
+
+        # Three jobs over the limit at 0.5 jobs/s, give or take the window's current bucket.
+        assert 6 <= exc_info.value.retry_after <= 7
+        assert exc_info.value.details["queue_depth"] == 5
+        assert len(await arq_redis.queued_jobs(queue_name=INTERACTIVE_QUEUE)) == 5
+
+    async def test_backpressure_on_drain_time(self, mock_registry, arq_redis):
+        scheduler = LaneScheduler(arq_redis, throughput_window=10)
+        service = IngestionService(
+            mock_registry, arq_redis, scheduler=scheduler, max_drain_seconds=5
         )
+        docs = [Document(id=f"doc-{i}", content_raw="x") for i in range(3)]
+        # No throughput observed yet, so only depth limits would apply.
+        await service.ingest("test-collection", IngestRequest(documents=docs))
+        for _ in range(10):
+            await scheduler.job_started(IngestLane.INTERACTIVE, 1.0, wait_ms=0)
+
+        with pytest.raises(IngestionBackpressureError) as exc_info:
+            await service.ingest(
+                "test-collection",
+                IngestRequest(
+                    documents=[Document(id=f"new-{i}", content_raw="x") for i in range(10)]
+                ),
+            )
+
+        assert exc_info.value.retry_after >= 1
+        assert exc_info.value.details["lane"] == "interactive"
+
+    async def test_backpressure_is_per_lane(self, mock_registry, arq_redis):
+        service = IngestionService(
+            mock_registry, arq_redis, scheduler=LaneScheduler(arq_redis), max_queue_depth=2
+        )
+        bulk = [Document(id=f"b{i}", content_raw="x") for i in range(20)]
+        await service.ingest("test-collection", IngestRequest(documents=bulk))
+
+        with pytest.raises(IngestionBackpressureError) as exc_info:
+            await service.ingest("test-collection", IngestRequest(documents=bulk[:1], lane="bulk"))
+        response = await service.ingest("test-collection", IngestRequest(documents=bulk[:2]))
+
+        # Nothing has run, so the retry estimate falls back to the maximum.
+        assert exc_info.value.retry_after == IngestionService.MAX_RETRY_AFTER
+        assert response.lane == IngestLane.INTERACTIVE
+
+    async def test_reingest_supersedes_queued_job(self, mock_registry, arq_redis):
+        versions = DocumentVersions(arq_redis)
+        service = IngestionService(mock_registry, arq_redis, versions=versions)
+        request = IngestRequest(documents=[Document(id="doc-1", content_raw="v1")])
+
+        first = await service.ingest("test-collection", request)
+        second = await service.ingest("test-collection", request)
+
+        jobs = {
+            job.job_id: job.kwargs["doc_seq"]
+            for job in await arq_redis.queued_jobs(queue_name=INTERACTIVE_QUEUE)
+        }
+        first_job = f"{first.task_id}:doc-1"
+        second_job = f"{second.task_id}:doc-1"
+        assert jobs[first_job] < jobs[second_job]
+        assert (
+            await versions.claim("test-collection", "doc-1", second_job, jobs[second_job]) is None
+        )
+        assert (
+            await versions.claim("test-collection", "doc-1", first_job, jobs[first_job])
+            == second_job
+        )
+
+    async def test_job_id_format(self, ingestion_service, arq_redis):
+        request = IngestRequest(documents=[Document(id="doc-123", content_raw="Test")])
         response = await ingestion_service.ingest("test-collection", request)
 
-        call_kwargs = mock_arq_redis.enqueue_job.call_args.kwargs
-        assert response.task_id in call_kwargs["_job_id"]
-        assert "doc-123" in call_kwargs["_job_id"]
+        (job,) = await arq_redis.queued_jobs(queue_name=INTERACTIVE_QUEUE)
+        assert job.job_id == f"{response.task_id}:doc-123"
+
+
+async def _body(text: str, size: int = 7):
+    """An NDJSON body arriving in chunks of ``size`` bytes."""
+    data = text.encode()
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+def _ndjson(*docs: dict) -> str:
+    return "".join(json.dumps(doc) + "\n" for doc in docs)
+
+
+@pytest.mark.unit
+class TestIngestStream:
+    """Test cases for NDJSON stream ingestion."""
+
+    @pytest.fixture
+    def mock_registry(self):
+        registry = AsyncMock(spec=SchemaRegistry)
+        registry.get = AsyncMock(return_value=_make_mock_collection())
+        return registry
+
+    async def test_queues_chunks_under_one_task(self, mock_registry, arq_redis):
+        progress = TaskProgressStore(arq_redis)
+        service = IngestionService(mock_registry, arq_redis, progress=progress, stream_chunk_size=2)
+        body = _ndjson(*({"id": f"doc-{i}", "content_raw": "x"} for i in range(5)))
+
+        response = await service.ingest_stream("test-collection", _body(body))
+
+        assert (response.documents_queued, response.documents_failed) == (5, 0)
+        assert response.lane == IngestLane.BULK
+        status = await progress.get(response.task_id)
+        assert [job.doc_id for job in status.jobs] == [f"doc-{i}" for i in range(5)]
+        jobs = await arq_redis.queued_jobs(queue_name=LANE_QUEUES[IngestLane.BULK])
+        positions = {job.kwargs["doc_id"]: job.kwargs["task_position"] for job in jobs}
+        assert positions == {f"doc-{i}": i for i in range(5)}
+        assert {job.kwargs["task_id"] for job in jobs} == {response.task_id}
+
+    async def test_reports_invalid_lines(self, mock_registry, arq_redis):
+        mock_registry.get.return_value.index_schema = {"rating": FieldType.INT}
+        service = IngestionService(mock_registry, arq_redis, stream_max_line_bytes=200)
+        body = (
+            _ndjson({"id": "ok", "content_raw": "x", "payload": {"rating": 1}})
+            + "\n"
+            + "{not json\n"
+            + _ndjson(
+                {"content_raw": "no id"},
+                {"id": "bad", "content_raw": "x", "payload": {"rating": "high"}},
+                {"id": "big", "content_raw": "x" * 300},
+                {"id": "image", "content_base64": base64.b64encode(b"png").decode()},
+            )
+            + '{"id": "last", "content_raw": "no trailing newline", "payload": {"rating": 2}}'
+        )
+
+        response = await service.ingest_stream("test-collection", _body(body))
+
+        assert (response.documents_queued, response.documents_failed) == (2, 5)
+        assert response.lane == IngestLane.INTERACTIVE
+        assert [(e.line, e.id) for e in response.errors] == [
+            (3, None),
+            (4, None),
+            (5, "bad"),
+            (6, None),
+            (7, "image"),
+        ]
+        assert "id" in response.errors[1].error
+        assert "rating" in response.errors[2].error
+        assert "200 bytes" in response.errors[3].error
+        jobs = await arq_redis.queued_jobs(queue_name=INTERACTIVE_QUEUE)
+        assert sorted(job.kwargs["doc_id"] for job in jobs) == ["last", "ok"]
+
+    async def test_all_lines_rejected(self, mock_registry, arq_redis):
+        service = IngestionService(mock_registry, arq_redis)
+
+        response = await service.ingest_stream("test-collection", _body("{}\n[]\n"))
+
+        assert response.status == "rejected"
+        assert (response.documents_queued, response.documents_failed) == (0, 2)
+
+    async def test_empty_body(self, mock_registry, arq_redis):
+        service = IngestionService(mock_registry, arq_redis)
+
+        with pytest.raises(SchemaValidationError, match="no documents"):
+            await service.ingest_stream("test-collection", _body("\n \n"))
+
+    async def test_repeat_in_later_chunk_supersedes(self, mock_registry, arq_redis):
+        versions = DocumentVersions(arq_redis)
+        service = IngestionService(mock_registry, arq_redis, versions=versions, stream_chunk_size=2)
+        body = _ndjson(
+            {"id": "doc-1", "content_raw": "v1"},
+            {"id": "doc-1", "content_raw": "duplicate"},
+            {"id": "doc-1", "content_raw": "v2"},
+        )
+
+        response = await service.ingest_stream("test-collection", _body(body))
+
+        jobs = await arq_redis.queued_jobs(queue_name=LANE_QUEUES[IngestLane.BULK])
+        contents = {job.job_id: job.kwargs["content_raw"] for job in jobs}
+        seqs = {job.job_id: job.kwargs["doc_seq"] for job in jobs}
+        first, second = f"{response.task_id}:0:doc-1", f"{response.task_id}:1:doc-1"
+        assert contents == {first: "v1", second: "v2"}
+        assert response.documents_queued == 3
+        assert await versions.claim("test-collection", "doc-1", first, seqs[first]) == second
+
+    async def test_backpressure_refuses_first_chunk(self, mock_registry, arq_redis):
+        service = IngestionService(
+            mock_registry, arq_redis, scheduler=LaneScheduler(arq_redis), max_queue_depth=1
+        )
+        docs = [Document(id=f"doc-{i}", content_raw="x") for i in range(2)]
+        await service.ingest("test-collection", IngestRequest(documents=docs))
+
+        with pytest.raises(IngestionBackpressureError):
+            await service.ingest_stream(
+                "test-collection", _body(_ndjson({"id": "new", "content_raw": "x"}))
+            )
+
+        assert len(await arq_redis.queued_jobs(queue_name=INTERACTIVE_QUEUE)) == 2
+
+    async def test_later_chunks_wait_for_lane(self, mock_registry, arq_redis):
+        service = IngestionService(
+            mock_registry,
+            arq_redis,
+            scheduler=LaneScheduler(arq_redis),
+            max_queue_depth=3,
+            stream_chunk_size=2,
+        )
+        queue = LANE_QUEUES[IngestLane.BULK]
+        body = _ndjson(*({"id": f"doc-{i}", "content_raw": "x"} for i in range(4)))
+
+        async def drain(seconds):
+            await arq_redis.delete(queue)
+
+        with patch("recall.services.ingestion.asyncio.sleep", side_effect=drain) as sleep:
+            response = await service.ingest_stream("test-collection", _body(body))
+
+        sleep.assert_awaited_once_with(IngestionService.MAX_RETRY_AFTER)
+        assert response.documents_queued == 4
+        assert [job.kwargs["doc_id"] for job in await arq_redis.queued_jobs(queue_name=queue)] == [
+            "doc-2",
+            "doc-3",
+        ]
+
+    async def test_stops_for_resume_after_max_wait(self, mock_registry, arq_redis):
+        service = IngestionService(
+            mock_registry,
+            arq_redis,
+            scheduler=LaneScheduler(arq_redis),
+            max_queue_depth=2,
+            stream_chunk_size=2,
+            stream_max_wait=0.5,
+        )
+        body = (
+            _ndjson({"id": "doc-0", "content_raw": "x"}, {"id": "doc-1", "content_raw": "x"})
+            + "not json\n"
+            + _ndjson(*({"id": f"doc-{i}", "content_raw": "x"} for i in range(2, 6)))
+        )
+
+        with patch("recall.services.ingestion.asyncio.sleep") as sleep:
+            response = await service.ingest_stream("test-collection", _body(body))
+
+        assert sleep.await_args_list == [call(0.5)]
+        assert response.status == "partial"
+        assert (response.documents_queued, response.documents_failed) == (2, 0)
+        assert response.resume_from_line == 3
+        (error,) = response.errors
+        assert error.line == 3
+        assert "from line 3" in error.error
+        queued = await arq_redis.queued_jobs(queue_name=LANE_QUEUES[IngestLane.BULK])
+        assert sorted(job.kwargs["doc_id"] for job in queued) == ["doc-0", "doc-1"]
 
 
 @pytest.mark.unit
@@ -0,0 +1,118 @@
+"""Tests for LaneScheduler."""
+
+import time
+
+import pytest
+
+from recall.core.queue import JobSpec, enqueue_jobs
+from recall.models.document import IngestLane
+from recall.services.lanes import LANE_QUEUES, LaneScheduler, drain_seconds
+
+BULK = IngestLane.BULK
+
+
+@pytest.mark.unit
+class TestLaneScheduler:
+    """Test cases for LaneScheduler."""
+
+    async def test_consecutive_tags_per_collection(self, fake_redis):
+        scheduler = LaneScheduler(fake_redis)
+
+        first = await scheduler.assign(BULK, "a", 3)
+        second = await scheduler.assign(BULK, "a", 2)
+
+        assert first == [1.0, 2.0, 3.0]
+        assert second == [4.0, 5.0]
+
+    async def test_idle_collection_starts_at_the_clock(self, fake_redis):
+        scheduler = LaneScheduler(fake_redis)
+        backfill = await scheduler.assign(BULK, "backfill", 1000)
+        await scheduler.job_started(BULK, backfill[9], wait_ms=5)
+
+        small = await scheduler.assign(BULK, "small", 2)
+
+        # Queued behind 10 backfill jobs at most, not behind all 1000.
+        assert small == [backfill[9], backfill[10]]
+        assert sum(tag < small[0] for tag in backfill) == 9
+
+    async def test_weights_share_the_lane(self, fake_redis):
+        scheduler = LaneScheduler(fake_redis, weights={"heavy": 3.0})
+
+        heavy = await scheduler.assign(BULK, "heavy", 30)
+        light = await scheduler.assign(BULK, "light", 30)
+
+        first_30 = sorted([(t, "heavy") for t in heavy] + [(t, "light") for t in light])[:30]
+        assert sum(name == "heavy" for _, name in first_30) in (22, 23)
+
+    async def test_clock_never_moves_back(self, fake_redis):
+        scheduler = LaneScheduler(fake_redis)
+        await scheduler.assign(BULK, "a", 10)
+
+        await scheduler.job_started(BULK, 8.0, wait_ms=1)
+        await scheduler.job_started(BULK, 3.0, wait_ms=1)
+
+        assert await scheduler.assign(BULK, "b", 1) == [8.0]
+
+    async def test_lanes_are_independent(self, fake_redis):
+        scheduler = LaneScheduler(fake_redis)
+        await scheduler.assign(BULK, "a", 10)
+
+        assert await scheduler.assign(IngestLane.INTERACTIVE, "a", 1) == [1.0]
+
+    async def test_stats(self, arq_redis):
+        scheduler = LaneScheduler(arq_redis)
+        tags = await scheduler.assign(BULK, "a", 2)
+        await enqueue_jobs(
+            arq_redis,
+            [JobSpec("embed_document", f"t:{i}", score=tag) for i, tag in enumerate(tags)],
+            queue_name=LANE_QUEUES[BULK],
+        )
+        await scheduler.job_started(BULK, tags[0], wait_ms=100)
+        await scheduler.job_started(BULK, tags[1], wait_ms=300)
+
+        interactive, bulk = await scheduler.stats()
+
+        assert (interactive.lane, interactive.queue_depth, interactive.head_wait_ms) == (
+            "interactive",
+            0,
+            None,
+        )
+        assert interactive.mean_wait_ms is None
+        assert (bulk.queue, bulk.queue_depth) == ("recall:queue:bulk", 2)
+        assert 0 <= bulk.head_wait_ms < (time.time() + 60) * 1000
+        assert (bulk.jobs_started, bulk.wait_ms_total, bulk.mean_wait_ms) == (2, 400.0, 200.0)
+        assert bulk.throughput_per_s > 0
+        # throughput_per_s is rounded to 3 decimals; drain_seconds uses the exact rate.
+        assert bulk.drain_seconds == pytest.approx(2 / bulk.throughput_per_s, rel=0.05)
+        assert (interactive.throughput_per_s, interactive.drain_seconds) == (0.0, 0.0)
+
+    async def test_load(self, arq_redis):
+        scheduler = LaneScheduler(arq_redis, throughput_window=60)
+        await enqueue_jobs(
+            arq_redis,
+            [JobSpec("embed_document", f"t:{i}") for i in range(7)],
+            queue_name=LANE_QUEUES[BULK],
+        )
+        for _ in range(60):
+            await scheduler.job_started(BULK, 1.0, wait_ms=0)
+
+        depth, throughput = await scheduler.load(BULK)
+
+        assert depth == 7
+        # 60 jobs over the 60s window plus the elapsed part of the current bucket.
+        assert 60 / 65 < throughput <= 1.0
+        assert await scheduler.load(IngestLane.INTERACTIVE) == (0, 0.0)
+
+    async def test_throughput_window_expires(self, fake_redis):
+        scheduler = LaneScheduler(fake_redis, throughput_window=10)
+        await scheduler.job_started(BULK, 1.0, wait_ms=0)
+
+        keys = await fake_redis.keys("recall:lane:bulk:started:*")
+
+        assert len(keys) == 1
+        assert 0 < await fake_redis.ttl(keys[0]) <= 20
+
+    def test_drain_seconds(self):
+        assert drain_seconds(0, 0.0) == 0.0
+        assert drain_seconds(10, 0.0) is None
+        assert drain_seconds(10, 4.0) == 2.5
@@ -0,0 +1,101 @@
+"""Tests for PayloadUpdateService."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from recall.core.utils import deterministic_vector_id
+from recall.core.vectordb.base import Point
+from recall.core.vectordb.embedded import EmbeddedAdapter
+from recall.models.document import PayloadUpdate, PayloadUpdateRequest
+from recall.models.errors import SchemaValidationError
+from recall.services.payload_updates import PayloadUpdateService
+from recall.services.registry import SchemaRegistry
+
+COLLECTION = "test-collection"
+
+
+def _point_id(doc_id: str) -> str:
+    return deterministic_vector_id(COLLECTION, doc_id)
+
+
+@pytest.mark.unit
+class TestPayloadUpdateService:
+    """Test cases for PayloadUpdateService."""
+
+    @pytest.fixture
+    async def vectordb(self, tmp_path):
+        db = EmbeddedAdapter(str(tmp_path))
+        await db.create_collection(COLLECTION, 2)
+        payload = {"category": "shoes", "price": 50.0, "rating": 4}
+        await db.upsert(
+            COLLECTION,
+            [
+                Point(_point_id(doc_id), [1.0, 0.0], {**payload, "_doc_id": doc_id})
+                for doc_id in ("doc-1", "doc-2")
+            ],
+        )
+        yield db
+        await db.close()
+
+    @pytest.fixture
+    def service(self, sample_collection, vectordb):
+        registry = AsyncMock(spec=SchemaRegistry)
+        registry.get = AsyncMock(return_value=sample_collection)
+        return PayloadUpdateService(registry, vectordb)
+
+    async def _payload(self, vectordb, doc_id):
+        points = await vectordb.scroll(COLLECTION, limit=10)
+        return next(p.payload for p in points if p.id == _point_id(doc_id))
+
+    async def test_merges_fields_into_payload(self, service, vectordb):
+        request = PayloadUpdateRequest(
+            documents=[
+                PayloadUpdate(id="doc-1", payload={"price": 45.0}),
+                PayloadUpdate(id="doc-1", payload={"rating": 5}),
+                PayloadUpdate(id="unknown", payload={"price": 1.0}),
+            ]
+        )
+
+        response = await service.update(COLLECTION, request)
+
+        assert (response.updated, response.not_found) == (1, ["unknown"])
+        assert await self._payload(vectordb, "doc-1") == {
+            "category": "shoes",
+            "price": 45.0,
+            "rating": 5,
+            "_doc_id": "doc-1",
+        }
+
+    async def test_overwrite_keeps_document_id(self, service, vectordb):
+        request = PayloadUpdateRequest(
+            documents=[
+                PayloadUpdate(id="doc-2", payload={"category": "boots", "price": 1.0, "rating": 1})
+            ],
+            overwrite=True,
+        )
+
+        await service.update(COLLECTION, request)
+
+        assert await self._payload(vectordb, "doc-2") == {
+            "category": "boots",
+            "price": 1.0,
+            "rating": 1,
+            "_doc_id": "doc-2",
+        }
+
+    async def test_partial_payload_is_validated(self, service):
+        request = PayloadUpdateRequest(
+            documents=[PayloadUpdate(id="doc-1", payload={"price": "cheap"})]
+        )
+
+        with pytest.raises(SchemaValidationError, match="doc-1"):
+            await service.update(COLLECTION, request)
+
+    async def test_overwrite_requires_complete_payload(self, service):
+        request = PayloadUpdateRequest(
+            documents=[PayloadUpdate(id="doc-1", payload={"price": 45.0})], overwrite=True
+        )
+
+        with pytest.raises(SchemaValidationError):
+            await service.update(COLLECTION, request)
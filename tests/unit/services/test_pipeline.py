@@ -0,0 +1,401 @@
+"""Tests for IngestionPipeline and PipelineStatsStore."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock
+
+import pytest
+
+from recall.core.blobstore.local import LocalBlobStore
+from recall.core.embedders.base import BaseEmbedder
+from recall.core.utils import deterministic_vector_id
+from recall.models.errors import ContentFetchError
+from recall.services.blob_staging import BlobStaging
+from recall.services.content_validators import ContentValidatorStore
+from recall.services.fetcher import ContentValidators, FetchedContent
+from recall.services.pipeline import IngestionPipeline
+from recall.services.pipeline_stats import PipelineStatsStore
+
+
+class FakeEmbedder(BaseEmbedder):
+    """Embeds a string as [len(content)]; rejects content equal to "bad"."""
+
+    def __init__(self, name: str = "fake"):
+        self.name = name
+        self.batches: list[list[bytes | str]] = []
+
+    def prepare(self, content: bytes | str) -> str:
+        return content.decode() if isinstance(content, bytes) else content
+
+    def embed(self, content: bytes | str) -> list[float]:
+        if content == "bad":
+            raise ValueError("cannot decode")
+        return [float(len(content))]
+
+    def embed_batch(self, contents: list[bytes | str]) -> list[list[float]]:
+        self.batches.append(list(contents))
+        return [self.embed(content) for content in contents]
+
+    @property
+    def dimensions(self) -> int:
+        return 1
+
+    @property
+    def model_name(self) -> str:
+        return self.name
+
+
+@pytest.fixture
+def vectordb():
+    vectordb = AsyncMock()
+    vectordb.upsert = AsyncMock(side_effect=lambda _collection, points: len(points))
+    return vectordb
+
+
+@pytest.fixture
+def fetcher():
+    async def fetch(uri):
+        if uri.endswith("/missing"):
+            raise ContentFetchError("not found", uri, 404)
+        return FetchedContent(content=uri.rsplit("/", 1)[1].encode(), elapsed_ms=5.0, attempts=1)
+
+    fetcher = AsyncMock()
+    fetcher.fetch = AsyncMock(side_effect=fetch)
+    return fetcher
+
+
+@pytest.fixture
+async def make_pipeline(vectordb, fetcher):
+    pipelines: list[IngestionPipeline] = []
+
+    def make(**kwargs) -> IngestionPipeline:
+        pipeline = IngestionPipeline(vectordb, fetcher, **kwargs)
+        pipelines.append(pipeline)
+        return pipeline
+
+    yield make
+    for pipeline in pipelines:
+        await pipeline.close()
+
+
+@pytest.mark.unit
+class TestIngestionPipeline:
+    """Test cases for IngestionPipeline."""
+
+    async def test_full_batch_uses_one_embed_and_upsert(self, make_pipeline, vectordb):
+        pipeline = make_pipeline(batch_size=3, linger=60)
+        embedder = FakeEmbedder()
+
+        results = await asyncio.gather(
+            *(
+                pipeline.submit("items", embedder, f"d{i}", content="x" * i, payload={"i": i})
+                for i in range(1, 4)
+            )
+        )
+
+        assert [r.vector for r in results] == [[1.0], [2.0], [3.0]]
+        assert sorted(embedder.batches[0]) == ["x", "xx", "xxx"]
+        assert len(embedder.batches) == 1
+        vectordb.upsert.assert_awaited_once()
+        collection, points = vectordb.upsert.await_args.args
+        assert collection == "items"
+        assert sorted(p.id for p in points) == sorted(
+            deterministic_vector_id("items", f"d{i}") for i in range(1, 4)
+        )
+        assert {"i": 1, "_doc_id": "d1"} in [p.payload for p in points]
+
+    async def test_partial_batch_flushes_after_linger(self, make_pipeline, vectordb):
+        pipeline = make_pipeline(batch_size=100, linger=0.01)
+
+        results = await asyncio.gather(
+            pipeline.submit("items", FakeEmbedder(), "a", content="a"),
+            pipeline.submit("items", FakeEmbedder(), "b", content="bb"),
+        )
+
+        assert [r.vector for r in results] == [[1.0], [2.0]]
+        vectordb.upsert.assert_awaited_once()
+
+    async def test_groups_by_collection_and_model(self, make_pipeline, vectordb):
+        pipeline = make_pipeline(batch_size=100, linger=0.01)
+
+        await asyncio.gather(
+            pipeline.submit("a", FakeEmbedder("m1"), "1", content="x"),
+            pipeline.submit("a", FakeEmbedder("m2"), "2", content="x"),
+            pipeline.submit("b", FakeEmbedder("m1"), "3", content="x"),
+            pipeline.submit("a", FakeEmbedder("m1"), "4", content="x"),
+        )
+
+        sizes = sorted(len(call.args[1]) for call in vectordb.upsert.await_args_list)
+        assert sizes == [1, 1, 2]
+
+    async def test_fetches_uri_documents(self, make_pipeline, fetcher):
+        pipeline = make_pipeline(batch_size=2, linger=60)
+        embedder = FakeEmbedder()
+
+        fetched, inline = await asyncio.gather(
+            pipeline.submit("items", embedder, "a", content_uri="https://host/abcd"),
+            pipeline.submit("items", embedder, "b", content="xy"),
+        )
+
+        assert fetched.vector == [4.0]
+        assert fetched.fetch_ms == 5.0
+        assert inline.fetch_ms == 0.0
+        fetcher.fetch.assert_awaited_once_with("https://host/abcd")
+        # Fetched bytes were decoded by the prepare stage before embedding.
+        assert sorted(embedder.batches[0]) == ["abcd", "xy"]
+
+    async def test_loads_blob_staged_content(self, vectordb, fetcher, fake_redis, tmp_path):
+        staging = BlobStaging(fake_redis, LocalBlobStore(tmp_path))
+        ref = await staging.stage(b"staged text")
+        pipeline = IngestionPipeline(vectordb, fetcher, staging=staging, batch_size=1)
+        try:
+            result = await pipeline.submit("items", FakeEmbedder(), "a", content_ref=ref)
+        finally:
+            await pipeline.close()
+
+        assert result.vector == [11.0]
+        fetcher.fetch.assert_not_called()
+
+    async def test_bad_item_fails_only_its_own_job(self, make_pipeline, vectordb):
+        pipeline = make_pipeline(batch_size=3, linger=0.05)
+        embedder = FakeEmbedder()
+
+        results = await asyncio.gather(
+            pipeline.submit("items", embedder, "a", content="a"),
+            pipeline.submit("items", embedder, "b", content="bad"),
+            pipeline.submit("items", embedder, "c", content_uri="https://host/missing"),
+            pipeline.submit("items", embedder, "d", content="ddd"),
+            return_exceptions=True,
+        )
+
+        assert results[0].vector == [1.0]
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[2], ContentFetchError)
+        assert results[3].vector == [3.0]
+        upserted = [
+            p.payload["_doc_id"] for call in vectordb.upsert.await_args_list for p in call.args[1]
+        ]
+        assert sorted(upserted) == ["a", "d"]
+
+    async def test_upsert_failure_fails_every_job(self, make_pipeline, vectordb):
+        vectordb.upsert.side_effect = ConnectionError("down")
+        pipeline = make_pipeline(batch_size=2, linger=60)
+        embedder = FakeEmbedder()
+
+        results = await asyncio.gather(
+            pipeline.submit("items", embedder, "a", content="a"),
+            pipeline.submit("items", embedder, "b", content="b"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+    async def test_batch_size_one_writes_immediately(self, make_pipeline, vectordb):
+        pipeline = make_pipeline(batch_size=1, linger=60)
+
+        result = await pipeline.submit("items", FakeEmbedder(), "a", content="abc")
+
+        assert result.vector == [3.0]
+        vectordb.upsert.assert_awaited_once()
+
+    async def test_close_finishes_pending(self, vectordb, fetcher):
+        pipeline = IngestionPipeline(vectordb, fetcher, batch_size=10, linger=60)
+        job = asyncio.create_task(pipeline.submit("items", FakeEmbedder(), "a", content="ab"))
+        await asyncio.sleep(0.05)
+
+        await pipeline.close()
+
+        assert (await job).vector == [2.0]
+
+    async def test_inference_runs_off_the_event_loop(self, make_pipeline):
+        loop_thread = threading.get_ident()
+        seen: list[int] = []
+
+        class ThreadRecordingEmbedder(FakeEmbedder):
+            def embed_batch(self, contents):
+                seen.append(threading.get_ident())
+                return super().embed_batch(contents)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pipeline = make_pipeline(batch_size=2, linger=60, executor=executor)
+            embedder = ThreadRecordingEmbedder()
+            await asyncio.gather(
+                pipeline.submit("items", embedder, "a", content="a"),
+                pipeline.submit("items", embedder, "b", content="b"),
+            )
+
+        assert seen and loop_thread not in seen
+
+    async def test_stats(self, make_pipeline):
+        pipeline = make_pipeline(batch_size=2, linger=60, fetch_concurrency=3, buffer_size=8)
+        embedder = FakeEmbedder()
+
+        await asyncio.gather(
+            pipeline.submit("items", embedder, "a", content_uri="https://host/a"),
+            pipeline.submit("items", embedder, "b", content="b"),
+        )
+        stats = {stage.name: stage for stage in pipeline.stats()}
+
+        assert list(stats) == ["fetch", "prepare", "embed", "upsert"]
+        assert stats["fetch"].concurrency == 3
+        assert stats["fetch"].buffer_size == 8
+        assert stats["embed"].buffer_size == 4
+        assert (stats["fetch"].processed, stats["prepare"].processed) == (1, 2)
+        assert (stats["embed"].processed, stats["upsert"].processed) == (1, 1)
+        assert all(stage.queue_depth == 0 and stage.in_flight == 0 for stage in stats.values())
+        assert all(0.0 <= stage.utilization <= 1.0 for stage in stats.values())
+
+
+class FakeOrigin:
+    """Serves bodies with ETags (when ``etags``) and answers matching conditions with 304."""
+
+    def __init__(self, etags: bool = True):
+        self.bodies: dict[str, bytes] = {}
+        self.etags = etags
+        self.calls: list[tuple[str, ContentValidators | None]] = []
+
+    async def fetch(self, uri, validators=None):
+        self.calls.append((uri, validators))
+        body = self.bodies[uri]
+        etag = f'"{len(body)}-{body[:4].decode()}"' if self.etags else None
+        if validators is not None and etag is not None and validators.etag == etag:
+            return FetchedContent(b"", elapsed_ms=1.0, attempts=1, etag=etag, not_modified=True)
+        return FetchedContent(body, elapsed_ms=5.0, attempts=1, etag=etag)
+
+
+@pytest.mark.unit
+class TestConditionalFetch:
+    """Test cases for skipping unchanged URI content."""
+
+    URI = "https://cdn.example/a.png"
+
+    @pytest.fixture
+    def store(self, fake_redis):
+        return ContentValidatorStore(fake_redis)
+
+    @pytest.fixture
+    async def run(self, vectordb, store):
+        vectordb.set_payload = AsyncMock(
+            side_effect=lambda _collection, payloads, overwrite: list(payloads)
+        )
+        pipelines: list[IngestionPipeline] = []
+
+        async def run(origin, doc_id="a", uri=self.URI, **kwargs):
+            pipeline = IngestionPipeline(vectordb, origin, batch_size=1, validators=store)
+            pipelines.append(pipeline)
+            return await pipeline.submit("items", FakeEmbedder(), doc_id, content_uri=uri, **kwargs)
+
+        yield run
+        for pipeline in pipelines:
+            await pipeline.close()
+
+    async def test_not_modified_skips_download_and_embedding(self, run, vectordb, store):
+        origin = FakeOrigin()
+        origin.bodies[self.URI] = b"image"
+
+        first = await run(origin)
+        second = await run(origin, payload={"price": 9})
+
+        assert (first.vector, first.unchanged) == ([5.0], False)
+        assert (second.vector, second.unchanged) == ([], True)
+        assert origin.calls[1][1].etag == '"5-imag"'
+        vectordb.upsert.assert_awaited_once()
+        vectordb.set_payload.assert_awaited_once_with(
+            "items",
+            {deterministic_vector_id("items", "a"): {"price": 9, "_doc_id": "a"}},
+            overwrite=True,
+        )
+
+    async def test_changed_content_is_embedded(self, run, vectordb, store):
+        origin = FakeOrigin()
+        origin.bodies[self.URI] = b"image"
+        await run(origin)
+        origin.bodies[self.URI] = b"new image"
+
+        result = await run(origin)
+
+        assert result.vector == [9.0]
+        assert (await store.get("items", "a")).etag == '"9-new "'
+        vectordb.set_payload.assert_not_awaited()
+
+    async def test_same_hash_skips_embedding(self, run, vectordb, store):
+        origin = FakeOrigin(etags=False)
+        origin.bodies[self.URI] = b"image"
+        await run(origin)
+
+        result = await run(origin)
+
+        assert result.unchanged
+        assert len(origin.calls) == 2
+        assert vectordb.upsert.await_count == 1
+
+    async def test_missing_point_is_embedded_again(self, run, vectordb):
+        origin = FakeOrigin()
+        origin.bodies[self.URI] = b"image"
+        await run(origin)
+        vectordb.set_payload.side_effect = None
+        vectordb.set_payload.return_value = []
+
+        result = await run(origin)
+
+        assert result.vector == [5.0]
+        assert [validators for _, validators in origin.calls][2] is None
+        assert vectordb.upsert.await_count == 2
+
+    async def test_other_uri_is_fetched_unconditionally(self, run, vectordb):
+        origin = FakeOrigin()
+        origin.bodies[self.URI] = origin.bodies["https://cdn.example/b.png"] = b"image"
+        await run(origin)
+
+        result = await run(origin, uri="https://cdn.example/b.png")
+
+        assert not result.unchanged
+        assert origin.calls[1][1] is None
+
+    async def test_inline_content_clears_validators(self, run, vectordb, store):
+        origin = FakeOrigin()
+        origin.bodies[self.URI] = b"image"
+        await run(origin)
+        pipeline = IngestionPipeline(vectordb, origin, batch_size=1, validators=store)
+        try:
+            await pipeline.submit("items", FakeEmbedder(), "a", content="inline")
+        finally:
+            await pipeline.close()
+
+        assert await store.get("items", "a") is None
+
+
+@pytest.mark.unit
+class TestPipelineStatsStore:
+    """Test cases for PipelineStatsStore."""
+
+    async def test_publish_and_read(self, fake_redis, make_pipeline):
+        pipeline = make_pipeline()
+        pipeline.start()
+        store = PipelineStatsStore(fake_redis)
+
+        await store.publish("w2", pipeline.stats(), ttl=30)
+        await store.publish("w1", pipeline.stats()[:1], ttl=30)
+
+        reports = await store.read_all()
+        assert [r.worker_id for r in reports] == ["w1", "w2"]
+        assert [s.name for s in reports[1].stages] == ["fetch", "prepare", "embed", "upsert"]
+        assert await fake_redis.pttl("recall:pipeline_stats:w1") > 0
+
+    async def test_read_without_reports(self, fake_redis):
+        assert await PipelineStatsStore(fake_redis).read_all() == []
+
+    async def test_read_skips_expired_workers_without_scanning(self, fake_redis, monkeypatch):
+        store = PipelineStatsStore(fake_redis)
+        await store.publish("old", [], ttl=30)
+        await store.publish("live", [], ttl=30)
+        # "old" stopped reporting: its report and set entry have expired.
+        await fake_redis.delete("recall:pipeline_stats:old")
+        await fake_redis.zadd(PipelineStatsStore.WORKERS_KEY, {"old": 1.0})
+        monkeypatch.setattr(fake_redis, "scan_iter", None)
+
+        assert [r.worker_id for r in await store.read_all()] == ["live"]
+
+        await store.publish("live", [], ttl=30)
+        assert await fake_redis.zrange(PipelineStatsStore.WORKERS_KEY, 0, -1) == [b"live"]
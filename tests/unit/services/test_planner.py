@@ -0,0 +1,152 @@
+"""Tests for QueryPlanner."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from recall.core.transpiler.cache import FilterCache
+from recall.core.vectordb.base import Point
+from recall.core.vectordb.embedded import EmbeddedAdapter
+from recall.models.errors import VectorDBError
+from recall.models.search import AndFilter, EqCondition, GteCondition
+from recall.services.collection_cache import CollectionCache
+from recall.services.planner import QueryPlanner
+from recall.services.registry import SchemaRegistry
+
+
+def _counting_vectordb(total: int, matches: int) -> AsyncMock:
+    vectordb = AsyncMock()
+    vectordb.count = AsyncMock(
+        side_effect=lambda collection, filter=None, exact=True: matches if filter else total
+    )
+    return vectordb
+
+
+@pytest.mark.unit
+class TestQueryPlanner:
+    """Test cases for QueryPlanner."""
+
+    @pytest.fixture
+    def compiled(self):
+        return FilterCache().compile(EqCondition(field="category", value="shoes"))
+
+    async def test_no_filter_uses_default_hnsw(self):
+        vectordb = _counting_vectordb(1000, 10)
+        plan = await QueryPlanner().plan(vectordb, "items", None, limit=10)
+
+        assert plan.strategy == "hnsw"
+        assert plan.hnsw_ef is None
+        vectordb.count.assert_not_called()
+
+    async def test_contradictory_filter_is_empty(self):
+        vectordb = _counting_vectordb(1000, 10)
+        compiled = FilterCache().compile(
+            AndFilter(
+                conditions=[
+                    EqCondition(field="category", value="shoes"),
+                    EqCondition(field="category", value="hats"),
+                ]
+            ),
+            {"category"},
+        )
+        plan = await QueryPlanner().plan(vectordb, "items", compiled, limit=10)
+
+        assert plan.strategy == "empty"
+        vectordb.count.assert_not_called()
+
+    async def test_selective_filter_uses_exact(self, compiled):
+        vectordb = _counting_vectordb(1_000_000, 120)
+        plan = await QueryPlanner(exact_max_matches=500).plan(vectordb, "items", compiled, 10)
+
+        assert plan.strategy == "exact"
+        assert plan.estimated_matches == 120
+        assert plan.total_points == 1_000_000
+        vectordb.count.assert_any_await("items", filter=compiled.filter, exact=False)
+
+    @pytest.mark.parametrize(
+        "matches,expected_ef",
+        [
+            (1_000_000, 128),
+            (250_000, 512),
+            (20_000, 1024),
+        ],
+    )
+    async def test_broad_filter_scales_hnsw_ef(self, compiled, matches, expected_ef):
+        vectordb = _counting_vectordb(1_000_000, matches)
+        planner = QueryPlanner(exact_max_matches=5000, hnsw_ef=128, max_hnsw_ef=1024)
+        plan = await planner.plan(vectordb, "items", compiled, limit=10)
+
+        assert plan.strategy == "hnsw"
+        assert plan.hnsw_ef == expected_ef
+
+    async def test_hnsw_ef_at_least_limit(self, compiled):
+        vectordb = _counting_vectordb(1_000_000, 1_000_000)
+        plan = await QueryPlanner(hnsw_ef=16).plan(vectordb, "items", compiled, limit=100)
+        assert plan.hnsw_ef == 100
+
+    async def test_counts_are_cached(self, compiled):
+        vectordb = _counting_vectordb(1_000_000, 120)
+        planner = QueryPlanner()
+
+        await planner.plan(vectordb, "items", compiled, limit=10)
+        await planner.plan(vectordb, "items", compiled, limit=10)
+        assert vectordb.count.await_count == 2
+
+        planner.invalidate("items")
+        await planner.plan(vectordb, "items", compiled, limit=10)
+        assert vectordb.count.await_count == 4
+
+    async def test_collection_writes_in_other_processes_drop_counts(self, compiled, fake_redis):
+        vectordb = _counting_vectordb(1_000_000, 120)
+        planner = QueryPlanner()
+        cache, writer_cache = CollectionCache(), CollectionCache()
+        cache.add_listener(planner.invalidate)
+        await cache.start(fake_redis)
+        await writer_cache.start(fake_redis)
+        try:
+            await planner.plan(vectordb, "items", compiled, limit=10)
+            await planner.plan(vectordb, "other", compiled, limit=10)
+
+            await SchemaRegistry(fake_redis, writer_cache).delete("items")
+            for _ in range(200):
+                if ("items", None) not in planner._counts:
+                    break
+                await asyncio.sleep(0.01)
+
+            assert [key[0] for key in planner._counts] == ["other", "other"]
+        finally:
+            await writer_cache.stop()
+            await cache.stop()
+
+    async def test_counts_expire(self, compiled):
+        vectordb = _counting_vectordb(1_000_000, 120)
+        planner = QueryPlanner(ttl=0)
+
+        await planner.plan(vectordb, "items", compiled, limit=10)
+        await planner.plan(vectordb, "items", compiled, limit=10)
+        assert vectordb.count.await_count == 4
+
+    async def test_count_failure_falls_back_to_hnsw(self, compiled):
+        vectordb = AsyncMock()
+        vectordb.count = AsyncMock(side_effect=VectorDBError("down", "count"))
+
+        plan = await QueryPlanner().plan(vectordb, "items", compiled, limit=10)
+        assert plan.strategy == "hnsw"
+        assert plan.hnsw_ef is None
+
+    async def test_plans_against_embedded_counts(self, tmp_path):
+        db = EmbeddedAdapter(str(tmp_path))
+        await db.create_collection("items", 2)
+        await db.upsert(
+            "items",
+            [Point(id=str(i), vector=[1.0, float(i)], payload={"i": i}) for i in range(100)],
+        )
+        compiled = FilterCache().compile(GteCondition(field="i", value=90))
+
+        plan = await QueryPlanner(exact_max_matches=5).plan(db, "items", compiled, limit=10)
+
+        assert plan.estimated_matches == 10
+        assert plan.selectivity == 0.1
+        assert plan.strategy == "hnsw"
+        assert plan.hnsw_ef == 1024
@@ -1,6 +1,5 @@
 """Tests for SchemaRegistry service."""
 
-
 import pytest
 
 from recall.models.collection import CreateCollectionRequest, EmbeddingConfig, FieldType, Modality
@@ -82,6 +81,71 @@ class TestSchemaRegistry:
         assert len(collections) == 3
         assert set(collections) == {"collection-a", "collection-b", "collection-c"}
 
+    async def test_list_all_does_not_use_keys(self, registry, fake_redis):
+        await registry.save(
+            CreateCollectionRequest(
+                name="indexed",
+                embedding_config=EmbeddingConfig(model="all-MiniLM-L6-v2", modality=Modality.TEXT),
+            )
+        )
+        await fake_redis.set("recall:collection:stray", b"{}")
+
+        assert await registry.list_all() == ["indexed"]
+        assert await fake_redis.smembers(registry.NAMES_KEY) == {b"indexed"}
+
+    async def test_delete_removes_name(self, registry, create_request):
+        await registry.save(create_request)
+        await registry.delete("test-collection")
+        assert await registry.list_all() == []
+
+    async def test_scan_pages(self, registry):
+        for i in range(25):
+            await registry.save(
+                CreateCollectionRequest(
+                    name=f"c{i:02d}",
+                    embedding_config=EmbeddingConfig(
+                        model="all-MiniLM-L6-v2", modality=Modality.TEXT
+                    ),
+                )
+            )
+
+        names: list[str] = []
+        cursor = 0
+        while True:
+            cursor, page = await registry.scan(cursor, count=10)
+            names.extend(page)
+            if cursor == 0:
+                break
+
+        assert sorted(set(names)) == [f"c{i:02d}" for i in range(25)]
+
+    async def test_get_many(self, registry, create_request):
+        await registry.save(create_request)
+        other = create_request.model_copy(update={"name": "other"})
+        await registry.save(other)
+
+        collections = await registry.get_many(["other", "missing", "test-collection"])
+
+        assert [c.name for c in collections] == ["other", "test-collection"]
+        assert collections[1].index_schema == create_request.index_schema
+
+    async def test_get_many_chunks_requests(self, registry, create_request, monkeypatch):
+        monkeypatch.setattr(SchemaRegistry, "MGET_CHUNK", 2)
+        names = [f"c{i}" for i in range(5)]
+        for name in names:
+            await registry.save(create_request.model_copy(update={"name": name}))
+
+        collections = await registry.get_many(names)
+        assert [c.name for c in collections] == names
+
+    async def test_backfill_names(self, registry, fake_redis, create_request):
+        await registry.save(create_request)
+        await fake_redis.delete(registry.NAMES_KEY)
+
+        assert await registry.backfill_names() == 1
+        assert await registry.list_all() == ["test-collection"]
+        assert await registry.backfill_names() == 0
+
     async def test_key_prefix(self, registry):
         assert registry.KEY_PREFIX == "recall:collection:"
         assert registry._key("test") == "recall:collection:test"
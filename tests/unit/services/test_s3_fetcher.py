@@ -0,0 +1,98 @@
+"""Tests for S3Fetcher."""
+
+import io
+from datetime import UTC, datetime
+
+import pytest
+
+from recall.models.errors import ContentFetchError, ContentTooLargeError
+from recall.services.fetcher import ContentValidators
+from recall.services.s3_fetcher import S3Fetcher
+
+URI = "s3://bucket/images/a%20b.png"
+KEY = {"Bucket": "bucket", "Key": "images/a b.png"}
+ETAG = '"abc123"'
+
+
+@pytest.fixture
+def s3():
+    boto3 = pytest.importorskip("boto3")
+    from botocore.stub import Stubber
+
+    client = boto3.client(
+        "s3",
+        region_name="us-east-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+    )
+    with Stubber(client) as stubber:
+        yield client, stubber
+        stubber.assert_no_pending_responses()
+
+
+def _head(stubber, size: int) -> None:
+    stubber.add_response(
+        "head_object",
+        {"ContentLength": size, "ETag": ETAG, "LastModified": datetime(2025, 10, 1, tzinfo=UTC)},
+        KEY,
+    )
+
+
+@pytest.mark.unit
+class TestS3Fetcher:
+    """Test cases for S3Fetcher."""
+
+    async def test_small_object_in_one_get(self, s3):
+        client, stubber = s3
+        _head(stubber, 5)
+        stubber.add_response("get_object", {"Body": io.BytesIO(b"image")}, {**KEY, "IfMatch": ETAG})
+
+        fetched = await S3Fetcher(client=client).fetch(URI)
+
+        assert fetched.content == b"image"
+        assert fetched.etag == ETAG
+        assert fetched.last_modified == "Wed, 01 Oct 2025 00:00:00 GMT"
+
+    async def test_large_object_in_ranged_parts(self, s3):
+        client, stubber = s3
+        _head(stubber, 10)
+        for first, last, body in [(0, 3, b"0123"), (4, 7, b"4567"), (8, 9, b"89")]:
+            stubber.add_response(
+                "get_object",
+                {"Body": io.BytesIO(body)},
+                {**KEY, "IfMatch": ETAG, "Range": f"bytes={first}-{last}"},
+            )
+        # One part at a time keeps the stubbed calls in order.
+        fetcher = S3Fetcher(client=client, part_size=4, part_concurrency=1)
+
+        fetched = await fetcher.fetch(URI)
+
+        assert bytes(fetched.content) == b"0123456789"
+
+    async def test_unchanged_object_is_not_downloaded(self, s3):
+        client, stubber = s3
+        _head(stubber, 5)
+
+        fetched = await S3Fetcher(client=client).fetch(URI, ContentValidators(URI, etag=ETAG))
+
+        assert fetched.not_modified
+        assert fetched.content == b""
+
+    async def test_missing_object(self, s3):
+        client, stubber = s3
+        stubber.add_client_error("head_object", "404", http_status_code=404, expected_params=KEY)
+
+        with pytest.raises(ContentFetchError) as exc_info:
+            await S3Fetcher(client=client).fetch(URI)
+        assert exc_info.value.status_code == 404
+
+    async def test_rejects_large_objects(self, s3):
+        client, stubber = s3
+        _head(stubber, 100)
+
+        with pytest.raises(ContentTooLargeError):
+            await S3Fetcher(client=client, max_bytes=50).fetch(URI)
+
+    async def test_uri_needs_bucket_and_key(self):
+        with pytest.raises(ContentFetchError, match="bucket and a key"):
+            await S3Fetcher(client=object()).fetch("s3://bucket/")
@@ -1,12 +1,16 @@
 """Tests for SearchService."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from redis.exceptions import RedisError
 
 from recall.core.vectordb.base import SearchResult as VDBSearchResult
 from recall.models.errors import CollectionNotFoundError
-from recall.models.search import LtCondition, SearchRequest
+from recall.models.search import AndFilter, EqCondition, LtCondition, SearchRequest
+from recall.services.filter_usage import FilterUsageTracker
+from recall.services.planner import QueryPlanner
 from recall.services.registry import SchemaRegistry
 from recall.services.search import SearchService
 
@@ -32,12 +36,13 @@ class TestSearchService:
                 VDBSearchResult(id="doc-2", score=0.85, payload={"category": "boots"}),
             ]
         )
+        vectordb.count = AsyncMock(return_value=100_000)
         return vectordb
 
     @pytest.fixture
     def search_service(self, mock_registry, mock_vectordb):
         """Create SearchService with mocks."""
-        return SearchService(mock_registry, mock_vectordb)
+        return SearchService(mock_registry, mock_vectordb, planner=QueryPlanner())
 
     async def test_search_basic_query(self, search_service, mock_vectordb):
         with patch("recall.services.search.EmbedderFactory") as mock_factory:
@@ -72,6 +77,109 @@ class TestSearchService:
             assert call_args.kwargs["limit"] == 5
             assert call_args.kwargs["filter"] is not None
 
+    async def test_search_plan_exact_for_selective_filter(self, search_service, mock_vectordb):
+        mock_vectordb.count = AsyncMock(
+            side_effect=lambda c, filter=None, exact=True: 40 if filter else 100_000
+        )
+        with patch("recall.services.search.EmbedderFactory") as mock_factory:
+            mock_factory.create.return_value.embed.return_value = [0.1] * 384
+
+            request = SearchRequest(query="shoes", filter=LtCondition(field="price", value=100))
+            response = await search_service.search("test-collection", request)
+
+            assert response.plan.strategy == "exact"
+            assert response.plan.estimated_matches == 40
+            assert mock_vectordb.search.call_args.kwargs["exact"] is True
+
+    async def test_search_plan_raises_ef_for_broad_filter(self, search_service, mock_vectordb):
+        mock_vectordb.count = AsyncMock(
+            side_effect=lambda c, filter=None, exact=True: 50_000 if filter else 100_000
+        )
+        with patch("recall.services.search.EmbedderFactory") as mock_factory:
+            mock_factory.create.return_value.embed.return_value = [0.1] * 384
+
+            request = SearchRequest(query="shoes", filter=LtCondition(field="price", value=100))
+            response = await search_service.search("test-collection", request)
+
+            assert response.plan.strategy == "hnsw"
+            assert response.plan.selectivity == 0.5
+            call_args = mock_vectordb.search.call_args
+            assert call_args.kwargs["exact"] is False
+            assert call_args.kwargs["hnsw_ef"] == 256
+
+    async def test_search_contradictory_filter_skips_vectordb(self, search_service, mock_vectordb):
+        with patch("recall.services.search.EmbedderFactory") as mock_factory:
+            request = SearchRequest(
+                query="shoes",
+                filter=AndFilter(
+                    conditions=[
+                        EqCondition(field="category", value="shoes"),
+                        EqCondition(field="category", value="boots"),
+                    ]
+                ),
+            )
+            response = await search_service.search("test-collection", request)
+
+            assert response.count == 0
+            assert response.results == []
+            mock_factory.create.assert_not_called()
+            mock_vectordb.search.assert_not_called()
+
+    async def test_search_undeclared_field_may_hold_lists(self, search_service, mock_vectordb):
+        with patch("recall.services.search.EmbedderFactory") as mock_factory:
+            mock_factory.create.return_value.embed.return_value = [0.1] * 384
+            request = SearchRequest(
+                query="shoes",
+                filter=AndFilter(
+                    conditions=[
+                        EqCondition(field="tags", value="sale"),
+                        EqCondition(field="tags", value="new"),
+                    ]
+                ),
+            )
+            response = await search_service.search("test-collection", request)
+
+            assert response.count == 2
+            flt = mock_vectordb.search.call_args.kwargs["filter"]
+            assert [c.match.value for c in flt.must] == ["sale", "new"]
+
+    async def test_search_records_filter_usage(self, mock_registry, mock_vectordb):
+        usage = AsyncMock(spec=FilterUsageTracker)
+        service = SearchService(mock_registry, mock_vectordb, planner=QueryPlanner(), usage=usage)
+        with patch("recall.services.search.EmbedderFactory") as mock_factory:
+            mock_factory.create.return_value.embed.return_value = [0.1] * 384
+
+            await service.search("test-collection", SearchRequest(query="shoes"))
+            usage.record.assert_not_called()
+
+            request = SearchRequest(query="shoes", filter=EqCondition(field="brand", value="acme"))
+            await service.search("test-collection", request)
+
+            collection, compiled, elapsed_ms = usage.record.call_args.args
+            assert collection == "test-collection"
+            assert set(compiled.fields) == {"brand"}
+            assert elapsed_ms >= 0
+
+    async def test_search_succeeds_when_usage_cannot_be_saved(self, mock_registry, mock_vectordb):
+        redis = MagicMock()
+        redis.pipeline.side_effect = RedisError("down")
+        usage = FilterUsageTracker(redis, flush_interval=0.01)
+        service = SearchService(mock_registry, mock_vectordb, planner=QueryPlanner(), usage=usage)
+        await usage.start()
+        try:
+            with patch("recall.services.search.EmbedderFactory") as mock_factory:
+                mock_factory.create.return_value.embed.return_value = [0.1] * 384
+                request = SearchRequest(query="shoes", filter=EqCondition(field="brand", value="a"))
+
+                response = await service.search("test-collection", request)
+                await asyncio.sleep(0.05)
+        finally:
+            await usage.stop()
+
+        assert response.count == 2
+        assert redis.pipeline.called
+        assert usage._pending["test-collection"]["brand|uses"] == 1
+
     async def test_search_collection_not_found(self, mock_vectordb):
         registry = AsyncMock(spec=SchemaRegistry)
         registry.get = AsyncMock(side_effect=CollectionNotFoundError("missing"))
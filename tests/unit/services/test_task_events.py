@@ -0,0 +1,78 @@
+"""Tests for TaskEventHub."""
+
+import asyncio
+
+import pytest
+
+from recall.services.task_events import TaskEventHub
+from recall.services.task_progress import TaskProgressStore
+
+
+@pytest.fixture
+async def hub(fake_redis):
+    hub = TaskEventHub(queue_size=2)
+    await hub.start(fake_redis)
+    yield hub
+    await hub.stop()
+
+
+async def _subscribers(redis, task_id: str) -> int:
+    ((_, count),) = await redis.pubsub_numsub(TaskProgressStore.events_channel(task_id))
+    return count
+
+
+@pytest.mark.unit
+class TestTaskEventHub:
+    """Test cases for TaskEventHub."""
+
+    async def test_watchers_share_one_subscription(self, hub, fake_redis):
+        progress = TaskProgressStore(fake_redis)
+        await progress.create("t1", ["a", "b"])
+
+        async with hub.watch("t1") as first, hub.watch("t1") as second:
+            assert await _subscribers(fake_redis, "t1") == 1
+            await progress.mark_complete("t1", 0, "a", {"vector_dim": 3})
+            events = [await asyncio.wait_for(queue.get(), 1) for queue in (first, second)]
+
+        assert events[0] == events[1]
+        assert (events[0].job.doc_id, events[0].job.status) == ("a", "complete")
+        assert (events[0].summary.complete, events[0].summary.queued) == (1, 1)
+        assert await _subscribers(fake_redis, "t1") == 0
+
+    async def test_only_finished_documents_publish(self, hub, fake_redis):
+        progress = TaskProgressStore(fake_redis)
+        await progress.create("t1", ["a"])
+
+        async with hub.watch("t1") as queue:
+            await progress.mark_started("t1", 0, "a")
+            await progress.mark_failed("t1", 0, "a", "boom")
+            event = await asyncio.wait_for(queue.get(), 1)
+
+        assert (event.job.status, event.job.error) == ("failed", "boom")
+        assert queue.empty()
+
+    async def test_other_tasks_are_not_delivered(self, hub, fake_redis):
+        progress = TaskProgressStore(fake_redis)
+        await progress.create("t1", ["a"])
+        await progress.create("t2", ["a"])
+
+        async with hub.watch("t1") as queue:
+            await progress.mark_complete("t2", 0, "a", {})
+            await progress.mark_complete("t1", 0, "a", {})
+            event = await asyncio.wait_for(queue.get(), 1)
+
+        assert event.summary.complete == 1
+        assert queue.empty()
+
+    async def test_slow_watcher_gets_resync_marker(self, hub, fake_redis):
+        progress = TaskProgressStore(fake_redis)
+        await progress.create("t1", ["a", "b", "c"])
+
+        async with hub.watch("t1") as queue:
+            for position, doc_id in enumerate("abc"):
+                await progress.mark_complete("t1", position, doc_id, {})
+            await asyncio.sleep(0.1)
+
+            # Three events overflowed the queue of two.
+            assert queue.qsize() == 1
+            assert queue.get_nowait() is None
@@ -0,0 +1,136 @@
+"""Tests for TaskProgressStore."""
+
+import pytest
+
+from recall.services.task_progress import TaskProgressStore
+
+
+@pytest.fixture
+def progress(fake_redis):
+    return TaskProgressStore(fake_redis, ttl=60)
+
+
+@pytest.mark.unit
+class TestTaskProgressStore:
+    """Test cases for TaskProgressStore."""
+
+    async def test_new_batch_is_queued(self, progress):
+        await progress.create("t1", ["a", "b", "c"])
+
+        status = await progress.get("t1")
+
+        assert [(job.doc_id, job.status) for job in status.jobs] == [
+            ("a", "queued"),
+            ("b", "queued"),
+            ("c", "queued"),
+        ]
+        assert status.summary.total == status.summary.queued == 3
+
+    async def test_transitions_update_counts_and_jobs(self, progress):
+        await progress.create("t1", ["a", "b", "c"])
+
+        await progress.mark_started("t1", 0, "a")
+        await progress.mark_started("t1", 1, "b")
+        await progress.mark_complete("t1", 0, "a", {"vector_dim": 384})
+        await progress.mark_started("t1", 2, "c")
+        await progress.mark_failed("t1", 2, "c", "Connection timeout")
+        status = await progress.get("t1")
+
+        summary = status.summary
+        assert (summary.queued, summary.in_progress, summary.complete, summary.failed) == (
+            0,
+            1,
+            1,
+            1,
+        )
+        a, b, c = status.jobs
+        assert (a.status, a.result) == ("complete", {"vector_dim": 384})
+        assert b.status == "in_progress"
+        assert (c.status, c.error) == ("failed", "Connection timeout")
+
+    async def test_repeated_transitions_count_once(self, progress):
+        await progress.create("t1", ["a", "b"])
+
+        await progress.mark_started("t1", 0, "a")
+        await progress.mark_failed("t1", 0, "a", "worker died")
+        # arq re-runs the job, which now succeeds.
+        await progress.mark_started("t1", 0, "a")
+        await progress.mark_started("t1", 0, "a")
+        await progress.mark_complete("t1", 0, "a", {})
+        await progress.mark_complete("t1", 0, "a", {})
+        summary = (await progress.get("t1")).summary
+
+        assert (summary.queued, summary.in_progress, summary.complete, summary.failed) == (
+            1,
+            0,
+            1,
+            0,
+        )
+
+    async def test_superseded_jobs_are_finished(self, progress):
+        await progress.create("t1", ["a", "b"])
+
+        await progress.mark_superseded("t1", 0, "a", "t2:a")
+        status = await progress.get("t1")
+
+        a, _ = status.jobs
+        assert (a.status, a.superseded_by) == ("superseded", "t2:a")
+        summary = status.summary
+        assert (summary.queued, summary.in_progress, summary.superseded) == (1, 0, 1)
+        assert summary.finished == 1
+
+    async def test_pagination(self, progress):
+        await progress.create("t1", [f"doc-{i}" for i in range(10)])
+
+        page = await progress.get("t1", limit=3, offset=8)
+        summary_only = await progress.get("t1", limit=0)
+
+        assert [job.doc_id for job in page.jobs] == ["doc-8", "doc-9"]
+        assert (page.limit, page.offset, page.summary.total) == (3, 8, 10)
+        assert summary_only.jobs == []
+        assert summary_only.summary.total == 10
+
+    async def test_doc_ids_with_separators(self, progress):
+        await progress.create("t1", ["a:1:b", "é"])
+        await progress.mark_failed("t1", 0, "a:1:b", "bad: input")
+
+        jobs = (await progress.get("t1")).jobs
+
+        assert [(job.doc_id, job.error) for job in jobs] == [("a:1:b", "bad: input"), ("é", None)]
+
+    async def test_get_many_in_one_round_trip(self, progress, fake_redis):
+        await progress.create("t1", ["a"])
+        await progress.create("t2", ["b", "c"])
+        pipelines = []
+        pipeline = fake_redis.pipeline
+
+        def counting_pipeline(*args, **kwargs):
+            pipelines.append(kwargs)
+            return pipeline(*args, **kwargs)
+
+        fake_redis.pipeline = counting_pipeline
+        statuses = await progress.get_many(["t2", "missing", "t1"], limit=1)
+
+        assert [s.task_id if s else None for s in statuses] == ["t2", None, "t1"]
+        assert [s.summary.total for s in statuses if s] == [2, 1]
+        assert [job.doc_id for job in statuses[0].jobs] == ["b"]
+        assert pipelines == [{"transaction": False}]
+
+    async def test_unknown_and_deleted_tasks(self, progress, fake_redis):
+        await progress.create("t1", ["a"])
+        await progress.mark_started("t1", 0, "a")
+
+        await progress.delete("t1")
+
+        assert await progress.get("t1") is None
+        assert await fake_redis.keys("recall:task:*") == []
+
+    async def test_records_expire(self, progress, fake_redis):
+        await progress.create("t1", ["a"])
+        await progress.mark_complete("t1", 0, "a", {})
+
+        keys = await fake_redis.keys("recall:task:t1:*")
+
+        assert keys
+        for key in keys:
+            assert 0 < await fake_redis.pttl(key) <= 60_000
@@ -0,0 +1,99 @@
+"""Tests for blob stores."""
+
+import io
+
+import pytest
+
+from recall.config import Settings
+from recall.core.blobstore.factory import BlobStoreFactory
+from recall.core.blobstore.local import LocalBlobStore
+from recall.core.blobstore.s3 import S3BlobStore
+from recall.models.errors import BlobNotFoundError
+
+KEY = "ab" + "0" * 62
+
+
+@pytest.mark.unit
+class TestLocalBlobStore:
+    """Test cases for LocalBlobStore."""
+
+    async def test_round_trip(self, tmp_path):
+        store = LocalBlobStore(tmp_path)
+
+        await store.put(KEY, b"data")
+
+        assert await store.exists(KEY)
+        assert await store.get(KEY) == b"data"
+        assert (tmp_path / "ab" / KEY).read_bytes() == b"data"
+        assert list((tmp_path / "ab").iterdir()) == [tmp_path / "ab" / KEY]
+
+    async def test_delete(self, tmp_path):
+        store = LocalBlobStore(tmp_path)
+        await store.put(KEY, b"data")
+
+        assert await store.delete(KEY) is True
+        assert await store.delete(KEY) is False
+        assert not await store.exists(KEY)
+
+    async def test_get_missing(self, tmp_path):
+        with pytest.raises(BlobNotFoundError):
+            await LocalBlobStore(tmp_path).get(KEY)
+
+
+@pytest.mark.unit
+class TestS3BlobStore:
+    """Test cases for S3BlobStore."""
+
+    @pytest.fixture
+    def s3(self):
+        boto3 = pytest.importorskip("boto3")
+        from botocore.stub import Stubber
+
+        client = boto3.client(
+            "s3",
+            region_name="us-east-1",
+            aws_access_key_id="test",
+            aws_secret_access_key="test",
+        )
+        with Stubber(client) as stubber:
+            yield client, stubber
+            stubber.assert_no_pending_responses()
+
+    async def test_put_and_get(self, s3):
+        client, stubber = s3
+        key = {"Bucket": "bucket", "Key": f"blobs/{KEY}"}
+        stubber.add_response("put_object", {}, {**key, "Body": b"data"})
+        stubber.add_response("get_object", {"Body": io.BytesIO(b"data")}, key)
+        store = S3BlobStore("bucket", prefix="blobs/", client=client)
+
+        await store.put(KEY, b"data")
+
+        assert await store.get(KEY) == b"data"
+
+    async def test_missing_blob(self, s3):
+        client, stubber = s3
+        key = {"Bucket": "bucket", "Key": f"blobs/{KEY}"}
+        stubber.add_client_error("get_object", "NoSuchKey", expected_params=key)
+        stubber.add_client_error("head_object", "404", http_status_code=404, expected_params=key)
+        store = S3BlobStore("bucket", prefix="blobs/", client=client)
+
+        with pytest.raises(BlobNotFoundError):
+            await store.get(KEY)
+        assert await store.delete(KEY) is False
+
+
+@pytest.mark.unit
+class TestBlobStoreFactory:
+    """Test cases for BlobStoreFactory."""
+
+    def test_local_from_settings(self, tmp_path):
+        store = BlobStoreFactory.from_settings(Settings(blob_store_path=str(tmp_path)))
+        assert isinstance(store, LocalBlobStore)
+
+    def test_s3_needs_bucket(self):
+        with pytest.raises(ValueError, match="bucket"):
+            BlobStoreFactory.create("s3")
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unsupported"):
+            BlobStoreFactory.create("ftp")
@@ -1,5 +1,6 @@
 """Tests for embedder factory and implementations."""
 
+import io
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -151,6 +152,11 @@ class TestTextEmbedder:
             with pytest.raises(EmbeddingError, match="expects string content"):
                 embedder.embed(12345)
 
+    def test_prepare_decodes_bytes(self):
+        embedder = TextEmbedder("all-MiniLM-L6-v2")
+        assert embedder.prepare("caf\u00e9".encode()) == "caf\u00e9"
+        assert embedder.prepare("text") == "text"
+
 
 @pytest.mark.unit
 class TestCLIPEmbedder:
@@ -193,3 +199,20 @@ class TestCLIPEmbedder:
             embedder = CLIPEmbedder("clip-ViT-B-32")
             with pytest.raises(EmbeddingError, match="content must be downloaded first"):
                 embedder.embed("s3://bucket/image.jpg")
+
+    def test_prepare_decodes_image(self):
+        from PIL import Image
+
+        buffer = io.BytesIO()
+        Image.new("RGB", (4, 4)).save(buffer, format="PNG")
+
+        embedder = CLIPEmbedder("clip-ViT-B-32")
+        image = embedder.prepare(buffer.getvalue())
+
+        assert isinstance(image, Image.Image)
+        assert embedder.prepare(image) is image
+
+    def test_prepare_rejects_invalid_image(self):
+        embedder = CLIPEmbedder("clip-ViT-B-32")
+        with pytest.raises(EmbeddingError):
+            embedder.prepare(b"not an image")
@@ -0,0 +1,129 @@
+"""Tests for the filter compile cache."""
+
+import pytest
+from pydantic import ValidationError
+
+from recall.core.transpiler.cache import FilterCache, filter_key, get_filter_cache
+from recall.models.collection import FieldType
+from recall.models.search import EqCondition, SearchRequest
+
+COMPLEX_FILTER = {
+    "op": "AND",
+    "conditions": [
+        {"op": "EQ", "field": "category", "value": "shoes"},
+        {"op": "LT", "field": "price", "value": 200},
+    ],
+}
+
+
+@pytest.mark.unit
+class TestFilterKey:
+    """Test cases for canonical filter hashing."""
+
+    def test_key_ignores_key_order(self):
+        a = {"op": "EQ", "field": "category", "value": "shoes"}
+        b = {"value": "shoes", "field": "category", "op": "EQ"}
+        assert filter_key(a) == filter_key(b)
+
+    def test_key_distinguishes_values(self):
+        a = {"op": "EQ", "field": "flag", "value": True}
+        b = {"op": "EQ", "field": "flag", "value": 1}
+        assert filter_key(a) != filter_key(b)
+
+
+@pytest.mark.unit
+class TestFilterCache:
+    """Test cases for FilterCache."""
+
+    def test_parse_reuses_parsed_tree(self):
+        cache = FilterCache()
+
+        first = cache.parse(COMPLEX_FILTER)
+        second = cache.parse(dict(reversed(COMPLEX_FILTER.items())))
+
+        assert first is second
+        assert cache.misses == 1
+        assert cache.hits == 1
+
+    def test_compile_parsed_tree_is_a_hit(self):
+        cache = FilterCache()
+        dsl = cache.parse(COMPLEX_FILTER)
+
+        compiled = cache.compile(dsl)
+
+        assert compiled.dsl is dsl
+        assert len(compiled.filter.must) == 2
+        assert cache.misses == 1
+
+    def test_compile_equal_model_shares_entry(self):
+        cache = FilterCache()
+        first = cache.compile(EqCondition(field="category", value="shoes"))
+        second = cache.compile(EqCondition(field="category", value="shoes"))
+
+        assert first is second
+        assert cache.misses == 1
+
+    def test_compile_is_cached_per_scalar_fields(self):
+        cache = FilterCache()
+        raw = {
+            "op": "AND",
+            "conditions": [
+                {"op": "EQ", "field": "tags", "value": "a"},
+                {"op": "EQ", "field": "tags", "value": "b"},
+            ],
+        }
+        dsl = cache.parse(raw)
+
+        listed = cache.compile(dsl)
+        scalar = cache.compile(dsl, {"tags"})
+
+        assert not listed.matches_nothing
+        assert scalar.matches_nothing
+        assert scalar.dsl is dsl
+        assert cache.compile(dsl, frozenset({"tags"})) is scalar
+        assert cache.compile(raw, ["tags"]) is scalar
+        assert cache.misses == 2
+
+    def test_compile_raw_mapping(self):
+        cache = FilterCache()
+        compiled = cache.compile(COMPLEX_FILTER)
+        assert compiled.key == filter_key(COMPLEX_FILTER)
+
+    def test_compile_none(self):
+        assert FilterCache().compile(None) is None
+
+    def test_lru_eviction(self):
+        cache = FilterCache(maxsize=2)
+        for value in ["a", "b", "c"]:
+            cache.parse({"op": "EQ", "field": "f", "value": value})
+
+        assert len(cache) == 2
+        cache.parse({"op": "EQ", "field": "f", "value": "a"})
+        assert cache.misses == 4
+
+    def test_compiled_fields(self):
+        compiled = FilterCache().compile(COMPLEX_FILTER)
+        assert compiled.fields == {
+            "category": frozenset({FieldType.KEYWORD}),
+            "price": frozenset({FieldType.INT}),
+        }
+
+    def test_invalid_filter_raises(self):
+        with pytest.raises(ValidationError):
+            FilterCache().parse({"op": "NOPE", "field": "f"})
+
+
+@pytest.mark.unit
+class TestSearchRequestFilterCache:
+    """Test cases for SearchRequest parsing through the cache."""
+
+    def test_repeated_filters_share_parsed_tree(self):
+        first = SearchRequest.model_validate({"query": "q", "filter": COMPLEX_FILTER})
+        second = SearchRequest.model_validate({"query": "q", "filter": COMPLEX_FILTER})
+
+        assert first.filter is second.filter
+        assert get_filter_cache().compile(first.filter).dsl is first.filter
+
+    def test_invalid_filter_still_rejected(self):
+        with pytest.raises(ValidationError):
+            SearchRequest.model_validate({"query": "q", "filter": {"op": "LT", "field": "p"}})
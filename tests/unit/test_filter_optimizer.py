@@ -0,0 +1,346 @@
+"""Tests for the filter DSL optimizer."""
+
+from typing import Any
+
+import pytest
+from hypothesis import example, given, settings
+from hypothesis import strategies as st
+from qdrant_client import models
+
+from recall.core.transpiler.optimizer import FilterOptimizer, NeverCondition, RangeCondition
+from recall.core.transpiler.qdrant import QdrantTranspiler
+from recall.models.search import (
+    AndFilter,
+    EqCondition,
+    GtCondition,
+    GteCondition,
+    InCondition,
+    LtCondition,
+    LteCondition,
+    NeqCondition,
+    OrFilter,
+)
+
+FIELDS = ["a", "b", "c"]
+# Fields declared in the index schema; "c" may also hold lists.
+SCALAR_FIELDS = frozenset({"a", "b"})
+
+
+def _kind(value: Any) -> str:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int | float):
+        return "number"
+    return "str"
+
+
+def _same(left: Any, right: Any) -> bool:
+    return _kind(left) == _kind(right) and left == right
+
+
+def _in_range(value: Any, gt=None, gte=None, lt=None, lte=None) -> bool:
+    if _kind(value) != "number":
+        return False
+    return (
+        (gt is None or value > gt)
+        and (gte is None or value >= gte)
+        and (lt is None or value < lt)
+        and (lte is None or value <= lte)
+    )
+
+
+def _any(value: Any, test) -> bool:
+    """Qdrant matches a list-valued field when any of its elements matches."""
+    return any(test(v) for v in value) if isinstance(value, list) else test(value)
+
+
+def eval_dsl(node: Any, payload: dict[str, Any]) -> bool:
+    """Reference evaluator for DSL trees, following Qdrant's matching rules."""
+    if node is None:
+        return True
+    match node.op:
+        case "AND":
+            return all(eval_dsl(c, payload) for c in node.conditions)
+        case "OR":
+            return any(eval_dsl(c, payload) for c in node.conditions)
+        case "NEVER":
+            return False
+    if node.field not in payload:
+        return node.op == "NEQ"
+    value = payload[node.field]
+    match node.op:
+        case "EQ":
+            return _any(value, lambda v: _same(v, node.value))
+        case "NEQ":
+            return not _any(value, lambda v: _same(v, node.value))
+        case "IN":
+            return _any(value, lambda v: any(_same(v, x) for x in node.value))
+        case "RANGE":
+            bounds = {"gt": node.gt, "gte": node.gte, "lt": node.lt, "lte": node.lte}
+            return _any(value, lambda v: _in_range(v, **bounds))
+    bound = {"LT": "lt", "LTE": "lte", "GT": "gt", "GTE": "gte"}[node.op]
+    return _any(value, lambda v: _in_range(v, **{bound: node.value}))
+
+
+def eval_qdrant(flt: Any, payload: dict[str, Any]) -> bool:
+    """Reference evaluator for transpiled Qdrant filters."""
+    if flt is None:
+        return True
+    if isinstance(flt, models.HasIdCondition):
+        return False
+    if isinstance(flt, models.FieldCondition):
+        if flt.key not in payload:
+            return False
+        value = payload[flt.key]
+        if isinstance(flt.match, models.MatchValue):
+            return _any(value, lambda v: _same(v, flt.match.value))
+        if isinstance(flt.match, models.MatchAny):
+            return _any(value, lambda v: any(_same(v, x) for x in flt.match.any))
+        r = flt.range
+        return _any(value, lambda v: _in_range(v, gt=r.gt, gte=r.gte, lt=r.lt, lte=r.lte))
+    return (
+        all(eval_qdrant(c, payload) for c in flt.must or [])
+        and (not flt.should or any(eval_qdrant(c, payload) for c in flt.should))
+        and not any(eval_qdrant(c, payload) for c in flt.must_not or [])
+    )
+
+
+fields = st.sampled_from(FIELDS)
+eq_values = st.one_of(st.integers(0, 3), st.sampled_from(["x", "y"]), st.booleans())
+range_values = st.one_of(st.integers(0, 3), st.sampled_from([0.5, 1.5, 2.5]))
+in_values = st.one_of(
+    st.lists(st.integers(0, 3), max_size=3),
+    st.lists(st.sampled_from(["x", "y", "z"]), max_size=3),
+)
+
+leaves = st.one_of(
+    st.builds(EqCondition, field=fields, value=eq_values),
+    st.builds(NeqCondition, field=fields, value=eq_values),
+    st.builds(LtCondition, field=fields, value=range_values),
+    st.builds(LteCondition, field=fields, value=range_values),
+    st.builds(GtCondition, field=fields, value=range_values),
+    st.builds(GteCondition, field=fields, value=range_values),
+    st.builds(InCondition, field=fields, value=in_values),
+)
+
+filters = st.recursive(
+    leaves,
+    lambda children: st.one_of(
+        st.builds(AndFilter, conditions=st.lists(children, min_size=1, max_size=4)),
+        st.builds(OrFilter, conditions=st.lists(children, min_size=1, max_size=4)),
+    ),
+    max_leaves=12,
+)
+
+scalars = st.one_of(
+    st.integers(0, 3),
+    st.sampled_from([0.5, 1.5, 2.5]),
+    st.sampled_from(["x", "y", "z"]),
+    st.booleans(),
+)
+# Few distinct elements, so that lists often satisfy several conditions at once.
+list_elements = st.sampled_from([0, 1, 2, 0.5, 2.5, "x", "y", True])
+payloads = st.lists(
+    st.fixed_dictionaries(
+        {},
+        optional={
+            "a": scalars,
+            "b": scalars,
+            "c": st.one_of(scalars, st.lists(list_elements, max_size=4)),
+        },
+    ),
+    min_size=1,
+    max_size=20,
+)
+
+
+# Conditions that different elements of one list satisfy.
+LIST_EXAMPLES = [
+    (
+        AndFilter(
+            conditions=[EqCondition(field="c", value="x"), EqCondition(field="c", value="y")]
+        ),
+        [{"c": ["x", "y"]}],
+    ),
+    (
+        AndFilter(conditions=[GtCondition(field="c", value=2), LtCondition(field="c", value=1)]),
+        [{"c": [0, 2.5]}],
+    ),
+    (
+        AndFilter(
+            conditions=[EqCondition(field="c", value="x"), NeqCondition(field="c", value="y")]
+        ),
+        [{"c": ["x", "y"]}],
+    ),
+    (
+        AndFilter(
+            conditions=[
+                InCondition(field="c", value=["x"]),
+                InCondition(field="c", value=["y", "z"]),
+            ]
+        ),
+        [{"c": ["x", "y"]}],
+    ),
+]
+
+
+def _with_list_examples(test):
+    for dsl, points in LIST_EXAMPLES:
+        test = example(dsl=dsl, points=points)(test)
+    return test
+
+
+@pytest.mark.unit
+class TestFilterOptimizerEquivalence:
+    """Property-based checks that optimized filters mean the same thing."""
+
+    @settings(max_examples=300, deadline=None)
+    @given(dsl=filters, points=payloads)
+    @_with_list_examples
+    def test_optimized_dsl_is_equivalent(self, dsl, points):
+        optimized = FilterOptimizer.optimize(dsl, SCALAR_FIELDS)
+        for payload in points:
+            assert eval_dsl(optimized, payload) == eval_dsl(dsl, payload)
+
+    @settings(max_examples=300, deadline=None)
+    @given(dsl=filters, points=payloads)
+    @_with_list_examples
+    def test_transpiled_filters_are_equivalent(self, dsl, points):
+        original = QdrantTranspiler.transpile(dsl)
+        optimized = QdrantTranspiler.transpile(FilterOptimizer.optimize(dsl, SCALAR_FIELDS))
+        for payload in points:
+            expected = eval_dsl(dsl, payload)
+            assert eval_qdrant(original, payload) == expected
+            assert eval_qdrant(optimized, payload) == expected
+
+
+@pytest.mark.unit
+class TestFilterOptimizerRewrites:
+    """Test cases for individual rewrite rules."""
+
+    def test_none_passes_through(self):
+        assert FilterOptimizer.optimize(None) is None
+
+    def test_or_of_eqs_becomes_in(self):
+        dsl = OrFilter(
+            conditions=[
+                EqCondition(field="color", value="red"),
+                EqCondition(field="color", value="blue"),
+                EqCondition(field="color", value="red"),
+            ]
+        )
+        optimized = FilterOptimizer.optimize(dsl)
+
+        assert optimized.op == "IN"
+        assert optimized.value == ["red", "blue"]
+        result = QdrantTranspiler.transpile(optimized)
+        assert result.must[0].match.any == ["red", "blue"]
+
+    def test_or_does_not_mix_value_kinds(self):
+        dsl = OrFilter(
+            conditions=[
+                EqCondition(field="f", value="1"),
+                EqCondition(field="f", value=1),
+            ]
+        )
+        optimized = FilterOptimizer.optimize(dsl)
+        assert optimized.op == "OR"
+        assert len(optimized.conditions) == 2
+
+    def test_range_bounds_merge(self):
+        dsl = AndFilter(
+            conditions=[
+                GtCondition(field="price", value=10),
+                LtCondition(field="price", value=100),
+                LteCondition(field="price", value=50),
+            ]
+        )
+        optimized = FilterOptimizer.optimize(dsl, {"price"})
+
+        assert isinstance(optimized, RangeCondition)
+        assert (optimized.gt, optimized.lte, optimized.lt) == (10, 50, None)
+        result = QdrantTranspiler.transpile(optimized)
+        assert len(result.must) == 1
+        assert result.must[0].range == models.Range(gt=10, lte=50)
+
+    def test_empty_range_short_circuits(self):
+        dsl = AndFilter(
+            conditions=[
+                GteCondition(field="price", value=100),
+                LtCondition(field="price", value=100),
+            ]
+        )
+        assert isinstance(FilterOptimizer.optimize(dsl, {"price"}), NeverCondition)
+
+    def test_conflicting_eqs_short_circuit(self):
+        dsl = AndFilter(
+            conditions=[
+                EqCondition(field="status", value="active"),
+                EqCondition(field="status", value="deleted"),
+            ]
+        )
+        optimized = FilterOptimizer.optimize(dsl, {"status"})
+
+        assert isinstance(optimized, NeverCondition)
+        assert QdrantTranspiler.transpile(optimized).must[0].has_id == []
+
+    def test_eq_drops_implied_conditions(self):
+        dsl = AndFilter(
+            conditions=[
+                EqCondition(field="rating", value=4),
+                InCondition(field="rating", value=[3, 4, 5]),
+                GtCondition(field="rating", value=2),
+                NeqCondition(field="rating", value=1),
+            ]
+        )
+        assert FilterOptimizer.optimize(dsl, {"rating"}) == EqCondition(field="rating", value=4)
+
+    def test_list_fields_keep_per_element_conditions(self):
+        dsl = AndFilter(
+            conditions=[
+                EqCondition(field="tags", value="a"),
+                EqCondition(field="tags", value="b"),
+                NeqCondition(field="tags", value="c"),
+                GtCondition(field="prices", value=10),
+                LtCondition(field="prices", value=5),
+            ]
+        )
+        optimized = FilterOptimizer.optimize(dsl, {"status"})
+
+        assert optimized == dsl
+        assert eval_dsl(optimized, {"tags": ["a", "b"], "prices": [3, 12]})
+
+    def test_nested_ands_flatten(self):
+        dsl = AndFilter(
+            conditions=[
+                AndFilter(conditions=[EqCondition(field="a", value=1)]),
+                AndFilter(
+                    conditions=[
+                        EqCondition(field="b", value=2),
+                        AndFilter(conditions=[EqCondition(field="c", value=3)]),
+                    ]
+                ),
+            ]
+        )
+        optimized = FilterOptimizer.optimize(dsl)
+
+        assert optimized.op == "AND"
+        assert [c.field for c in optimized.conditions] == ["a", "b", "c"]
+
+    def test_duplicate_clauses_removed(self):
+        dsl = AndFilter(
+            conditions=[
+                NeqCondition(field="status", value="deleted"),
+                NeqCondition(field="status", value="deleted"),
+            ]
+        )
+        assert FilterOptimizer.optimize(dsl) == NeqCondition(field="status", value="deleted")
+
+    def test_eq_or_neq_same_value_matches_everything(self):
+        dsl = OrFilter(
+            conditions=[
+                EqCondition(field="status", value="active"),
+                NeqCondition(field="status", value="active"),
+            ]
+        )
+        assert FilterOptimizer.optimize(dsl) is None
@@ -0,0 +1,59 @@
+"""Tests for batched job enqueueing."""
+
+import pytest
+from arq.jobs import Job, JobStatus
+
+from recall.core.queue import JobSpec, enqueue_jobs
+
+
+@pytest.mark.unit
+class TestEnqueueJobs:
+    """Test cases for enqueue_jobs."""
+
+    async def test_jobs_match_arq_enqueue_job(self, arq_redis):
+        await enqueue_jobs(arq_redis, [JobSpec("embed_document", "batch:a", {"doc_id": "a"})])
+        await arq_redis.enqueue_job("embed_document", doc_id="b", _job_id="batch:b")
+
+        batched = await Job("batch:a", arq_redis).info()
+        single = await Job("batch:b", arq_redis).info()
+
+        assert batched.function == single.function
+        assert batched.kwargs == {"doc_id": "a"}
+        assert batched.args == single.args == ()
+        assert await Job("batch:a", arq_redis).status() == JobStatus.queued
+        assert await arq_redis.pttl("arq:job:batch:a") > 0
+
+    async def test_duplicate_ids_keep_first(self, arq_redis):
+        job_ids = await enqueue_jobs(
+            arq_redis,
+            [
+                JobSpec("embed_document", "batch:a", {"n": 1}),
+                JobSpec("embed_document", "batch:b", {"n": 2}),
+                JobSpec("embed_document", "batch:a", {"n": 3}),
+            ],
+        )
+
+        assert job_ids == ["batch:a", "batch:b"]
+        assert (await Job("batch:a", arq_redis).info()).kwargs == {"n": 1}
+        assert await arq_redis.zcard(arq_redis.default_queue_name) == 2
+
+    async def test_custom_queue(self, arq_redis):
+        await enqueue_jobs(arq_redis, [JobSpec("embed_document", "x:1")], queue_name="arq:other")
+        assert await arq_redis.zrange("arq:other", 0, -1) == [b"x:1"]
+
+    async def test_explicit_scores_order_the_queue(self, arq_redis):
+        jobs = [
+            JobSpec("embed_document", "x:late", score=5),
+            JobSpec("embed_document", "x:early", score=2),
+        ]
+
+        await enqueue_jobs(arq_redis, jobs)
+
+        queue = arq_redis.default_queue_name
+        assert await arq_redis.zrange(queue, 0, -1, withscores=True) == [
+            (b"x:early", 2.0),
+            (b"x:late", 5.0),
+        ]
+
+    async def test_empty_batch(self, arq_redis):
+        assert await enqueue_jobs(arq_redis, []) == []
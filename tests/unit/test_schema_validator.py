@@ -4,7 +4,12 @@ import pytest
 
 from recall.models.collection import FieldType
 from recall.models.errors import SchemaValidationError
-from recall.services.schema_validator import build_payload_model, validate_payload
+from recall.services.schema_validator import (
+    build_payload_model,
+    coerce_payloads,
+    validate_payload,
+    validate_payloads,
+)
 
 
 class TestBuildPayloadModel:
@@ -108,3 +113,83 @@ class TestValidatePayload:
             validate_payload(payload, schema, "doc-1")
         assert "price" in exc_info.value.message
         assert "count" in exc_info.value.message
+
+
+class TestValidatePayloads:
+    """Tests for validate_payloads."""
+
+    SCHEMA = {"price": FieldType.FLOAT, "count": FieldType.INT, "tag": FieldType.KEYWORD}
+
+    def test_valid_batch_passes(self) -> None:
+        payloads = [{"price": 1.5, "count": i, "tag": "a"} for i in range(50)]
+        validate_payloads(payloads, self.SCHEMA, [f"doc-{i}" for i in range(50)])
+
+    def test_empty_schema_accepts_any_payload(self) -> None:
+        validate_payloads([{"anything": object()}], {}, ["doc-1"])
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"price": 1, "count": 2, "tag": "a"},
+            {"price": "1.5", "count": "2", "tag": "a"},
+            {"price": 1.0, "count": 2.0, "tag": "a", "extra": [1]},
+        ],
+    )
+    def test_accepts_what_single_validation_accepts(self, payload) -> None:
+        validate_payload(payload, self.SCHEMA, "doc-1")
+        validate_payloads([payload], self.SCHEMA, ["doc-1"])
+
+    def test_reports_every_failing_document(self) -> None:
+        payloads = [
+            {"price": 1.0, "count": 1, "tag": "a"},
+            {"price": "cheap", "count": 1, "tag": "a"},
+            {"price": 1.0, "count": 1, "tag": "a"},
+            {"count": 1.5, "tag": "a"},
+        ]
+        with pytest.raises(SchemaValidationError) as exc_info:
+            validate_payloads(payloads, self.SCHEMA, ["d0", "d1", "d2", "d3"])
+
+        error = exc_info.value
+        assert error.message.startswith("2 documents failed payload validation")
+        assert set(error.details["documents"]) == {"d1", "d3"}
+        assert len(error.details["documents"]["d3"]) == 2
+        assert all(
+            message.startswith(("price", "count")) for message in error.details["documents"]["d3"]
+        )
+
+    def test_single_failure_matches_single_validation_message(self) -> None:
+        payload = {"count": 1, "tag": "a"}
+        with pytest.raises(SchemaValidationError) as single:
+            validate_payload(payload, self.SCHEMA, "doc-1")
+        with pytest.raises(SchemaValidationError) as batch:
+            validate_payloads([payload], self.SCHEMA, ["doc-1"])
+
+        assert batch.value.message == single.value.message
+
+    def test_partial_checks_only_present_fields(self) -> None:
+        payloads = [{"price": 2.5}, {"tag": "b", "note": "free text"}, {}]
+        validate_payloads(payloads, self.SCHEMA, ["d0", "d1", "d2"], partial=True)
+
+    def test_partial_reports_invalid_fields(self) -> None:
+        payloads = [{"price": 2.5}, {"count": "many"}, {"tag": "b", "price": "cheap"}]
+        with pytest.raises(SchemaValidationError) as exc_info:
+            validate_payloads(payloads, self.SCHEMA, ["d0", "d1", "d2"], partial=True)
+
+        documents = exc_info.value.details["documents"]
+        assert list(documents) == ["d1", "d2"]
+        assert documents["d2"][0].startswith("price")
+
+    def test_coerce_converts_valid_payloads_and_reports_the_rest(self) -> None:
+        payloads = [
+            {"price": "5", "count": "2", "tag": "a", "note": "kept"},
+            {"price": "cheap", "count": "2", "tag": "b"},
+            {"price": 1.5, "count": 3, "tag": "c"},
+        ]
+
+        coerced, errors = coerce_payloads(payloads, self.SCHEMA)
+
+        assert coerced[0] == {"price": 5.0, "count": 2, "tag": "a", "note": "kept"}
+        assert coerced[1] is payloads[1]
+        assert coerced[2] is payloads[2]
+        assert list(errors) == [1]
+        assert errors[1][0].startswith("price")
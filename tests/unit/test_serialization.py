@@ -0,0 +1,163 @@
+"""Tests for the msgpack job serializer."""
+
+import pickle
+
+import pytest
+from arq.connections import ArqRedis
+from arq.jobs import Job, serialize_result
+
+from recall.config import Settings
+from recall.core.queue import JobSpec, enqueue_jobs
+from recall.core.serialization import (
+    MAGIC,
+    JobSerializer,
+    RemoteJobError,
+    job_serializer_options,
+)
+from recall.models.collection import FieldType
+from recall.models.errors import ContentFetchError
+
+
+@pytest.mark.unit
+class TestJobSerializer:
+    """Test cases for JobSerializer."""
+
+    def test_round_trips_job_data(self):
+        serializer = JobSerializer()
+        job = {
+            "t": 1,
+            "f": "embed_document",
+            "a": ("items",),
+            "k": {"doc_id": "a", "content_raw": "text", "payload": {"n": 1.5, "tags": ["x"]}},
+            "et": 1700000000000,
+            "raw": b"\x00\x01",
+            1: None,
+        }
+
+        assert serializer.loads(serializer.dumps(job)) == job
+
+    def test_tuples_stay_tuples(self):
+        serializer = JobSerializer()
+
+        assert serializer.loads(serializer.dumps({"a": ("x", (1, 2))}))["a"] == ("x", (1, 2))
+
+    def test_builtin_subclasses_store_plain_values(self):
+        serializer = JobSerializer()
+
+        data = serializer.loads(serializer.dumps({"type": FieldType.KEYWORD}))
+
+        assert data == {"type": "keyword"}
+        assert type(data["type"]) is str
+
+    def test_exceptions_become_remote_job_errors(self):
+        serializer = JobSerializer()
+
+        exc = serializer.loads(serializer.dumps(ContentFetchError("not found", "https://x", 404)))
+
+        assert isinstance(exc, RemoteJobError)
+        assert exc.type_name == "ContentFetchError"
+        assert str(exc) == "not found"
+
+    def test_unsupported_types_raise(self):
+        with pytest.raises(TypeError, match="object"):
+            JobSerializer().dumps({"x": object()})
+
+    def test_compresses_above_threshold(self):
+        serializer = JobSerializer(compress_min_bytes=100)
+        small, large = {"k": "x" * 10}, {"k": "x" * 1000}
+
+        small_data, large_data = serializer.dumps(small), serializer.dumps(large)
+
+        assert small_data[len(MAGIC)] == 0
+        assert large_data[len(MAGIC)] == 1
+        assert len(large_data) < 100
+        assert serializer.loads(large_data) == large
+
+    def test_zero_threshold_disables_compression(self):
+        data = JobSerializer(compress_min_bytes=0).dumps({"k": "x" * 10_000})
+
+        assert data[len(MAGIC)] == 0
+
+    def test_reads_pickled_jobs(self):
+        job = {"f": "embed_document", "a": ("items",), "k": {"doc_id": "a"}}
+
+        assert JobSerializer().loads(pickle.dumps(job)) == job
+
+    def test_options_follow_settings(self):
+        msgpack_options = job_serializer_options(Settings(job_serializer="msgpack"))
+        pickle_options = job_serializer_options(Settings(job_serializer="pickle"))
+
+        assert msgpack_options["job_serializer"]({"a": 1}).startswith(MAGIC)
+        assert pickle_options["job_serializer"] is pickle.dumps
+        # Either setting reads jobs written under the other.
+        encoded = msgpack_options["job_serializer"]({"a": 1})
+        assert pickle_options["job_deserializer"](encoded) == {"a": 1}
+
+    def test_unknown_serializer_raises(self):
+        with pytest.raises(ValueError, match="json"):
+            job_serializer_options(Settings(job_serializer="json"))
+
+
+@pytest.mark.unit
+class TestArqCompatibility:
+    """JobSerializer used as arq's job serializer."""
+
+    @pytest.fixture
+    def serializer(self):
+        return JobSerializer(compress_min_bytes=64)
+
+    @pytest.fixture
+    def msgpack_redis(self, fake_redis, serializer):
+        return ArqRedis(
+            connection_pool=fake_redis.connection_pool,
+            job_serializer=serializer.dumps,
+            job_deserializer=serializer.loads,
+        )
+
+    async def test_enqueue_and_read_job(self, msgpack_redis, serializer):
+        await msgpack_redis.enqueue_job("embed_document", "items", doc_id="a", _job_id="j1")
+        await enqueue_jobs(
+            msgpack_redis,
+            [JobSpec("embed_document", "j2", {"doc_id": "b", "content_raw": "x" * 500})],
+        )
+
+        first = await Job("j1", msgpack_redis, _deserializer=serializer.loads).info()
+        second = await Job("j2", msgpack_redis, _deserializer=serializer.loads).info()
+
+        assert (first.function, first.args, first.kwargs) == (
+            "embed_document",
+            ("items",),
+            {"doc_id": "a"},
+        )
+        assert second.kwargs["content_raw"] == "x" * 500
+        raw = await msgpack_redis.get("arq:job:j2")
+        assert raw.startswith(MAGIC) and len(raw) < 200
+
+    async def test_reads_jobs_queued_with_pickle(self, arq_redis, serializer):
+        await arq_redis.enqueue_job("embed_document", doc_id="a", _job_id="old")
+
+        info = await Job("old", arq_redis, _deserializer=serializer.loads).info()
+
+        assert info.kwargs == {"doc_id": "a"}
+
+    def test_failed_result_round_trips(self, serializer):
+        data = serialize_result(
+            "embed_document",
+            ("items",),
+            {"doc_id": "a"},
+            1,
+            1000,
+            False,
+            ContentFetchError("gone", "https://x", 410),
+            1000,
+            1001,
+            "embed_document:j1",
+            "arq:queue",
+            "j1",
+            serializer=serializer.dumps,
+        )
+
+        result = serializer.loads(data)
+
+        assert result["s"] is False
+        assert str(result["r"]) == "gone"
@@ -2,6 +2,7 @@
 
 import pytest
 
+from recall.core.transpiler.optimizer import NeverCondition, RangeCondition
 from recall.core.transpiler.qdrant import QdrantTranspiler
 from recall.models.search import (
     AndFilter,
@@ -123,6 +124,9 @@ class TestQdrantTranspiler:
 
         assert result is not None
         assert result.must is not None
+        nested = [c for c in result.must if getattr(c, "should", None)]
+        assert len(nested) == 1
+        assert len(nested[0].should) == 2
 
     def test_transpile_and_with_neq(self):
         condition = AndFilter(
@@ -169,6 +173,19 @@ class TestQdrantTranspiler:
         result = QdrantTranspiler.transpile(condition)
         assert result is not None
 
+    def test_transpile_range_condition(self):
+        condition = RangeCondition(field="price", gte=10, lt=100)
+        result = QdrantTranspiler.transpile(condition)
+
+        assert len(result.must) == 1
+        assert result.must[0].range.gte == 10
+        assert result.must[0].range.lt == 100
+        assert result.must[0].range.gt is None
+
+    def test_transpile_never_condition(self):
+        result = QdrantTranspiler.transpile(NeverCondition())
+        assert result.must[0].has_id == []
+
     def test_transpile_unknown_operation_raises(self):
         class UnknownCondition:
             op = "UNKNOWN"
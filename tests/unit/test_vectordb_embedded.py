@@ -0,0 +1,399 @@
+"""Tests for the embedded NumPy vector database backend."""
+
+import asyncio
+import multiprocessing
+
+import pytest
+from qdrant_client import QdrantClient, models
+
+from recall.core.transpiler.qdrant import QdrantTranspiler
+from recall.core.vectordb.base import Point
+from recall.core.vectordb.embedded import (
+    COMPACT_MIN_DEAD,
+    INITIAL_CAPACITY,
+    JOURNAL_FILE,
+    EmbeddedAdapter,
+)
+from recall.core.vectordb.factory import VectorDBFactory
+from recall.models.errors import VectorDBError
+from recall.models.search import (
+    AndFilter,
+    EqCondition,
+    GtCondition,
+    GteCondition,
+    InCondition,
+    LtCondition,
+    NeqCondition,
+    OrFilter,
+)
+
+
+def _points() -> list[Point]:
+    return [
+        Point(id="a", vector=[1.0, 0.0, 0.0], payload={"category": "shoes", "price": 50}),
+        Point(id="b", vector=[0.9, 0.1, 0.0], payload={"category": "boots", "price": 120.5}),
+        Point(id="c", vector=[0.0, 1.0, 0.0], payload={"category": "shoes", "price": 200}),
+        Point(id="d", vector=[0.0, 0.0, 1.0], payload={"category": "hats", "in_stock": True}),
+    ]
+
+
+def _tagged_points() -> list[Point]:
+    return [
+        Point(id="a", vector=[1.0, 0.0], payload={"tags": ["red", "blue"], "sizes": [4, 12]}),
+        Point(id="b", vector=[0.9, 0.1], payload={"tags": ["green", 1, 2]}),
+        Point(id="c", vector=[0.5, 0.5], payload={"tags": "red", "sizes": 7}),
+        Point(id="d", vector=[0.1, 0.9], payload={"tags": [True], "sizes": [True, "8"]}),
+        Point(id="e", vector=[0.0, 1.0], payload={"tags": [], "sizes": [9, 10.5]}),
+    ]
+
+
+def _write_points(path: str, writer: int, count: int) -> None:
+    async def write() -> None:
+        adapter = EmbeddedAdapter(path)
+        for i in range(count):
+            point_id = f"w{writer}-{i}"
+            await adapter.upsert(
+                "items", [Point(id=point_id, vector=[float(writer), 1.0, float(i)])]
+            )
+            await adapter.set_payload("items", {point_id: {"writer": writer}})
+
+    asyncio.run(write())
+
+
+@pytest.mark.unit
+class TestEmbeddedAdapter:
+    """Test cases for EmbeddedAdapter."""
+
+    @pytest.fixture
+    async def db(self, tmp_path) -> EmbeddedAdapter:
+        adapter = EmbeddedAdapter(str(tmp_path))
+        await adapter.create_collection("items", 3, {"category": "keyword"})
+        await adapter.upsert("items", _points())
+        yield adapter
+        await adapter.close()
+
+    async def test_collection_lifecycle(self, tmp_path):
+        adapter = EmbeddedAdapter(str(tmp_path))
+        assert await adapter.collection_exists("items") is False
+
+        await adapter.create_collection("items", 3)
+        assert await adapter.collection_exists("items") is True
+
+        assert await adapter.delete_collection("items") is True
+        assert await adapter.collection_exists("items") is False
+        assert await adapter.delete_collection("items") is False
+
+    async def test_count(self, db):
+        assert await db.count("items") == 4
+
+    async def test_search_orders_by_cosine_similarity(self, db):
+        results = await db.search("items", [1.0, 0.0, 0.0], limit=2)
+
+        assert [r.id for r in results] == ["a", "b"]
+        assert results[0].score == pytest.approx(1.0)
+        assert results[0].payload == {"category": "shoes", "price": 50}
+
+    async def test_search_without_payload_with_vectors(self, db):
+        results = await db.search(
+            "items", [0.0, 1.0, 0.0], limit=1, with_payload=False, with_vectors=True
+        )
+
+        assert results[0].id == "c"
+        assert results[0].payload is None
+        assert results[0].vector == pytest.approx([0.0, 1.0, 0.0])
+
+    @pytest.mark.parametrize(
+        "dsl,expected",
+        [
+            (EqCondition(field="category", value="shoes"), {"a", "c"}),
+            (NeqCondition(field="category", value="shoes"), {"b", "d"}),
+            (LtCondition(field="price", value=150), {"a", "b"}),
+            (GteCondition(field="price", value=120.5), {"b", "c"}),
+            (InCondition(field="category", value=["boots", "hats"]), {"b", "d"}),
+            (EqCondition(field="in_stock", value=True), {"d"}),
+            (
+                AndFilter(
+                    conditions=[
+                        EqCondition(field="category", value="shoes"),
+                        LtCondition(field="price", value=100),
+                    ]
+                ),
+                {"a"},
+            ),
+            (
+                OrFilter(
+                    conditions=[
+                        EqCondition(field="category", value="hats"),
+                        GteCondition(field="price", value=150),
+                    ]
+                ),
+                {"c", "d"},
+            ),
+        ],
+    )
+    async def test_search_with_transpiled_filter(self, db, dsl, expected):
+        results = await db.search(
+            "items", [1.0, 1.0, 1.0], filter=QdrantTranspiler.transpile(dsl), limit=10
+        )
+        assert {r.id for r in results} == expected
+
+    async def test_bool_and_int_are_distinct(self, tmp_path):
+        adapter = EmbeddedAdapter(str(tmp_path))
+        await adapter.create_collection("flags", 2)
+        await adapter.upsert(
+            "flags",
+            [
+                Point(id="t", vector=[1.0, 0.0], payload={"flag": True}),
+                Point(id="one", vector=[0.0, 1.0], payload={"flag": 1}),
+            ],
+        )
+
+        flt = QdrantTranspiler.transpile(EqCondition(field="flag", value=1))
+        results = await adapter.search("flags", [1.0, 1.0], filter=flt)
+        assert [r.id for r in results] == ["one"]
+
+    async def test_upsert_overwrites_existing_point(self, db):
+        await db.upsert("items", [Point(id="a", vector=[0.0, 1.0, 0.0], payload={"x": 1})])
+
+        assert await db.count("items") == 4
+        results = await db.search("items", [0.0, 1.0, 0.0], limit=1)
+        assert results[0].payload == {"x": 1}
+
+    async def test_set_payload_merges_without_touching_vectors(self, db):
+        updated = await db.set_payload("items", {"a": {"price": 45}, "missing": {"price": 1}})
+
+        assert updated == ["a"]
+        (result,) = await db.search("items", [1.0, 0.0, 0.0], limit=1, with_vectors=True)
+        assert result.payload == {"category": "shoes", "price": 45}
+        assert result.vector == pytest.approx([1.0, 0.0, 0.0])
+        flt = QdrantTranspiler.transpile(LtCondition(field="price", value=46))
+        assert [r.id for r in await db.search("items", [1.0, 0.0, 0.0], filter=flt)] == ["a"]
+
+    async def test_set_payload_overwrite(self, db, tmp_path):
+        await db.set_payload("items", {"d": {"category": "caps"}}, overwrite=True)
+
+        reader = EmbeddedAdapter(str(tmp_path))
+        (result,) = await reader.search("items", [0.0, 0.0, 1.0], limit=1)
+        assert result.payload == {"category": "caps"}
+        assert await reader.count("items") == 4
+
+    async def test_upsert_wrong_dimension_raises(self, db):
+        with pytest.raises(VectorDBError):
+            await db.upsert("items", [Point(id="z", vector=[1.0, 0.0])])
+
+    async def test_missing_collection_raises(self, tmp_path):
+        adapter = EmbeddedAdapter(str(tmp_path))
+        with pytest.raises(VectorDBError, match="not found"):
+            await adapter.search("missing", [1.0])
+
+    async def test_scroll_pagination(self, db):
+        first = await db.scroll("items", limit=3, offset=0)
+        second = await db.scroll("items", limit=3, offset=3)
+
+        assert [r.id for r in first] == ["a", "b", "c"]
+        assert [r.id for r in second] == ["d"]
+
+    async def test_grows_past_initial_capacity(self, tmp_path):
+        adapter = EmbeddedAdapter(str(tmp_path))
+        await adapter.create_collection("big", 2)
+        points = [
+            Point(id=str(i), vector=[1.0, float(i)], payload={"i": i})
+            for i in range(INITIAL_CAPACITY + 10)
+        ]
+        await adapter.upsert("big", points)
+
+        assert await adapter.count("big") == INITIAL_CAPACITY + 10
+        flt = QdrantTranspiler.transpile(GteCondition(field="i", value=INITIAL_CAPACITY))
+        results = await adapter.search("big", [1.0, 0.0], filter=flt, limit=100)
+        assert len(results) == 10
+
+    async def test_create_payload_index_records_schema(self, db, tmp_path):
+        await db.create_payload_index("items", "price", "float")
+
+        reopened = EmbeddedAdapter(str(tmp_path))
+        coll = reopened._open("items", "test")
+        assert coll.schema == {"category": "keyword", "price": "float"}
+
+    async def test_data_persists_across_instances(self, db, tmp_path):
+        reopened = EmbeddedAdapter(str(tmp_path))
+
+        assert await reopened.count("items") == 4
+        results = await reopened.search("items", [0.0, 0.0, 1.0], limit=1)
+        assert results[0].id == "d"
+
+    async def test_reader_sees_points_from_other_writer(self, db, tmp_path):
+        reader = EmbeddedAdapter(str(tmp_path))
+        assert await reader.count("items") == 4
+
+        await db.upsert("items", [Point(id="e", vector=[1.0, 1.0, 0.0])])
+        assert await reader.count("items") == 5
+
+    async def test_concurrent_writers_do_not_share_rows(self, db, tmp_path):
+        other = EmbeddedAdapter(str(tmp_path))
+        assert await other.count("items") == 4
+
+        # Both writers last saw four points; each must append after the other's.
+        await db.upsert("items", [Point(id="e", vector=[1.0, 1.0, 0.0], payload={"n": 1})])
+        await other.upsert("items", [Point(id="f", vector=[0.0, 1.0, 1.0], payload={"n": 2})])
+        await db.set_payload("items", {"f": {"seen": True}})
+
+        reader = EmbeddedAdapter(str(tmp_path))
+        assert await reader.count("items") == 6
+        (e,) = await reader.search("items", [1.0, 1.0, 0.0], limit=1)
+        (f,) = await reader.search("items", [0.0, 1.0, 1.0], limit=1)
+        assert (e.id, e.payload) == ("e", {"n": 1})
+        assert (f.id, f.payload) == ("f", {"n": 2, "seen": True})
+
+    async def test_concurrent_processes_keep_every_point(self, db, tmp_path):
+        ctx = multiprocessing.get_context("spawn")
+        writers = [
+            ctx.Process(target=_write_points, args=(str(tmp_path), w, 100)) for w in range(4)
+        ]
+        for proc in writers:
+            proc.start()
+        for proc in writers:
+            proc.join(timeout=60)
+            assert proc.exitcode == 0
+
+        reader = EmbeddedAdapter(str(tmp_path))
+        assert await reader.count("items") == 404
+        results = await reader.scroll("items", limit=500, with_vectors=True)
+        for result in results[4:]:
+            writer, i = (int(part) for part in result.id[1:].split("-"))
+            assert result.payload == {"writer": writer}
+            expected = [float(writer), 1.0, float(i)]
+            norm = sum(x * x for x in expected) ** 0.5
+            assert result.vector == pytest.approx([x / norm for x in expected], abs=1e-6)
+
+    async def test_writer_sees_capacity_grown_by_other_writer(self, db, tmp_path):
+        other = EmbeddedAdapter(str(tmp_path))
+        await other.upsert(
+            "items",
+            [Point(id=f"p{i}", vector=[0.0, 1.0, 0.0]) for i in range(INITIAL_CAPACITY)],
+        )
+
+        await db.upsert("items", [Point(id="last", vector=[0.0, 0.0, 1.0])])
+
+        reader = EmbeddedAdapter(str(tmp_path))
+        assert await reader.count("items") == INITIAL_CAPACITY + 5
+        (result,) = await reader.search("items", [0.0, 0.0, 1.0], limit=1, with_vectors=True)
+        assert result.vector == pytest.approx([0.0, 0.0, 1.0])
+
+    async def test_journal_compacted_on_open(self, db, tmp_path):
+        for i in range(COMPACT_MIN_DEAD + 1):
+            await db.set_payload("items", {"a": {"price": i}})
+        reader = EmbeddedAdapter(str(tmp_path))
+        assert await reader.count("items") == 4
+
+        reopened = EmbeddedAdapter(str(tmp_path))
+        assert await reopened.count("items") == 4
+
+        lines = (tmp_path / "items" / JOURNAL_FILE).read_text().splitlines()
+        assert len(lines) == 4
+        (result,) = await reopened.search("items", [1.0, 0.0, 0.0], limit=1)
+        assert result.payload == {"category": "shoes", "price": COMPACT_MIN_DEAD}
+
+        # Processes that had read the old journal replay the compacted one.
+        await reopened.upsert("items", [Point(id="e", vector=[1.0, 1.0, 0.0])])
+        assert await reader.count("items") == 5
+        assert await db.count("items") == 5
+        await db.upsert("items", [Point(id="f", vector=[0.0, 1.0, 1.0])])
+        assert [r.id for r in await reopened.scroll("items", limit=10)] == list("abcdef")
+
+    async def test_journal_below_threshold_not_compacted(self, db, tmp_path):
+        for i in range(10):
+            await db.set_payload("items", {"a": {"price": i}})
+
+        await EmbeddedAdapter(str(tmp_path)).count("items")
+
+        lines = (tmp_path / "items" / JOURNAL_FILE).read_text().splitlines()
+        assert len(lines) == 14
+
+    @pytest.mark.parametrize(
+        "dsl,expected",
+        [
+            (EqCondition(field="tags", value="red"), {"a", "c"}),
+            (EqCondition(field="tags", value=1), {"b"}),
+            (EqCondition(field="tags", value=True), {"d"}),
+            (InCondition(field="tags", value=["blue", "green"]), {"a", "b"}),
+            (NeqCondition(field="tags", value="red"), {"b", "d", "e"}),
+        ],
+    )
+    async def test_array_payloads_match_any_element(self, tmp_path, dsl, expected):
+        adapter = EmbeddedAdapter(str(tmp_path))
+        await adapter.create_collection("tagged", 2)
+        await adapter.upsert("tagged", _tagged_points())
+
+        flt = QdrantTranspiler.transpile(dsl)
+        results = await adapter.search("tagged", [1.0, 1.0], filter=flt, limit=10)
+        assert {r.id for r in results} == expected
+
+
+@pytest.mark.unit
+class TestQdrantParity:
+    """The embedded backend filters the same way as Qdrant (local mode)."""
+
+    @pytest.fixture
+    def qdrant(self):
+        client = QdrantClient(":memory:")
+        client.create_collection(
+            "tagged", vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE)
+        )
+        client.upsert(
+            "tagged",
+            [
+                models.PointStruct(id=i, vector=p.vector, payload=p.payload)
+                for i, p in enumerate(_tagged_points())
+            ],
+        )
+        yield client
+        client.close()
+
+    @pytest.mark.parametrize(
+        "dsl",
+        [
+            EqCondition(field="tags", value="red"),
+            EqCondition(field="tags", value=1),
+            EqCondition(field="tags", value="blue"),
+            InCondition(field="tags", value=["blue", "green"]),
+            InCondition(field="tags", value=[2, 3]),
+            NeqCondition(field="tags", value="red"),
+            AndFilter(
+                conditions=[
+                    EqCondition(field="tags", value="red"),
+                    EqCondition(field="tags", value="blue"),
+                ]
+            ),
+            GteCondition(field="sizes", value=10),
+            LtCondition(field="sizes", value=8),
+            AndFilter(
+                conditions=[
+                    GtCondition(field="sizes", value=10),
+                    LtCondition(field="sizes", value=5),
+                ]
+            ),
+        ],
+    )
+    async def test_match_parity(self, tmp_path, qdrant, dsl):
+        adapter = EmbeddedAdapter(str(tmp_path))
+        await adapter.create_collection("tagged", 2)
+        points = _tagged_points()
+        await adapter.upsert("tagged", points)
+
+        flt = QdrantTranspiler.transpile(dsl)
+        embedded = await adapter.search("tagged", [1.0, 1.0], filter=flt, limit=10)
+        reference = qdrant.query_points("tagged", query=[1.0, 1.0], query_filter=flt, limit=10)
+        assert {r.id for r in embedded} == {points[p.id].id for p in reference.points}
+
+
+@pytest.mark.unit
+class TestVectorDBFactory:
+    """Test cases for backend selection in VectorDBFactory."""
+
+    def test_create_embedded(self, tmp_path):
+        client = VectorDBFactory.create("embedded", str(tmp_path))
+        assert isinstance(client, EmbeddedAdapter)
+
+    def test_create_unknown_backend_raises(self):
+        with pytest.raises(ValueError, match="Unsupported backend"):
+            VectorDBFactory.create("weaviate")
@@ -0,0 +1,98 @@
+"""Tests for the embed_document worker task."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from arq.constants import default_queue_name
+from redis.exceptions import RedisError
+
+from recall.services.lanes import LANE_QUEUES
+from recall.workers.tasks import (
+    BulkWorkerSettings,
+    MaintenanceWorkerSettings,
+    WorkerSettings,
+    embed_document,
+)
+
+REF = "blob:abc"
+
+
+@pytest.fixture
+def ctx(sample_collection):
+    registry = AsyncMock()
+    registry.get = AsyncMock(return_value=sample_collection)
+    pipeline = AsyncMock()
+    pipeline.submit = AsyncMock(
+        return_value=SimpleNamespace(unchanged=False, vector=[0.1, 0.2], fetch_ms=1.0)
+    )
+    versions = AsyncMock()
+    versions.claim = AsyncMock(return_value=None)
+    with patch("recall.workers.tasks.EmbedderFactory"):
+        yield {
+            "registry": registry,
+            "pipeline": pipeline,
+            "blob_staging": AsyncMock(),
+            "doc_versions": versions,
+            "job_id": "job-1",
+        }
+
+
+@pytest.mark.unit
+class TestEmbedDocument:
+    """Test cases for embed_document's release of staged content."""
+
+    async def test_success_releases_blob_once(self, ctx):
+        ctx["blob_staging"].release.side_effect = RedisError("down")
+
+        result = await embed_document(ctx, "items", "doc-1", content_ref=REF)
+
+        assert result["status"] == "success"
+        ctx["blob_staging"].release.assert_awaited_once_with(REF)
+
+    async def test_failure_releases_blob_once(self, ctx):
+        ctx["pipeline"].submit.side_effect = RuntimeError("embed failed")
+
+        with pytest.raises(RuntimeError):
+            await embed_document(ctx, "items", "doc-1", content_ref=REF)
+
+        ctx["blob_staging"].release.assert_awaited_once_with(REF)
+
+    async def test_superseded_releases_blob_once(self, ctx):
+        ctx["doc_versions"].claim.return_value = "job-2"
+
+        result = await embed_document(ctx, "items", "doc-1", content_ref=REF, doc_seq=1)
+
+        assert result == {"status": "superseded", "doc_id": "doc-1", "superseded_by": "job-2"}
+        ctx["pipeline"].submit.assert_not_awaited()
+        ctx["blob_staging"].release.assert_awaited_once_with(REF)
+
+    async def test_cancelled_job_keeps_blob(self, ctx):
+        ctx["pipeline"].submit.side_effect = asyncio.CancelledError()
+
+        with pytest.raises(asyncio.CancelledError):
+            await embed_document(ctx, "items", "doc-1", content_ref=REF)
+
+        ctx["blob_staging"].release.assert_not_awaited()
+
+    async def test_inline_content_releases_nothing(self, ctx):
+        await embed_document(ctx, "items", "doc-1", content_raw="hello")
+
+        ctx["blob_staging"].release.assert_not_awaited()
+
+
+@pytest.mark.unit
+class TestWorkerSettings:
+    """Test cases for the worker queue layout."""
+
+    def test_cron_jobs_stay_off_the_lane_queues(self):
+        # Cron jobs are scored by time and would sort after a lane's fair backlog.
+        assert default_queue_name not in LANE_QUEUES.values()
+        assert {WorkerSettings.queue_name, BulkWorkerSettings.queue_name} == set(
+            LANE_QUEUES.values()
+        )
+        assert "cron_jobs" not in vars(WorkerSettings)
+        assert "cron_jobs" not in vars(BulkWorkerSettings)
+        assert "queue_name" not in vars(MaintenanceWorkerSettings)
+        assert MaintenanceWorkerSettings.cron_jobs